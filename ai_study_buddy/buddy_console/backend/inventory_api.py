@@ -5,6 +5,7 @@ from dataclasses import dataclass, field
 import os
 from pathlib import Path
 import threading
+import time
 from typing import Any
 from urllib.parse import quote
 
@@ -13,8 +14,10 @@ from pydantic import BaseModel, Field
 
 from ai_study_buddy.files import (
     __version__ as FILES_VERSION,
+    CardFacetIndex,
     build_enriched_inventory,
     build_main_pdf_index_for_roots,
+    enrich_on_disk_main_pdf,
     filter_main_pdf_cards,
     filter_meta_for_response,
     inventory_meta,
@@ -26,7 +29,16 @@ from ai_study_buddy.files import (
 )
 from ai_study_buddy.files.main_pdfs import OnDiskMainPdfRow
 from ai_study_buddy.files.pdf_registry_paths import RegistryPathIndex, is_pdf_registered
-from ai_study_buddy.marking.core.artifact_lookup import find_marking_artifacts_for_attempt
+from ai_study_buddy.marking.core.artifact_lookup import (
+    MarkingArtifactIndex,
+    build_marking_artifact_index,
+    find_marking_artifacts_for_attempt,
+)
+from ai_study_buddy.marking.core.change_journal import (
+    WorkflowChange,
+    WorkflowTreeWatcher,
+    workflow_change_journal,
+)
 from ai_study_buddy.marking.review.note_service import ReviewStateWriteError, put_review_state
 from ai_study_buddy.marking.review.payload_reader import read_marking_result_payload
 from ai_study_buddy.marking.review.repository import StudentReviewRepository
@@ -39,6 +51,8 @@ router = APIRouter()
 
 DEFAULT_CONTEXT_ROOT = Path(__file__).resolve().parents[2] / "context"
 INDEX_WARN_THRESHOLD = 2000
+# Out-of-process writers (batch marking scripts) are picked up by a tree poll at most this often.
+DEFAULT_WORKFLOW_POLL_SECONDS = 30.0
 
 
 @dataclass
@@ -49,8 +63,17 @@ class InventoryRuntime:
     index_rows: list[OnDiskMainPdfRow]
     context_root: Path
     enriched_cache: list[Any] | None = None
-    # Max mtime under review/amendment/marking trees when enriched_cache was built.
-    _enriched_workflow_stamp: float = field(default=0.0, repr=False, compare=False)
+    # Change-journal generation that enriched_cache reflects; newer entries are applied per card.
+    _enriched_generation: int = field(
+        default_factory=lambda: workflow_change_journal().generation, repr=False, compare=False
+    )
+    _card_slots_by_file_id: dict[str, list[int]] = field(default_factory=dict, repr=False, compare=False)
+    _file_ids_by_artifact_stem: dict[str, set[str]] = field(default_factory=dict, repr=False, compare=False)
+    _registry_index: RegistryPathIndex | None = field(default=None, repr=False, compare=False)
+    # Facet bitsets over enriched_cache; rebuilt whenever the cached list object changes.
+    _facet_index: CardFacetIndex | None = field(default=None, repr=False, compare=False)
+    _workflow_watcher: WorkflowTreeWatcher | None = field(default=None, repr=False, compare=False)
+    _workflow_polled_at: float = field(default=0.0, repr=False, compare=False)
     _enrich_lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
 
 
@@ -216,33 +239,35 @@ class ReviewStatusPatchBody(BaseModel):
     review_status: str = Field(pattern=r"^(completed|not_started)$")
 
 
-def _workflow_context_stamp(context_root: Path) -> float:
-    """Cheap fingerprint for marking/review JSON trees (invalidates enriched cache when changed)."""
-    best = 0.0
-    for sub in ("student_review_states", "marking_amendments", "marking_results"):
-        root = context_root / sub
-        if not root.is_dir():
-            continue
-        try:
-            for path in root.rglob("*.json"):
-                try:
-                    best = max(best, path.stat().st_mtime)
-                except OSError:
-                    continue
-        except OSError:
-            continue
-    return best
+def _workflow_poll_seconds() -> float:
+    raw = os.environ.get("BUDDY_CONSOLE_WORKFLOW_POLL_SECONDS")
+    if raw is None or not raw.strip():
+        return DEFAULT_WORKFLOW_POLL_SECONDS
+    try:
+        return max(0.0, float(raw))
+    except ValueError:
+        return DEFAULT_WORKFLOW_POLL_SECONDS
+
+
+def _poll_workflow_trees(runtime: InventoryRuntime, *, force: bool = False) -> None:
+    """Record out-of-process marking/review/amendment edits in the change journal (throttled)."""
+    now = time.monotonic()
+    if runtime._workflow_watcher is None:
+        runtime._workflow_watcher = WorkflowTreeWatcher(runtime.context_root)
+    elif not force and now - runtime._workflow_polled_at < _workflow_poll_seconds():
+        return
+    runtime._workflow_watcher.poll()
+    runtime._workflow_polled_at = now
 
 
 def invalidate_enriched_cache(app: Any | None = None) -> None:
-    """Drop cached inventory cards (registry edits, review writes, or workflow file changes)."""
+    """Drop cached inventory cards (registry edits). Workflow writes go through the change journal."""
     if app is None:
         return
     runtime = getattr(app.state, "inventory_runtime", None)
     if runtime is None:
         return
     runtime.enriched_cache = None
-    runtime._enriched_workflow_stamp = 0.0
 
 
 def build_buddy_console_source_detail(
@@ -258,35 +283,132 @@ def build_buddy_console_source_detail(
     return detail
 
 
+def _index_enriched_cards(
+    runtime: InventoryRuntime,
+    cards: list[Any],
+    artifact_index: MarkingArtifactIndex | None,
+) -> None:
+    slots: dict[str, list[int]] = defaultdict(list)
+    for pos, card in enumerate(cards):
+        file_id = getattr(card, "registry_file_id", None)
+        if file_id:
+            slots[file_id].append(pos)
+    by_stem: dict[str, set[str]] = defaultdict(set)
+    if artifact_index is not None:
+        for file_id, refs in artifact_index.by_completion_id.items():
+            for ref in refs:
+                by_stem[ref.marking_result_json.stem].add(file_id)
+    runtime._card_slots_by_file_id = dict(slots)
+    runtime._file_ids_by_artifact_stem = dict(by_stem)
+
+
+def _rebuild_enriched_cards(runtime: InventoryRuntime) -> list[Any]:
+    pfm = PdfFileManager()
+    index = RegistryPathIndex.from_pdf_file_manager(pfm)
+    review_repo = StudentReviewRepository(context_root=runtime.context_root)
+    artifact_index = build_marking_artifact_index(context_root=runtime.context_root)
+    cards = build_enriched_inventory(
+        runtime.index_rows,
+        index=index,
+        pfm=pfm,
+        review_repo=review_repo,
+        context_root=runtime.context_root,
+        artifact_index=artifact_index,
+    )
+    runtime._registry_index = index
+    _index_enriched_cards(runtime, cards, artifact_index)
+    runtime.enriched_cache = cards
+    return cards
+
+
+def _affected_card_slots(runtime: InventoryRuntime, changes: tuple[WorkflowChange, ...]) -> set[int] | None:
+    """Card positions touched by ``changes``, or ``None`` when only a full rebuild is safe."""
+    cards = runtime.enriched_cache or []
+    file_ids: set[str] = set()
+    for change in changes:
+        if change.attempt_file_id:
+            file_ids.add(change.attempt_file_id)
+            runtime._file_ids_by_artifact_stem.setdefault(change.artifact_stem, set()).add(change.attempt_file_id)
+        known = runtime._file_ids_by_artifact_stem.get(change.artifact_stem)
+        if known:
+            file_ids |= known
+            continue
+        if change.attempt_file_id:
+            continue
+        if change.kind == "marking_result" or not change.student_id:
+            return None
+        # Review/amendment for an artifact matched by path (not id): refresh that student's marked cards.
+        for card in cards:
+            if card.has_marking and card.student_id == change.student_id and card.registry_file_id:
+                file_ids.add(card.registry_file_id)
+    slots: set[int] = set()
+    for file_id in file_ids:
+        slots.update(runtime._card_slots_by_file_id.get(file_id, ()))
+    return slots
+
+
+def _refresh_enriched_cards(
+    runtime: InventoryRuntime,
+    changes: tuple[WorkflowChange, ...],
+) -> list[Any] | None:
+    """Re-enrich only cards affected by journal ``changes``; ``None`` means fall back to a rebuild."""
+    cards = runtime.enriched_cache
+    if cards is None:
+        return None
+    slots = _affected_card_slots(runtime, changes)
+    if slots is None:
+        return None
+    if not slots:
+        return cards
+    if runtime._registry_index is None or len(runtime.index_rows) != len(cards):
+        return None
+    pfm = PdfFileManager()
+    review_repo = StudentReviewRepository(context_root=runtime.context_root)
+    refreshed = list(cards)
+    for pos in sorted(slots):
+        # No artifact_index: per-card lookup sees artifacts written after the last full build.
+        refreshed[pos] = enrich_on_disk_main_pdf(
+            runtime.index_rows[pos],
+            index=runtime._registry_index,
+            pfm=pfm,
+            review_repo=review_repo,
+            context_root=runtime.context_root,
+        )
+    runtime.enriched_cache = refreshed
+    return refreshed
+
+
 def _get_enriched_cards(runtime: InventoryRuntime) -> list[Any]:
-    # Test/runtime override hook: when explicitly provided, trust the injected cache.
+    journal = workflow_change_journal()
     if runtime.enriched_cache is not None:
-        stamp = _workflow_context_stamp(runtime.context_root)
-        if stamp == runtime._enriched_workflow_stamp:
+        _poll_workflow_trees(runtime)
+        if journal.generation == runtime._enriched_generation:
             return runtime.enriched_cache
-        runtime.enriched_cache = None
 
     with runtime._enrich_lock:
+        generation = journal.generation
         if runtime.enriched_cache is not None:
-            stamp = _workflow_context_stamp(runtime.context_root)
-            if stamp == runtime._enriched_workflow_stamp:
-                return runtime.enriched_cache
-
-        pfm = PdfFileManager()
-        index = RegistryPathIndex.from_pdf_file_manager(pfm)
-        review_repo = StudentReviewRepository(context_root=runtime.context_root)
-        cards = build_enriched_inventory(
-            runtime.index_rows,
-            index=index,
-            pfm=pfm,
-            review_repo=review_repo,
-            context_root=runtime.context_root,
-        )
-        runtime.enriched_cache = cards
-        runtime._enriched_workflow_stamp = _workflow_context_stamp(runtime.context_root)
+            changes = journal.changes_since(runtime._enriched_generation, context_root=runtime.context_root)
+            if changes is not None:
+                refreshed = _refresh_enriched_cards(runtime, changes)
+                if refreshed is not None:
+                    runtime._enriched_generation = generation
+                    return refreshed
+
+        # Baseline the watcher before the build so writes made during it are seen next poll.
+        _poll_workflow_trees(runtime, force=True)
+        generation = journal.generation
+        cards = _rebuild_enriched_cards(runtime)
+        runtime._enriched_generation = generation
         return cards
 
 
+def _get_facet_index(runtime: InventoryRuntime, cards: list[Any]) -> CardFacetIndex:
+    facet_index = CardFacetIndex.for_cards(cards, runtime._facet_index)
+    runtime._facet_index = facet_index
+    return facet_index
+
+
 def warm_enriched_cache(app: Any) -> None:
     """Build inventory enrichment once in a background thread (first load is slow)."""
     runtime = getattr(app.state, "inventory_runtime", None)
@@ -320,8 +442,9 @@ def inventory_config(request: Request) -> dict[str, Any]:
     runtime = _get_runtime(request)
     criteria = filter_criteria_from_query(_query_params_as_lists(request))
     cards = _get_enriched_cards(runtime)
+    facet_index = _get_facet_index(runtime, cards)
     pfm = PdfFileManager()
-    filter_meta = filter_meta_for_response(cards, criteria, pfm=pfm)
+    filter_meta = filter_meta_for_response(cards, criteria, pfm=pfm, facet_index=facet_index)
     students: list[dict[str, str]] = []
     try:
         for s in pfm.list_students():
@@ -450,8 +573,6 @@ def patch_inventory_review_status(
     except ReviewStateWriteError as exc:
         raise HTTPException(status_code=400, detail=str(exc)) from exc
 
-    invalidate_enriched_cache(request.app)
-
     return {
         "registry_file_id": registry_file_id,
         "review_status": result["review_state"]["review_status"],
@@ -463,10 +584,11 @@ def inventory_list(request: Request) -> dict[str, Any]:
     runtime = _get_runtime(request)
     criteria = filter_criteria_from_query(_query_params_as_lists(request))
     cards = _get_enriched_cards(runtime)
+    facet_index = _get_facet_index(runtime, cards)
     pfm = PdfFileManager()
-    filtered = filter_main_pdf_cards(cards, criteria, pfm=pfm)
+    filtered = filter_main_pdf_cards(cards, criteria, pfm=pfm, facet_index=facet_index)
     filtered = sort_main_pdf_cards(filtered, criteria.sort)
-    filter_meta = filter_meta_for_response(cards, criteria, pfm=pfm)
+    filter_meta = filter_meta_for_response(cards, criteria, pfm=pfm, facet_index=facet_index)
     meta = inventory_meta(
         cards,
         filtered_count=len(filtered),
@@ -3,12 +3,14 @@ from __future__ import annotations
 from pathlib import Path
 from types import SimpleNamespace
 
+import pytest
 from fastapi.testclient import TestClient
 
 from ai_study_buddy import files
 from ai_study_buddy.buddy_console.backend.app import app
 from ai_study_buddy.buddy_console.backend.inventory_api import InventoryRuntime
 from ai_study_buddy.files.on_disk_inventory import OnDiskMainPdfCard
+from ai_study_buddy.marking.core.change_journal import record_workflow_change
 
 
 def _card(pdf_path: Path) -> OnDiskMainPdfCard:
@@ -65,6 +67,7 @@ def test_get_enriched_cards_reuses_cache_until_workflow_changes(
     monkeypatch, tmp_path: Path
 ) -> None:
     runtime = _runtime(tmp_path)
+    runtime.enriched_cache = None
     app.state.inventory_runtime = runtime
     build_calls = {"n": 0}
 
@@ -77,8 +80,12 @@ def test_get_enriched_cards_reuses_cache_until_workflow_changes(
         fake_build,
     )
     monkeypatch.setattr(
-        "ai_study_buddy.buddy_console.backend.inventory_api._workflow_context_stamp",
-        lambda _root: 1.0,
+        "ai_study_buddy.buddy_console.backend.inventory_api.PdfFileManager",
+        lambda: SimpleNamespace(),
+    )
+    monkeypatch.setattr(
+        "ai_study_buddy.buddy_console.backend.inventory_api.RegistryPathIndex.from_pdf_file_manager",
+        lambda _pfm: None,
     )
 
     from ai_study_buddy.buddy_console.backend.inventory_api import _get_enriched_cards
@@ -88,16 +95,86 @@ def test_get_enriched_cards_reuses_cache_until_workflow_changes(
     assert build_calls["n"] == 1
     assert first is second
 
-    runtime._enriched_workflow_stamp = 0.0
-    monkeypatch.setattr(
-        "ai_study_buddy.buddy_console.backend.inventory_api._workflow_context_stamp",
-        lambda _root: 2.0,
-    )
+    # A marking result whose attempt is not in the cached index cannot be patched in place.
+    record_workflow_change(kind="marking_result", context_root=tmp_path, artifact_stem="unknown-run")
     third = _get_enriched_cards(runtime)
     assert build_calls["n"] == 2
     assert third is not first
 
 
+def test_get_enriched_cards_re_enriches_only_cards_touched_by_journal(
+    monkeypatch, tmp_path: Path
+) -> None:
+    leaf = tmp_path / "goodnotes" / "Math" / "emma" / "P4"
+    runtime = _runtime(tmp_path)
+    first_card = _card(leaf / "registered.pdf")
+    second_card = _card(leaf / "other.pdf")
+    second_card.registry_file_id = "attempt-456"
+    runtime.index_rows = [SimpleNamespace(name="row-123"), SimpleNamespace(name="row-456")]
+    runtime.enriched_cache = [first_card, second_card]
+    runtime._card_slots_by_file_id = {"attempt-123": [0], "attempt-456": [1]}
+    runtime._file_ids_by_artifact_stem = {"run-123": {"attempt-123"}}
+    runtime._registry_index = SimpleNamespace()
+    app.state.inventory_runtime = runtime
+    enriched_rows: list[str] = []
+
+    def fake_enrich(row, **_kwargs):
+        enriched_rows.append(row.name)
+        refreshed = _card(leaf / "registered.pdf")
+        refreshed.review_status = "completed"
+        return refreshed
+
+    monkeypatch.setattr(
+        "ai_study_buddy.buddy_console.backend.inventory_api.enrich_on_disk_main_pdf",
+        fake_enrich,
+    )
+    monkeypatch.setattr(
+        "ai_study_buddy.buddy_console.backend.inventory_api.build_enriched_inventory",
+        lambda *_a, **_k: pytest.fail("journaled review write must not rebuild the whole inventory"),
+    )
+    monkeypatch.setattr(
+        "ai_study_buddy.buddy_console.backend.inventory_api.PdfFileManager",
+        lambda: SimpleNamespace(),
+    )
+
+    from ai_study_buddy.buddy_console.backend.inventory_api import _get_enriched_cards
+
+    record_workflow_change(
+        kind="student_review_state",
+        context_root=tmp_path,
+        artifact_stem="run-123",
+        student_id="emma",
+    )
+    cards = _get_enriched_cards(runtime)
+    assert enriched_rows == ["row-123"]
+    assert cards[0].review_status == "completed"
+    assert cards[1] is second_card
+    assert _get_enriched_cards(runtime) is cards
+
+
+def test_workflow_tree_poll_journals_out_of_process_writes(monkeypatch, tmp_path: Path) -> None:
+    monkeypatch.setenv("BUDDY_CONSOLE_WORKFLOW_POLL_SECONDS", "0")
+    runtime = _runtime(tmp_path)
+    app.state.inventory_runtime = runtime
+
+    from ai_study_buddy.buddy_console.backend.inventory_api import _get_enriched_cards
+
+    cached = _get_enriched_cards(runtime)
+    refreshed: list[object] = []
+    monkeypatch.setattr(
+        "ai_study_buddy.buddy_console.backend.inventory_api._refresh_enriched_cards",
+        lambda rt, changes: refreshed.append(changes) or rt.enriched_cache,
+    )
+    review = tmp_path / "student_review_states" / "emma" / "math" / "run-123.json"
+    review.parent.mkdir(parents=True)
+    review.write_text("{}", encoding="utf-8")
+
+    assert _get_enriched_cards(runtime) is cached
+    assert len(refreshed) == 1
+    (change,) = refreshed[0]
+    assert (change.kind, change.student_id, change.artifact_stem) == ("student_review_state", "emma", "run-123")
+
+
 def test_inventory_config_and_list(monkeypatch, tmp_path: Path) -> None:
     runtime = _runtime(tmp_path)
     app.state.inventory_runtime = runtime
@@ -115,6 +192,8 @@ def test_inventory_config_and_list(monkeypatch, tmp_path: Path) -> None:
 
     config_response = client.get("/api/config")
     assert config_response.status_code == 200
+    facet_index = runtime._facet_index
+    assert facet_index is not None and facet_index.cards is runtime.enriched_cache
     config_payload = config_response.json()
     assert config_payload["roots"] == [
         {
@@ -137,6 +216,7 @@ def test_inventory_config_and_list(monkeypatch, tmp_path: Path) -> None:
     assert inventory_payload["meta"]["total_in_index"] == 1
     assert inventory_payload["meta"]["total_after_filter"] == 1
     assert inventory_payload["items"][0]["registry_file_id"] == "attempt-123"
+    assert runtime._facet_index is facet_index
 
 
 def test_pdf_browser_list_and_stream(monkeypatch, tmp_path: Path) -> None:
@@ -1,6 +1,6 @@
 """Shared filesystem utilities for AI Study Buddy."""
 
-__version__ = "0.3.13"
+__version__ = "0.3.17"
 
 from .leaf_folders import (
     is_goodnotes_excluded_relative_path,
@@ -18,6 +18,7 @@ from .main_pdfs import (
     list_main_pdfs_in_leaf_folder,
 )
 from .on_disk_inventory import (
+    CardFacetIndex,
     FilterCriteria,
     FilterDropdownOptions,
     InventoryMeta,
@@ -38,6 +39,7 @@ from .path_facets import PathFacets, infer_path_facets
 from .pdf_registry_paths import (
     LeafFolderRegistryStatus,
     PdfFileRegistryStatus,
+    RegistryEnrichmentSnapshot,
     RegistryPathIndex,
     ScanRootRegistrationBuckets,
     direct_pdf_paths_in_leaf_folder,
@@ -80,6 +82,7 @@ __all__ = [
     "COMPLETION_UNIVERSE_EXCLUDED_DOC_TYPES",
     "build_main_pdf_index_for_roots",
     "include_in_completion_operator_universe",
+    "CardFacetIndex",
     "FilterCriteria",
     "FilterDropdownOptions",
     "WorkflowFilterOptions",
@@ -97,6 +100,7 @@ __all__ = [
     "filter_meta_for_response",
     "resolved_path_from_registry_row",
     "RegistryPathIndex",
+    "RegistryEnrichmentSnapshot",
     "PdfFileRegistryStatus",
     "is_pdf_registered",
     "pdf_file_registry_status",
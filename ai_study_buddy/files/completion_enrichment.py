@@ -11,6 +11,7 @@ from ai_study_buddy.marking.review.repository import StudentReviewRepository
 
 if TYPE_CHECKING:
     from ai_study_buddy.marking.core.artifact_lookup import MarkingArtifactIndex
+    from ai_study_buddy.marking.review.workflow_flags import CompletionMarkingPrefetch
 from ai_study_buddy.pdf_file_manager.pdf_file_manager import PdfFile, PdfFileManager
 
 
@@ -58,6 +59,7 @@ def enrich_registered_completion(
     pfm: PdfFileManager,
     review_repo: StudentReviewRepository,
     artifact_index: MarkingArtifactIndex | None = None,
+    marking_prefetch: CompletionMarkingPrefetch | None = None,
 ) -> RegisteredCompletionEnrichment:
     # Lazy import avoids ``files`` ↔ ``marking`` cycle when ``marking`` loads via ``files.roots``.
     from ai_study_buddy.marking.review.workflow_flags import load_completion_marking_context
@@ -68,6 +70,7 @@ def enrich_registered_completion(
         manager=pfm,
         review_repo=review_repo,
         artifact_index=artifact_index,
+        marking_prefetch=marking_prefetch,
     )
     earned, total, pct = (
         _marking_score_from_summary(ctx.resolved_summary) if ctx.has_marking else (None, None, None)
@@ -2,17 +2,19 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable
-from dataclasses import dataclass, fields, replace
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass, fields
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
     from ai_study_buddy.marking.core.artifact_lookup import MarkingArtifactIndex
+    from ai_study_buddy.marking.review.workflow_flags import CompletionMarkingPrefetch
 
 from ai_study_buddy.files.completion_enrichment import enrich_registered_completion
 from ai_study_buddy.files.main_pdfs import OnDiskMainPdfRow
 from ai_study_buddy.files.pdf_registry_paths import (
+    RegistryEnrichmentSnapshot,
     RegistryPathIndex,
     has_template_link,
     is_pdf_registered,
@@ -46,10 +48,6 @@ def normalize_facet_values(raw: str | tuple[str, ...] | list[str] | None = None)
     return tuple(out)
 
 
-def _facet_matches(selected: tuple[str, ...], value: str) -> bool:
-    return not selected or value in selected
-
-
 @dataclass(frozen=True)
 class FilterCriteria:
     scope: str = "completion"
@@ -76,44 +74,6 @@ _VALID_SORT_KEYS = frozenset({"name", "recent"})
 _REVIEW_STATUS_ORDER = ("not_started", "in_progress", "completed")
 
 
-def _bool_query_options(values: set[bool]) -> tuple[str, ...]:
-    """``true`` / ``false`` strings present in a boolean dimension of the current slice."""
-    out: list[str] = []
-    if True in values:
-        out.append("true")
-    if False in values:
-        out.append("false")
-    return tuple(out)
-
-
-def _count_all_and_values(
-    cards: list[OnDiskMainPdfCard],
-    values: tuple[str, ...],
-    matches: Callable[[OnDiskMainPdfCard, str], bool],
-    *,
-    all_key: str = "all",
-) -> dict[str, int]:
-    """File counts for an ``All`` row (*all_key*) plus each *values* entry in *cards*."""
-    counts: dict[str, int] = {all_key: len(cards)}
-    for value in values:
-        counts[value] = sum(1 for c in cards if matches(c, value))
-    return counts
-
-
-def _bool_option_counts(
-    cards: list[OnDiskMainPdfCard],
-    options: tuple[str, ...],
-    flag: Callable[[OnDiskMainPdfCard], bool],
-) -> dict[str, int]:
-    """Counts for workflow bool filters (``""`` = All, ``true`` / ``false``)."""
-    counts: dict[str, int] = {"": len(cards)}
-    if "true" in options:
-        counts["true"] = sum(1 for c in cards if flag(c) is True)
-    if "false" in options:
-        counts["false"] = sum(1 for c in cards if flag(c) is False)
-    return counts
-
-
 def resolve_card_student_id(
     card: OnDiskMainPdfCard,
     *,
@@ -227,14 +187,216 @@ def inventory_meta(
     )
 
 
+_UNSPECIFIED_FACET_VALUES = ("", "unknown", "all")
+
+# Value columns: card -> facet key (``""`` when unset). ``grade`` follows ``FilterCriteria.grade``.
+_FACET_COLUMNS: dict[str, Callable[[OnDiskMainPdfCard], str]] = {
+    "scope": lambda c: c.scope,
+    "root_id": lambda c: c.root_id,
+    "subject": lambda c: c.subject,
+    "grade": lambda c: c.grade_or_scope,
+    "doc_type": lambda c: c.doc_type,
+    "book": lambda c: c.book_group_name or "",
+    "review_status": lambda c: c.review_status or "",
+    "student_id": lambda c: c.student_id or "",
+    "student_id_folded": lambda c: (c.student_id or "").lower(),
+    "student_email_folded": lambda c: (c.student_email or "").lower(),
+}
+
+_FLAG_COLUMNS: dict[str, Callable[[OnDiskMainPdfCard], bool]] = {
+    "registered": lambda c: bool(c.is_registered),
+    "unregistered": lambda c: not c.is_registered,
+    "registered_completion": lambda c: c.scope == "completion" and bool(c.is_registered),
+    "template_true": lambda c: c.has_template is True,
+    "template_false": lambda c: c.has_template is False,
+    "marking_true": lambda c: c.has_marking is True,
+    "marking_false": lambda c: c.has_marking is False,
+    "registry_linked": lambda c: bool(c.registry_file_id),
+}
+
+
+def _bitset(positions: list[int]) -> int:
+    """Pack ascending card positions into an int bitset (bit *i* = ``cards[i]``)."""
+    if not positions:
+        return 0
+    buf = bytearray((positions[-1] >> 3) + 1)
+    for pos in positions:
+        buf[pos >> 3] |= 1 << (pos & 7)
+    return int.from_bytes(buf, "little")
+
+
+def _iter_bits(mask: int) -> Iterator[int]:
+    bits = bin(mask)[:1:-1]
+    pos = bits.find("1")
+    while pos != -1:
+        yield pos
+        pos = bits.find("1", pos + 1)
+
+
+class CardFacetIndex:
+    """Columnar bitset index over one enriched card list.
+
+    Built once per card list (the buddy_console cache keeps one per enriched-cache
+    generation). Each facet value and workflow flag maps to an int bitset, so the
+    "all other filters" slice for every dropdown is a handful of ANDs and each count
+    is a popcount instead of a re-filter of the full list. Cards are treated as
+    immutable once indexed; callers that replace or mutate cards must build a new index.
+    """
+
+    def __init__(self, cards: list[OnDiskMainPdfCard]):
+        self.cards = cards
+        self._all = (1 << len(cards)) - 1
+        value_positions: dict[str, dict[str, list[int]]] = {name: {} for name in _FACET_COLUMNS}
+        flag_positions: dict[str, list[int]] = {name: [] for name in _FLAG_COLUMNS}
+        for pos, card in enumerate(cards):
+            for name, key in _FACET_COLUMNS.items():
+                value_positions[name].setdefault(key(card), []).append(pos)
+            for name, test in _FLAG_COLUMNS.items():
+                if test(card):
+                    flag_positions[name].append(pos)
+        self._values: dict[str, dict[str, int]] = {
+            name: {value: _bitset(positions) for value, positions in by_value.items()}
+            for name, by_value in value_positions.items()
+        }
+        self._flags: dict[str, int] = {name: _bitset(positions) for name, positions in flag_positions.items()}
+
+    @classmethod
+    def for_cards(
+        cls,
+        cards: list[OnDiskMainPdfCard],
+        facet_index: CardFacetIndex | None = None,
+    ) -> CardFacetIndex:
+        """Reuse *facet_index* when it was built over this exact list; otherwise build one."""
+        if facet_index is not None and facet_index.cards is cards:
+            return facet_index
+        return cls(cards)
+
+    def flag(self, name: str) -> int:
+        return self._flags[name]
+
+    def _any_of(self, column: str, values: tuple[str, ...]) -> int:
+        by_value = self._values[column]
+        mask = 0
+        for value in values:
+            mask |= by_value.get(value, 0)
+        return mask
+
+    def criteria_masks(
+        self,
+        criteria: FilterCriteria,
+        *,
+        pfm: PdfFileManager | None = None,
+    ) -> dict[str, int]:
+        """Bitset of matching cards per active ``FilterCriteria`` field (inactive fields are omitted)."""
+        masks: dict[str, int] = {}
+        if criteria.scope not in ("", "all"):
+            masks["scope"] = self._any_of("scope", (criteria.scope,))
+        if criteria.root_id not in ("", "all"):
+            masks["root_id"] = self._any_of("root_id", (criteria.root_id,))
+        if criteria.subject:
+            masks["subject"] = self._any_of("subject", criteria.subject)
+        if criteria.grade:
+            masks["grade"] = self._any_of("grade", criteria.grade)
+        if criteria.doc_type:
+            masks["doc_type"] = self._any_of("doc_type", criteria.doc_type)
+        if criteria.book:
+            masks["book"] = self._any_of("book", (criteria.book,))
+        if criteria.is_registered in ("true", "false"):
+            masks["is_registered"] = self._flags["registered" if criteria.is_registered == "true" else "unregistered"]
+        if criteria.has_template in ("true", "false"):
+            masks["has_template"] = self._flags[f"template_{criteria.has_template}"]
+        if criteria.has_marking in ("true", "false"):
+            masks["has_marking"] = self._flags[f"marking_{criteria.has_marking}"]
+        if criteria.review_status:
+            masks["review_status"] = self._any_of("review_status", (criteria.review_status,))
+        if criteria.student:
+            masks["student"] = self._student_mask(criteria.student, pfm)
+        return masks
+
+    def _student_mask(self, student_filter: str, pfm: PdfFileManager | None) -> int:
+        needle = student_filter.strip().lower()
+        if pfm is None:
+            return self._any_of("student_id_folded", (needle,)) | self._any_of("student_email_folded", (needle,))
+        if not needle:
+            return 0
+        mask = self._any_of("student_id_folded", (needle,)) | self._any_of("student_email_folded", (needle,))
+        # Legacy URLs / localStorage may still store email: match the registry row's student by email.
+        pending = self._flags["registry_linked"] & ~mask
+        if not pending:
+            return mask
+        student_ids = {s.id for s in pfm.list_students() if s.email and s.email.lower() == needle}
+        if not student_ids:
+            return mask
+        positions = list(_iter_bits(pending))
+        rows = pfm.get_files_by_ids([self.cards[pos].registry_file_id for pos in positions])
+        matched = []
+        for pos in positions:
+            row = rows.get(self.cards[pos].registry_file_id)
+            if row is not None and row.student_id in student_ids:
+                matched.append(pos)
+        return mask | _bitset(matched)
+
+    def slice(self, masks: dict[str, int], *cleared: str) -> int:
+        """Cards matching every active criterion except the *cleared* fields."""
+        out = self._all
+        for name, mask in masks.items():
+            if name not in cleared:
+                out &= mask
+        return out
+
+    def cards_in(self, mask: int) -> list[OnDiskMainPdfCard]:
+        return [self.cards[pos] for pos in _iter_bits(mask)]
+
+    def values_present(self, column: str, mask: int, *, exclude: tuple[str, ...] = ()) -> tuple[str, ...]:
+        """Distinct *column* values among *mask* cards, sorted case-insensitively."""
+        present = [value for value, bits in self._values[column].items() if value not in exclude and bits & mask]
+        return tuple(sorted(present, key=str.casefold))
+
+    def value_counts(
+        self,
+        column: str,
+        mask: int,
+        values: tuple[str, ...],
+        *,
+        all_key: str = "all",
+    ) -> dict[str, int]:
+        """File counts for an ``All`` row (*all_key*) plus each *values* entry within *mask*."""
+        by_value = self._values[column]
+        counts: dict[str, int] = {all_key: mask.bit_count()}
+        for value in values:
+            counts[value] = (mask & by_value.get(value, 0)).bit_count()
+        return counts
+
+    def bool_options(self, mask: int, true_flag: str, false_flag: str) -> tuple[str, ...]:
+        """``true`` / ``false`` strings present in a boolean dimension of the *mask* slice."""
+        out: list[str] = []
+        if mask & self._flags[true_flag]:
+            out.append("true")
+        if mask & self._flags[false_flag]:
+            out.append("false")
+        return tuple(out)
+
+    def bool_option_counts(self, mask: int, options: tuple[str, ...], true_flag: str) -> dict[str, int]:
+        """Counts for workflow bool filters (``""`` = All, ``true`` / ``false``)."""
+        total = mask.bit_count()
+        true_count = (mask & self._flags[true_flag]).bit_count()
+        counts: dict[str, int] = {"": total}
+        if "true" in options:
+            counts["true"] = true_count
+        if "false" in options:
+            counts["false"] = total - true_count
+        return counts
+
+
 def should_show_is_registered_filter(
     cards: list[OnDiskMainPdfCard],
     criteria: FilterCriteria,
     *,
     pfm: PdfFileManager | None = None,
+    facet_index: CardFacetIndex | None = None,
 ) -> bool:
     """True when the contextual slice has both registered and unregistered mains."""
-    return len(_registration_filter_options(cards, criteria, pfm=pfm)) > 1
+    return len(_registration_filter_options(cards, criteria, pfm=pfm, facet_index=facet_index)) > 1
 
 
 def _registration_filter_options(
@@ -242,10 +404,11 @@ def _registration_filter_options(
     criteria: FilterCriteria,
     *,
     pfm: PdfFileManager | None = None,
+    facet_index: CardFacetIndex | None = None,
 ) -> tuple[str, ...]:
-    sans_reg = replace(criteria, is_registered=None)
-    subset = filter_main_pdf_cards(cards, sans_reg, pfm=pfm)
-    return _bool_query_options({c.is_registered for c in subset})
+    idx = CardFacetIndex.for_cards(cards, facet_index)
+    reg_slice = idx.slice(idx.criteria_masks(criteria, pfm=pfm), "is_registered")
+    return idx.bool_options(reg_slice, "registered", "unregistered")
 
 
 def workflow_filter_options(
@@ -253,68 +416,45 @@ def workflow_filter_options(
     criteria: FilterCriteria,
     *,
     pfm: PdfFileManager | None = None,
+    facet_index: CardFacetIndex | None = None,
 ) -> WorkflowFilterOptions:
     """Contextual registration + completion workflow filter options for the current slice.
 
     Each control is shown only when its slice (with that field cleared) has **>1** distinct
     value. Dropdown values are exactly those present (no fixed Has/No lists).
     """
-    sans_reg = replace(criteria, is_registered=None)
-    reg_subset = filter_main_pdf_cards(cards, sans_reg, pfm=pfm)
-    is_registered_options = _bool_query_options({c.is_registered for c in reg_subset})
-    is_registered_counts = _bool_option_counts(reg_subset, is_registered_options, lambda c: c.is_registered)
-
-    sans = replace(
-        criteria,
-        has_template=None,
-        has_marking=None,
-        review_status=None,
-    )
-    subset = filter_main_pdf_cards(cards, sans, pfm=pfm)
-    registered = [c for c in subset if c.scope == "completion" and c.is_registered]
+    idx = CardFacetIndex.for_cards(cards, facet_index)
+    masks = idx.criteria_masks(criteria, pfm=pfm)
 
-    template_vals = {c.has_template for c in registered}
-    marking_vals = {c.has_marking for c in registered}
-    reviewable = [c for c in subset if c.has_marking is True]
-    review_vals = {c.review_status for c in reviewable if c.review_status}
+    reg_slice = idx.slice(masks, "is_registered")
+    is_registered_options = idx.bool_options(reg_slice, "registered", "unregistered")
+    is_registered_counts = idx.bool_option_counts(reg_slice, is_registered_options, "registered")
 
-    has_template_options = _bool_query_options(template_vals)
-    has_marking_options = _bool_query_options(marking_vals)
+    subset = idx.slice(masks, "has_template", "has_marking", "review_status")
+    registered = subset & idx.flag("registered_completion")
+    has_template_options = idx.bool_options(registered, "template_true", "template_false")
+    has_marking_options = idx.bool_options(registered, "marking_true", "marking_false")
 
+    reviewable = subset & idx.flag("marking_true")
+    review_vals = set(idx.values_present("review_status", reviewable, exclude=("",)))
     ordered_reviews = [s for s in _REVIEW_STATUS_ORDER if s in review_vals]
     for extra in sorted(review_vals - set(_REVIEW_STATUS_ORDER), key=str.casefold):
         ordered_reviews.append(extra)
     review_status_options = tuple(ordered_reviews)
 
-    has_template_counts = _bool_option_counts(
-        subset,
-        has_template_options,
-        lambda c: c.has_template is True,
-    )
-    has_marking_counts = _bool_option_counts(
-        subset,
-        has_marking_options,
-        lambda c: c.has_marking is True,
-    )
-    review_status_counts: dict[str, int] = {"": len(reviewable)}
-    for status in review_status_options:
-        review_status_counts[status] = sum(
-            1 for c in reviewable if (c.review_status or "") == status
-        )
-
     return WorkflowFilterOptions(
         show_is_registered_filter=len(is_registered_options) > 1,
         is_registered_options=is_registered_options,
         is_registered_counts=is_registered_counts,
         show_has_template_filter=len(has_template_options) > 1,
         has_template_options=has_template_options,
-        has_template_counts=has_template_counts,
+        has_template_counts=idx.bool_option_counts(subset, has_template_options, "template_true"),
         show_has_marking_filter=len(has_marking_options) > 1,
         has_marking_options=has_marking_options,
-        has_marking_counts=has_marking_counts,
+        has_marking_counts=idx.bool_option_counts(subset, has_marking_options, "marking_true"),
         show_review_status_filter=len(review_status_options) > 1,
         review_status_options=review_status_options,
-        review_status_counts=review_status_counts,
+        review_status_counts=idx.value_counts("review_status", reviewable, review_status_options, all_key=""),
     )
 
 
@@ -323,14 +463,14 @@ def distinct_book_group_names(
     criteria: FilterCriteria,
     *,
     pfm: PdfFileManager | None = None,
+    facet_index: CardFacetIndex | None = None,
 ) -> list[str]:
     """Book group names in the index matching filters except ``book`` (requires type = book only)."""
     if criteria.doc_type != ("book",):
         return []
-    sans_book = replace(criteria, book="", is_registered=None)
-    subset = filter_main_pdf_cards(cards, sans_book, pfm=pfm)
-    names = {c.book_group_name for c in subset if c.book_group_name}
-    return sorted(names, key=str.casefold)
+    idx = CardFacetIndex.for_cards(cards, facet_index)
+    sub_books = idx.slice(idx.criteria_masks(criteria, pfm=pfm), "book", "is_registered")
+    return list(idx.values_present("book", sub_books, exclude=("",)))
 
 
 @dataclass(frozen=True)
@@ -371,107 +511,50 @@ class FilterDropdownOptions:
         }
 
 
-def _sorted_facet_values(values: set[str]) -> tuple[str, ...]:
-    return tuple(sorted(values, key=str.casefold))
-
-
 def filter_dropdown_options(
     cards: list[OnDiskMainPdfCard],
     criteria: FilterCriteria,
     *,
     pfm: PdfFileManager | None = None,
+    facet_index: CardFacetIndex | None = None,
 ) -> FilterDropdownOptions:
     """Dropdown choices implied by the current filter slice (excluding each control's field)."""
-
-    def subset(**overrides: object) -> list[OnDiskMainPdfCard]:
-        c = replace(criteria, **overrides)
-        return filter_main_pdf_cards(cards, c, pfm=pfm)
-
-    sub_scopes = subset(scope="all")
-    scopes = {c.scope for c in sub_scopes if c.scope}
-
-    sub_roots = subset(root_id="all")
-    root_ids_set = {c.root_id for c in sub_roots if c.root_id}
-
-    sub_subjects = subset(subject=())
-    subjects = {
-        c.subject for c in sub_subjects if c.subject and c.subject not in ("unknown", "all")
-    }
-
-    sub_grades = subset(grade=())
-    grades = {
-        c.grade_or_scope
-        for c in sub_grades
-        if c.grade_or_scope and c.grade_or_scope not in ("unknown", "all")
-    }
-
-    sub_types = subset(doc_type=())
-    doc_types = {c.doc_type for c in sub_types if c.doc_type and c.doc_type not in ("unknown", "all")}
-
-    sub_students = subset(student="")
-    student_ids: set[str] = set()
-    for c in sub_students:
-        if c.student_id:
-            student_ids.add(c.student_id)
-
-    book_names_list = distinct_book_group_names(cards, criteria, pfm=pfm)
-    sans_book = replace(criteria, book="", is_registered=None)
-    sub_books = filter_main_pdf_cards(cards, sans_book, pfm=pfm)
-
-    scope_values = _sorted_facet_values(scopes)
-    subject_values = _sorted_facet_values(subjects)
-    grade_values = _sorted_facet_values(grades)
-    doc_type_values = _sorted_facet_values(doc_types)
-    student_values = _sorted_facet_values(student_ids)
-    book_values = tuple(book_names_list)
-    root_values = _sorted_facet_values(root_ids_set)
+    idx = CardFacetIndex.for_cards(cards, facet_index)
+    masks = idx.criteria_masks(criteria, pfm=pfm)
+
+    sub_scopes = idx.slice(masks, "scope")
+    sub_roots = idx.slice(masks, "root_id")
+    sub_subjects = idx.slice(masks, "subject")
+    sub_grades = idx.slice(masks, "grade")
+    sub_types = idx.slice(masks, "doc_type")
+    sub_students = idx.slice(masks, "student")
+    sub_books = idx.slice(masks, "book", "is_registered")
+
+    scope_values = idx.values_present("scope", sub_scopes, exclude=("",))
+    subject_values = idx.values_present("subject", sub_subjects, exclude=_UNSPECIFIED_FACET_VALUES)
+    grade_values = idx.values_present("grade", sub_grades, exclude=_UNSPECIFIED_FACET_VALUES)
+    doc_type_values = idx.values_present("doc_type", sub_types, exclude=_UNSPECIFIED_FACET_VALUES)
+    student_values = idx.values_present("student_id", sub_students, exclude=("",))
+    book_values = (
+        idx.values_present("book", sub_books, exclude=("",)) if criteria.doc_type == ("book",) else ()
+    )
+    root_values = idx.values_present("root_id", sub_roots, exclude=("",))
 
     return FilterDropdownOptions(
         scopes=scope_values,
-        scope_counts=_count_all_and_values(
-            sub_scopes,
-            scope_values,
-            lambda c, v: c.scope == v,
-            all_key="all",
-        ),
+        scope_counts=idx.value_counts("scope", sub_scopes, scope_values),
         subjects=subject_values,
-        subject_counts=_count_all_and_values(
-            sub_subjects,
-            subject_values,
-            lambda c, v: c.subject == v,
-        ),
+        subject_counts=idx.value_counts("subject", sub_subjects, subject_values),
         grades=grade_values,
-        grade_counts=_count_all_and_values(
-            sub_grades,
-            grade_values,
-            lambda c, v: c.grade_or_scope == v,
-        ),
+        grade_counts=idx.value_counts("grade", sub_grades, grade_values),
         doc_types=doc_type_values,
-        doc_type_counts=_count_all_and_values(
-            sub_types,
-            doc_type_values,
-            lambda c, v: c.doc_type == v,
-        ),
+        doc_type_counts=idx.value_counts("doc_type", sub_types, doc_type_values),
         student_ids=student_values,
-        student_counts=_count_all_and_values(
-            sub_students,
-            student_values,
-            lambda c, v: c.student_id == v,
-            all_key="",
-        ),
+        student_counts=idx.value_counts("student_id", sub_students, student_values, all_key=""),
         book_names=book_values,
-        book_counts=_count_all_and_values(
-            sub_books,
-            book_values,
-            lambda c, v: (c.book_group_name or "") == v,
-            all_key="",
-        ),
+        book_counts=idx.value_counts("book", sub_books, book_values, all_key=""),
         root_ids=root_values,
-        root_counts=_count_all_and_values(
-            sub_roots,
-            root_values,
-            lambda c, v: c.root_id == v,
-        ),
+        root_counts=idx.value_counts("root_id", sub_roots, root_values),
     )
 
 
@@ -480,10 +563,12 @@ def filter_meta_for_response(
     criteria: FilterCriteria,
     *,
     pfm: PdfFileManager | None = None,
+    facet_index: CardFacetIndex | None = None,
 ) -> dict[str, Any]:
     """Contextual filter UI metadata for ``/api/config`` and ``/api/inventory``."""
-    workflow = workflow_filter_options(cards, criteria, pfm=pfm)
-    out = filter_dropdown_options(cards, criteria, pfm=pfm).to_dict()
+    idx = CardFacetIndex.for_cards(cards, facet_index)
+    workflow = workflow_filter_options(cards, criteria, pfm=pfm, facet_index=idx)
+    out = filter_dropdown_options(cards, criteria, pfm=pfm, facet_index=idx).to_dict()
     out.update(workflow.to_dict())
     return out
 
@@ -496,6 +581,8 @@ def enrich_on_disk_main_pdf(
     review_repo: StudentReviewRepository,
     context_root: Path,
     artifact_index: MarkingArtifactIndex | None = None,
+    registry_snapshot: RegistryEnrichmentSnapshot | None = None,
+    marking_prefetch: CompletionMarkingPrefetch | None = None,
 ) -> OnDiskMainPdfCard:
     f = row.facets
     registered = is_pdf_registered(row.absolute_path, index)
@@ -536,7 +623,10 @@ def enrich_on_disk_main_pdf(
     card.registry_file_id = pdf_file.id
     card.normal_name = pdf_file.normal_name
     card.registry_added_at = pdf_file.added_at
-    completion = pfm.get_completion_date(pdf_file.id)
+    if registry_snapshot is not None:
+        completion = registry_snapshot.completion_dates.get(pdf_file.id)
+    else:
+        completion = pfm.get_completion_date(pdf_file.id)
     if completion is not None:
         card.completion_date = completion.completion_date
         card.completion_date_source = completion.source
@@ -548,12 +638,19 @@ def enrich_on_disk_main_pdf(
         card.review_status = None
         return card
 
-    card.has_template = has_template_link(pfm, pdf_file.id)
+    if registry_snapshot is not None:
+        template = registry_snapshot.templates_by_file_id.get(pdf_file.id)
+        card.has_template = template is not None
+    else:
+        card.has_template = has_template_link(pfm, pdf_file.id)
+        template = pfm.get_template(pdf_file.id) if card.has_template else None
     if card.has_template:
-        template = pfm.get_template(pdf_file.id)
         if template is not None:
             card.template_file_id = template.id
-        member_info = pfm.get_completion_series_member(pdf_file.id)
+        if registry_snapshot is not None:
+            member_info = registry_snapshot.series_members_by_file_id.get(pdf_file.id)
+        else:
+            member_info = pfm.get_completion_series_member(pdf_file.id)
         if member_info is not None:
             series, member = member_info
             card.completion_series_id = series.series_id
@@ -565,6 +662,7 @@ def enrich_on_disk_main_pdf(
         pfm=pfm,
         review_repo=review_repo,
         artifact_index=artifact_index,
+        marking_prefetch=marking_prefetch,
     )
     card.has_marking = workflow.has_marking
     card.has_marking_amendment = workflow.has_marking_amendment
@@ -575,69 +673,15 @@ def enrich_on_disk_main_pdf(
     return card
 
 
-def _student_matches(card: OnDiskMainPdfCard, student_filter: str, pfm: PdfFileManager) -> bool:
-    if not student_filter:
-        return True
-    needle = student_filter.strip().lower()
-    if card.student_id and card.student_id.lower() == needle:
-        return True
-    # Legacy URLs / localStorage may still store email.
-    if card.student_email and card.student_email.lower() == needle:
-        return True
-    if card.registry_file_id:
-        row = pfm.get_file(card.registry_file_id)
-        if row and row.student_id:
-            student = pfm.get_student(row.student_id)
-            if student and student.email and student.email.lower() == needle:
-                return True
-    return False
-
-
 def filter_main_pdf_cards(
     cards: list[OnDiskMainPdfCard],
     criteria: FilterCriteria,
     *,
     pfm: PdfFileManager | None = None,
+    facet_index: CardFacetIndex | None = None,
 ) -> list[OnDiskMainPdfCard]:
-    out: list[OnDiskMainPdfCard] = []
-    for card in cards:
-        if criteria.scope not in ("", "all") and card.scope != criteria.scope:
-            continue
-        if criteria.root_id not in ("", "all") and card.root_id != criteria.root_id:
-            continue
-        if not _facet_matches(criteria.subject, card.subject):
-            continue
-        if not _facet_matches(criteria.grade, card.grade_or_scope):
-            continue
-        if not _facet_matches(criteria.doc_type, card.doc_type):
-            continue
-        if criteria.book and (card.book_group_name or "") != criteria.book:
-            continue
-        if criteria.is_registered == "true" and not card.is_registered:
-            continue
-        if criteria.is_registered == "false" and card.is_registered:
-            continue
-        if criteria.has_template == "true" and card.has_template is not True:
-            continue
-        if criteria.has_template == "false" and card.has_template is not False:
-            continue
-        if criteria.has_marking == "true" and card.has_marking is not True:
-            continue
-        if criteria.has_marking == "false" and card.has_marking is not False:
-            continue
-        if criteria.review_status and (card.review_status or "") != criteria.review_status:
-            continue
-        if criteria.student and pfm is not None:
-            if not _student_matches(card, criteria.student, pfm):
-                continue
-        elif criteria.student:
-            sid = (card.student_id or "").lower()
-            email = (card.student_email or "").lower()
-            needle = criteria.student.strip().lower()
-            if sid != needle and email != needle:
-                continue
-        out.append(card)
-    return out
+    idx = CardFacetIndex.for_cards(cards, facet_index)
+    return idx.cards_in(idx.slice(idx.criteria_masks(criteria, pfm=pfm)))
 
 
 def _display_name_key(card: OnDiskMainPdfCard) -> str:
@@ -678,10 +722,31 @@ def build_enriched_inventory(
     pfm: PdfFileManager,
     review_repo: StudentReviewRepository,
     context_root: Path,
+    artifact_index: MarkingArtifactIndex | None = None,
 ) -> list[OnDiskMainPdfCard]:
-    from ai_study_buddy.marking.core.artifact_lookup import build_marking_artifact_index
-
-    artifact_index = build_marking_artifact_index(context_root=context_root)
+    if artifact_index is None:
+        from ai_study_buddy.marking.core.artifact_lookup import build_marking_artifact_index
+
+        artifact_index = build_marking_artifact_index(context_root=context_root)
+    from ai_study_buddy.marking.review.workflow_flags import prefetch_completion_marking_documents
+
+    registered_ids = []
+    completions: list[PdfFile] = []
+    for row in rows:
+        reg_row = registry_file_for_path(row.absolute_path, index)
+        file_id = getattr(reg_row, "id", None)
+        if file_id:
+            registered_ids.append(file_id)
+            if not reg_row.is_template:
+                completions.append(reg_row)
+    registry_snapshot = RegistryEnrichmentSnapshot.from_pdf_file_manager(pfm, registered_ids)
+    marking_prefetch = prefetch_completion_marking_documents(
+        completions,
+        context_root=context_root,
+        manager=pfm,
+        review_repo=review_repo,
+        artifact_index=artifact_index,
+    )
     return [
         enrich_on_disk_main_pdf(
             row,
@@ -690,6 +755,8 @@ def build_enriched_inventory(
             review_repo=review_repo,
             context_root=context_root,
             artifact_index=artifact_index,
+            registry_snapshot=registry_snapshot,
+            marking_prefetch=marking_prefetch,
         )
         for row in rows
     ]
@@ -91,6 +91,30 @@ def registry_file_type_for_path(
     return getattr(row, "file_type", None)
 
 
+@dataclass(frozen=True)
+class RegistryEnrichmentSnapshot:
+    """Per-card registry facts for many completions, loaded with a handful of set-based queries.
+
+    Replaces the per-card ``get_completion_date`` / ``get_template`` /
+    ``get_completion_series_member`` round trips during inventory enrichment.
+    """
+
+    completion_dates: dict[str, object]
+    templates_by_file_id: dict[str, object]
+    series_members_by_file_id: dict[str, tuple]
+
+    @classmethod
+    def from_pdf_file_manager(cls, pfm: PdfFileManager, file_ids: Iterable[str]) -> RegistryEnrichmentSnapshot:
+        ids = list(dict.fromkeys(fid for fid in file_ids if fid))
+        if not ids:
+            return cls(completion_dates={}, templates_by_file_id={}, series_members_by_file_id={})
+        return cls(
+            completion_dates=dict(pfm.get_completion_dates_for_files(ids)),
+            templates_by_file_id=dict(pfm.get_templates_for_files(ids)),
+            series_members_by_file_id=dict(pfm.get_completion_series_members_for_files(ids)),
+        )
+
+
 def has_template_link(pfm: PdfFileManager, completion_file_id: str) -> bool:
     """True when a ``completed_from`` template is linked to this completion."""
     return pfm.get_template(completion_file_id) is not None
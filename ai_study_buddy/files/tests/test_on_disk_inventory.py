@@ -1,11 +1,13 @@
 """Tests for ai_study_buddy.files.on_disk_inventory."""
 
+from dataclasses import replace
 from pathlib import Path
 from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
 
 from ai_study_buddy.files.main_pdfs import OnDiskMainPdfRow
 from ai_study_buddy.files.on_disk_inventory import (
+    CardFacetIndex,
     FilterCriteria,
     OnDiskMainPdfCard,
     enrich_on_disk_main_pdf,
@@ -16,6 +18,7 @@ from ai_study_buddy.files.on_disk_inventory import (
     workflow_filter_options,
     filter_dropdown_options,
     sort_main_pdf_cards,
+    filter_meta_for_response,
 )
 from ai_study_buddy.files.path_facets import infer_path_facets
 from ai_study_buddy.files.pdf_registry_paths import RegistryPathIndex
@@ -546,6 +549,92 @@ def test_enrich_on_disk_main_pdf_populates_completion_series_fields() -> None:
     pfm.get_completion_date.assert_called_once_with("completion-1")
 
 
+def test_enrich_on_disk_main_pdf_uses_registry_snapshot_without_per_card_queries() -> None:
+    from unittest.mock import MagicMock
+
+    from ai_study_buddy.files.main_pdfs import OnDiskMainPdfRow
+    from ai_study_buddy.files.on_disk_inventory import enrich_on_disk_main_pdf
+    from ai_study_buddy.files.path_facets import PathFacets
+    from ai_study_buddy.files.pdf_registry_paths import RegistryEnrichmentSnapshot
+    from ai_study_buddy.pdf_file_manager.completion_date.core import CompletionDateRecord
+    from ai_study_buddy.pdf_file_manager.completion_series import (
+        CompletionSeries,
+        CompletionSeriesMember,
+    )
+
+    path = Path("/tmp/daydream/completion/math/winston@example.com/P4/Exam/_c_z.pdf")
+    facets = PathFacets(
+        root_id="daydreamedu",
+        scope="completion",
+        subject="math",
+        grade_or_scope="P4",
+        doc_type="exam",
+        book_group_name=None,
+        student_email="winston@example.com",
+        parse_status="ok",
+    )
+    row = OnDiskMainPdfRow(absolute_path=path, basename="_c_z.pdf", root_id="daydreamedu", facets=facets)
+    pdf_file = MagicMock(
+        id="completion-9",
+        normal_name="Z",
+        added_at="2026-01-01T00:00:00Z",
+        is_template=False,
+        student_id="winston",
+    )
+    member = CompletionSeriesMember(
+        file_id="completion-9", path=str(path), added_at="2026-01-01T00:00:00Z", attempt_sequence=1
+    )
+    series = CompletionSeries(
+        series_id="winston::template-9",
+        student_id="winston",
+        template_file_id="template-9",
+        members=(member,),
+    )
+    snapshot = RegistryEnrichmentSnapshot(
+        completion_dates={
+            "completion-9": CompletionDateRecord(
+                file_id="completion-9",
+                completion_date="2026-02-03",
+                source="manual",
+                confidence=None,
+                inference_model=None,
+                source_detail=None,
+                inferred_at="2026-02-03T00:00:00Z",
+                updated_at="2026-02-03T00:00:00Z",
+            )
+        },
+        templates_by_file_id={"completion-9": MagicMock(id="template-9")},
+        series_members_by_file_id={"completion-9": (series, member)},
+    )
+    index = MagicMock()
+    index.file_by_resolved_path = {str(path.resolve()): pdf_file}
+    pfm = MagicMock()
+
+    with patch(
+        "ai_study_buddy.files.on_disk_inventory.is_pdf_registered",
+        return_value=True,
+    ), patch(
+        "ai_study_buddy.files.on_disk_inventory.enrich_registered_completion",
+    ) as enrich_mock:
+        enrich_mock.return_value = MagicMock(has_marking=False, has_marking_amendment=False)
+        card = enrich_on_disk_main_pdf(
+            row,
+            index=index,
+            pfm=pfm,
+            review_repo=MagicMock(),
+            context_root=Path("/ctx"),
+            registry_snapshot=snapshot,
+        )
+
+    assert card.completion_date == "2026-02-03"
+    assert card.has_template is True
+    assert card.template_file_id == "template-9"
+    assert card.completion_series_id == "winston::template-9"
+    pfm.get_completion_date.assert_not_called()
+    pfm.get_template.assert_not_called()
+    pfm.get_completion_series_member.assert_not_called()
+
+
 def test_enrich_on_disk_main_pdf_completion_date() -> None:
     from ai_study_buddy.files.path_facets import PathFacets
     from ai_study_buddy.pdf_file_manager.completion_date.core import CompletionDateRecord
@@ -748,3 +837,98 @@ def test_distinct_book_group_names() -> None:
     criteria = FilterCriteria(scope="completion", subject="math", grade="P6", doc_type="book")
     assert distinct_book_group_names(cards, criteria) == ["Alpha Book"]
     assert distinct_book_group_names(cards, FilterCriteria(doc_type="exam")) == []
+
+
+def _facet_fixture_cards() -> list[OnDiskMainPdfCard]:
+    return [
+        _card(subject="math", grade_or_scope="P6", has_template=True, has_marking=True, review_status="completed"),
+        _card(subject="math", grade_or_scope="P5", has_template=False, has_marking=False),
+        _card(
+            subject="science",
+            doc_type="book",
+            book_group_name="Alpha Book",
+            has_template=True,
+            has_marking=True,
+            review_status="in_progress",
+            student_id="ada",
+            student_email="ada@example.com",
+        ),
+        _card(doc_type="book", book_group_name="Beta Book", is_registered=False, student_id=None),
+        _card(scope="template", root_id="goodnotes", subject="english", student_id=None, student_email=None),
+        _card(subject="unknown", grade_or_scope="unknown", has_template=True, has_marking=False),
+    ]
+
+
+def _reference_matches(card: OnDiskMainPdfCard, criteria: FilterCriteria) -> bool:
+    """Per-card predicate the facet index must agree with (no registry lookups)."""
+    needle = criteria.student.strip().lower()
+    return (
+        (criteria.scope in ("", "all") or card.scope == criteria.scope)
+        and (criteria.root_id in ("", "all") or card.root_id == criteria.root_id)
+        and (not criteria.subject or card.subject in criteria.subject)
+        and (not criteria.grade or card.grade_or_scope in criteria.grade)
+        and (not criteria.doc_type or card.doc_type in criteria.doc_type)
+        and (not criteria.book or (card.book_group_name or "") == criteria.book)
+        and criteria.is_registered != ("false" if card.is_registered else "true")
+        and (criteria.has_template not in ("true", "false") or card.has_template is (criteria.has_template == "true"))
+        and (criteria.has_marking not in ("true", "false") or card.has_marking is (criteria.has_marking == "true"))
+        and (not criteria.review_status or (card.review_status or "") == criteria.review_status)
+        and (not criteria.student or needle in ((card.student_id or "").lower(), (card.student_email or "").lower()))
+    )
+
+
+def test_facet_index_slices_match_per_card_filtering() -> None:
+    cards = _facet_fixture_cards()
+    facet_index = CardFacetIndex(cards)
+    grid = [
+        FilterCriteria(),
+        FilterCriteria(scope="all"),
+        FilterCriteria(subject=("math", "science"), is_registered="true"),
+        FilterCriteria(doc_type="book", book="Alpha Book"),
+        FilterCriteria(has_template="false", has_marking="false"),
+        FilterCriteria(review_status="completed", student="WINSTON"),
+        FilterCriteria(scope="all", student="ada@example.com", root_id="daydreamedu"),
+        FilterCriteria(scope="template", grade="P6"),
+    ]
+    for criteria in grid:
+        expected = [c for c in cards if _reference_matches(c, criteria)]
+        assert filter_main_pdf_cards(cards, criteria, facet_index=facet_index) == expected
+        opts = filter_dropdown_options(cards, criteria, facet_index=facet_index)
+        sans_subject = [c for c in cards if _reference_matches(c, replace(criteria, subject=()))]
+        assert opts.subject_counts["all"] == len(sans_subject)
+        for subject in opts.subjects:
+            assert opts.subject_counts[subject] == sum(1 for c in sans_subject if c.subject == subject)
+        assert "unknown" not in opts.subjects
+
+
+def test_filter_meta_for_response_reuses_facet_index() -> None:
+    cards = _facet_fixture_cards()
+    facet_index = CardFacetIndex(cards)
+    assert CardFacetIndex.for_cards(cards, facet_index) is facet_index
+    assert CardFacetIndex.for_cards(list(cards), facet_index) is not facet_index
+
+    criteria = FilterCriteria(doc_type="book")
+    meta = filter_meta_for_response(cards, criteria, facet_index=facet_index)
+    assert meta == filter_meta_for_response(cards, criteria)
+    assert meta["book_names"] == ["Alpha Book", "Beta Book"]
+    assert meta["book_counts"] == {"": 2, "Alpha Book": 1, "Beta Book": 1}
+    assert meta["is_registered_counts"] == {"": 2, "true": 1, "false": 1}
+    assert meta["review_status_options"] == ["in_progress"]
+
+
+def test_filter_student_email_uses_one_bulk_registry_lookup() -> None:
+    cards = [
+        _card(student_id=None, student_email=None, registry_file_id="f1"),
+        _card(student_id=None, student_email=None, registry_file_id="f2"),
+        _card(student_id=None, student_email=None),
+    ]
+    pfm = MagicMock()
+    pfm.list_students.return_value = [SimpleNamespace(id="winston", email="Winston@Example.com")]
+    pfm.get_files_by_ids.return_value = {
+        "f1": SimpleNamespace(student_id="winston"),
+        "f2": SimpleNamespace(student_id="other"),
+    }
+    out = filter_main_pdf_cards(cards, FilterCriteria(student="winston@example.com"), pfm=pfm)
+    assert out == [cards[0]]
+    pfm.get_files_by_ids.assert_called_once_with(["f1", "f2"])
+    pfm.get_file.assert_not_called()
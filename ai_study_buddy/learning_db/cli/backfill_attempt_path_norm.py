@@ -0,0 +1,83 @@
+"""Backfill ``marking_artifacts.attempt_path_norm`` for rows written before migration 003.
+
+New and re-imported rows get the column from ``upsert_marking_result``; this fills in the
+rest so ``find_marking_artifact_refs_from_db`` can serve them from the path index.
+"""
+
+from __future__ import annotations
+
+import argparse
+from dataclasses import dataclass
+from pathlib import Path
+import sqlite3
+
+from ai_study_buddy.learning_db.core.attempt_paths import normalize_attempt_path
+from ai_study_buddy.learning_db.core.connection import default_db_path, get_connection
+from ai_study_buddy.learning_db.core.migrate import apply_migrations
+
+BATCH_SIZE = 1000
+
+
+@dataclass
+class BackfillResult:
+    scanned: int = 0
+    updated: int = 0
+
+
+def backfill_attempt_path_norm(
+    conn: sqlite3.Connection,
+    *,
+    recompute: bool = False,
+    dry_run: bool = False,
+) -> BackfillResult:
+    """Set ``attempt_path_norm`` from ``attempt_file_path``; only NULL rows unless ``recompute``."""
+    where = "attempt_file_path IS NOT NULL AND trim(attempt_file_path) != ''"
+    if not recompute:
+        where += " AND attempt_path_norm IS NULL"
+    rows = conn.execute(
+        f"SELECT artifact_id, attempt_file_path, attempt_path_norm FROM marking_artifacts WHERE {where}"
+    ).fetchall()
+    result = BackfillResult(scanned=len(rows))
+    updates = [
+        (norm, str(row["artifact_id"]))
+        for row in rows
+        if (norm := normalize_attempt_path(row["attempt_file_path"])) != row["attempt_path_norm"]
+    ]
+    result.updated = len(updates)
+    if dry_run:
+        return result
+    for start in range(0, len(updates), BATCH_SIZE):
+        with conn:
+            conn.executemany(
+                "UPDATE marking_artifacts SET attempt_path_norm = ? WHERE artifact_id = ?",
+                updates[start : start + BATCH_SIZE],
+            )
+    return result
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--db-path", help="Optional DB path override.")
+    parser.add_argument(
+        "--recompute",
+        action="store_true",
+        help="Recompute every row, not only rows where attempt_path_norm is NULL.",
+    )
+    parser.add_argument("--dry-run", action="store_true", help="Report counts without writing.")
+    args = parser.parse_args()
+
+    db_path = Path(args.db_path).expanduser().resolve() if args.db_path else default_db_path()
+    apply_migrations(db_path=db_path)
+    conn = get_connection(db_path)
+    try:
+        result = backfill_attempt_path_norm(conn, recompute=args.recompute, dry_run=args.dry_run)
+    finally:
+        conn.close()
+    verb = "would_update" if args.dry_run else "updated"
+    print(f"db_path={db_path}")
+    print(f"scanned={result.scanned} {verb}={result.updated}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
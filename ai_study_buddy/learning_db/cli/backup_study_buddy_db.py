@@ -3,7 +3,7 @@ from __future__ import annotations
 
 import argparse
 import os
-import shutil
+import sqlite3
 from datetime import datetime
 from pathlib import Path
 from zoneinfo import ZoneInfo
@@ -32,6 +32,29 @@ def _last_backup_file(dest_path: Path, timestamped: bool) -> Path | None:
     return p if p.exists() else None
 
 
+def _source_mtime(src: Path) -> float:
+    """Newest mtime of the DB and its WAL (pooled readers keep WAL mode; recent commits live there)."""
+    mtime = src.stat().st_mtime
+    wal = src.with_name(f"{src.name}-wal")
+    if wal.exists():
+        mtime = max(mtime, wal.stat().st_mtime)
+    return mtime
+
+
+def _copy_db(src: Path, dest_file: Path) -> None:
+    """Consistent snapshot via the SQLite backup API (includes un-checkpointed WAL frames)."""
+    tmp = dest_file.with_name(f"{dest_file.name}.tmp")
+    tmp.unlink(missing_ok=True)
+    src_conn = sqlite3.connect(str(src))
+    dest_conn = sqlite3.connect(str(tmp))
+    try:
+        src_conn.backup(dest_conn)
+    finally:
+        dest_conn.close()
+        src_conn.close()
+    os.replace(tmp, dest_file)
+
+
 def _log_event(dest_path: Path, message: str) -> None:
     ts = datetime.now(SINGAPORE_TZ).strftime("%Y-%m-%dT%H:%M:%S%z")
     with (dest_path / "study_buddy_backup.log").open("a", encoding="utf-8") as f:
@@ -58,9 +81,7 @@ def main() -> int:
     if not args.force:
         last = _last_backup_file(dest, args.timestamp)
         if last and last.exists():
-            src_stat = src.stat()
-            last_stat = last.stat()
-            if src_stat.st_mtime <= last_stat.st_mtime and src_stat.st_size == last_stat.st_size:
+            if _source_mtime(src) <= last.stat().st_mtime:
                 print("No changes since last backup, skipping.")
                 _log_event(dest, "skipped (no changes)")
                 return 0
@@ -70,7 +91,7 @@ def main() -> int:
         dest_file = dest / f"study_buddy_{stamp}.db"
     else:
         dest_file = dest / "study_buddy.db"
-    shutil.copy2(src, dest_file)
+    _copy_db(src, dest_file)
     _log_event(dest, f"backed up to {dest_file.name}")
     print(f"Backed up to {dest_file}")
     return 0
@@ -0,0 +1,16 @@
+"""Normalized attempt paths stored in ``marking_artifacts.attempt_path_norm``."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+
+def normalize_attempt_path(path: object) -> str | None:
+    """Resolved absolute form of ``context.attempt_file_path``; ``None`` when blank or missing.
+
+    Must match ``artifact_lookup._normalize_path`` so DB rows compare equal to the
+    completion path the lookup is called with.
+    """
+    if not isinstance(path, str) or not path.strip():
+        return None
+    return Path(path).expanduser().resolve(strict=False).as_posix()
@@ -27,6 +27,11 @@ def learning_db_read_fallback_filesystem() -> bool:
     return _truthy("LEARNING_DB_READ_FALLBACK_FILESYSTEM", False)
 
 
+def learning_db_pooled_reads_enabled() -> bool:
+    """When True, ``learning_db.read`` reuses one query-only connection per thread. Default True."""
+    return _truthy("LEARNING_DB_POOLED_READS", True)
+
+
 def learning_db_dual_write_enabled() -> bool:
     """When True, canonical JSON snapshots also upsert rows in ``study_buddy.db``. Default True."""
     return _truthy("LEARNING_DB_ENABLE_DUAL_WRITE", True)
@@ -1,9 +1,19 @@
 from __future__ import annotations
 
+from collections.abc import Iterator
+from contextlib import contextmanager
 import os
 import sqlite3
+import threading
 from pathlib import Path
 
+from ai_study_buddy.learning_db.core.config import learning_db_pooled_reads_enabled
+
+# Read-connection tuning: 256 MiB memory map, 16 MiB page cache (negative = KiB), larger statement cache.
+READ_MMAP_SIZE_BYTES = 256 * 1024 * 1024
+READ_CACHE_SIZE_KIB = 16 * 1024
+READ_CACHED_STATEMENTS = 256
+
 
 def _repo_root() -> Path:
     p = Path(__file__).resolve().parent
@@ -36,3 +46,96 @@ def get_connection(db_path: Path | str | None = None) -> sqlite3.Connection:
     conn.execute("PRAGMA foreign_keys = ON")
     return conn
 
+
+
+class _ThreadReadConnections(threading.local):
+    def __init__(self) -> None:
+        self.pid = os.getpid()
+        # resolved db path -> (connection, (st_dev, st_ino) of the file it was opened on)
+        self.by_path: dict[Path, tuple[sqlite3.Connection, tuple[int, int]]] = {}
+
+
+_READ_CONNECTIONS = _ThreadReadConnections()
+
+
+def _file_identity(path: Path) -> tuple[int, int] | None:
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return (st.st_dev, st.st_ino)
+
+
+def _open_read_connection(resolved: Path) -> sqlite3.Connection:
+    resolved.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(str(resolved), cached_statements=READ_CACHED_STATEMENTS)
+    conn.row_factory = sqlite3.Row
+    conn.execute("PRAGMA foreign_keys = ON")
+    try:
+        # Persistent per database file; lets readers run alongside dual-write commits.
+        conn.execute("PRAGMA journal_mode = WAL")
+    except sqlite3.OperationalError:
+        pass
+    conn.execute(f"PRAGMA mmap_size = {READ_MMAP_SIZE_BYTES}")
+    conn.execute(f"PRAGMA cache_size = -{READ_CACHE_SIZE_KIB}")
+    conn.execute("PRAGMA query_only = ON")
+    return conn
+
+
+def _discard_read_connection(resolved: Path) -> None:
+    entry = _READ_CONNECTIONS.by_path.pop(resolved, None)
+    if entry is not None:
+        try:
+            entry[0].close()
+        except sqlite3.Error:
+            pass
+
+
+def get_read_connection(db_path: Path | str | None = None) -> sqlite3.Connection:
+    """Per-thread, long-lived, query-only connection to ``study_buddy.db``.
+
+    Reused across calls on the same thread (sqlite3 statement cache stays warm); do not
+    close it. Reopened when the database file is replaced or after ``fork``.
+    """
+    resolved = Path(db_path).expanduser().resolve() if db_path else default_db_path()
+    local = _READ_CONNECTIONS
+    if local.pid != os.getpid():
+        local.by_path = {}
+        local.pid = os.getpid()
+    entry = local.by_path.get(resolved)
+    identity = _file_identity(resolved)
+    if entry is not None and entry[1] == identity:
+        return entry[0]
+    if entry is not None:
+        _discard_read_connection(resolved)
+    conn = _open_read_connection(resolved)
+    local.by_path[resolved] = (conn, _file_identity(resolved) or (0, 0))
+    return conn
+
+
+@contextmanager
+def read_connection(db_path: Path | str | None = None) -> Iterator[sqlite3.Connection]:
+    """Connection for read paths: pooled per thread unless ``LEARNING_DB_POOLED_READS=0``.
+
+    A ``sqlite3.Error`` raised inside the block drops the pooled connection before re-raising.
+    """
+    if not learning_db_pooled_reads_enabled():
+        conn = get_connection(db_path)
+        try:
+            yield conn
+        finally:
+            conn.close()
+        return
+    resolved = Path(db_path).expanduser().resolve() if db_path else default_db_path()
+    conn = get_read_connection(resolved)
+    try:
+        yield conn
+    except sqlite3.Error:
+        _discard_read_connection(resolved)
+        raise
+
+
+def close_read_connections() -> None:
+    """Close this thread's pooled read connections (tests, shutdown hooks)."""
+    for resolved in list(_READ_CONNECTIONS.by_path):
+        _discard_read_connection(resolved)
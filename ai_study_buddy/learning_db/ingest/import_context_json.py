@@ -10,6 +10,7 @@ from typing import Any
 
 from jsonschema import Draft202012Validator
 
+from ai_study_buddy.learning_db.core.attempt_paths import normalize_attempt_path
 from ai_study_buddy.learning_db.core.connection import default_context_root, default_db_path, get_connection
 from ai_study_buddy.learning_db.core.migrate import apply_migrations
 from ai_study_buddy.learning_db.core.repository import (
@@ -147,15 +148,15 @@ def upsert_marking_result(
         """
         INSERT INTO marking_artifacts(
             artifact_id, schema_version, artifact_path, artifact_stem, source_content_hash, created_at, updated_at,
-            student_id, student_name, subject_context, attempt_file_id, attempt_file_path, template_file_id, template_file_path,
-            book_group_id, book_label, unit_file_id, unit_file_path, unit_label, answer_file_id, answer_file_path,
+            student_id, student_name, subject_context, attempt_file_id, attempt_file_path, attempt_path_norm,
+            template_file_id, template_file_path, book_group_id, book_label, unit_file_id, unit_file_path, unit_label, answer_file_id, answer_file_path,
             answer_page_start, answer_page_end, starts_mid_page, ends_mid_page, answer_mapping_source, answer_mapping_notes,
             marking_asset, is_partial, template_attempt_group_id, attempt_sequence, attempt_label,
             question_selection_json, context_resolution_json, summary_total_marks, summary_earned_marks, summary_percentage,
             summary_overall_assessment, summary_human_note, review_meta_updated_at, review_meta_updated_by,
             generation_produced_by, generation_mode, generation_notes, review_meta_json, generation_json, context_json, summary_json,
             raw_json
-        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
         ON CONFLICT(artifact_id) DO UPDATE SET
             schema_version = excluded.schema_version,
             artifact_path = excluded.artifact_path,
@@ -167,6 +168,7 @@ def upsert_marking_result(
             subject_context = excluded.subject_context,
             attempt_file_id = excluded.attempt_file_id,
             attempt_file_path = excluded.attempt_file_path,
+            attempt_path_norm = excluded.attempt_path_norm,
             template_file_id = excluded.template_file_id,
             template_file_path = excluded.template_file_path,
             book_group_id = excluded.book_group_id,
@@ -219,6 +221,7 @@ def upsert_marking_result(
             context.get("subject_context"),
             context.get("attempt_file_id"),
             context.get("attempt_file_path"),
+            normalize_attempt_path(context.get("attempt_file_path")),
             context.get("template_file_id"),
             context.get("template_file_path"),
             context.get("book_group_id"),
@@ -0,0 +1,10 @@
+-- Index-backed completion lookup for find_marking_artifact_refs_from_db.
+-- attempt_path_norm holds the resolved attempt_file_path (see core/attempt_paths.py);
+-- rows written before this migration stay NULL until
+-- `python3 -m ai_study_buddy.learning_db.cli.backfill_attempt_path_norm` runs.
+ALTER TABLE marking_artifacts ADD COLUMN attempt_path_norm TEXT;
+
+CREATE INDEX IF NOT EXISTS idx_marking_artifacts_attempt_live
+    ON marking_artifacts(attempt_file_id, is_deleted, created_at DESC);
+CREATE INDEX IF NOT EXISTS idx_marking_artifacts_student_attempt_path
+    ON marking_artifacts(student_id, attempt_path_norm);
@@ -12,7 +12,10 @@ from typing import Any
 
 from ai_study_buddy.learning_db.read.read_documents import (
     fetch_marking_amendment_raw_json as _fetch_amendment,
+    fetch_marking_amendments_raw_json as _fetch_amendments,
+    fetch_marking_artifacts_raw_json as _fetch_artifacts,
     fetch_student_review_state_raw_json as _fetch_review,
+    fetch_student_review_states_raw_json as _fetch_reviews,
 )
 from ai_study_buddy.learning_db.read.read_marking import find_marking_artifact_refs_from_db as _find_refs
 
@@ -33,3 +36,21 @@ class LearningDbReadRepository:
         """e.g. ``marking_amendments/emma/foo.json``."""
 
         return _fetch_amendment(json_relative_path_under_context)
+
+    @staticmethod
+    def fetch_marking_artifacts_raw(json_relative_paths_under_context: list[str]) -> dict[str, dict[str, Any]]:
+        """Bulk marking results keyed by relative path; missing paths are absent."""
+
+        return _fetch_artifacts(json_relative_paths_under_context)
+
+    @staticmethod
+    def fetch_student_review_states_raw(json_relative_paths_under_context: list[str]) -> dict[str, dict[str, Any]]:
+        """Bulk review states keyed by relative path; missing paths are absent."""
+
+        return _fetch_reviews(json_relative_paths_under_context)
+
+    @staticmethod
+    def fetch_marking_amendments_raw(json_relative_paths_under_context: list[str]) -> dict[str, dict[str, Any]]:
+        """Bulk amendments keyed by relative path; missing paths are absent."""
+
+        return _fetch_amendments(json_relative_paths_under_context)
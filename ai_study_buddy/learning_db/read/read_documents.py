@@ -6,7 +6,10 @@ import json
 import sqlite3
 from pathlib import Path
 
-from ai_study_buddy.learning_db.core.connection import get_connection
+from ai_study_buddy.learning_db.core.connection import read_connection
+
+# Stay well under SQLite's host-parameter limit for ``IN (...)`` lists.
+_SQL_IN_CHUNK_SIZE = 500
 
 
 def _parse_raw_dict(raw_js: object) -> dict | None:
@@ -52,36 +55,72 @@ def _row_get(row: sqlite3.Row, key: str, default: object = None) -> object:
     return row[key] if key in row.keys() else default
 
 
+def _in_chunks(values: list[str]) -> list[list[str]]:
+    unique = list(dict.fromkeys(values))
+    return [unique[i : i + _SQL_IN_CHUNK_SIZE] for i in range(0, len(unique), _SQL_IN_CHUNK_SIZE)]
+
+
+def _placeholders(chunk: list[str]) -> str:
+    return ",".join("?" for _ in chunk)
+
+
+def _group_rows(rows: list[sqlite3.Row], key: str) -> dict[str, list[sqlite3.Row]]:
+    """Group rows by *key*, keeping query order within each group."""
+    out: dict[str, list[sqlite3.Row]] = {}
+    for row in rows:
+        out.setdefault(row[key], []).append(row)
+    return out
+
+
 def fetch_student_review_state_raw_json(review_state_relative_path: str) -> dict | None:
     """``review_state_relative_path`` is relative to ``context_root`` e.g. ``student_review_states/emma/foo.json``."""
 
-    conn = get_connection()
+    return fetch_student_review_states_raw_json([review_state_relative_path]).get(review_state_relative_path)
+
+
+def fetch_student_review_states_raw_json(review_state_relative_paths: list[str]) -> dict[str, dict]:
+    """Bulk :func:`fetch_student_review_state_raw_json`: path -> document for every path found.
+
+    Two set-based queries per chunk of paths (states, then their notes) regardless of how many are requested.
+    """
+
+    out: dict[str, dict] = {}
     try:
-        row = conn.execute(
-            """
-            SELECT *
-            FROM student_review_states
-            WHERE review_state_path = ? AND is_deleted = 0
-            LIMIT 1
-            """,
-            (review_state_relative_path,),
-        ).fetchone()
-        if not row:
-            return None
-        note_rows = conn.execute(
-            """
-            SELECT scope, result_id, review_status, author_role, note_text, updated_at
-            FROM student_review_notes
-            WHERE review_state_id = ?
-            ORDER BY updated_at ASC, note_id ASC
-            """,
-            (row["review_state_id"],),
-        ).fetchall()
+        with read_connection() as conn:
+            for chunk in _in_chunks(review_state_relative_paths):
+                rows = conn.execute(
+                    f"""
+                    SELECT *
+                    FROM student_review_states
+                    WHERE review_state_path IN ({_placeholders(chunk)}) AND is_deleted = 0
+                    """,
+                    chunk,
+                ).fetchall()
+                if not rows:
+                    continue
+                state_ids = [row["review_state_id"] for row in rows]
+                notes_by_state = _group_rows(
+                    conn.execute(
+                        f"""
+                        SELECT review_state_id, scope, result_id, review_status, author_role, note_text, updated_at
+                        FROM student_review_notes
+                        WHERE review_state_id IN ({_placeholders(state_ids)})
+                        ORDER BY review_state_id, updated_at ASC, note_id ASC
+                        """,
+                        state_ids,
+                    ).fetchall(),
+                    "review_state_id",
+                )
+                for row in rows:
+                    out[row["review_state_path"]] = _review_state_document(
+                        row, notes_by_state.get(row["review_state_id"], [])
+                    )
     except sqlite3.Error:
-        return None
-    finally:
-        conn.close()
+        return {}
+    return out
+
 
+def _review_state_document(row: sqlite3.Row, note_rows: list[sqlite3.Row]) -> dict:
     question_reviews: list[dict] = []
     attempt_notes: list[dict] = []
     student_subject_notes: list[dict] = []
@@ -123,42 +162,70 @@ def fetch_student_review_state_raw_json(review_state_relative_path: str) -> dict
 def fetch_marking_artifact_raw_json(artifact_relative_path: str) -> dict | None:
     """``artifact_relative_path`` e.g. ``marking_results/emma/subject/foo.json``."""
 
-    conn = get_connection()
+    return fetch_marking_artifacts_raw_json([artifact_relative_path]).get(artifact_relative_path)
+
+
+def fetch_marking_artifacts_raw_json(artifact_relative_paths: list[str]) -> dict[str, dict]:
+    """Bulk :func:`fetch_marking_artifact_raw_json`: path -> payload for every path found.
+
+    Three set-based queries per chunk of paths (artifacts, question results, page map) instead of three per artifact.
+    """
+
+    out: dict[str, dict] = {}
     try:
-        row = conn.execute(
-            """
-            SELECT *
-            FROM marking_artifacts
-            WHERE artifact_path = ? AND is_deleted = 0
-            LIMIT 1
-            """,
-            (artifact_relative_path,),
-        ).fetchone()
-        if not row:
-            return None
-        question_rows = conn.execute(
-            """
-            SELECT *
-            FROM marking_question_results
-            WHERE artifact_id = ?
-            ORDER BY rowid ASC
-            """,
-            (row["artifact_id"],),
-        ).fetchall()
-        page_rows = conn.execute(
-            """
-            SELECT *
-            FROM marking_question_page_map
-            WHERE artifact_id = ?
-            ORDER BY rowid ASC
-            """,
-            (row["artifact_id"],),
-        ).fetchall()
+        with read_connection() as conn:
+            for chunk in _in_chunks(artifact_relative_paths):
+                rows = conn.execute(
+                    f"""
+                    SELECT *
+                    FROM marking_artifacts
+                    WHERE artifact_path IN ({_placeholders(chunk)}) AND is_deleted = 0
+                    """,
+                    chunk,
+                ).fetchall()
+                if not rows:
+                    continue
+                artifact_ids = [row["artifact_id"] for row in rows]
+                questions_by_artifact = _group_rows(
+                    conn.execute(
+                        f"""
+                        SELECT *
+                        FROM marking_question_results
+                        WHERE artifact_id IN ({_placeholders(artifact_ids)})
+                        ORDER BY rowid ASC
+                        """,
+                        artifact_ids,
+                    ).fetchall(),
+                    "artifact_id",
+                )
+                pages_by_artifact = _group_rows(
+                    conn.execute(
+                        f"""
+                        SELECT *
+                        FROM marking_question_page_map
+                        WHERE artifact_id IN ({_placeholders(artifact_ids)})
+                        ORDER BY rowid ASC
+                        """,
+                        artifact_ids,
+                    ).fetchall(),
+                    "artifact_id",
+                )
+                for row in rows:
+                    out[row["artifact_path"]] = _marking_artifact_document(
+                        row,
+                        questions_by_artifact.get(row["artifact_id"], []),
+                        pages_by_artifact.get(row["artifact_id"], []),
+                    )
     except sqlite3.Error:
-        return None
-    finally:
-        conn.close()
+        return {}
+    return out
+
 
+def _marking_artifact_document(
+    row: sqlite3.Row,
+    question_rows: list[sqlite3.Row],
+    page_rows: list[sqlite3.Row],
+) -> dict:
     question_page_map = [
         _clean_none_dict(
             {
@@ -269,42 +336,71 @@ def fetch_marking_artifact_raw_json(artifact_relative_path: str) -> dict | None:
 def fetch_marking_amendment_raw_json(amendment_relative_path: str) -> dict | None:
     """``amendment_relative_path`` e.g. ``marking_amendments/emma/subject/foo.json``."""
 
-    conn = get_connection()
+    return fetch_marking_amendments_raw_json([amendment_relative_path]).get(amendment_relative_path)
+
+
+def fetch_marking_amendments_raw_json(amendment_relative_paths: list[str]) -> dict[str, dict]:
+    """Bulk :func:`fetch_marking_amendment_raw_json`: path -> document for every path found.
+
+    Three set-based queries per chunk of paths (amendments, question amendments, page-map amendments).
+    """
+
+    out: dict[str, dict] = {}
     try:
-        row = conn.execute(
-            """
-            SELECT *
-            FROM marking_amendments
-            WHERE amendment_path = ? AND is_deleted = 0
-            LIMIT 1
-            """,
-            (amendment_relative_path,),
-        ).fetchone()
-        if not row:
-            return None
-        question_rows = conn.execute(
-            """
-            SELECT result_id, fields_json, reviewer_reason, evidence_json, updated_at, updated_by
-            FROM marking_question_amendments
-            WHERE amendment_id = ?
-            ORDER BY rowid ASC
-            """,
-            (row["amendment_id"],),
-        ).fetchall()
-        page_rows = conn.execute(
-            """
-            SELECT result_id, attempt_page_start, confidence, updated_at, updated_by
-            FROM marking_page_map_amendments
-            WHERE amendment_id = ?
-            ORDER BY rowid ASC
-            """,
-            (row["amendment_id"],),
-        ).fetchall()
+        with read_connection() as conn:
+            for chunk in _in_chunks(amendment_relative_paths):
+                rows = conn.execute(
+                    f"""
+                    SELECT *
+                    FROM marking_amendments
+                    WHERE amendment_path IN ({_placeholders(chunk)}) AND is_deleted = 0
+                    """,
+                    chunk,
+                ).fetchall()
+                if not rows:
+                    continue
+                amendment_ids = [row["amendment_id"] for row in rows]
+                questions_by_amendment = _group_rows(
+                    conn.execute(
+                        f"""
+                        SELECT amendment_id, result_id, fields_json, reviewer_reason, evidence_json, updated_at,
+                               updated_by
+                        FROM marking_question_amendments
+                        WHERE amendment_id IN ({_placeholders(amendment_ids)})
+                        ORDER BY rowid ASC
+                        """,
+                        amendment_ids,
+                    ).fetchall(),
+                    "amendment_id",
+                )
+                pages_by_amendment = _group_rows(
+                    conn.execute(
+                        f"""
+                        SELECT amendment_id, result_id, attempt_page_start, confidence, updated_at, updated_by
+                        FROM marking_page_map_amendments
+                        WHERE amendment_id IN ({_placeholders(amendment_ids)})
+                        ORDER BY rowid ASC
+                        """,
+                        amendment_ids,
+                    ).fetchall(),
+                    "amendment_id",
+                )
+                for row in rows:
+                    out[row["amendment_path"]] = _marking_amendment_document(
+                        row,
+                        questions_by_amendment.get(row["amendment_id"], []),
+                        pages_by_amendment.get(row["amendment_id"], []),
+                    )
     except sqlite3.Error:
-        return None
-    finally:
-        conn.close()
+        return {}
+    return out
+
 
+def _marking_amendment_document(
+    row: sqlite3.Row,
+    question_rows: list[sqlite3.Row],
+    page_rows: list[sqlite3.Row],
+) -> dict:
     context = _clean_none_dict(
         {
             "student_id": _row_get(row, "student_id"),
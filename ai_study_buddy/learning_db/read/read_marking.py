@@ -7,6 +7,7 @@ from datetime import datetime
 from pathlib import Path
 from typing import Literal
 
+from ai_study_buddy.learning_db.core.attempt_paths import normalize_attempt_path
 from ai_study_buddy.marking.core.artifact_lookup import (
     MarkingArtifactRef,
     _as_utc_epoch,
@@ -17,6 +18,39 @@ from ai_study_buddy.pdf_file_manager.pdf_file_manager import PdfFile
 
 MatchCondition = Literal["json_only", "json_and_report"]
 
+# Index-backed branches, each matching ``_row_matches_completion``: rows keyed by attempt id
+# (idx_marking_artifacts_attempt_live), ids stored with surrounding whitespace, id-less rows
+# keyed by normalized attempt path (idx_marking_artifacts_student_attempt_path), and id-less
+# rows not yet backfilled (attempt_path_norm IS NULL), which are re-checked in Python.
+_REFS_FOR_COMPLETION_SQL = """
+    SELECT artifact_path, created_at, attempt_file_id, attempt_file_path
+    FROM marking_artifacts
+    WHERE attempt_file_id = ? AND is_deleted = 0 AND student_id = ?
+    UNION ALL
+    SELECT artifact_path, created_at, attempt_file_id, attempt_file_path
+    FROM marking_artifacts
+    WHERE student_id = ? AND is_deleted = 0
+      AND attempt_file_id != trim(attempt_file_id) AND trim(attempt_file_id) = ?
+    UNION ALL
+    SELECT artifact_path, created_at, attempt_file_id, attempt_file_path
+    FROM marking_artifacts
+    WHERE student_id = ? AND attempt_path_norm = ? AND is_deleted = 0
+      AND (attempt_file_id IS NULL OR trim(attempt_file_id) = '')
+    UNION ALL
+    SELECT artifact_path, created_at, attempt_file_id, attempt_file_path
+    FROM marking_artifacts
+    WHERE student_id = ? AND attempt_path_norm IS NULL AND is_deleted = 0
+      AND (attempt_file_id IS NULL OR trim(attempt_file_id) = '')
+      AND attempt_file_path IS NOT NULL AND trim(attempt_file_path) != ''
+"""
+
+# Pre-migration-003 DBs have no attempt_path_norm: scan the student's live rows instead.
+_REFS_FOR_STUDENT_SQL = """
+    SELECT artifact_path, created_at, attempt_file_id, attempt_file_path
+    FROM marking_artifacts
+    WHERE student_id = ? AND is_deleted = 0
+"""
+
 
 def find_marking_artifact_refs_from_db(
     *,
@@ -35,25 +69,30 @@ def find_marking_artifact_refs_from_db(
         return []
 
     try:
-        from ai_study_buddy.learning_db.core.connection import get_connection
+        from ai_study_buddy.learning_db.core.connection import read_connection
     except ImportError:
         return []
 
-    conn = get_connection()
     try:
-        rows = conn.execute(
-            """
-            SELECT artifact_path, created_at, attempt_file_id, attempt_file_path
-            FROM marking_artifacts
-            WHERE student_id = ? AND is_deleted = 0
-            ORDER BY created_at DESC, artifact_path ASC
-            """,
-            (student_id,),
-        ).fetchall()
+        with read_connection() as conn:
+            try:
+                rows = conn.execute(
+                    _REFS_FOR_COMPLETION_SQL,
+                    (
+                        completion_id,
+                        student_id,
+                        student_id,
+                        completion_id,
+                        student_id,
+                        completion_path,
+                        student_id,
+                    ),
+                ).fetchall()
+            except sqlite3.OperationalError:
+                # e.g. "no such column: attempt_path_norm" before migration 003 is applied.
+                rows = conn.execute(_REFS_FOR_STUDENT_SQL, (student_id,)).fetchall()
     except sqlite3.Error:
         return []
-    finally:
-        conn.close()
 
     matches: list[tuple[datetime, Path, Path]] = []
 
@@ -102,4 +141,4 @@ def _row_matches_completion(*, row: sqlite3.Row, completion_id: str, completion_
 
 
 def _normalize_db_path(path: str) -> str:
-    return str(Path(path).expanduser().resolve(strict=False))
+    return normalize_attempt_path(path) or ""
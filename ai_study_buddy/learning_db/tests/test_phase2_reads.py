@@ -9,8 +9,13 @@ import pytest
 
 from ai_study_buddy.learning_db.ingest.import_context_json import run_import
 from ai_study_buddy.learning_db.core.migrate import apply_migrations
-from ai_study_buddy.learning_db.read.read_documents import fetch_marking_artifact_raw_json
-from ai_study_buddy.learning_db.core.connection import get_connection
+from ai_study_buddy.learning_db.read.read_documents import (
+    fetch_marking_amendments_raw_json,
+    fetch_marking_artifact_raw_json,
+    fetch_marking_artifacts_raw_json,
+    fetch_student_review_states_raw_json,
+)
+from ai_study_buddy.learning_db.core.connection import close_read_connections, get_connection, get_read_connection
 from ai_study_buddy.marking.core.artifact_lookup import find_marking_artifacts_for_attempt
 from ai_study_buddy.pdf_file_manager.pdf_file_manager import PdfFileManager
 
@@ -236,3 +241,186 @@ def test_fetch_marking_artifact_reconstructs_from_projection_not_raw_json(
     assert payload.get("created_at") == "2026-04-19T11:00:00+08:00"
     context = payload.get("context") if isinstance(payload.get("context"), dict) else {}
     assert context.get("attempt_file_id") == str(attempt.id)
+
+
+def test_bulk_marking_artifact_fetch_matches_single_fetch_in_three_queries(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    db_path = tmp_path / "study_buddy.db"
+    monkeypatch.setenv("STUDY_BUDDY_DB_PATH", str(db_path))
+    apply_migrations(db_path=db_path)
+
+    context_root = tmp_path / "context"
+    rel_paths = []
+    for stem, attempt_id in (("run_a", "attempt-a"), ("run_b", "attempt-b")):
+        rel = f"marking_results/emma/singapore_primary_science/{stem}.json"
+        _write_json(
+            context_root / rel,
+            _minimal_valid_payload(attempt_id=attempt_id, attempt_path=str(tmp_path / f"{attempt_id}.pdf")),
+        )
+        rel_paths.append(rel)
+    run_import(
+        db_path=db_path,
+        context_root=context_root,
+        dry_run=False,
+        limit=None,
+        artifact_family=None,
+        retry_quarantine=False,
+        retry_status="open",
+        retry_failure_stage=None,
+    )
+
+    singles = {rel: fetch_marking_artifact_raw_json(rel) for rel in rel_paths}
+    statements: list[str] = []
+    conn = get_read_connection()
+    conn.set_trace_callback(statements.append)
+    try:
+        bulk = fetch_marking_artifacts_raw_json([*rel_paths, "marking_results/emma/missing.json"])
+    finally:
+        conn.set_trace_callback(None)
+        close_read_connections()
+
+    assert set(bulk) == set(rel_paths)
+    assert bulk == singles
+    assert bulk[rel_paths[1]]["context"]["attempt_file_id"] == "attempt-b"
+    assert len([sql for sql in statements if sql.lstrip().upper().startswith("SELECT")]) == 3
+    assert fetch_student_review_states_raw_json(["student_review_states/emma/none.json"]) == {}
+    assert fetch_marking_amendments_raw_json([]) == {}
+
+
+def test_path_only_rows_found_before_and_after_attempt_path_norm_backfill(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    from ai_study_buddy.learning_db.cli.backfill_attempt_path_norm import backfill_attempt_path_norm
+
+    db_path = tmp_path / "study_buddy.db"
+    monkeypatch.setenv("STUDY_BUDDY_DB_PATH", str(db_path))
+    monkeypatch.setenv("LEARNING_DB_ENABLE_READS", "1")
+    monkeypatch.setenv("LEARNING_DB_READ_FALLBACK_FILESYSTEM", "0")
+    apply_migrations(db_path=db_path)
+
+    manager = PdfFileManager(db_path=tmp_path / "registry.db")
+    manager.add_student(id="emma", name="Emma", email="emma@example.com")
+    attempt_path = _touch(tmp_path / "attempt.pdf")
+    attempt = manager.register_file(
+        attempt_path, file_type="main", doc_type="book", student_id="emma", is_template=False
+    )
+    other_path = _touch(tmp_path / "other.pdf")
+
+    context_root = tmp_path / "context"
+    results_dir = context_root / "marking_results" / "emma" / "singapore_primary_science"
+    by_id = _write_json(
+        results_dir / "by_id.json",
+        _minimal_valid_payload(attempt_id=str(attempt.id), attempt_path=str(attempt_path)),
+    )
+    by_path_payload = _minimal_valid_payload(attempt_id="", attempt_path=f"{tmp_path}/./attempt.pdf")
+    by_path_payload["created_at"] = "2026-04-18T10:00:00+08:00"
+    by_path = _write_json(results_dir / "by_path.json", by_path_payload)
+    _write_json(
+        results_dir / "other.json",
+        _minimal_valid_payload(attempt_id="", attempt_path=str(other_path)),
+    )
+    run_import(
+        db_path=db_path,
+        context_root=context_root,
+        dry_run=False,
+        limit=None,
+        artifact_family=None,
+        retry_quarantine=False,
+        retry_status="open",
+        retry_failure_stage=None,
+    )
+    expected = [by_id.resolve(), by_path.resolve()]
+
+    conn = get_connection(db_path)
+    try:
+        norm = conn.execute(
+            "SELECT attempt_path_norm FROM marking_artifacts WHERE artifact_path LIKE '%by_path.json'"
+        ).fetchone()[0]
+        assert norm == attempt_path.resolve().as_posix()
+        plan = " ".join(
+            str(row["detail"])
+            for row in conn.execute(
+                "EXPLAIN QUERY PLAN SELECT artifact_path FROM marking_artifacts "
+                "WHERE student_id = ? AND attempt_path_norm = ? AND is_deleted = 0",
+                ("emma", norm),
+            )
+        )
+        assert "idx_marking_artifacts_student_attempt_path" in plan
+
+        with conn:
+            conn.execute("UPDATE marking_artifacts SET attempt_path_norm = NULL")
+        close_read_connections()
+        refs = find_marking_artifacts_for_attempt(attempt.id, manager=manager, context_root=context_root)
+        assert [r.marking_result_json for r in refs] == expected
+
+        result = backfill_attempt_path_norm(conn)
+        assert (result.scanned, result.updated) == (3, 3)
+        assert backfill_attempt_path_norm(conn).scanned == 0
+    finally:
+        conn.close()
+
+    close_read_connections()
+    refs = find_marking_artifacts_for_attempt(attempt.id, manager=manager, context_root=context_root)
+    assert [r.marking_result_json for r in refs] == expected
+
+
+def test_marking_refs_read_from_db_without_migration_003(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    db_path = tmp_path / "study_buddy.db"
+    monkeypatch.setenv("STUDY_BUDDY_DB_PATH", str(db_path))
+    monkeypatch.setenv("LEARNING_DB_ENABLE_READS", "1")
+    monkeypatch.setenv("LEARNING_DB_READ_FALLBACK_FILESYSTEM", "0")
+    apply_migrations(db_path=db_path)
+
+    manager = PdfFileManager(db_path=tmp_path / "registry.db")
+    manager.add_student(id="emma", name="Emma", email="emma@example.com")
+    attempt_path = _touch(tmp_path / "attempt.pdf")
+    attempt = manager.register_file(
+        attempt_path, file_type="main", doc_type="book", student_id="emma", is_template=False
+    )
+
+    context_root = tmp_path / "context"
+    results_dir = context_root / "marking_results" / "emma" / "singapore_primary_science"
+    by_id = _write_json(
+        results_dir / "by_id.json",
+        _minimal_valid_payload(attempt_id=str(attempt.id), attempt_path=str(attempt_path)),
+    )
+    by_path_payload = _minimal_valid_payload(attempt_id="", attempt_path=str(attempt_path))
+    by_path_payload["created_at"] = "2026-04-18T10:00:00+08:00"
+    by_path = _write_json(results_dir / "by_path.json", by_path_payload)
+    run_import(
+        db_path=db_path,
+        context_root=context_root,
+        dry_run=False,
+        limit=None,
+        artifact_family=None,
+        retry_quarantine=False,
+        retry_status="open",
+        retry_failure_stage=None,
+    )
+    expected = [by_id.resolve(), by_path.resolve()]
+
+    conn = get_connection(db_path)
+    try:
+        with conn:
+            # Padded ids matched the old Python-side ``strip()`` comparison; keep them matching.
+            conn.execute(
+                "UPDATE marking_artifacts SET attempt_file_id = ? WHERE attempt_file_id = ?",
+                (f" {attempt.id} ", str(attempt.id)),
+            )
+        close_read_connections()
+        refs = find_marking_artifacts_for_attempt(attempt.id, manager=manager, context_root=context_root)
+        assert [r.marking_result_json for r in refs] == expected
+
+        with conn:
+            conn.execute("DROP INDEX idx_marking_artifacts_student_attempt_path")
+            conn.execute("ALTER TABLE marking_artifacts DROP COLUMN attempt_path_norm")
+            conn.execute("DELETE FROM schema_migrations WHERE version = '003_marking_attempt_path_norm.sql'")
+    finally:
+        conn.close()
+
+    close_read_connections()
+    refs = find_marking_artifacts_for_attempt(attempt.id, manager=manager, context_root=context_root)
+    assert [r.marking_result_json for r in refs] == expected
@@ -0,0 +1,87 @@
+"""Per-thread pooled read connections (``learning_db.core.connection.read_connection``)."""
+
+from __future__ import annotations
+
+import sqlite3
+import threading
+from pathlib import Path
+
+import pytest
+
+from ai_study_buddy.learning_db.core.connection import (
+    close_read_connections,
+    get_connection,
+    get_read_connection,
+    read_connection,
+)
+from ai_study_buddy.learning_db.core.migrate import apply_migrations
+from ai_study_buddy.learning_db.read.read_documents import fetch_student_review_state_raw_json
+
+
+@pytest.fixture()
+def db_path(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    path = tmp_path / "study_buddy.db"
+    monkeypatch.setenv("STUDY_BUDDY_DB_PATH", str(path))
+    monkeypatch.delenv("LEARNING_DB_POOLED_READS", raising=False)
+    apply_migrations(path)
+    yield path
+    close_read_connections()
+
+
+def _insert_review_state(db_path: Path, rel_path: str) -> None:
+    conn = get_connection(db_path)
+    conn.execute("PRAGMA foreign_keys = OFF")
+    with conn:
+        conn.execute(
+            """
+            INSERT INTO student_review_states(
+                review_state_id, artifact_id, schema_version, review_state_path, source_content_hash,
+                marking_result_path, review_status, created_at, updated_at, context_json, raw_json
+            )
+            VALUES (?, 'a1', 'student_review_state.v1', ?, 'h', 'marking_results/emma/x.json',
+                    'in_progress', '2026-05-01', '2026-05-01', '{}', '{}')
+            """,
+            (f"rs::{rel_path}", rel_path),
+        )
+    conn.close()
+
+
+def test_read_connection_is_reused_per_thread_and_query_only(db_path: Path) -> None:
+    with read_connection() as first:
+        pass
+    with read_connection() as second:
+        assert second is first
+    assert first.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+    with pytest.raises(sqlite3.OperationalError):
+        first.execute("DELETE FROM student_review_states")
+
+    other: list[sqlite3.Connection] = []
+    worker = threading.Thread(target=lambda: other.append(get_read_connection(db_path)))
+    worker.start()
+    worker.join()
+    assert other and other[0] is not first
+
+
+def test_pooled_reader_sees_later_writes_and_reopens_recreated_file(db_path: Path) -> None:
+    rel = "student_review_states/emma/science/paper.json"
+    assert fetch_student_review_state_raw_json(rel) is None
+    pooled = get_read_connection(db_path)
+
+    _insert_review_state(db_path, rel)
+    doc = fetch_student_review_state_raw_json(rel)
+    assert doc is not None and doc["review_status"] == "in_progress"
+    assert get_read_connection(db_path) is pooled
+
+    for suffix in ("", "-wal", "-shm"):
+        Path(f"{db_path}{suffix}").unlink(missing_ok=True)
+    apply_migrations(db_path)
+    assert get_read_connection(db_path) is not pooled
+    assert fetch_student_review_state_raw_json(rel) is None
+
+
+def test_pooled_reads_can_be_disabled(db_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("LEARNING_DB_POOLED_READS", "0")
+    with read_connection() as first:
+        pass
+    with pytest.raises(sqlite3.ProgrammingError):
+        first.execute("SELECT 1")
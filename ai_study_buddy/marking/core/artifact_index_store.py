@@ -0,0 +1,177 @@
+"""SQLite sidecar that persists per-file facts for ``build_marking_artifact_index``.
+
+Each marking-result JSON under ``marking_results/`` is recorded with its ``(mtime_ns, size)``
+signature and the few payload fields the index needs. A rebuild stats every file, reparses
+only new or changed ones, and drops rows for deleted files, so a warm index costs one
+directory walk instead of one JSON parse per run.
+
+Placeholder path tokens (``GOODNOTES_ROOT``, ``<student_email>``) are stored unexpanded;
+``build_marking_artifact_index`` resolves them at build time so a changed root or email
+never serves stale paths from the sidecar.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+import json
+import os
+from pathlib import Path
+import sqlite3
+
+SIDECAR_FORMAT_VERSION = "1"
+DEFAULT_SIDECAR_RELPATH = Path(".cache") / "marking_artifact_index.sqlite"
+
+
+def marking_artifact_index_cache_enabled() -> bool:
+    """``MARKING_ARTIFACT_INDEX_CACHE=0`` disables the sidecar (always full rescan)."""
+    return os.environ.get("MARKING_ARTIFACT_INDEX_CACHE", "").strip() != "0"
+
+
+def default_sidecar_path(context_root: str | Path) -> Path:
+    return Path(context_root) / DEFAULT_SIDECAR_RELPATH
+
+
+@dataclass(frozen=True)
+class IndexedArtifactFile:
+    """Index-relevant facts from one marking-result JSON (``indexable=False`` when unusable)."""
+
+    rel_path: str
+    mtime_ns: int
+    size: int
+    indexable: bool
+    created_at: str | None = None
+    student_id: str | None = None
+    attempt_file_id: str | None = None
+    attempt_file_path: str | None = None
+
+
+def scan_artifact_file(json_path: Path, *, rel_path: str, mtime_ns: int, size: int) -> IndexedArtifactFile:
+    """Parse one JSON file into an ``IndexedArtifactFile``."""
+    try:
+        payload = json.loads(json_path.read_text(encoding="utf-8"))
+    except Exception:
+        payload = None
+    context = payload.get("context") if isinstance(payload, dict) else None
+    if not isinstance(context, dict):
+        return IndexedArtifactFile(rel_path=rel_path, mtime_ns=mtime_ns, size=size, indexable=False)
+
+    def _text(value: object) -> str | None:
+        return value if isinstance(value, str) else None
+
+    return IndexedArtifactFile(
+        rel_path=rel_path,
+        mtime_ns=mtime_ns,
+        size=size,
+        indexable=True,
+        created_at=_text(payload.get("created_at")),
+        student_id=_text(context.get("student_id")),
+        attempt_file_id=_text(context.get("attempt_file_id")),
+        attempt_file_path=_text(context.get("attempt_file_path")),
+    )
+
+
+class MarkingArtifactIndexStore:
+    """Read/write the sidecar; every failure degrades to "no cached rows" / "not persisted"."""
+
+    def __init__(self, path: str | Path):
+        self.path = Path(path)
+
+    def _connect(self) -> sqlite3.Connection:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(self.path, timeout=5.0)
+        conn.row_factory = sqlite3.Row
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS meta (
+                key TEXT PRIMARY KEY,
+                value TEXT NOT NULL
+            )
+            """
+        )
+        row = conn.execute("SELECT value FROM meta WHERE key = 'format_version'").fetchone()
+        if row is None or row["value"] != SIDECAR_FORMAT_VERSION:
+            with conn:
+                conn.execute("DROP TABLE IF EXISTS artifact_files")
+                conn.execute(
+                    "INSERT OR REPLACE INTO meta(key, value) VALUES ('format_version', ?)",
+                    (SIDECAR_FORMAT_VERSION,),
+                )
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS artifact_files (
+                rel_path TEXT PRIMARY KEY,
+                mtime_ns INTEGER NOT NULL,
+                size INTEGER NOT NULL,
+                indexable INTEGER NOT NULL,
+                created_at TEXT,
+                student_id TEXT,
+                attempt_file_id TEXT,
+                attempt_file_path TEXT
+            )
+            """
+        )
+        return conn
+
+    def load(self) -> dict[str, IndexedArtifactFile]:
+        if not self.path.exists():
+            return {}
+        try:
+            conn = self._connect()
+        except (sqlite3.Error, OSError):
+            return {}
+        try:
+            rows = conn.execute("SELECT * FROM artifact_files").fetchall()
+        except sqlite3.Error:
+            return {}
+        finally:
+            conn.close()
+        return {
+            str(row["rel_path"]): IndexedArtifactFile(
+                rel_path=str(row["rel_path"]),
+                mtime_ns=int(row["mtime_ns"]),
+                size=int(row["size"]),
+                indexable=bool(row["indexable"]),
+                created_at=row["created_at"],
+                student_id=row["student_id"],
+                attempt_file_id=row["attempt_file_id"],
+                attempt_file_path=row["attempt_file_path"],
+            )
+            for row in rows
+        }
+
+    def apply(self, *, upserts: list[IndexedArtifactFile], deletes: list[str]) -> bool:
+        """Persist one refresh in a single transaction; ``False`` if the sidecar is unavailable."""
+        if not upserts and not deletes:
+            return True
+        try:
+            conn = self._connect()
+        except (sqlite3.Error, OSError):
+            return False
+        try:
+            with conn:
+                conn.executemany("DELETE FROM artifact_files WHERE rel_path = ?", [(rel,) for rel in deletes])
+                conn.executemany(
+                    """
+                    INSERT OR REPLACE INTO artifact_files(
+                        rel_path, mtime_ns, size, indexable, created_at, student_id, attempt_file_id, attempt_file_path
+                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                    """,
+                    [
+                        (
+                            item.rel_path,
+                            item.mtime_ns,
+                            item.size,
+                            1 if item.indexable else 0,
+                            item.created_at,
+                            item.student_id,
+                            item.attempt_file_id,
+                            item.attempt_file_path,
+                        )
+                        for item in upserts
+                    ],
+                )
+        except sqlite3.Error:
+            return False
+        finally:
+            conn.close()
+        return True
@@ -8,7 +8,14 @@ from pathlib import Path
 from typing import Literal
 
 from ai_study_buddy.marking.core.artifact_paths import parse_iso_datetime, slugify_student
-from ai_study_buddy.marking.core.path_privacy import resolve_marking_artifact_paths
+from ai_study_buddy.marking.core.artifact_index_store import (
+    IndexedArtifactFile,
+    MarkingArtifactIndexStore,
+    default_sidecar_path,
+    marking_artifact_index_cache_enabled,
+    scan_artifact_file,
+)
+from ai_study_buddy.marking.core.path_privacy import resolve_context_path_text, resolve_marking_artifact_paths
 from ai_study_buddy.pdf_file_manager.pdf_file_manager import NotFoundError, PdfFile, PdfFileManager
 
 MatchCondition = Literal["json_only", "json_and_report"]
@@ -24,7 +31,7 @@ class MarkingArtifactRef:
 
 @dataclass(frozen=True)
 class MarkingArtifactIndex:
-    """Pre-built marking artifact lookup (one filesystem scan under ``marking_results/``)."""
+    """Pre-built marking artifact lookup (one filesystem walk under ``marking_results/``)."""
 
     by_completion_id: dict[str, tuple[MarkingArtifactRef, ...]]
     by_completion_path: dict[str, tuple[MarkingArtifactRef, ...]]
@@ -34,51 +41,77 @@ def build_marking_artifact_index(
     *,
     context_root: str | Path,
     match_condition: MatchCondition = "json_only",
+    cache_path: str | Path | None = None,
 ) -> MarkingArtifactIndex:
-    """Index marking-result JSON files by completion id and normalized attempt path."""
+    """Index marking-result JSON files by completion id and normalized attempt path.
+
+    Per-file payload facts are kept in a SQLite sidecar (``cache_path``, default
+    ``<context_root>/.cache/marking_artifact_index.sqlite``) keyed by ``(mtime_ns, size)``;
+    only new or changed files are reparsed. ``MARKING_ARTIFACT_INDEX_CACHE=0`` disables it.
+    """
     root = Path(context_root)
     results_root = root / "marking_results"
     if not results_root.is_dir():
         return MarkingArtifactIndex(by_completion_id={}, by_completion_path={})
 
-    by_id: dict[str, list[tuple[float, str, MarkingArtifactRef]]] = defaultdict(list)
-    by_path: dict[str, list[tuple[float, str, MarkingArtifactRef]]] = defaultdict(list)
+    store = None
+    if marking_artifact_index_cache_enabled():
+        store = MarkingArtifactIndexStore(cache_path if cache_path is not None else default_sidecar_path(root))
+    cached = store.load() if store is not None else {}
 
+    files: list[tuple[str, Path, IndexedArtifactFile]] = []
+    upserts: list[IndexedArtifactFile] = []
+    seen: set[str] = set()
     for student_dir in results_root.iterdir():
         if not student_dir.is_dir():
             continue
         student_slug = student_dir.name
         for json_path in student_dir.rglob("*.json"):
-            payload = _load_json_safely(json_path)
-            if payload is None:
-                continue
-            context = payload.get("context")
-            if not isinstance(context, dict):
+            try:
+                st = json_path.stat()
+            except OSError:
                 continue
-            report_path = _build_report_path(
-                json_path=json_path,
-                context_root=root,
-                student_slug=student_slug,
-            )
-            if match_condition == "json_and_report" and not report_path.exists():
-                continue
-            ref = MarkingArtifactRef(marking_result_json=json_path, learning_report_md=report_path)
-            created_epoch = _as_utc_epoch(_parse_created_at(payload.get("created_at")))
-            sort_key = json_path.as_posix()
-
-            attempt_file_id = context.get("attempt_file_id")
-            if isinstance(attempt_file_id, str) and attempt_file_id.strip():
-                by_id[attempt_file_id.strip()].append((created_epoch, sort_key, ref))
-
-            attempt_file_path = context.get("attempt_file_path")
-            if isinstance(attempt_file_path, str) and attempt_file_path.strip():
-                resolved = resolve_marking_artifact_paths(payload)
-                resolved_context = resolved.get("context")
-                if isinstance(resolved_context, dict):
-                    resolved_path = resolved_context.get("attempt_file_path")
-                    if isinstance(resolved_path, str) and resolved_path.strip():
-                        norm = _normalize_path(resolved_path)
-                        by_path[norm].append((created_epoch, sort_key, ref))
+            rel_path = json_path.relative_to(results_root).as_posix()
+            seen.add(rel_path)
+            item = cached.get(rel_path)
+            if item is None or item.mtime_ns != st.st_mtime_ns or item.size != st.st_size:
+                item = scan_artifact_file(json_path, rel_path=rel_path, mtime_ns=st.st_mtime_ns, size=st.st_size)
+                upserts.append(item)
+            if item.indexable:
+                files.append((student_slug, json_path, item))
+    if store is not None:
+        store.apply(upserts=upserts, deletes=[rel for rel in cached if rel not in seen])
+
+    by_id: dict[str, list[tuple[float, str, MarkingArtifactRef]]] = defaultdict(list)
+    by_path: dict[str, list[tuple[float, str, MarkingArtifactRef]]] = defaultdict(list)
+    resolved_paths: dict[tuple[str | None, str], str] = {}
+
+    for student_slug, json_path, item in files:
+        report_path = _build_report_path(
+            json_path=json_path,
+            context_root=root,
+            student_slug=student_slug,
+        )
+        if match_condition == "json_and_report" and not report_path.exists():
+            continue
+        ref = MarkingArtifactRef(marking_result_json=json_path, learning_report_md=report_path)
+        created_epoch = _as_utc_epoch(_parse_created_at(item.created_at))
+        sort_key = json_path.as_posix()
+
+        attempt_file_id = item.attempt_file_id
+        if attempt_file_id is not None and attempt_file_id.strip():
+            by_id[attempt_file_id.strip()].append((created_epoch, sort_key, ref))
+
+        attempt_file_path = item.attempt_file_path
+        if attempt_file_path is not None and attempt_file_path.strip():
+            key = (item.student_id, attempt_file_path)
+            norm = resolved_paths.get(key)
+            if norm is None:
+                resolved_path = resolve_context_path_text(attempt_file_path, student_id=item.student_id)
+                norm = _normalize_path(resolved_path) if resolved_path.strip() else ""
+                resolved_paths[key] = norm
+            if norm:
+                by_path[norm].append((created_epoch, sort_key, ref))
 
     def _finalize(
         buckets: dict[str, list[tuple[float, str, MarkingArtifactRef]]],
@@ -10,6 +10,7 @@ from ai_study_buddy.marking.core.artifact_schema import (
     DEFAULT_MARKING_RESULT_VERSION,
     validate_marking_artifact_dict,
 )
+from ai_study_buddy.marking.core.change_journal import record_workflow_change
 from ai_study_buddy.marking.core.marking_time import to_marking_iso
 from ai_study_buddy.marking.core.partial_marking import infer_is_partial_from_raw_text
 from ai_study_buddy.marking.core.path_privacy import sanitize_marking_artifact_paths
@@ -160,6 +161,14 @@ def write_marking_artifact(
         actor=actor,
         metadata={"context_root": str(ctxp)},
     )
+    written_context = payload.get("context") if isinstance(payload.get("context"), dict) else {}
+    attempt_file_id = written_context.get("attempt_file_id")
+    record_workflow_change(
+        kind="marking_result",
+        context_root=ctxp,
+        artifact_stem=path.stem,
+        attempt_file_id=attempt_file_id if isinstance(attempt_file_id, str) and attempt_file_id.strip() else None,
+    )
     return path
 
 
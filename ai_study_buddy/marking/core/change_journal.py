@@ -0,0 +1,215 @@
+"""In-process change journal for marking results, review states, and amendments.
+
+Writers (``write_marking_artifact``, ``StudentReviewRepository.save_review_state`` /
+``save_amendment``) record one entry per successful write and bump a monotonic
+generation counter. Caches (e.g. the buddy_console inventory) remember the generation
+they were built at and ask for ``changes_since`` to refresh only affected entries.
+
+Writes made by other processes (batch marking scripts, agents) never reach this
+journal directly; ``WorkflowTreeWatcher`` diffs the on-disk JSON trees on demand
+and records what changed so both sources look the same to consumers.
+"""
+
+from __future__ import annotations
+
+from collections import deque
+from dataclasses import dataclass
+import json
+from pathlib import Path
+import threading
+from typing import Literal
+
+WorkflowChangeKind = Literal["marking_result", "student_review_state", "marking_amendment"]
+
+WORKFLOW_TREE_KINDS: dict[str, WorkflowChangeKind] = {
+    "marking_results": "marking_result",
+    "student_review_states": "student_review_state",
+    "marking_amendments": "marking_amendment",
+}
+
+DEFAULT_MAX_ENTRIES = 4096
+
+
+@dataclass(frozen=True)
+class WorkflowChange:
+    """One recorded write. ``artifact_stem`` is the marking-result JSON stem shared by all three trees."""
+
+    generation: int
+    kind: WorkflowChangeKind
+    context_root: str
+    artifact_stem: str
+    student_id: str | None = None
+    attempt_file_id: str | None = None
+
+
+def _context_root_key(context_root: str | Path) -> str:
+    return Path(context_root).expanduser().resolve().as_posix()
+
+
+class WorkflowChangeJournal:
+    """Bounded, thread-safe ring of recent workflow writes keyed by generation."""
+
+    def __init__(self, *, max_entries: int = DEFAULT_MAX_ENTRIES):
+        self._lock = threading.Lock()
+        self._generation = 0
+        self._entries: deque[WorkflowChange] = deque(maxlen=max(1, int(max_entries)))
+
+    @property
+    def generation(self) -> int:
+        with self._lock:
+            return self._generation
+
+    def record(
+        self,
+        *,
+        kind: WorkflowChangeKind,
+        context_root: str | Path,
+        artifact_stem: str,
+        student_id: str | None = None,
+        attempt_file_id: str | None = None,
+    ) -> int:
+        root_key = _context_root_key(context_root)
+        with self._lock:
+            self._generation += 1
+            self._entries.append(
+                WorkflowChange(
+                    generation=self._generation,
+                    kind=kind,
+                    context_root=root_key,
+                    artifact_stem=artifact_stem,
+                    student_id=student_id,
+                    attempt_file_id=attempt_file_id,
+                )
+            )
+            return self._generation
+
+    def changes_since(
+        self,
+        generation: int,
+        *,
+        context_root: str | Path | None = None,
+    ) -> tuple[WorkflowChange, ...] | None:
+        """Entries newer than ``generation`` (oldest first), or ``None`` if some were already evicted."""
+        root_key = _context_root_key(context_root) if context_root is not None else None
+        with self._lock:
+            if generation >= self._generation:
+                return ()
+            oldest = self._entries[0].generation if self._entries else self._generation + 1
+            if oldest > generation + 1:
+                return None
+            return tuple(
+                entry
+                for entry in self._entries
+                if entry.generation > generation and (root_key is None or entry.context_root == root_key)
+            )
+
+
+_JOURNAL = WorkflowChangeJournal()
+
+
+def workflow_change_journal() -> WorkflowChangeJournal:
+    """Process-wide journal shared by all writers and caches."""
+    return _JOURNAL
+
+
+def record_workflow_change(
+    *,
+    kind: WorkflowChangeKind,
+    context_root: str | Path,
+    artifact_stem: str,
+    student_id: str | None = None,
+    attempt_file_id: str | None = None,
+) -> int:
+    """Record one successful write in the process-wide journal; returns the new generation."""
+    return _JOURNAL.record(
+        kind=kind,
+        context_root=context_root,
+        artifact_stem=artifact_stem,
+        student_id=student_id,
+        attempt_file_id=attempt_file_id,
+    )
+
+
+def _attempt_file_id_from_marking_json(path: Path) -> str | None:
+    try:
+        payload = json.loads(path.read_text(encoding="utf-8"))
+    except Exception:
+        return None
+    context = payload.get("context") if isinstance(payload, dict) else None
+    if not isinstance(context, dict):
+        return None
+    raw = context.get("attempt_file_id")
+    return raw.strip() if isinstance(raw, str) and raw.strip() else None
+
+
+class WorkflowTreeWatcher:
+    """Polling watcher that turns out-of-process edits under ``context_root`` into journal entries.
+
+    The first ``poll()`` only records a baseline. Later polls compare ``(mtime_ns, size)`` per
+    JSON file and record one change per added, modified, or removed file.
+    """
+
+    def __init__(self, context_root: str | Path, *, journal: WorkflowChangeJournal | None = None):
+        self._context_root = Path(context_root)
+        self._journal = journal if journal is not None else _JOURNAL
+        self._snapshot: dict[Path, tuple[int, int]] | None = None
+        self._lock = threading.Lock()
+
+    def _scan(self) -> dict[Path, tuple[int, int]]:
+        out: dict[Path, tuple[int, int]] = {}
+        for sub in WORKFLOW_TREE_KINDS:
+            root = self._context_root / sub
+            if not root.is_dir():
+                continue
+            try:
+                for path in root.rglob("*.json"):
+                    try:
+                        st = path.stat()
+                    except OSError:
+                        continue
+                    out[path] = (st.st_mtime_ns, st.st_size)
+            except OSError:
+                continue
+        return out
+
+    def _record_path(self, path: Path, *, exists: bool) -> None:
+        try:
+            rel = path.relative_to(self._context_root)
+        except ValueError:
+            return
+        if not rel.parts:
+            return
+        kind = WORKFLOW_TREE_KINDS.get(rel.parts[0])
+        if kind is None:
+            return
+        student = rel.parts[1] if len(rel.parts) > 2 else None
+        attempt_file_id = None
+        if kind == "marking_result":
+            # marking_results/ uses student slugs, not ids; the payload carries the attempt id.
+            student = None
+            attempt_file_id = _attempt_file_id_from_marking_json(path) if exists else None
+        self._journal.record(
+            kind=kind,
+            context_root=self._context_root,
+            artifact_stem=path.stem,
+            student_id=student,
+            attempt_file_id=attempt_file_id,
+        )
+
+    def poll(self) -> int:
+        """Diff the trees against the last poll; returns the number of changes recorded."""
+        with self._lock:
+            current = self._scan()
+            previous = self._snapshot
+            self._snapshot = current
+            if previous is None:
+                return 0
+            changed = 0
+            for path, sig in current.items():
+                if previous.get(path) != sig:
+                    self._record_path(path, exists=True)
+                    changed += 1
+            for path in previous.keys() - current.keys():
+                self._record_path(path, exists=False)
+                changed += 1
+            return changed
@@ -56,6 +56,16 @@ def resolve_marking_artifact_paths(payload: dict[str, Any]) -> dict[str, Any]:
     return out
 
 
+def resolve_context_path_text(text: str, *, student_id: Any) -> str:
+    """Expand placeholder tokens in one context path field (see ``resolve_marking_artifact_paths``)."""
+    return _resolve_path_text(
+        text,
+        student_email=_resolve_student_email(student_id) if "<student_email>" in text else None,
+        goodnotes_root=resolve_goodnotes_root(),
+        daydreamedu_root=resolve_daydreamedu_root(),
+    )
+
+
 def _sanitize_path_text(text: str) -> str:
     sanitized = _GOODNOTES_PREFIX_RE.sub("GOODNOTES_ROOT", text)
     sanitized = _DAYDREAMEDU_PREFIX_RE.sub("DAYDREAMEDU_ROOT", sanitized)
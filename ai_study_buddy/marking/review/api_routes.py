@@ -3,7 +3,7 @@ from __future__ import annotations
 from pathlib import Path
 from typing import Any
 
-from fastapi import APIRouter, HTTPException, Query, Request
+from fastapi import APIRouter, HTTPException, Query
 from fastapi.responses import StreamingResponse
 
 from ai_study_buddy.pdf_file_manager.pdf_file_manager import PdfFileManager
@@ -126,18 +126,8 @@ def attempt_review_evidence(attempt_id: str) -> dict[str, Any]:
         raise HTTPException(status_code=404, detail="review evidence unavailable") from None
 
 
-def _invalidate_buddy_console_inventory_cache(request: Request) -> None:
-    try:
-        from ai_study_buddy.buddy_console.backend.inventory_api import invalidate_enriched_cache
-
-        invalidate_enriched_cache(request.app)
-    except ImportError:
-        pass
-
-
 @router.put("/api/student/attempts/{attempt_id}/review-state")
 def update_review_state(
-    request: Request,
     attempt_id: str,
     body: dict[str, Any],
 ) -> dict[str, Any]:
@@ -153,13 +143,11 @@ def update_review_state(
         )
     except ReviewStateWriteError as exc:
         raise HTTPException(status_code=400, detail=str(exc)) from None
-    _invalidate_buddy_console_inventory_cache(request)
     return result
 
 
 @router.put("/api/student/attempts/{attempt_id}/amendments")
 def update_amendments(
-    request: Request,
     attempt_id: str,
     body: dict[str, Any],
 ) -> dict[str, Any]:
@@ -199,7 +187,6 @@ def update_amendments(
         raise HTTPException(status_code=400, detail={"errors": exc.errors}) from None
     except AmendmentWriteError as exc:
         raise HTTPException(status_code=400, detail=str(exc)) from None
-    _invalidate_buddy_console_inventory_cache(request)
 
 
 @router.get("/api/student/attempts/{attempt_id}/questions/{result_id}/tutor-chat")
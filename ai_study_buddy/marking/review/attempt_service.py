@@ -15,7 +15,11 @@ from ai_study_buddy.marking.review.models import (
     parse_iso_timestamp,
 )
 from ai_study_buddy.marking.review.repository import StudentReviewRepository
-from ai_study_buddy.marking.review.workflow_flags import load_completion_marking_context
+from ai_study_buddy.marking.review.workflow_flags import (
+    CompletionMarkingPrefetch,
+    load_completion_marking_context,
+    prefetch_completion_marking_documents,
+)
 
 
 def _is_completion_candidate(file: PdfFile) -> bool:
@@ -38,12 +42,14 @@ def _attempt_summary(
     context_root: Path,
     manager: PdfFileManager,
     review_repo: StudentReviewRepository,
+    marking_prefetch: CompletionMarkingPrefetch | None = None,
 ) -> dict[str, Any]:
     marking_ctx = load_completion_marking_context(
         completion,
         context_root=context_root,
         manager=manager,
         review_repo=review_repo,
+        marking_prefetch=marking_prefetch,
     )
 
     context: dict[str, Any] = {}
@@ -124,6 +130,12 @@ def list_attempts_for_student(
 ) -> list[dict[str, Any]]:
     files = manager.find_files(student_id=student_id, is_template=False)
     attempts = [f for f in files if _is_completion_candidate(f)]
+    marking_prefetch = prefetch_completion_marking_documents(
+        attempts,
+        context_root=context_root,
+        manager=manager,
+        review_repo=review_repo,
+    )
 
     items = [
         _attempt_summary(
@@ -131,6 +143,7 @@ def list_attempts_for_student(
             context_root=context_root,
             manager=manager,
             review_repo=review_repo,
+            marking_prefetch=marking_prefetch,
         )
         for completion in attempts
     ]
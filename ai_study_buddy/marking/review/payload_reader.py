@@ -30,6 +30,38 @@ def read_marking_result_payload(*, marking_result_json: Path, context_root: Path
     return _read_json_payload(marking_result_json)
 
 
+def read_marking_result_payloads(
+    *,
+    marking_result_jsons: list[Path],
+    context_root: Path,
+) -> dict[Path, dict[str, Any] | None]:
+    """Bulk :func:`read_marking_result_payload`: one set-based DB read for every path."""
+
+    try:
+        from ai_study_buddy.learning_db.core.config import (
+            learning_db_read_fallback_filesystem,
+            learning_db_reads_enabled,
+        )
+        from ai_study_buddy.learning_db.read.read_documents import fetch_marking_artifacts_raw_json
+    except ImportError:
+        return {path: _read_json_payload(path) for path in marking_result_jsons}
+
+    if not learning_db_reads_enabled():
+        return {path: _read_json_payload(path) for path in marking_result_jsons}
+
+    rel_paths = {path: _relative_to_context(path, context_root) for path in marking_result_jsons}
+    fetched = fetch_marking_artifacts_raw_json([rel for rel in rel_paths.values() if rel is not None])
+    fallback_fs = learning_db_read_fallback_filesystem()
+    out: dict[Path, dict[str, Any] | None] = {}
+    for path, rel in rel_paths.items():
+        raw = fetched.get(rel) if rel is not None else None
+        if raw is not None:
+            out[path] = raw
+        else:
+            out[path] = _read_json_payload(path) if fallback_fs else None
+    return out
+
+
 def _relative_to_context(path: Path, context_root: Path) -> str | None:
     try:
         return path.resolve(strict=False).relative_to(context_root.resolve(strict=False)).as_posix()
@@ -1,9 +1,11 @@
 from __future__ import annotations
 
+from collections.abc import Iterable
 import json
 from pathlib import Path
 from typing import Any
 
+from ai_study_buddy.marking.core.change_journal import record_workflow_change
 from ai_study_buddy.marking.review.models import normalize_review_state
 
 
@@ -12,6 +14,57 @@ class StudentReviewRepository:
         self._context_root = context_root
         self._review_states_root = context_root / "student_review_states"
         self._marking_amendments_root = context_root / "marking_amendments"
+        # DB documents loaded by ``prefetch_db_documents`` (relative path -> raw doc, ``None`` = not in DB).
+        self._prefetched_review_states: dict[str, dict[str, Any] | None] = {}
+        self._prefetched_amendments: dict[str, dict[str, Any] | None] = {}
+
+    def prefetch_db_documents(
+        self,
+        *,
+        review_states: Iterable[tuple[str, str, str]] = (),
+        amendments: Iterable[tuple[str, str, str]] = (),
+    ) -> None:
+        """Bulk-load ``(student_id, subject_context, artifact_stem)`` review states / amendments from the DB.
+
+        Later ``load_*`` calls for these keys skip their per-call queries; DB misses still follow the
+        filesystem-fallback rules. No-op when ``LEARNING_DB_ENABLE_READS`` is off.
+        """
+        try:
+            from ai_study_buddy.learning_db.core.config import learning_db_reads_enabled
+            from ai_study_buddy.learning_db.read.read_documents import (
+                fetch_marking_amendments_raw_json,
+                fetch_student_review_states_raw_json,
+                relative_amendment_path,
+                relative_review_state_path,
+            )
+        except ImportError:
+            return
+        if not learning_db_reads_enabled():
+            return
+        review_rels = [relative_review_state_path(*key) for key in review_states]
+        if review_rels:
+            found = fetch_student_review_states_raw_json(review_rels)
+            for rel in review_rels:
+                self._prefetched_review_states[rel] = found.get(rel)
+        amendment_rels = [relative_amendment_path(*key) for key in amendments]
+        if amendment_rels:
+            found = fetch_marking_amendments_raw_json(amendment_rels)
+            for rel in amendment_rels:
+                self._prefetched_amendments[rel] = found.get(rel)
+
+    def _db_review_state(self, rel: str) -> dict[str, Any] | None:
+        if rel in self._prefetched_review_states:
+            return self._prefetched_review_states[rel]
+        from ai_study_buddy.learning_db.read.read_documents import fetch_student_review_state_raw_json
+
+        return fetch_student_review_state_raw_json(rel)
+
+    def _db_amendment(self, rel: str) -> dict[str, Any] | None:
+        if rel in self._prefetched_amendments:
+            return self._prefetched_amendments[rel]
+        from ai_study_buddy.learning_db.read.read_documents import fetch_marking_amendment_raw_json
+
+        return fetch_marking_amendment_raw_json(rel)
 
     def review_state_path(self, *, student_id: str, subject_context: str, artifact_stem: str) -> Path:
         return self._review_states_root / student_id / subject_context / f"{artifact_stem}.json"
@@ -23,10 +76,7 @@ class StudentReviewRepository:
         subject_context: str,
         artifact_stem: str,
     ) -> dict[str, Any]:
-        from ai_study_buddy.learning_db.read.read_documents import (
-            fetch_student_review_state_raw_json,
-            relative_review_state_path,
-        )
+        from ai_study_buddy.learning_db.read.read_documents import relative_review_state_path
 
         rel = relative_review_state_path(student_id, subject_context, artifact_stem)
         learns = False
@@ -43,7 +93,7 @@ class StudentReviewRepository:
             pass
 
         if learns:
-            raw = fetch_student_review_state_raw_json(rel)
+            raw = self._db_review_state(rel)
             if raw is not None:
                 return normalize_review_state(raw)
             if not fallback_fs:
@@ -84,6 +134,7 @@ class StudentReviewRepository:
         from ai_study_buddy.learning_db.cli.write_boundary_audit import audit_write_boundary_event
 
         rel_posix = relative_review_state_path(student_id, subject_context, artifact_stem)
+        self._prefetched_review_states.pop(rel_posix, None)
 
         try:
             if learning_db_json_export_enabled():
@@ -125,6 +176,12 @@ class StudentReviewRepository:
             actor=actor,
             metadata={"context_root": str(self._context_root)},
         )
+        record_workflow_change(
+            kind="student_review_state",
+            context_root=self._context_root,
+            artifact_stem=artifact_stem,
+            student_id=student_id,
+        )
         return path
 
     def load_raw_review_state(
@@ -134,10 +191,7 @@ class StudentReviewRepository:
         subject_context: str,
         artifact_stem: str,
     ) -> dict[str, Any] | None:
-        from ai_study_buddy.learning_db.read.read_documents import (
-            fetch_student_review_state_raw_json,
-            relative_review_state_path,
-        )
+        from ai_study_buddy.learning_db.read.read_documents import relative_review_state_path
 
         rel = relative_review_state_path(student_id, subject_context, artifact_stem)
         learns = False
@@ -154,7 +208,7 @@ class StudentReviewRepository:
             pass
 
         if learns:
-            raw = fetch_student_review_state_raw_json(rel)
+            raw = self._db_review_state(rel)
             if raw is not None:
                 return raw
             if not fallback_fs:
@@ -183,10 +237,7 @@ class StudentReviewRepository:
         subject_context: str,
         artifact_stem: str,
     ) -> dict[str, Any] | None:
-        from ai_study_buddy.learning_db.read.read_documents import (
-            fetch_marking_amendment_raw_json,
-            relative_amendment_path,
-        )
+        from ai_study_buddy.learning_db.read.read_documents import relative_amendment_path
 
         rel = relative_amendment_path(student_id, subject_context, artifact_stem)
         learns = False
@@ -203,7 +254,7 @@ class StudentReviewRepository:
             pass
 
         if learns:
-            raw = fetch_marking_amendment_raw_json(rel)
+            raw = self._db_amendment(rel)
             if raw is not None:
                 return raw
             if not fallback_fs:
@@ -244,6 +295,7 @@ class StudentReviewRepository:
         from ai_study_buddy.learning_db.cli.write_boundary_audit import audit_write_boundary_event
 
         rel_posix = relative_amendment_path(student_id, subject_context, artifact_stem)
+        self._prefetched_amendments.pop(rel_posix, None)
 
         try:
             if learning_db_json_export_enabled():
@@ -285,4 +337,10 @@ class StudentReviewRepository:
             actor=actor,
             metadata={"context_root": str(self._context_root)},
         )
+        record_workflow_change(
+            kind="marking_amendment",
+            context_root=self._context_root,
+            artifact_stem=artifact_stem,
+            student_id=student_id,
+        )
         return path
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterable
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
@@ -17,7 +18,10 @@ from ai_study_buddy.marking.review.amendment_service import (
     resolve_marking_result,
 )
 from ai_study_buddy.marking.review.models import infer_subject_context
-from ai_study_buddy.marking.review.payload_reader import read_marking_result_payload
+from ai_study_buddy.marking.review.payload_reader import (
+    read_marking_result_payload,
+    read_marking_result_payloads,
+)
 from ai_study_buddy.marking.review.repository import StudentReviewRepository
 from ai_study_buddy.pdf_file_manager.pdf_file_manager import PdfFile, PdfFileManager
 
@@ -41,6 +45,100 @@ class CompletionMarkingContext:
     resolved_summary: dict[str, Any] | None
 
 
+@dataclass(frozen=True)
+class CompletionMarkingPrefetch:
+    """Latest-artifact refs and marking payloads for many completions, loaded in bulk.
+
+    Built by :func:`prefetch_completion_marking_documents`, which also primes the review
+    repository with the matching review states and amendments.
+    """
+
+    refs_by_completion_id: dict[str, tuple[MarkingArtifactRef, ...]]
+    payloads: dict[Path, dict[str, Any] | None]
+
+
+@dataclass(frozen=True)
+class _ReviewDocumentKeys:
+    review_state: tuple[str, str, str] | None
+    amendment: tuple[str, str, str] | None
+    amendment_context: dict[str, Any] | None
+
+
+def _review_document_keys(
+    completion: PdfFile,
+    *,
+    payload: dict[str, Any],
+    latest_ref: MarkingArtifactRef,
+    context_root: Path,
+) -> _ReviewDocumentKeys:
+    subject_context = infer_subject_context(completion.subject)
+    ctx = payload.get("context") if isinstance(payload.get("context"), dict) else {}
+    if isinstance(ctx.get("subject_context"), str):
+        subject_context = ctx["subject_context"]
+    student_id = ctx.get("student_id") if isinstance(ctx.get("student_id"), str) else completion.student_id
+    if not (student_id and subject_context):
+        return _ReviewDocumentKeys(review_state=None, amendment=None, amendment_context=None)
+    artifact_stem = latest_ref.marking_result_json.stem
+    marking_result_path = latest_ref.marking_result_json.relative_to(context_root).as_posix()
+    amendment_context = build_amendment_context(
+        base_payload=payload,
+        attempt_id=completion.id,
+        marking_result_path=marking_result_path,
+        fallback_student_id=completion.student_id,
+    )
+    return _ReviewDocumentKeys(
+        review_state=(student_id, subject_context, artifact_stem),
+        amendment=(amendment_context["student_id"], amendment_context["subject_context"], artifact_stem),
+        amendment_context=amendment_context,
+    )
+
+
+def prefetch_completion_marking_documents(
+    completions: Iterable[PdfFile],
+    *,
+    context_root: Path,
+    manager: PdfFileManager,
+    review_repo: StudentReviewRepository,
+    artifact_index: MarkingArtifactIndex | None = None,
+) -> CompletionMarkingPrefetch:
+    """Bulk counterpart of the per-completion reads in :func:`load_completion_marking_context`.
+
+    Latest marking payloads come from one set-based DB read; their review states and
+    amendments are primed into *review_repo* the same way.
+    """
+    refs_by_completion_id: dict[str, tuple[MarkingArtifactRef, ...]] = {}
+    latest_by_completion: list[tuple[PdfFile, MarkingArtifactRef]] = []
+    for completion in completions:
+        refs = tuple(
+            find_marking_artifacts_for_attempt(
+                completion.id,
+                manager=manager,
+                context_root=context_root,
+                artifact_index=artifact_index,
+            )
+        )
+        refs_by_completion_id[completion.id] = refs
+        if refs:
+            latest_by_completion.append((completion, refs[0]))
+
+    payloads = read_marking_result_payloads(
+        marking_result_jsons=[ref.marking_result_json for _, ref in latest_by_completion],
+        context_root=context_root,
+    )
+    review_state_keys: list[tuple[str, str, str]] = []
+    amendment_keys: list[tuple[str, str, str]] = []
+    for completion, ref in latest_by_completion:
+        payload = payloads.get(ref.marking_result_json)
+        if not payload:
+            continue
+        keys = _review_document_keys(completion, payload=payload, latest_ref=ref, context_root=context_root)
+        if keys.review_state is not None and keys.amendment is not None:
+            review_state_keys.append(keys.review_state)
+            amendment_keys.append(keys.amendment)
+    review_repo.prefetch_db_documents(review_states=review_state_keys, amendments=amendment_keys)
+    return CompletionMarkingPrefetch(refs_by_completion_id=refs_by_completion_id, payloads=payloads)
+
+
 def load_completion_marking_context(
     completion: PdfFile,
     *,
@@ -48,14 +146,18 @@ def load_completion_marking_context(
     manager: PdfFileManager,
     review_repo: StudentReviewRepository,
     artifact_index: MarkingArtifactIndex | None = None,
+    marking_prefetch: CompletionMarkingPrefetch | None = None,
 ) -> CompletionMarkingContext:
     """Load marking artifact, review status, amendment presence, and resolved summary (if marked)."""
-    refs = find_marking_artifacts_for_attempt(
-        completion.id,
-        manager=manager,
-        context_root=context_root,
-        artifact_index=artifact_index,
-    )
+    if marking_prefetch is not None and completion.id in marking_prefetch.refs_by_completion_id:
+        refs = list(marking_prefetch.refs_by_completion_id[completion.id])
+    else:
+        refs = find_marking_artifacts_for_attempt(
+            completion.id,
+            manager=manager,
+            context_root=context_root,
+            artifact_index=artifact_index,
+        )
     if not refs:
         return CompletionMarkingContext(
             has_marking=False,
@@ -67,46 +169,37 @@ def load_completion_marking_context(
         )
 
     latest_ref = refs[0]
-    payload = read_marking_result_payload(
-        marking_result_json=latest_ref.marking_result_json,
-        context_root=context_root,
-    )
-    subject_context = infer_subject_context(completion.subject)
+    if marking_prefetch is not None and latest_ref.marking_result_json in marking_prefetch.payloads:
+        payload = marking_prefetch.payloads[latest_ref.marking_result_json]
+    else:
+        payload = read_marking_result_payload(
+            marking_result_json=latest_ref.marking_result_json,
+            context_root=context_root,
+        )
     review_status = "not_started"
     has_amendment = False
     resolved_summary: dict[str, Any] | None = None
 
     if payload:
-        ctx = payload.get("context") if isinstance(payload.get("context"), dict) else {}
-        if isinstance(ctx.get("subject_context"), str):
-            subject_context = ctx["subject_context"]
-        student_id = (
-            ctx.get("student_id") if isinstance(ctx.get("student_id"), str) else completion.student_id
-        )
-        if student_id and subject_context:
-            artifact_stem = latest_ref.marking_result_json.stem
+        keys = _review_document_keys(completion, payload=payload, latest_ref=latest_ref, context_root=context_root)
+        if keys.review_state is not None and keys.amendment is not None:
+            student_id, subject_context, artifact_stem = keys.review_state
             state = review_repo.load_review_state(
                 student_id=student_id,
                 subject_context=subject_context,
                 artifact_stem=artifact_stem,
             )
             review_status = state.get("review_status", "not_started")
-            marking_result_path = latest_ref.marking_result_json.relative_to(context_root).as_posix()
-            amendment_context = build_amendment_context(
-                base_payload=payload,
-                attempt_id=completion.id,
-                marking_result_path=marking_result_path,
-                fallback_student_id=completion.student_id,
-            )
+            amendment_student_id, amendment_subject_context, _ = keys.amendment
             raw_amendment = review_repo.load_raw_amendment(
-                student_id=amendment_context["student_id"],
-                subject_context=amendment_context["subject_context"],
+                student_id=amendment_student_id,
+                subject_context=amendment_subject_context,
                 artifact_stem=artifact_stem,
             )
             has_amendment = bool(raw_amendment)
             amendment_state = normalize_amendment_state(
                 raw_amendment,
-                context=amendment_context,
+                context=keys.amendment_context,
             )
             resolved_payload = resolve_marking_result(
                 base_payload=payload,
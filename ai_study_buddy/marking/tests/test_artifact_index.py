@@ -101,3 +101,53 @@ def test_find_marking_artifacts_uses_prebuilt_index(monkeypatch, tmp_path: Path)
     )
     assert len(refs) == 1
     assert refs[0].marking_result_json.name == "run.json"
+
+
+def test_index_sidecar_reparses_only_changed_files(monkeypatch, tmp_path: Path) -> None:
+    import os
+
+    from ai_study_buddy.marking.core import artifact_index_store
+
+    monkeypatch.delenv("MARKING_ARTIFACT_INDEX_CACHE", raising=False)
+    ctx = tmp_path / "context"
+    results = ctx / "marking_results" / "winston" / "singapore_primary_math"
+    _write_marking_json(results / "a.json", attempt_file_id="file-1")
+    _write_marking_json(results / "b.json", attempt_file_id="file-2")
+    (results / "broken.json").write_text("{not json", encoding="utf-8")
+
+    parsed: list[str] = []
+    real_scan = artifact_index_store.scan_artifact_file
+
+    def counting_scan(json_path: Path, **kwargs):
+        parsed.append(json_path.name)
+        return real_scan(json_path, **kwargs)
+
+    monkeypatch.setattr("ai_study_buddy.marking.core.artifact_lookup.scan_artifact_file", counting_scan)
+
+    cold = build_marking_artifact_index(context_root=ctx)
+    assert sorted(parsed) == ["a.json", "b.json", "broken.json"]
+    assert (ctx / ".cache" / "marking_artifact_index.sqlite").is_file()
+
+    parsed.clear()
+    warm = build_marking_artifact_index(context_root=ctx)
+    assert parsed == []
+    assert warm == cold
+
+    _write_marking_json(
+        results / "a.json",
+        attempt_file_id="file-3",
+        created_at="2026-05-03T10:00:00+08:00",
+    )
+    os.utime(results / "a.json", ns=(1, 1))
+    (results / "b.json").unlink()
+    _write_marking_json(results / "c.json", attempt_file_id="file-2")
+    parsed.clear()
+    refreshed = build_marking_artifact_index(context_root=ctx)
+    assert sorted(parsed) == ["a.json", "c.json"]
+    assert set(refreshed.by_completion_id) == {"file-2", "file-3"}
+    assert [r.marking_result_json.name for r in refreshed.by_completion_id["file-2"]] == ["c.json"]
+
+    monkeypatch.setenv("MARKING_ARTIFACT_INDEX_CACHE", "0")
+    parsed.clear()
+    assert build_marking_artifact_index(context_root=ctx) == refreshed
+    assert sorted(parsed) == ["a.json", "broken.json", "c.json"]
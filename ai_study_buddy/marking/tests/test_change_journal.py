@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from ai_study_buddy.marking.core.change_journal import (
+    WorkflowChangeJournal,
+    WorkflowTreeWatcher,
+    workflow_change_journal,
+)
+from ai_study_buddy.marking.review.repository import StudentReviewRepository
+
+
+def test_changes_since_filters_by_root_and_reports_eviction(tmp_path: Path):
+    journal = WorkflowChangeJournal(max_entries=2)
+    start = journal.generation
+    journal.record(kind="student_review_state", context_root=tmp_path / "a", artifact_stem="s1", student_id="emma")
+    journal.record(kind="marking_amendment", context_root=tmp_path / "b", artifact_stem="s2", student_id="emma")
+
+    only_a = journal.changes_since(start, context_root=tmp_path / "a")
+    assert [c.artifact_stem for c in only_a] == ["s1"]
+    assert journal.changes_since(journal.generation) == ()
+
+    journal.record(kind="marking_result", context_root=tmp_path / "a", artifact_stem="s3", attempt_file_id="f1")
+    # s1 has been evicted from the 2-entry ring, so callers must rebuild from scratch.
+    assert journal.changes_since(start) is None
+
+
+def test_save_review_state_bumps_process_journal(monkeypatch, tmp_path: Path):
+    monkeypatch.setenv("STUDY_BUDDY_DB_PATH", str(tmp_path / "study_buddy.db"))
+    journal = workflow_change_journal()
+    before = journal.generation
+    repo = StudentReviewRepository(context_root=tmp_path)
+    repo.save_review_state(
+        student_id="emma",
+        subject_context="singapore_primary_math",
+        artifact_stem="run-1",
+        payload={"review_status": "completed"},
+    )
+    changes = journal.changes_since(before, context_root=tmp_path)
+    assert [(c.kind, c.student_id, c.artifact_stem) for c in changes] == [
+        ("student_review_state", "emma", "run-1")
+    ]
+
+
+def test_tree_watcher_records_added_modified_and_removed_files(tmp_path: Path):
+    journal = WorkflowChangeJournal()
+    watcher = WorkflowTreeWatcher(tmp_path, journal=journal)
+    amendment = tmp_path / "marking_amendments" / "emma" / "math" / "run-1.json"
+    amendment.parent.mkdir(parents=True)
+    amendment.write_text("{}", encoding="utf-8")
+    assert watcher.poll() == 0  # baseline
+
+    result = tmp_path / "marking_results" / "emma" / "math" / "run-2.json"
+    result.parent.mkdir(parents=True)
+    result.write_text('{"context": {"attempt_file_id": "file-2"}}', encoding="utf-8")
+    amendment.unlink()
+    assert watcher.poll() == 2
+
+    changes = {c.artifact_stem: c for c in journal.changes_since(0)}
+    assert changes["run-2"].kind == "marking_result"
+    assert changes["run-2"].attempt_file_id == "file-2"
+    assert changes["run-1"].kind == "marking_amendment"
+    assert changes["run-1"].student_id == "emma"
+    assert watcher.poll() == 0
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
 import tempfile
+import threading
+import time
 from dataclasses import replace
 from pathlib import Path
 import json
@@ -36,6 +38,8 @@ from ai_study_buddy.marking.workflows.mark_student_work_multi_agent_v3 import (
     write_context_resolution_debug_artifact,
     plan_phase2_batches,
     plan_phase3_batches,
+    Phase3QuestionInput,
+    run_items_concurrently,
     find_latest_in_progress_bundle,
     collect_stale_partial_bundle_paths,
     write_run_state,
@@ -823,6 +827,64 @@ def test_phase_d_runtime_raises_after_retry_exhaustion(monkeypatch, tmp_path):
         )
 
 
+def test_run_items_concurrently_honours_cap_and_preserves_input_order():
+    lock = threading.Lock()
+    state = {"in_flight": 0, "peak": 0}
+
+    def _run(item):
+        with lock:
+            state["in_flight"] += 1
+            state["peak"] = max(state["peak"], state["in_flight"])
+        # Later items finish first so completion order differs from input order.
+        time.sleep(0.005 * (8 - item))
+        with lock:
+            state["in_flight"] -= 1
+        return item * 10
+
+    out = run_items_concurrently(list(range(8)), _run, max_concurrency=3)
+    assert [value for value, _timing in out] == [i * 10 for i in range(8)]
+    assert 1 < state["peak"] <= 3
+    assert all(timing.queue_wait_ms >= 0 and timing.duration_ms >= 0 for _value, timing in out)
+    assert out[-1][1].queue_wait_ms > 0
+
+
+def test_phase_e_runtime_runs_questions_concurrently_with_timed_trace(tmp_path):
+    qinputs = tuple(
+        Phase3QuestionInput(question_id=f"Q{i}", page_numbers=(i,), section_index=0) for i in range(1, 7)
+    )
+    barrier = threading.Barrier(3, timeout=5)
+    attempts: dict[str, int] = {}
+    lock = threading.Lock()
+
+    def _worker(qinput):
+        with lock:
+            attempts[qinput.question_id] = attempts.get(qinput.question_id, 0) + 1
+            first_try = attempts[qinput.question_id] == 1
+        if qinput.question_id in {"Q1", "Q2", "Q3"} and first_try:
+            # Only passes if three workers are in flight at the same time.
+            barrier.wait()
+        if qinput.question_id == "Q5" and first_try:
+            raise RuntimeError("transient failure")
+        return {"question_id": qinput.question_id, "outcome": "correct"}
+
+    p3 = execute_phase3_question_runtime(
+        question_inputs=qinputs,
+        worker=_worker,
+        bundle_root=tmp_path / "bundle",
+        max_concurrency=3,
+        max_retries=1,
+    )
+    assert [r["question_id"] for r in p3.remediated_rows] == [q.question_id for q in qinputs]
+    assert [r.attempts for r in p3.results] == [1, 1, 1, 1, 2, 1]
+    trace = json.loads(p3.trace_path.read_text(encoding="utf-8"))
+    assert trace["max_concurrency"] == 3
+    assert [q["question_id"] for q in trace["questions"]] == [q.question_id for q in qinputs]
+    for entry in trace["questions"]:
+        assert entry["started_at"] <= entry["finished_at"]
+        assert entry["queue_wait_ms"] >= 0
+        assert entry["duration_ms"] >= 0
+
+
 def _build_context_with_mapping(tmp_path: Path):
     mgr = PdfFileManager(db_path=str(tmp_path / "registry.db"))
     attempt_path = _touch(tmp_path / "GoodNotes" / "Math" / "_c_p6.math.wa1.2 (attempt).pdf")
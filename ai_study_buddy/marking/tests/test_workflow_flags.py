@@ -3,9 +3,11 @@
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
+from ai_study_buddy.marking.core.artifact_lookup import MarkingArtifactRef
 from ai_study_buddy.marking.review.workflow_flags import (
     completion_workflow_flags,
     load_completion_marking_context,
+    prefetch_completion_marking_documents,
 )
 
 
@@ -58,3 +60,50 @@ def test_load_completion_marking_context_marked(mock_read, mock_find) -> None:
     assert ctx.has_marking is True
     assert ctx.review_status == "in_progress"
     assert ctx.has_marking_amendment is False
+
+
+@patch("ai_study_buddy.marking.review.workflow_flags.find_marking_artifacts_for_attempt")
+@patch("ai_study_buddy.marking.review.workflow_flags.read_marking_result_payload")
+@patch("ai_study_buddy.marking.review.workflow_flags.read_marking_result_payloads")
+def test_prefetch_completion_marking_documents_feeds_load(mock_read_bulk, mock_read, mock_find) -> None:
+    ctx_root = Path("/ctx")
+    marked = MarkingArtifactRef(
+        marking_result_json=ctx_root / "marking_results/winston/singapore_primary_math/run.json",
+        learning_report_md=ctx_root / "learning_reports/winston/run.md",
+    )
+    mock_find.side_effect = lambda file_id, **_: [marked] if file_id == "file-1" else []
+    payload = {
+        "context": {"student_id": "winston", "subject_context": "singapore_primary_math"},
+        "summary": {"earned_marks": 1, "total_marks": 2},
+    }
+    mock_read_bulk.return_value = {marked.marking_result_json: payload}
+    review_repo = MagicMock()
+    review_repo.load_review_state.return_value = {"review_status": "completed"}
+    review_repo.load_raw_amendment.return_value = None
+    unmarked = _completion()
+    unmarked.id = "file-2"
+
+    prefetch = prefetch_completion_marking_documents(
+        [_completion(), unmarked],
+        context_root=ctx_root,
+        manager=MagicMock(),
+        review_repo=review_repo,
+    )
+    review_repo.prefetch_db_documents.assert_called_once_with(
+        review_states=[("winston", "singapore_primary_math", "run")],
+        amendments=[("winston", "singapore_primary_math", "run")],
+    )
+    mock_find.reset_mock()
+
+    ctx = load_completion_marking_context(
+        _completion(),
+        context_root=ctx_root,
+        manager=MagicMock(),
+        review_repo=review_repo,
+        marking_prefetch=prefetch,
+    )
+    assert ctx.payload is payload
+    assert ctx.review_status == "completed"
+    assert prefetch.refs_by_completion_id["file-2"] == ()
+    mock_find.assert_not_called()
+    mock_read.assert_not_called()
@@ -1,10 +1,12 @@
 from __future__ import annotations
 
 import json
+import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, replace
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Callable, Mapping, Sequence
+from typing import Any, Callable, Mapping, Sequence, TypeVar
 
 from ai_study_buddy.marking import (
     build_marking_run_paths,
@@ -54,6 +56,9 @@ V3_MODE_EMBEDDED_ANSWER = "embedded-answer"
 V3_MODE_TEACHER_ANNOTATED = "teacher-annotated"
 V3_MODE_REDO_PRACTICE = "redo-practice"
 
+_ItemT = TypeVar("_ItemT")
+_OutT = TypeVar("_OutT")
+
 
 class V3WorkflowError(ValueError):
     pass
@@ -762,6 +767,14 @@ class Phase2SectionInput:
     question_rows: tuple[Mapping[str, object], ...]
 
 
+@dataclass(frozen=True)
+class WorkerItemTiming:
+    started_at: str
+    finished_at: str
+    queue_wait_ms: int
+    duration_ms: int
+
+
 @dataclass(frozen=True)
 class Phase2SectionExecutionResult:
     section_index: int
@@ -769,6 +782,7 @@ class Phase2SectionExecutionResult:
     attempts: int
     succeeded: bool
     error: str | None = None
+    timing: WorkerItemTiming | None = None
 
 
 @dataclass(frozen=True)
@@ -793,6 +807,7 @@ class Phase3QuestionExecutionResult:
     attempts: int
     succeeded: bool
     error: str | None = None
+    timing: WorkerItemTiming | None = None
 
 
 @dataclass(frozen=True)
@@ -859,6 +874,71 @@ def build_phase2_section_inputs(authority: QuestionSectionsAuthority) -> tuple[P
     return tuple(out)
 
 
+def _utc_now_iso_millis() -> str:
+    return datetime.now(timezone.utc).isoformat(timespec="milliseconds").replace("+00:00", "Z")
+
+
+def _call_with_retries(call: Callable[[], _OutT], *, max_retries: int) -> tuple[bool, _OutT | None, int, str | None]:
+    attempts = 0
+    last_error: str | None = None
+    for _attempt in range(max_retries + 1):
+        attempts += 1
+        try:
+            return True, call(), attempts, None
+        except Exception as exc:
+            last_error = str(exc)
+    return False, None, attempts, last_error
+
+
+def run_items_concurrently(
+    items: Sequence[_ItemT],
+    run_item: Callable[[_ItemT], _OutT],
+    *,
+    max_concurrency: int = 5,
+) -> tuple[tuple[_OutT, WorkerItemTiming], ...]:
+    """Run ``run_item`` over ``items`` on at most ``max_concurrency`` threads.
+
+    Results are returned in input order regardless of completion order. Each
+    result carries wall-clock start/end timestamps and the time the item spent
+    queued behind earlier items.
+    """
+    if not items:
+        return ()
+    cap = max(1, int(max_concurrency))
+    enqueued = time.monotonic()
+
+    def _timed(item: _ItemT) -> tuple[_OutT, WorkerItemTiming]:
+        started = time.monotonic()
+        started_at = _utc_now_iso_millis()
+        out = run_item(item)
+        finished = time.monotonic()
+        timing = WorkerItemTiming(
+            started_at=started_at,
+            finished_at=_utc_now_iso_millis(),
+            queue_wait_ms=int(round((started - enqueued) * 1000)),
+            duration_ms=int(round((finished - started) * 1000)),
+        )
+        return out, timing
+
+    workers = min(cap, len(items))
+    if workers == 1:
+        return tuple(_timed(item) for item in items)
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="v3-worker") as pool:
+        futures = [pool.submit(_timed, item) for item in items]
+        return tuple(f.result() for f in futures)
+
+
+def _timing_trace_fields(timing: WorkerItemTiming | None) -> dict[str, Any]:
+    if timing is None:
+        return {}
+    return {
+        "started_at": timing.started_at,
+        "finished_at": timing.finished_at,
+        "queue_wait_ms": timing.queue_wait_ms,
+        "duration_ms": timing.duration_ms,
+    }
+
+
 def plan_phase2_batches(
     section_inputs: Sequence[Phase2SectionInput],
     *,
@@ -928,11 +1008,12 @@ def write_phase2_execution_trace(
     *,
     bundle_root: Path,
     section_results: Sequence[Phase2SectionExecutionResult],
+    max_concurrency: int | None = None,
 ) -> Path:
     debug_dir = bundle_root / "debug"
     debug_dir.mkdir(parents=True, exist_ok=True)
     out = debug_dir / "phase2_section_execution_trace.json"
-    payload = {
+    payload: dict[str, Any] = {
         "sections": [
             {
                 "section_index": r.section_index,
@@ -940,10 +1021,13 @@ def write_phase2_execution_trace(
                 "attempts": r.attempts,
                 "error": r.error,
                 "row_count": len(r.rows),
+                **_timing_trace_fields(r.timing),
             }
             for r in section_results
         ]
     }
+    if max_concurrency is not None:
+        payload["max_concurrency"] = max_concurrency
     out.write_text(json.dumps(payload, indent=2, ensure_ascii=True) + "\n", encoding="utf-8")
     return out
 
@@ -958,25 +1042,19 @@ def execute_phase2_section_runtime(
     max_concurrency: int = 5,
     max_retries: int = 1,
 ) -> Phase2ExecutionSummary:
-    _ = plan_phase2_batches(section_inputs, max_concurrency=max_concurrency)
+    def _run_section(section_input: Phase2SectionInput) -> tuple[bool, tuple[dict[str, Any], ...] | None, int, str | None]:
+        return _call_with_retries(
+            lambda: tuple(dict(r) for r in worker(section_input)),
+            max_retries=max_retries,
+        )
+
+    cap = max(1, int(max_concurrency))
+    outcomes = run_items_concurrently(section_inputs, _run_section, max_concurrency=cap)
     successful: dict[int, tuple[dict[str, Any], ...]] = {}
     results: list[Phase2SectionExecutionResult] = []
-
-    for section_input in section_inputs:
-        last_error: str | None = None
-        rows: tuple[dict[str, Any], ...] = ()
-        attempts = 0
-        for _attempt in range(max_retries + 1):
-            attempts += 1
-            try:
-                produced = worker(section_input)
-                rows = tuple(dict(r) for r in produced)
-                successful[section_input.section_index] = rows
-                last_error = None
-                break
-            except Exception as exc:
-                last_error = str(exc)
-        succeeded = section_input.section_index in successful
+    for section_input, ((succeeded, rows, attempts, last_error), timing) in zip(section_inputs, outcomes):
+        if succeeded:
+            successful[section_input.section_index] = rows or ()
         results.append(
             Phase2SectionExecutionResult(
                 section_index=section_input.section_index,
@@ -984,6 +1062,7 @@ def execute_phase2_section_runtime(
                 attempts=attempts,
                 succeeded=succeeded,
                 error=last_error if not succeeded else None,
+                timing=timing,
             )
         )
 
@@ -994,7 +1073,7 @@ def execute_phase2_section_runtime(
 
     aggregated = aggregate_phase2_section_rows(successful, authority=authority)
     retry_targets = build_phase2_retry_targets(aggregated, english_required=english_required)
-    trace = write_phase2_execution_trace(bundle_root=bundle_root, section_results=results)
+    trace = write_phase2_execution_trace(bundle_root=bundle_root, section_results=results, max_concurrency=cap)
     return Phase2ExecutionSummary(
         aggregated_rows=aggregated,
         retry_targets=retry_targets,
@@ -1075,21 +1154,25 @@ def write_phase3_execution_trace(
     *,
     bundle_root: Path,
     results: Sequence[Phase3QuestionExecutionResult],
+    max_concurrency: int | None = None,
 ) -> Path:
     debug_dir = bundle_root / "debug"
     debug_dir.mkdir(parents=True, exist_ok=True)
     out = debug_dir / "phase3_question_execution_trace.json"
-    payload = {
+    payload: dict[str, Any] = {
         "questions": [
             {
                 "question_id": r.question_id,
                 "succeeded": r.succeeded,
                 "attempts": r.attempts,
                 "error": r.error,
+                **_timing_trace_fields(r.timing),
             }
             for r in results
         ]
     }
+    if max_concurrency is not None:
+        payload["max_concurrency"] = max_concurrency
     out.write_text(json.dumps(payload, indent=2, ensure_ascii=True) + "\n", encoding="utf-8")
     return out
 
@@ -1102,24 +1185,21 @@ def execute_phase3_question_runtime(
     max_concurrency: int = 5,
     max_retries: int = 1,
 ) -> Phase3ExecutionSummary:
-    _ = plan_phase3_batches(question_inputs, max_concurrency=max_concurrency)
+    def _run_question(qinput: Phase3QuestionInput) -> tuple[bool, dict[str, Any] | None, int, str | None]:
+        def _call() -> dict[str, Any]:
+            row = dict(worker(qinput))
+            row["question_id"] = row.get("question_id") or qinput.question_id
+            return row
+
+        return _call_with_retries(_call, max_retries=max_retries)
+
+    cap = max(1, int(max_concurrency))
+    outcomes = run_items_concurrently(question_inputs, _run_question, max_concurrency=cap)
     successes: dict[str, dict[str, Any]] = {}
     results: list[Phase3QuestionExecutionResult] = []
-    for qinput in question_inputs:
-        attempts = 0
-        last_error: str | None = None
-        for _attempt in range(max_retries + 1):
-            attempts += 1
-            try:
-                row = dict(worker(qinput))
-                qid = row.get("question_id") or qinput.question_id
-                row["question_id"] = qid
-                successes[qinput.question_id] = row
-                last_error = None
-                break
-            except Exception as exc:
-                last_error = str(exc)
-        succeeded = qinput.question_id in successes
+    for qinput, ((succeeded, row, attempts, last_error), timing) in zip(question_inputs, outcomes):
+        if succeeded and row is not None:
+            successes[qinput.question_id] = row
         results.append(
             Phase3QuestionExecutionResult(
                 question_id=qinput.question_id,
@@ -1127,6 +1207,7 @@ def execute_phase3_question_runtime(
                 attempts=attempts,
                 succeeded=succeeded,
                 error=last_error if not succeeded else None,
+                timing=timing,
             )
         )
     failed = [r for r in results if not r.succeeded]
@@ -1134,7 +1215,7 @@ def execute_phase3_question_runtime(
         detail = ", ".join(f"{r.question_id}: {r.error or 'unknown'}" for r in failed)
         raise V3WorkflowError(f"Phase 3 runtime failed after retries: {detail}")
     ordered_rows = tuple(successes[q.question_id] for q in question_inputs if q.question_id in successes)
-    trace = write_phase3_execution_trace(bundle_root=bundle_root, results=results)
+    trace = write_phase3_execution_trace(bundle_root=bundle_root, results=results, max_concurrency=cap)
     return Phase3ExecutionSummary(remediated_rows=ordered_rows, results=tuple(results), trace_path=trace)
 
 
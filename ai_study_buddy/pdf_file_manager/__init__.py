@@ -27,7 +27,12 @@ from .pdf_file_manager import (
     Student,
     SuggestedGroup,
 )
-from .goodnotes_metadata import GoodnotesDocumentMatch, GoodnotesDocumentTimestamps
+from .goodnotes_metadata import (
+    GoodnotesDocumentMatch,
+    GoodnotesDocumentTimestamps,
+    GoodnotesMatchRequest,
+    GoodnotesMetadataIndex,
+)
 
 __all__ = [
     "AlreadyRegisteredError",
@@ -42,6 +47,8 @@ __all__ = [
     "GoodNotesTemplateLinkOutcome",
     "GoodnotesDocumentMatch",
     "GoodnotesDocumentTimestamps",
+    "GoodnotesMatchRequest",
+    "GoodnotesMetadataIndex",
     "InferCompletionDatesReport",
     "InvalidMetadataError",
     "NotFoundError",
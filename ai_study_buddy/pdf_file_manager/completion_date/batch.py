@@ -0,0 +1,286 @@
+# Bulk completion-date inference over a cohort (proposal 17 matrix, backfill-sized).
+
+from __future__ import annotations
+
+import json
+import logging
+import sqlite3
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from ..goodnotes_metadata import (
+    GoodnotesDocumentMatch,
+    GoodnotesMatchRequest,
+    get_goodnotes_document_matches,
+)
+from .core import InferCompletionDatesReport, merge_infer_completion_dates_report
+from .drive_modified import (
+    DRIVE_MODIFIED_CONFIDENCE,
+    DRIVE_MODIFIED_SOURCE,
+    infer_completion_date_from_drive_modified,
+)
+from .filename_term import (
+    FILENAME_TERM_CONFIDENCE,
+    FILENAME_TERM_SOURCE,
+    infer_completion_date_from_filename_term,
+)
+from .page1 import (
+    PAGE1_SOURCE,
+    Page1InspectionResult,
+    default_page1_work_dir,
+    inventory_root_from_path,
+    load_page1_inspection_result,
+    prepare_page1_inspection_result,
+)
+
+if TYPE_CHECKING:
+    from ..pdf_file_manager import PdfFile, PdfFileManager
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_INFERENCE_WORKERS = 8
+_GOODNOTES_SOURCES = frozenset({"goodnotes_last_modified", "goodnotes_updated_at"})
+
+
+@dataclass(frozen=True)
+class _Lookups:
+    """Per-file lookups: cached page-1 JSON (worker pool) and the bulk GoodNotes match."""
+
+    page1: Page1InspectionResult | None = None
+    goodnotes: GoodnotesDocumentMatch | None = None
+    page1_seconds: float = 0.0
+
+
+@dataclass(frozen=True)
+class _PlannedWrite:
+    pdf: PdfFile
+    completion_date: str
+    source: str
+    confidence: str | None
+    inference_model: str | None
+    source_detail: dict[str, Any] | None
+
+
+def _lookup(
+    pdf: PdfFile,
+    *,
+    work_dir: Path | None,
+    goodnotes: GoodnotesDocumentMatch | None,
+) -> _Lookups:
+    page1 = None
+    page1_seconds = 0.0
+    if work_dir is not None:
+        started = time.perf_counter()
+        page1 = load_page1_inspection_result(work_dir, pdf.id)
+        page1_seconds = time.perf_counter() - started
+    return _Lookups(page1, goodnotes, page1_seconds)
+
+
+def _resolve(
+    pdf: PdfFile,
+    lookups: _Lookups,
+    *,
+    active: frozenset[str],
+    existing: sqlite3.Row | None,
+    force: bool,
+    timings: dict[str, float],
+) -> _PlannedWrite | None:
+    """Walk handwritten_page1 → goodnotes → filename_term → drive_modified in memory."""
+    inventory_root = inventory_root_from_path(str(pdf.path))
+
+    if lookups.page1 is not None:
+        started = time.perf_counter()
+        # Same rule as apply_page1_inspection_result: page-1 replaces a row only with force.
+        prepared = prepare_page1_inspection_result(lookups.page1, pdf)
+        timings[PAGE1_SOURCE] = timings.get(PAGE1_SOURCE, 0.0) + time.perf_counter() - started
+        if prepared is not None and (existing is None or force):
+            return _PlannedWrite(
+                pdf,
+                prepared.completion_date,
+                PAGE1_SOURCE,
+                prepared.confidence,
+                prepared.inference_model,
+                prepared.source_detail,
+            )
+
+    if lookups.goodnotes is not None:
+        from .goodnotes import infer_completion_date_from_goodnotes_match
+
+        inf = infer_completion_date_from_goodnotes_match(lookups.goodnotes)
+        if inf is not None and inf.source in active:
+            return _PlannedWrite(pdf, inf.completion_date, inf.source, inf.confidence, None, inf.source_detail)
+
+    if inventory_root == "d_root" and FILENAME_TERM_SOURCE in active:
+        started = time.perf_counter()
+        inf = infer_completion_date_from_filename_term(
+            pdf.normal_name or Path(pdf.name).stem,
+            student_id=pdf.student_id,
+            path=pdf.path,
+            name=pdf.name,
+        )
+        timings[FILENAME_TERM_SOURCE] = timings.get(FILENAME_TERM_SOURCE, 0.0) + time.perf_counter() - started
+        if inf is not None:
+            return _PlannedWrite(
+                pdf, inf.completion_date, FILENAME_TERM_SOURCE, FILENAME_TERM_CONFIDENCE, None, inf.source_detail
+            )
+
+    if DRIVE_MODIFIED_SOURCE in active:
+        started = time.perf_counter()
+        drive_inf = infer_completion_date_from_drive_modified(
+            pdf.path,
+            doc_type=pdf.doc_type,
+            inventory_root=inventory_root,
+        )
+        timings[DRIVE_MODIFIED_SOURCE] = timings.get(DRIVE_MODIFIED_SOURCE, 0.0) + time.perf_counter() - started
+        if drive_inf is not None:
+            return _PlannedWrite(
+                pdf,
+                drive_inf.completion_date,
+                DRIVE_MODIFIED_SOURCE,
+                DRIVE_MODIFIED_CONFIDENCE,
+                None,
+                drive_inf.source_detail,
+            )
+    return None
+
+
+def infer_completion_dates_bulk(
+    mgr: PdfFileManager,
+    candidates: list[PdfFile],
+    *,
+    active: frozenset[str],
+    work_dir: str | Path | None = None,
+    dry_run: bool = False,
+    force: bool = False,
+    force_manual: bool = False,
+    workers: int = DEFAULT_INFERENCE_WORKERS,
+) -> InferCompletionDatesReport:
+    """Infer completion dates for ``candidates`` in four stages.
+
+    1. **load** – existing ``file_completion_dates`` rows (and GoodNotes raw-source stems)
+       in chunked ``IN (...)`` queries; apply the manual/force skip rules.
+    2. **lookup** – every g_root file is matched against one in-memory
+       ``GoodnotesMetadataIndex`` in a single bulk call; cached page-1 JSON reads fan out
+       over a thread pool of ``workers``.
+    3. **resolve** – per file, in cohort order, walk the same priority chain as
+       ``infer_completion_date_for_file``; filename terms and drive mtimes are computed here.
+    4. **write** – every upsert and its operation_log rows in one transaction.
+
+    ``report.timings`` holds wall seconds per stage and per source; ``written_by_source``
+    counts rows written per source.
+    """
+    report = InferCompletionDatesReport()
+    timings: dict[str, float] = {}
+    written_by_source: dict[str, int] = {}
+
+    started = time.perf_counter()
+    existing_rows = mgr._completion_date_rows_for_files([pdf.id for pdf in candidates])
+    todo: list[PdfFile] = []
+    skipped_manual = skipped_existing = still_undated = 0
+    for pdf in candidates:
+        existing = existing_rows.get(pdf.id)
+        if existing is not None:
+            if existing["source"] == "manual" and not force_manual:
+                skipped_manual += 1
+                continue
+            if existing["source"] != "manual" and not force:
+                skipped_existing += 1
+                continue
+        if dry_run:
+            if existing is None:
+                still_undated += 1
+            continue
+        todo.append(pdf)
+
+    use_goodnotes = bool(active & _GOODNOTES_SOURCES)
+    goodnotes_pdfs = [
+        pdf for pdf in todo if use_goodnotes and inventory_root_from_path(str(pdf.path)) == "g_root"
+    ]
+    raw_stems = mgr._raw_source_stems_for_files([pdf.id for pdf in goodnotes_pdfs]) if goodnotes_pdfs else {}
+    timings["load"] = time.perf_counter() - started
+
+    started = time.perf_counter()
+    goodnotes_matches: dict[str, GoodnotesDocumentMatch] = {}
+    if goodnotes_pdfs:
+        matches = get_goodnotes_document_matches(
+            [
+                GoodnotesMatchRequest(pdf.id, pdf.path, pdf.file_type, raw_stems.get(pdf.id, ()))
+                for pdf in goodnotes_pdfs
+            ]
+        )
+        goodnotes_matches = {match.file_id: match for match in matches}
+        timings["goodnotes"] = time.perf_counter() - started
+
+    page1_dir: Path | None = None
+    if PAGE1_SOURCE in active:
+        page1_dir = Path(work_dir) if work_dir is not None else default_page1_work_dir()
+
+    def lookup(pdf: PdfFile) -> _Lookups | Exception:
+        try:
+            return _lookup(pdf, work_dir=page1_dir, goodnotes=goodnotes_matches.get(pdf.id))
+        except Exception as exc:  # noqa: BLE001 - counted as failed, like the per-file path
+            return exc
+
+    if workers > 1 and len(todo) > 1:
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            lookups = list(pool.map(lookup, todo))
+    else:
+        lookups = [lookup(pdf) for pdf in todo]
+    timings["lookup"] = time.perf_counter() - started
+
+    started = time.perf_counter()
+    failed = 0
+    plans: list[_PlannedWrite] = []
+    for pdf, found in zip(todo, lookups):
+        if isinstance(found, Exception):
+            logger.error("completion-date inference failed for %s", pdf.id, exc_info=found)
+            failed += 1
+            continue
+        timings[PAGE1_SOURCE] = timings.get(PAGE1_SOURCE, 0.0) + found.page1_seconds
+        plan = _resolve(
+            pdf,
+            found,
+            active=active,
+            existing=existing_rows.get(pdf.id),
+            force=force,
+            timings=timings,
+        )
+        if plan is not None:
+            plans.append(plan)
+        elif pdf.id in existing_rows:
+            skipped_existing += 1
+        else:
+            still_undated += 1
+    timings["resolve"] = time.perf_counter() - started
+
+    started = time.perf_counter()
+    written = mgr._write_inferred_completion_dates(plans, existing_rows, written_by_source)
+    failed += len(plans) - written
+    timings["write"] = time.perf_counter() - started
+
+    return merge_infer_completion_dates_report(
+        report,
+        processed=len(candidates),
+        written=written,
+        skipped_existing=skipped_existing,
+        skipped_manual=skipped_manual,
+        failed=failed,
+        still_undated=still_undated,
+        written_by_source=written_by_source,
+        timings={key: round(value, 4) for key, value in timings.items()},
+    )
+
+
+def page1_inference_log_state(plan: _PlannedWrite) -> str:
+    """after_state for the extra ``infer_completion_date`` log row page-1 writes carry."""
+    return json.dumps(
+        {
+            "method": PAGE1_SOURCE,
+            "completion_date": plan.completion_date,
+            "confidence": plan.confidence,
+            "inference_model": plan.inference_model,
+        }
+    )
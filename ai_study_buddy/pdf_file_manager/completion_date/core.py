@@ -3,8 +3,9 @@
 from __future__ import annotations
 
 import re
-from dataclasses import dataclass
+from dataclasses import dataclass, field, replace
 from datetime import datetime
+from typing import Any
 
 COMPLETION_DATE_SOURCES = frozenset(
     {
@@ -60,24 +61,16 @@ class InferCompletionDatesReport:
     skipped_no_date: int = 0
     failed: int = 0
     still_undated: int = 0
+    # Bulk engine only: rows written per source, and wall seconds per stage / source lookup.
+    written_by_source: dict[str, int] = field(default_factory=dict)
+    timings: dict[str, float] = field(default_factory=dict)
 
 
 def merge_infer_completion_dates_report(
-    report: InferCompletionDatesReport, **kwargs: int
+    report: InferCompletionDatesReport, **kwargs: Any
 ) -> InferCompletionDatesReport:
     """Return a new report with selected counters incremented or replaced."""
-    data = {
-        "processed": report.processed,
-        "written": report.written,
-        "skipped_existing": report.skipped_existing,
-        "skipped_manual": report.skipped_manual,
-        "skipped_no_cached_result": report.skipped_no_cached_result,
-        "skipped_no_date": report.skipped_no_date,
-        "failed": report.failed,
-        "still_undated": report.still_undated,
-    }
-    data.update(kwargs)
-    return InferCompletionDatesReport(**data)
+    return replace(report, **kwargs)
 
 
 def normalize_completion_date(completion_date: str) -> str:
@@ -15,10 +15,12 @@ from .core import (
     check_completion_date_school_year,
     expected_school_year,
     infer_primary_level_from_path,
+    merge_infer_completion_dates_report,
     normalize_completion_date,
     normalize_completion_date_confidence,
     normalize_inference_model,
 )
+from .render_cache import RENDER_CACHE_DIR_NAME, PageRenderCache, RenderedPages, materialize_png
 
 if TYPE_CHECKING:
     from .pdf_file_manager import PdfFile, PdfFileManager
@@ -36,6 +38,9 @@ PAGE1_SOURCE = "handwritten_page1"
 REASON_NO_DATE_PAGE1 = "no_date_on_page_1"
 REASON_NO_DATE_PAGES_1_AND_2 = "no_date_on_pages_1_or_2"
 
+DEFAULT_RENDER_WORKERS = 4
+_BATCH_PAGE_INDICES = (0, 1)
+
 _D_ROOT_MARKER = "/DaydreamEdu/"
 _G_ROOT_MARKER = "/GoodNotes/"
 
@@ -357,8 +362,17 @@ def prepare_page1_batch(
     dpi_scale: float = 2.0,
     dry_run: bool = False,
     limit: int | None = None,
+    cache_dir: Path | None = None,
+    render_workers: int = DEFAULT_RENDER_WORKERS,
 ) -> Page1BatchManifest:
-    """Build manifest and render page-1 (and page-2 when present) PNGs for the d_root Phase 2 cohort."""
+    """Build manifest and render page-1 (and page-2 when present) PNGs for the d_root Phase 2 cohort.
+
+    Renders go through a content-addressed cache (default ``<work_dir>/render_cache``) keyed by
+    PDF sha256 and ``dpi_scale``; only misses are rendered, both pages from one open document,
+    over a process pool of ``render_workers``. ``images/<file_id>/`` entries are hard links into
+    the cache, so a rerun over unchanged PDFs renders nothing. ``counts`` reports
+    ``cache_hits`` and ``rendered`` (distinct PDFs rendered this run).
+    """
     work_dir = work_dir.resolve()
     work_dir.mkdir(parents=True, exist_ok=True)
     skip = skip_doc_types or frozenset()
@@ -373,6 +387,30 @@ def prepare_page1_batch(
     if limit is not None:
         cohort = cohort[: max(0, limit)]
 
+    cache = PageRenderCache(Path(cache_dir) if cache_dir is not None else work_dir / RENDER_CACHE_DIR_NAME)
+    digests: dict[str, str] = {}
+    rendered: dict[str, RenderedPages] = {}
+    misses: list[tuple[str, str]] = []
+    for pdf in cohort:
+        try:
+            sha = cache.content_digest(pdf.path)
+        except OSError:
+            continue
+        digests[pdf.id] = sha
+        cached = cache.get(sha, dpi_scale, _BATCH_PAGE_INDICES)
+        if cached is not None:
+            rendered[sha] = cached
+        else:
+            misses.append((sha, str(pdf.path)))
+    cache.save_digests()
+    cache_hits = sum(1 for pdf_id in digests if digests[pdf_id] in rendered)
+    if misses and not dry_run:
+        for sha, outcome in cache.render_missing(
+            misses, dpi_scale, _BATCH_PAGE_INDICES, workers=render_workers
+        ).items():
+            if isinstance(outcome, RenderedPages):
+                rendered[sha] = outcome
+
     items: list[Page1BatchManifestItem] = []
     for pdf in cohort:
         image_path = page1_image_path_for(work_dir, pdf.id)
@@ -381,17 +419,20 @@ def prepare_page1_batch(
             "deprioritized" if pdf.doc_type == "book" else "priority"
         )
         existing = mgr.get_completion_date(pdf.id)
-        try:
+        pages = rendered.get(digests.get(pdf.id, ""))
+        if pages is not None:
             if not dry_run:
-                render_page1_png(pdf.path, image_path, dpi_scale=dpi_scale)
-            if pdf_page_count(pdf.path) >= 2:
+                materialize_png(pages.pages[0], image_path)
+            if pages.page_count >= 2:
                 page2_path = page2_image_path_for(work_dir, pdf.id)
                 if not dry_run:
-                    render_page_png(
-                        pdf.path, page2_path, page_index=1, dpi_scale=dpi_scale
-                    )
-        except (RuntimeError, ValueError, FileNotFoundError):
-            page2_path = None
+                    materialize_png(pages.pages[1], page2_path)
+        elif dry_run and pdf.id in digests:
+            try:
+                if pdf_page_count(pdf.path) >= 2:
+                    page2_path = page2_image_path_for(work_dir, pdf.id)
+            except (RuntimeError, ValueError, FileNotFoundError):
+                page2_path = None
 
         level = infer_primary_level_from_path(pdf.path, name=pdf.name)
         exp_year = (
@@ -427,6 +468,8 @@ def prepare_page1_batch(
             "total": len(items),
             "priority": priority,
             "deprioritized": deprioritized,
+            "cache_hits": cache_hits,
+            "rendered": 0 if dry_run else len({sha for sha, _ in misses} & rendered.keys()),
         },
     )
     write_batch_manifest(work_dir, manifest)
@@ -522,20 +565,20 @@ def save_page1_inspection_result(work_dir: Path, payload: dict[str, Any]) -> Pat
     return out
 
 
-def apply_page1_inspection_result(
-    mgr: PdfFileManager,
+def prepare_page1_inspection_result(
     result: Page1InspectionResult,
+    pdf: PdfFile | None,
     *,
-    force: bool = False,
-    force_manual: bool = False,
-    dry_run: bool = False,
     validate_school_year: bool = True,
-) -> CompletionDateRecord | None:
-    """Persist one agent inspection result; returns None when skipped or no date."""
+) -> Page1InspectionResult | None:
+    """Apply path-context year adjustment and the school-year check to one result.
+
+    Returns the (possibly adjusted) result ready to persist, or None when it has no
+    date or the date is implausible for the file's school year. Touches no registry state.
+    """
     if result.completion_date is None:
         return None
 
-    pdf = mgr.get_file(result.file_id)
     completion_date = result.completion_date
     source_detail = dict(result.source_detail) if result.source_detail else None
     if pdf is not None:
@@ -550,24 +593,44 @@ def apply_page1_inspection_result(
             completion_date = adjusted
             source_detail = source_detail or {}
             source_detail["year_adjustment"] = adjustment
-            result = Page1InspectionResult(
-                file_id=result.file_id,
-                completion_date=completion_date,
-                confidence=result.confidence,
-                inference_model=result.inference_model,
-                source_detail=source_detail,
-            )
 
-    if validate_school_year:
-        if pdf is not None:
-            plausible, _detail = check_completion_date_school_year(
-                completion_date,
-                student_id=pdf.student_id,
-                path=pdf.path,
-                name=pdf.name,
-            )
-            if not plausible:
-                return None
+    if validate_school_year and pdf is not None:
+        plausible, _detail = check_completion_date_school_year(
+            completion_date,
+            student_id=pdf.student_id,
+            path=pdf.path,
+            name=pdf.name,
+        )
+        if not plausible:
+            return None
+
+    return Page1InspectionResult(
+        file_id=result.file_id,
+        completion_date=completion_date,
+        confidence=result.confidence,
+        inference_model=result.inference_model,
+        source_detail=source_detail,
+    )
+
+
+def apply_page1_inspection_result(
+    mgr: PdfFileManager,
+    result: Page1InspectionResult,
+    *,
+    force: bool = False,
+    force_manual: bool = False,
+    dry_run: bool = False,
+    validate_school_year: bool = True,
+) -> CompletionDateRecord | None:
+    """Persist one agent inspection result; returns None when skipped or no date."""
+    pdf = mgr.get_file(result.file_id)
+    result = prepare_page1_inspection_result(
+        result, pdf, validate_school_year=validate_school_year
+    )
+    if result is None:
+        return None
+    completion_date = result.completion_date
+    source_detail = result.source_detail
 
     existing = mgr.get_completion_date(result.file_id)
     if existing is not None:
@@ -612,18 +675,7 @@ def apply_page1_inspection_result(
 
 
 def _merge_report(report: InferCompletionDatesReport, **kwargs: int) -> InferCompletionDatesReport:
-    data = {
-        "processed": report.processed,
-        "written": report.written,
-        "skipped_existing": report.skipped_existing,
-        "skipped_manual": report.skipped_manual,
-        "skipped_no_cached_result": report.skipped_no_cached_result,
-        "skipped_no_date": report.skipped_no_date,
-        "failed": report.failed,
-        "still_undated": report.still_undated,
-    }
-    data.update(kwargs)
-    return InferCompletionDatesReport(**data)
+    return merge_infer_completion_dates_report(report, **kwargs)
 
 
 def apply_page1_results_from_path(
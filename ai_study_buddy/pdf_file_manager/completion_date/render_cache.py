@@ -0,0 +1,186 @@
+# Content-addressed PNG render cache for the page-1 batch (proposal 17 Phase 2).
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import shutil
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+
+RENDER_CACHE_DIR_NAME = "render_cache"
+_DIGEST_INDEX_NAME = "digests.json"
+_META_NAME = "meta.json"
+
+
+def file_content_sha256(path: str | Path) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as fh:
+        for block in iter(lambda: fh.read(1024 * 1024), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def render_pdf_pages_png(
+    pdf_path: str | Path,
+    out_dir: str | Path,
+    page_indices: tuple[int, ...],
+    *,
+    dpi_scale: float = 2.0,
+) -> int:
+    """Render several pages from one open document to ``out_dir/page-NN.png``.
+
+    Indices past the end of the document are skipped. Returns the page count.
+    """
+    try:
+        import fitz  # type: ignore
+    except ImportError as exc:  # pragma: no cover - environment guard
+        raise RuntimeError(
+            "PyMuPDF dependency missing: install with `pip3 install pymupdf`"
+        ) from exc
+
+    if dpi_scale <= 0:
+        raise ValueError("dpi_scale must be > 0")
+    source = Path(pdf_path)
+    if not source.is_file():
+        raise FileNotFoundError(f"PDF does not exist: {source}")
+
+    destination = Path(out_dir)
+    destination.mkdir(parents=True, exist_ok=True)
+    doc = fitz.open(str(source))
+    try:
+        if doc.page_count < 1:
+            raise ValueError(f"PDF has no pages: {source}")
+        matrix = fitz.Matrix(dpi_scale, dpi_scale)
+        for page_index in page_indices:
+            if 0 <= page_index < doc.page_count:
+                pix = doc[page_index].get_pixmap(matrix=matrix, alpha=False)
+                pix.save(str(destination / f"page-{page_index + 1:02d}.png"))
+        return int(doc.page_count)
+    finally:
+        doc.close()
+
+
+def _render_entry(
+    pdf_path: str, entry_dir: str, page_indices: tuple[int, ...], dpi_scale: float
+) -> int:
+    """Process-pool job: render into a cache entry, then write meta.json last (marks it complete)."""
+    page_count = render_pdf_pages_png(pdf_path, entry_dir, page_indices, dpi_scale=dpi_scale)
+    Path(entry_dir, _META_NAME).write_text(json.dumps({"page_count": page_count}) + "\n", encoding="utf-8")
+    return page_count
+
+
+@dataclass(frozen=True)
+class RenderedPages:
+    page_count: int
+    pages: dict[int, Path]  # page_index -> cached PNG
+
+
+class PageRenderCache:
+    """PNG renders keyed by (PDF content sha256, dpi_scale), stored under ``cache_dir``.
+
+    ``cache_dir/<sha[:2]>/<sha>/dpi-<scale>/page-NN.png`` plus ``meta.json`` (page count).
+    Content digests are memoized per (path, size, mtime_ns) in ``digests.json`` so unchanged
+    files are not re-hashed on every run.
+    """
+
+    def __init__(self, cache_dir: Path):
+        self.cache_dir = Path(cache_dir)
+        self._index_path = self.cache_dir / _DIGEST_INDEX_NAME
+        self._digests: dict[str, dict] | None = None
+        self._dirty = False
+
+    def content_digest(self, pdf_path: str | Path) -> str:
+        if self._digests is None:
+            try:
+                self._digests = json.loads(self._index_path.read_text(encoding="utf-8"))
+            except (OSError, ValueError):
+                self._digests = {}
+        key = str(Path(pdf_path).resolve())
+        stat = os.stat(key)
+        memo = self._digests.get(key)
+        if memo and memo.get("size") == stat.st_size and memo.get("mtime_ns") == stat.st_mtime_ns:
+            return memo["sha256"]
+        sha = file_content_sha256(key)
+        self._digests[key] = {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns, "sha256": sha}
+        self._dirty = True
+        return sha
+
+    def save_digests(self) -> None:
+        if self._dirty and self._digests is not None:
+            self._index_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self._index_path.with_suffix(".tmp")
+            tmp.write_text(json.dumps(self._digests, indent=0) + "\n", encoding="utf-8")
+            tmp.replace(self._index_path)
+            self._dirty = False
+
+    def entry_dir(self, sha: str, dpi_scale: float) -> Path:
+        return self.cache_dir / sha[:2] / sha / f"dpi-{dpi_scale:g}"
+
+    def get(self, sha: str, dpi_scale: float, page_indices: tuple[int, ...]) -> RenderedPages | None:
+        """Cached renders for every requested page that exists, or None on a miss."""
+        entry = self.entry_dir(sha, dpi_scale)
+        try:
+            page_count = int(json.loads((entry / _META_NAME).read_text(encoding="utf-8"))["page_count"])
+        except (OSError, ValueError, KeyError):
+            return None
+        pages: dict[int, Path] = {}
+        for page_index in page_indices:
+            if page_index >= page_count:
+                continue
+            png = entry / f"page-{page_index + 1:02d}.png"
+            if not png.is_file():
+                return None
+            pages[page_index] = png
+        return RenderedPages(page_count, pages)
+
+    def render_missing(
+        self,
+        jobs: list[tuple[str, str]],
+        dpi_scale: float,
+        page_indices: tuple[int, ...],
+        *,
+        workers: int = 1,
+    ) -> dict[str, RenderedPages | Exception]:
+        """Render (sha, pdf_path) jobs into the cache; ``workers > 1`` uses a process pool."""
+        unique = dict(jobs)  # one render per distinct content
+        args = [(path, str(self.entry_dir(sha, dpi_scale)), page_indices, dpi_scale) for sha, path in unique.items()]
+        outcomes: dict[str, RenderedPages | Exception] = {}
+        if workers > 1 and len(args) > 1:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                futures = {sha: pool.submit(_render_entry, *a) for sha, a in zip(unique, args)}
+                for sha, future in futures.items():
+                    try:
+                        future.result()
+                    except Exception as exc:  # noqa: BLE001 - reported per file
+                        outcomes[sha] = exc
+        else:
+            for sha, a in zip(unique, args):
+                try:
+                    _render_entry(*a)
+                except Exception as exc:  # noqa: BLE001 - reported per file
+                    outcomes[sha] = exc
+        for sha in unique:
+            if sha not in outcomes:
+                cached = self.get(sha, dpi_scale, page_indices)
+                outcomes[sha] = cached if cached is not None else RuntimeError(f"render incomplete: {sha}")
+        return outcomes
+
+
+def materialize_png(cached: Path, destination: Path) -> Path:
+    """Expose a cached render at ``destination`` (hard link, else copy); no-op when already linked."""
+    destination.parent.mkdir(parents=True, exist_ok=True)
+    if destination.exists():
+        try:
+            if os.path.samefile(cached, destination):
+                return destination
+        except OSError:
+            pass
+        destination.unlink()
+    try:
+        os.link(cached, destination)
+    except OSError:
+        shutil.copyfile(cached, destination)
+    return destination
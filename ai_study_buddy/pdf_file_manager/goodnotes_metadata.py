@@ -3,6 +3,7 @@ from __future__ import annotations
 import os
 import re
 import sqlite3
+import threading
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
@@ -98,8 +99,7 @@ def _is_under(path: Path, root: Path) -> bool:
         return False
 
 
-def _is_goodnotes_path(path: Path) -> bool:
-    root = _resolve_goodnotes_root()
+def _is_goodnotes_path(path: Path, root: Path | None) -> bool:
     if root is not None:
         return _is_under(path, root)
     return "GoodNotes" in path.parts
@@ -204,69 +204,52 @@ def _empty_match(
 
 
 _GOODNOTES_SHARE_LINK_PREFIX = "https://share.goodnotes.com/s/"
+_SHARE_ALIAS_RE = re.compile(rb'"documentAlias":"([^"]+)"')
+_MAX_FOLDER_DEPTH = 50
 
 
-def _fetch_share_link(conn: sqlite3.Connection, document_id: str) -> str | None:
-    row = conn.execute(
-        """
-        SELECT data
-        FROM document_share
-        WHERE document_id = ?
-        ORDER BY updated_at DESC
-        LIMIT 1
-        """,
-        (document_id,),
-    ).fetchone()
-    if row is None or row["data"] is None:
-        return None
+@dataclass(frozen=True)
+class GoodnotesMatchRequest:
+    """One registered file to match (see :func:`get_goodnotes_document_matches`)."""
 
-    data = row["data"]
+    file_id: str
+    registered_path: str
+    file_type: str
+    raw_source_stems: tuple[str, ...] = ()
+
+
+@dataclass(frozen=True)
+class _DocumentRow:
+    id: str
+    name: str
+    created_at: float | None
+    updated_at: float | None
+    last_modified: str | None
+    live: bool  # documents.deleted = 0 and document_meta.is_deleted is 0/NULL
+
+
+def _share_link_from_data(data: bytes | str | None) -> str | None:
+    if data is None:
+        return None
     if isinstance(data, str):
         data = data.encode("utf-8", errors="surrogateescape")
-    match = re.search(rb'"documentAlias":"([^"]+)"', data)
+    match = _SHARE_ALIAS_RE.search(data)
     if not match:
         return None
     return f"{_GOODNOTES_SHARE_LINK_PREFIX}{match.group(1).decode()}"
 
 
-def _connect_projection_db() -> sqlite3.Connection | None:
-    projection = _projection_db_path()
-    fts = _fts_db_path()
-    if not projection.is_file() or not fts.is_file():
-        return None
-    conn = sqlite3.connect(f"file:{projection}?mode=ro", uri=True)
-    conn.row_factory = sqlite3.Row
-    conn.execute("ATTACH DATABASE ? AS fts", (f"file:{fts}?mode=ro",))
-    return conn
-
-
-def _fetch_matches(
-    conn: sqlite3.Connection,
-    candidate_names: tuple[str, ...],
-    *,
-    include_deleted: bool,
-) -> list[sqlite3.Row]:
-    if not candidate_names:
-        return []
-    placeholders = ",".join("?" for _ in candidate_names)
-    sql = f"""
-        SELECT
-            d.id,
-            d.name,
-            d.created_at,
-            d.updated_at,
-            d.deleted,
-            m.last_modified,
-            m.is_deleted AS meta_is_deleted
-        FROM documents d
-        LEFT JOIN fts.document_meta m ON m.document_id = d.id
-        WHERE d.name IN ({placeholders})
-    """
-    params: list[object] = list(candidate_names)
-    if not include_deleted:
-        sql += " AND d.deleted = 0 AND COALESCE(m.is_deleted, 0) = 0"
-    sql += " ORDER BY d.name, d.id"
-    return conn.execute(sql, params).fetchall()
+def _metadata_db_version(projection: Path, fts: Path) -> tuple:
+    """Identity of the projection + FTS DBs as of now: (size, mtime_ns) of each file and its WAL."""
+    stats: list[tuple[int, int] | None] = []
+    for path in (projection, Path(f"{projection}-wal"), fts, Path(f"{fts}-wal")):
+        try:
+            st = path.stat()
+        except FileNotFoundError:
+            stats.append(None)
+            continue
+        stats.append((st.st_size, st.st_mtime_ns))
+    return (str(projection), str(fts), tuple(stats))
 
 
 def _is_in_review_folder(folder_path: str | None) -> bool:
@@ -276,177 +259,161 @@ def _is_in_review_folder(folder_path: str | None) -> bool:
     return bool(parts) and parts[-1] == "Review"
 
 
-def _filter_rows_by_folder_scope(
-    conn: sqlite3.Connection,
-    rows: list[sqlite3.Row],
-    folder_scope: GoodnotesFolderScope | None,
-) -> list[sqlite3.Row]:
-    if folder_scope is None or len(rows) <= 1:
-        return rows
-
-    filtered: list[sqlite3.Row] = []
-    for row in rows:
-        folder_path, _ = _folder_path_for_document(conn, row["id"])
-        in_review = _is_in_review_folder(folder_path)
-        if folder_scope == "review" and in_review:
-            filtered.append(row)
-        elif folder_scope == "attempt" and not in_review:
-            filtered.append(row)
-    return filtered
-
-
-def _folder_path_for_document(conn: sqlite3.Connection, document_id: str) -> tuple[str | None, tuple[str, ...]]:
-    row = conn.execute(
-        """
-        SELECT parent_folder_id
-        FROM folder_to_folder_items
-        WHERE item_id = ? AND deleted = 0
-        ORDER BY id
-        LIMIT 1
-        """,
-        (document_id,),
-    ).fetchone()
-    if row is None or not row["parent_folder_id"]:
-        return None, ()
-
-    folder_ids_leaf_to_root: list[str] = []
-    folder_names_leaf_to_root: list[str] = []
-    current_id = row["parent_folder_id"]
-    seen: set[str] = set()
-    while current_id and current_id not in seen and len(seen) < 50:
-        seen.add(current_id)
-        folder_row = conn.execute("SELECT name FROM folders WHERE id = ?", (current_id,)).fetchone()
-        if folder_row is not None and folder_row["name"]:
-            folder_ids_leaf_to_root.append(current_id)
-            folder_names_leaf_to_root.append(folder_row["name"])
-        parent_row = conn.execute(
-            """
-            SELECT parent_folder_id
-            FROM folder_to_folder_items
-            WHERE item_id = ? AND deleted = 0
-            ORDER BY id
-            LIMIT 1
-            """,
-            (current_id,),
-        ).fetchone()
-        current_id = parent_row["parent_folder_id"] if parent_row is not None else None
-
-    folder_ids = tuple(reversed(folder_ids_leaf_to_root))
-    folder_names = tuple(reversed(folder_names_leaf_to_root))
-    folder_path = " / ".join(folder_names) if folder_names else None
-    return folder_path, folder_ids
-
-
-def _match_from_row(
-    conn: sqlite3.Connection,
-    *,
-    row: sqlite3.Row,
-    file_id: str,
-    registered_path: str,
-    backup_stem: str,
-    candidates: tuple[_Candidate, ...],
-    active_candidates: tuple[_Candidate, ...],
-) -> GoodnotesDocumentMatch:
-    candidate_by_name = {candidate.name: candidate for candidate in active_candidates}
-    matched_candidate = candidate_by_name.get(row["name"])
-    status: GoodnotesDocumentMatchStatus = matched_candidate.status if matched_candidate else "matched_exact"
-    folder_path, folder_ids = _folder_path_for_document(conn, row["id"])
-    share_link = _fetch_share_link(conn, row["id"])
-    timestamps = GoodnotesDocumentTimestamps(
-        created_at=_iso_utc_from_unix_ms(row["created_at"]),
-        updated_at=_iso_utc_from_unix_ms(row["updated_at"]),
-        last_modified=_iso_utc_from_sqlite_datetime(row["last_modified"]),
-        created_at_raw=row["created_at"],
-        updated_at_raw=row["updated_at"],
-        last_modified_raw=row["last_modified"],
-    )
-    return GoodnotesDocumentMatch(
-        status=status,
-        file_id=file_id,
-        registered_path=registered_path,
-        backup_stem=backup_stem,
-        candidate_names=tuple(candidate.name for candidate in candidates),
-        matched_candidate_name=row["name"],
-        goodnotes_document_id=row["id"],
-        goodnotes_document_name=row["name"],
-        goodnotes_folder_path=folder_path,
-        goodnotes_folder_ids=folder_ids,
-        timestamps=timestamps,
-        share_link=share_link,
-    )
+class GoodnotesMetadataIndex:
+    """In-memory snapshot of the Goodnotes projection + FTS metadata DBs.
 
+    :meth:`load` reads documents (with ``document_meta`` timestamps and deletion flags),
+    folder parents/names and the newest share link per document over one read-only
+    connection, then closes it. Matching is dictionary lookups; folder paths are memoized
+    per parent folder. Use :func:`current_goodnotes_metadata_index` for the process-wide
+    instance, which is reloaded only when a DB file (or its WAL) changes.
+    """
 
-def get_goodnotes_document_match(
-    *,
-    file_id: str,
-    registered_path: str,
-    file_type: str,
-    raw_source_stems: tuple[str, ...] = (),
-    include_deleted: bool = False,
-    folder_scope: GoodnotesFolderScope | None = None,
-) -> GoodnotesDocumentMatch:
-    path = Path(registered_path)
-    backup_stem = path.stem
-    if not _is_goodnotes_path(path):
-        return _empty_match(
-            status="not_goodnotes_root",
-            file_id=file_id,
-            registered_path=registered_path,
-            backup_stem=backup_stem,
-        )
-    if file_type != "main":
-        return _empty_match(
-            status="not_main_file",
-            file_id=file_id,
-            registered_path=registered_path,
-            backup_stem=backup_stem,
+    def __init__(
+        self,
+        *,
+        version: tuple,
+        documents_by_name: dict[str, list[_DocumentRow]],
+        folder_parents: dict[str, str | None],
+        folder_names: dict[str, str | None],
+        share_links: dict[str, str | None],
+    ):
+        self.version = version
+        self._documents_by_name = documents_by_name
+        self._folder_parents = folder_parents
+        self._folder_names = folder_names
+        self._share_links = share_links
+        self._folder_paths: dict[str, tuple[str | None, tuple[str, ...]]] = {}
+
+    @classmethod
+    def load(cls, projection: Path, fts: Path, *, version: tuple | None = None) -> GoodnotesMetadataIndex:
+        """Read both DBs in four queries. Raises ``sqlite3.Error`` if they cannot be read."""
+        if version is None:
+            version = _metadata_db_version(projection, fts)
+        conn = sqlite3.connect(f"file:{projection}?mode=ro", uri=True)
+        try:
+            conn.execute("ATTACH DATABASE ? AS fts", (f"file:{fts}?mode=ro",))
+            documents_by_name: dict[str, list[_DocumentRow]] = {}
+            for doc_id, name, created_at, updated_at, deleted, last_modified, meta_is_deleted in conn.execute(
+                """
+                SELECT d.id, d.name, d.created_at, d.updated_at, d.deleted, m.last_modified, m.is_deleted
+                FROM documents d
+                LEFT JOIN fts.document_meta m ON m.document_id = d.id
+                ORDER BY d.name, d.id
+                """
+            ):
+                documents_by_name.setdefault(name, []).append(
+                    _DocumentRow(
+                        id=doc_id,
+                        name=name,
+                        created_at=created_at,
+                        updated_at=updated_at,
+                        last_modified=last_modified,
+                        live=deleted == 0 and (meta_is_deleted or 0) == 0,
+                    )
+                )
+            folder_parents: dict[str, str | None] = {}
+            for item_id, parent_folder_id in conn.execute(
+                "SELECT item_id, parent_folder_id FROM folder_to_folder_items WHERE deleted = 0 ORDER BY id"
+            ):
+                folder_parents.setdefault(item_id, parent_folder_id)
+            folder_names = dict(conn.execute("SELECT id, name FROM folders").fetchall())
+            share_links: dict[str, str | None] = {}
+            for document_id, data in conn.execute(
+                "SELECT document_id, data FROM document_share ORDER BY updated_at DESC"
+            ):
+                if document_id not in share_links:
+                    share_links[document_id] = _share_link_from_data(data)
+        finally:
+            conn.close()
+        return cls(
+            version=version,
+            documents_by_name=documents_by_name,
+            folder_parents=folder_parents,
+            folder_names=folder_names,
+            share_links=share_links,
         )
 
-    primary_candidates = _primary_candidates(backup_stem)
-    raw_candidates = _raw_source_candidates(backup_stem, raw_source_stems)
-    candidates = primary_candidates + tuple(candidate for candidate in raw_candidates if candidate.name not in {c.name for c in primary_candidates})
-    try:
-        conn = _connect_projection_db()
-    except sqlite3.Error as exc:
-        return _empty_match(
-            status="metadata_unavailable",
-            file_id=file_id,
-            registered_path=registered_path,
-            backup_stem=backup_stem,
-            candidates=candidates,
-            message=str(exc),
-        )
-    if conn is None:
-        return _empty_match(
-            status="metadata_unavailable",
-            file_id=file_id,
-            registered_path=registered_path,
-            backup_stem=backup_stem,
-            candidates=candidates,
-            message="Goodnotes metadata databases not found",
-        )
+    def folder_path_for_document(self, document_id: str) -> tuple[str | None, tuple[str, ...]]:
+        """Goodnotes app-folder path (``A / B / C``) and folder ids, root first."""
+        parent_id = self._folder_parents.get(document_id)
+        if not parent_id:
+            return None, ()
+        cached = self._folder_paths.get(parent_id)
+        if cached is not None:
+            return cached
+
+        folder_ids_leaf_to_root: list[str] = []
+        folder_names_leaf_to_root: list[str] = []
+        current_id: str | None = parent_id
+        seen: set[str] = set()
+        while current_id and current_id not in seen and len(seen) < _MAX_FOLDER_DEPTH:
+            seen.add(current_id)
+            name = self._folder_names.get(current_id)
+            if name:
+                folder_ids_leaf_to_root.append(current_id)
+                folder_names_leaf_to_root.append(name)
+            current_id = self._folder_parents.get(current_id)
+
+        folder_ids = tuple(reversed(folder_ids_leaf_to_root))
+        folder_names = tuple(reversed(folder_names_leaf_to_root))
+        resolved = (" / ".join(folder_names) if folder_names else None, folder_ids)
+        self._folder_paths[parent_id] = resolved
+        return resolved
+
+    def _rows_for(self, candidates: tuple[_Candidate, ...], *, include_deleted: bool) -> list[_DocumentRow]:
+        rows: list[_DocumentRow] = []
+        for name in sorted({candidate.name for candidate in candidates}):
+            for row in self._documents_by_name.get(name, ()):
+                if include_deleted or row.live:
+                    rows.append(row)
+        return rows
+
+    def _filter_rows_by_folder_scope(
+        self,
+        rows: list[_DocumentRow],
+        folder_scope: GoodnotesFolderScope | None,
+    ) -> list[_DocumentRow]:
+        if folder_scope is None or len(rows) <= 1:
+            return rows
+        filtered: list[_DocumentRow] = []
+        for row in rows:
+            in_review = _is_in_review_folder(self.folder_path_for_document(row.id)[0])
+            if (folder_scope == "review") == in_review:
+                filtered.append(row)
+        return filtered
+
+    def match(
+        self,
+        request: GoodnotesMatchRequest,
+        *,
+        include_deleted: bool = False,
+        folder_scope: GoodnotesFolderScope | None = None,
+    ) -> GoodnotesDocumentMatch:
+        """Match one g_root main (path and file-type checks are the caller's job)."""
+        backup_stem = Path(request.registered_path).stem
+        primary_candidates, raw_candidates, candidates = _match_candidates(backup_stem, request.raw_source_stems)
 
-    try:
         active_candidates = primary_candidates
-        rows = _fetch_matches(conn, tuple(candidate.name for candidate in active_candidates), include_deleted=include_deleted)
+        rows = self._rows_for(active_candidates, include_deleted=include_deleted)
         if not rows and raw_candidates:
             active_candidates = raw_candidates
-            rows = _fetch_matches(conn, tuple(candidate.name for candidate in active_candidates), include_deleted=include_deleted)
+            rows = self._rows_for(active_candidates, include_deleted=include_deleted)
         if not rows:
             return _empty_match(
                 status="not_found",
-                file_id=file_id,
-                registered_path=registered_path,
+                file_id=request.file_id,
+                registered_path=request.registered_path,
                 backup_stem=backup_stem,
                 candidates=candidates,
             )
 
-        scoped_rows = _filter_rows_by_folder_scope(conn, rows, folder_scope)
+        scoped_rows = self._filter_rows_by_folder_scope(rows, folder_scope)
         if not scoped_rows:
             return _empty_match(
                 status="not_found",
-                file_id=file_id,
-                registered_path=registered_path,
+                file_id=request.file_id,
+                registered_path=request.registered_path,
                 backup_stem=backup_stem,
                 candidates=candidates,
                 message=f"No Goodnotes document matched folder scope {folder_scope!r}",
@@ -454,30 +421,142 @@ def get_goodnotes_document_match(
         if len(scoped_rows) > 1:
             return _empty_match(
                 status="ambiguous",
-                file_id=file_id,
-                registered_path=registered_path,
+                file_id=request.file_id,
+                registered_path=request.registered_path,
                 backup_stem=backup_stem,
                 candidates=candidates,
                 message=f"Matched {len(scoped_rows)} Goodnotes documents",
             )
 
-        return _match_from_row(
-            conn,
-            row=scoped_rows[0],
-            file_id=file_id,
-            registered_path=registered_path,
+        row = scoped_rows[0]
+        candidate_by_name = {candidate.name: candidate for candidate in active_candidates}
+        matched_candidate = candidate_by_name.get(row.name)
+        status: GoodnotesDocumentMatchStatus = matched_candidate.status if matched_candidate else "matched_exact"
+        folder_path, folder_ids = self.folder_path_for_document(row.id)
+        timestamps = GoodnotesDocumentTimestamps(
+            created_at=_iso_utc_from_unix_ms(row.created_at),
+            updated_at=_iso_utc_from_unix_ms(row.updated_at),
+            last_modified=_iso_utc_from_sqlite_datetime(row.last_modified),
+            created_at_raw=row.created_at,
+            updated_at_raw=row.updated_at,
+            last_modified_raw=row.last_modified,
+        )
+        return GoodnotesDocumentMatch(
+            status=status,
+            file_id=request.file_id,
+            registered_path=request.registered_path,
             backup_stem=backup_stem,
-            candidates=candidates,
-            active_candidates=active_candidates,
+            candidate_names=tuple(candidate.name for candidate in candidates),
+            matched_candidate_name=row.name,
+            goodnotes_document_id=row.id,
+            goodnotes_document_name=row.name,
+            goodnotes_folder_path=folder_path,
+            goodnotes_folder_ids=folder_ids,
+            timestamps=timestamps,
+            share_link=self._share_links.get(row.id),
         )
+
+
+_INDEX: GoodnotesMetadataIndex | None = None
+_INDEX_LOCK = threading.Lock()
+
+
+def current_goodnotes_metadata_index() -> GoodnotesMetadataIndex | None:
+    """Process-wide index for the configured DBs, reloaded when their version changes.
+
+    Returns None when either DB file is missing; raises ``sqlite3.Error`` when a load fails.
+    """
+    global _INDEX
+    projection = _projection_db_path()
+    fts = _fts_db_path()
+    if not projection.is_file() or not fts.is_file():
+        return None
+    version = _metadata_db_version(projection, fts)
+    with _INDEX_LOCK:
+        if _INDEX is None or _INDEX.version != version:
+            _INDEX = GoodnotesMetadataIndex.load(projection, fts, version=version)
+        return _INDEX
+
+
+def _match_candidates(
+    backup_stem: str, raw_source_stems: tuple[str, ...]
+) -> tuple[tuple[_Candidate, ...], tuple[_Candidate, ...], tuple[_Candidate, ...]]:
+    """(primary, raw-source fallback, all reported candidates) for one backup stem."""
+    primary_candidates = _primary_candidates(backup_stem)
+    raw_candidates = _raw_source_candidates(backup_stem, raw_source_stems)
+    primary_names = {c.name for c in primary_candidates}
+    candidates = primary_candidates + tuple(
+        candidate for candidate in raw_candidates if candidate.name not in primary_names
+    )
+    return primary_candidates, raw_candidates, candidates
+
+
+def get_goodnotes_document_matches(
+    requests: list[GoodnotesMatchRequest],
+    *,
+    include_deleted: bool = False,
+    folder_scope: GoodnotesFolderScope | None = None,
+) -> list[GoodnotesDocumentMatch]:
+    """Bulk :func:`get_goodnotes_document_match`: one result per request, in request order.
+
+    The Goodnotes root is resolved once and every g_root main is answered from the same
+    :class:`GoodnotesMetadataIndex`, so the metadata DBs are read at most once per call.
+    """
+    goodnotes_root = _resolve_goodnotes_root()
+    out: list[GoodnotesDocumentMatch | None] = [None] * len(requests)
+    pending: list[int] = []
+    for i, request in enumerate(requests):
+        path = Path(request.registered_path)
+        if not _is_goodnotes_path(path, goodnotes_root):
+            status: GoodnotesDocumentMatchStatus = "not_goodnotes_root"
+        elif request.file_type != "main":
+            status = "not_main_file"
+        else:
+            pending.append(i)
+            continue
+        out[i] = _empty_match(
+            status=status,
+            file_id=request.file_id,
+            registered_path=request.registered_path,
+            backup_stem=path.stem,
+        )
+    if not pending:
+        return out  # type: ignore[return-value]
+
+    index: GoodnotesMetadataIndex | None = None
+    message = "Goodnotes metadata databases not found"
+    try:
+        index = current_goodnotes_metadata_index()
     except sqlite3.Error as exc:
-        return _empty_match(
+        message = str(exc)
+    for i in pending:
+        request = requests[i]
+        if index is not None:
+            out[i] = index.match(request, include_deleted=include_deleted, folder_scope=folder_scope)
+            continue
+        backup_stem = Path(request.registered_path).stem
+        out[i] = _empty_match(
             status="metadata_unavailable",
-            file_id=file_id,
-            registered_path=registered_path,
+            file_id=request.file_id,
+            registered_path=request.registered_path,
             backup_stem=backup_stem,
-            candidates=candidates,
-            message=str(exc),
+            candidates=_match_candidates(backup_stem, request.raw_source_stems)[2],
+            message=message,
         )
-    finally:
-        conn.close()
+    return out  # type: ignore[return-value]
+
+
+def get_goodnotes_document_match(
+    *,
+    file_id: str,
+    registered_path: str,
+    file_type: str,
+    raw_source_stems: tuple[str, ...] = (),
+    include_deleted: bool = False,
+    folder_scope: GoodnotesFolderScope | None = None,
+) -> GoodnotesDocumentMatch:
+    return get_goodnotes_document_matches(
+        [GoodnotesMatchRequest(file_id, registered_path, file_type, tuple(raw_source_stems))],
+        include_deleted=include_deleted,
+        folder_scope=folder_scope,
+    )[0]
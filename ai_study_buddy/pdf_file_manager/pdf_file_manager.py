@@ -10,6 +10,7 @@ import subprocess
 import sys
 import uuid
 from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
@@ -18,14 +19,15 @@ from .completion_date.core import (
     COMPLETION_DATE_SOURCES,
     CompletionDateRecord,
     InferCompletionDatesReport,
-    merge_infer_completion_dates_report,
     normalize_completion_date,
     normalize_completion_date_confidence,
     normalize_completion_date_source,
     normalize_inference_model,
     validate_inferred_completion_date_provenance,
 )
+from .completion_date.batch import DEFAULT_INFERENCE_WORKERS, infer_completion_dates_bulk
 from .completion_date.page1 import (
+    PAGE1_SOURCE,
     default_page1_work_dir,
     infer_completion_date_for_file_cached_page1,
     infer_completion_dates_cached_page1,
@@ -36,7 +38,13 @@ from .completion_date.filename_term import (
     FILENAME_TERM_SOURCE,
     infer_completion_date_from_filename_term,
 )
-from .goodnotes_metadata import GoodnotesDocumentMatch, GoodnotesFolderScope, get_goodnotes_document_match
+from .goodnotes_metadata import (
+    GoodnotesDocumentMatch,
+    GoodnotesFolderScope,
+    GoodnotesMatchRequest,
+    get_goodnotes_document_match,
+    get_goodnotes_document_matches,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -114,6 +122,50 @@ class CompressResult:
     compressed: bool  # True if we kept compressed output; False if restored original
     raw_archive_id: str | None  # Set if we created a _raw_ file
 
+@dataclass(frozen=True)
+class _CompressionJob:
+    """Filesystem half of compress_and_register; picklable so it can run in a worker process."""
+    file_path: str
+    name: str
+    preserve_input: bool
+    compress_kwargs: dict
+
+    def paths(self) -> tuple[str, Path, str, Path]:
+        """(raw_name, raw_path, main_name, main_path) for this job."""
+        dir_path = Path(self.file_path).parent
+        main_name = f"_c_{self.name}"
+        if self.preserve_input:
+            # GoodNotes-safe variant: the original stays in place and is treated as raw.
+            return self.name, Path(self.file_path), main_name, dir_path / main_name
+        raw_name = f"_raw_{self.name}"
+        return raw_name, dir_path / raw_name, main_name, dir_path / main_name
+
+
+def _run_compression_job(job: _CompressionJob):
+    """Move the input aside (unless preserve_input) and run compress_pdf; no registry access."""
+    from ai_study_buddy.utils.compress_pdf.compress_pdf import compress_pdf as _do_compress
+
+    _raw_name, raw_path, main_name, main_path = job.paths()
+    if job.preserve_input:
+        if main_path.exists():
+            raise ValueError(f"Destination already exists: {main_path}")
+    else:
+        if raw_path.exists():
+            raise ValueError(f"Destination already exists: {raw_path}")
+        shutil.move(job.file_path, str(raw_path))
+    try:
+        return _do_compress(
+            str(raw_path),
+            output_name=main_name,
+            **job.compress_kwargs,
+        )
+    except Exception:
+        # On failure, restore original location when we moved it.
+        if not job.preserve_input:
+            shutil.move(str(raw_path), job.file_path)
+        raise
+
+
 @dataclass
 class GoodNotesTemplateLinkOutcome:
     main_path: str
@@ -295,10 +347,49 @@ def _default_db_path() -> Path:
     return _repo_root() / "ai_study_buddy" / "db" / "pdf_registry.db"
 
 
+def _default_compress_workers(env_name: str) -> int:
+    """Worker count from ``PDF_COMPRESS_WORKERS`` / ``PDF_COMPRESS_PAGE_WORKERS``; 1 when unset."""
+    value = os.environ.get(env_name, "").strip()
+    if not value:
+        return 1
+    try:
+        return max(1, int(value))
+    except ValueError:
+        raise ConfigError(f"{env_name} must be an integer; got {value!r}") from None
+
+
 def _schema_sql() -> str:
     schema_file = Path(__file__).resolve().parent / "schema.sql"
     return schema_file.read_text()
 
+
+# Stay well under SQLite's host-parameter limit for bulk ``IN (...)`` lookups.
+_SQL_IN_CHUNK_SIZE = 500
+
+
+def _id_chunks(ids: list[str]) -> list[list[str]]:
+    return [ids[i : i + _SQL_IN_CHUNK_SIZE] for i in range(0, len(ids), _SQL_IN_CHUNK_SIZE)]
+
+
+def _normalize_completion_date_values(
+    completion_date: str,
+    source: str,
+    confidence: str | None,
+    inference_model: str | None,
+) -> tuple[str, str, str | None, str | None]:
+    """Normalize and validate one completion-date write (raises ValueError)."""
+    completion_date = normalize_completion_date(completion_date)
+    source = normalize_completion_date_source(source)
+    confidence = normalize_completion_date_confidence(confidence)
+    inference_model = normalize_inference_model(inference_model)
+    validate_inferred_completion_date_provenance(
+        source=source,
+        confidence=confidence,
+        inference_model=inference_model,
+    )
+    return completion_date, source, confidence, inference_model
+
+
 class PdfFileManager:
     _ALLOWED_SUBJECTS = ("english", "math", "science", "chinese")
     # Canonical doc_type values; keep in sync with DATA_MODEL.md / SPEC.md / README.md.
@@ -309,6 +400,7 @@ class PdfFileManager:
     def __init__(self, db_path=None):
         self._db_path = Path(db_path).resolve() if db_path else _default_db_path()
         self._conn = None
+        self._fts_enabled = False
 
     @property
     def db_path(self):
@@ -358,6 +450,61 @@ class PdfFileManager:
         else:
             self._migrate_file_completion_dates_if_needed()
 
+        self._ensure_pdf_files_fts()
+
+    def _pdf_files_fts_create_sql(self) -> str:
+        # External-content trigram index over pdf_files(name, path), keyed by pdf_files.rowid.
+        return """
+            CREATE VIRTUAL TABLE IF NOT EXISTS pdf_files_fts USING fts5(
+                name, path, content='pdf_files', tokenize='trigram'
+            );
+            CREATE TRIGGER IF NOT EXISTS pdf_files_fts_ai AFTER INSERT ON pdf_files BEGIN
+                INSERT INTO pdf_files_fts (rowid, name, path) VALUES (new.rowid, new.name, new.path);
+            END;
+            CREATE TRIGGER IF NOT EXISTS pdf_files_fts_ad AFTER DELETE ON pdf_files BEGIN
+                INSERT INTO pdf_files_fts (pdf_files_fts, rowid, name, path)
+                VALUES ('delete', old.rowid, old.name, old.path);
+            END;
+            CREATE TRIGGER IF NOT EXISTS pdf_files_fts_au AFTER UPDATE OF name, path ON pdf_files BEGIN
+                INSERT INTO pdf_files_fts (pdf_files_fts, rowid, name, path)
+                VALUES ('delete', old.rowid, old.name, old.path);
+                INSERT INTO pdf_files_fts (rowid, name, path) VALUES (new.rowid, new.name, new.path);
+            END;
+        """
+
+    def _ensure_pdf_files_fts(self) -> None:
+        """Create the name/path FTS index and its sync triggers; rebuild it when either was missing.
+
+        Rebuilding ``pdf_files`` (enum migrations) drops the triggers, so their absence also
+        means the index may be stale. SQLite builds without FTS5 trigram fall back to LIKE scans.
+        """
+        conn = self._conn
+        assert conn is not None
+        present = {
+            row[0]
+            for row in conn.execute(
+                "SELECT name FROM sqlite_master WHERE name IN "
+                "('pdf_files_fts', 'pdf_files_fts_ai', 'pdf_files_fts_ad', 'pdf_files_fts_au')"
+            ).fetchall()
+        }
+        if len(present) == 4:
+            self._fts_enabled = True
+            return
+        try:
+            conn.executescript(
+                "BEGIN;"
+                + self._pdf_files_fts_create_sql()
+                + "INSERT INTO pdf_files_fts (pdf_files_fts) VALUES ('rebuild');"
+                + "COMMIT;"
+            )
+        except sqlite3.OperationalError as exc:
+            if conn.in_transaction:
+                conn.rollback()
+            logger.warning("pdf_files full-text index unavailable (%s); find_files(query=...) will scan", exc)
+            self._fts_enabled = False
+            return
+        self._fts_enabled = True
+
     def _migrate_file_completion_dates_if_needed(self) -> None:
         conn = self._conn
         assert conn is not None
@@ -504,6 +651,14 @@ class PdfFileManager:
             FROM pdf_files;
             DROP TABLE pdf_files;
             ALTER TABLE pdf_files_new RENAME TO pdf_files;
+            CREATE INDEX idx_pdf_files_student_type
+                ON pdf_files(student_id, file_type, doc_type);
+            CREATE INDEX idx_pdf_files_file_type_doc_type
+                ON pdf_files(file_type, doc_type);
+            CREATE INDEX idx_pdf_files_grade_or_scope
+                ON pdf_files(json_extract(metadata, '$.grade_or_scope'));
+            CREATE INDEX idx_pdf_files_unit
+                ON pdf_files(json_extract(metadata, '$.unit'));
             COMMIT;
             """
         )
@@ -571,6 +726,7 @@ class PdfFileManager:
         before_state: str | None = None,
         after_state: str | None = None,
         notes: str | None = None,
+        commit: bool = True,
     ):
         conn = self._get_connection()
         now = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
@@ -581,7 +737,8 @@ class PdfFileManager:
             """,
             (str(uuid.uuid4()), operation, file_id, group_id, now, performed_by, before_state, after_state, notes),
         )
-        conn.commit()
+        if commit:
+            conn.commit()
 
     def _row_to_pdf_file(self, row: sqlite3.Row) -> PdfFile:
         meta = row["metadata"]
@@ -784,12 +941,13 @@ class PdfFileManager:
 
     def _infer_student_id_from_path(self, path: str | Path) -> str | None:
         """Resolve a registered student's email folder in the path to that student's id."""
-        resolved = Path(path).resolve()
-        parts = set(resolved.parts)
-        matches: list[str] = []
-        for student in self.list_students():
-            if student.email and student.email in parts:
-                matches.append(student.id)
+        return self._student_id_for_path_parts(Path(path).resolve().parts, self.list_students())
+
+    @staticmethod
+    def _student_id_for_path_parts(parts: tuple[str, ...], students: list[Student]) -> str | None:
+        """The one student whose email is a segment of ``parts`` (resolved path), else None."""
+        segments = set(parts)
+        matches = [student.id for student in students if student.email and student.email in segments]
         if len(matches) == 1:
             return matches[0]
         return None
@@ -876,11 +1034,25 @@ class PdfFileManager:
         subject: str | None = None,
         is_template: bool | None = None,
         has_raw: bool | None = None,
+        grade_or_scope: str | None = None,
+        unit: str | None = None,
     ) -> list[PdfFile]:
+        """Registry search over ``pdf_files``.
+
+        ``query`` is a case-insensitive substring of ``name``. ``grade_or_scope`` and ``unit``
+        match the metadata keys of the same name exactly. Indexed (see schema.sql): filters led
+        by ``student_id`` or ``file_type`` (optionally narrowed by ``doc_type``), ``grade_or_scope``,
+        ``unit``, and ``query`` via ``pdf_files_fts``. ``subject``, ``is_template``, ``has_raw``
+        and ``doc_type`` alone are applied while scanning.
+        """
         conn = self._get_connection()
         sql = "SELECT * FROM pdf_files WHERE 1=1"
         params: list = []
         if query is not None:
+            if self._fts_enabled:
+                # The trigram index narrows candidates; the LIKE below keeps the exact semantics.
+                sql += " AND rowid IN (SELECT rowid FROM pdf_files_fts WHERE name LIKE ?)"
+                params.append(f"%{query}%")
             sql += " AND LOWER(name) LIKE LOWER(?)"
             params.append(f"%{query}%")
         if file_type is not None:
@@ -901,10 +1073,41 @@ class PdfFileManager:
         if has_raw is not None:
             sql += " AND has_raw = ?"
             params.append(1 if has_raw else 0)
+        if grade_or_scope is not None:
+            sql += " AND json_extract(metadata, '$.grade_or_scope') = ?"
+            params.append(grade_or_scope)
+        if unit is not None:
+            sql += " AND json_extract(metadata, '$.unit') = ?"
+            params.append(unit)
         sql += " ORDER BY added_at"
         rows = conn.execute(sql, params).fetchall()
         return [self._row_to_pdf_file(row) for row in rows]
 
+    def _raw_source_stems_for_files(self, file_ids: list[str]) -> dict[str, tuple[str, ...]]:
+        """Bulk :meth:`_raw_source_stems_for_file` (relations in original row order)."""
+        conn = self._get_connection()
+        linked: dict[str, list[tuple[int, str]]] = {}
+        for chunk in _id_chunks(list(dict.fromkeys(file_ids))):
+            placeholders = ",".join("?" for _ in chunk)
+            rows = conn.execute(
+                f"""SELECT r.rowid AS rid, r.source_id AS file_id, f.path FROM file_relations r
+                    JOIN pdf_files f ON f.id = r.target_id
+                    WHERE r.relation_type IN ('raw_source', 'main_version') AND f.file_type = 'raw'
+                      AND r.source_id IN ({placeholders})
+                    UNION ALL
+                    SELECT r.rowid AS rid, r.target_id AS file_id, f.path FROM file_relations r
+                    JOIN pdf_files f ON f.id = r.source_id
+                    WHERE r.relation_type IN ('raw_source', 'main_version') AND f.file_type = 'raw'
+                      AND r.target_id IN ({placeholders})""",
+                chunk + chunk,
+            ).fetchall()
+            for row in rows:
+                linked.setdefault(row["file_id"], []).append((row["rid"], row["path"]))
+        out: dict[str, tuple[str, ...]] = {}
+        for file_id, items in linked.items():
+            out[file_id] = tuple(dict.fromkeys(Path(path).stem for _rid, path in sorted(items)))
+        return out
+
     def _raw_source_stems_for_file(self, file_id: str) -> tuple[str, ...]:
         raw_stems: list[str] = []
         for related_file, _relation_type in self.get_related_files(file_id):
@@ -942,6 +1145,37 @@ class PdfFileManager:
             folder_scope=folder_scope,
         )
 
+    def get_goodnotes_document_timestamps_for_files(
+        self,
+        file_ids: list[str],
+        *,
+        include_deleted: bool = False,
+        folder_scope: GoodnotesFolderScope | None = None,
+    ) -> dict[str, GoodnotesDocumentMatch]:
+        """Bulk :meth:`get_goodnotes_document_timestamps_for_file`: id -> match for every id that exists.
+
+        Registry rows and raw-source stems are read in chunked queries; every match is answered
+        from one :class:`~.goodnotes_metadata.GoodnotesMetadataIndex` snapshot.
+        """
+        files = self.get_files_by_ids(file_ids)
+        main_ids = [file_id for file_id, pdf_file in files.items() if pdf_file.file_type == "main"]
+        raw_stems = self._raw_source_stems_for_files(main_ids) if main_ids else {}
+        requests = [
+            GoodnotesMatchRequest(
+                pdf_file.id,
+                pdf_file.path,
+                pdf_file.file_type,
+                raw_stems.get(pdf_file.id, ()),
+            )
+            for pdf_file in files.values()
+        ]
+        matches = get_goodnotes_document_matches(
+            requests,
+            include_deleted=include_deleted,
+            folder_scope=folder_scope,
+        )
+        return {match.file_id: match for match in matches}
+
     def get_goodnotes_document_timestamps_for_path(
         self,
         path: str | Path,
@@ -1026,8 +1260,17 @@ class PdfFileManager:
         preserve_input: bool = False,
         **compress_kwargs,
     ) -> CompressResult:
-        from compress_pdf.compress_pdf import compress_pdf as _do_compress
+        job, row = self._prepare_compression_job(file_id_or_path, preserve_input=preserve_input, **compress_kwargs)
+        result = _run_compression_job(job)
+        return self._record_compression(job, row, result, min_savings_pct=min_savings_pct)
 
+    def _prepare_compression_job(
+        self,
+        file_id_or_path,
+        preserve_input: bool = False,
+        **compress_kwargs,
+    ) -> tuple["_CompressionJob", sqlite3.Row]:
+        """Registry half of compress_and_register before compression: resolve/register the row."""
         conn = self._get_connection()
         s = str(file_id_or_path)
         is_path = "/" in s or "\\" in s or s.endswith(".pdf")
@@ -1041,40 +1284,30 @@ class PdfFileManager:
             row = conn.execute("SELECT * FROM pdf_files WHERE id = ?", (str(file_id_or_path),)).fetchone()
             if not row:
                 raise NotFoundError(f"File not found: {file_id_or_path}")
-        file_id, file_path, _ = row["id"], row["path"], row
         if row["file_type"] != "unknown":
             raise ValueError(f"compress_and_register requires file_type='unknown'; got {row['file_type']!r}")
-        dir_path = Path(file_path).parent
-        name = row["name"]
-        # GoodNotes-safe variant: preserve the original input file and create a
-        # new compressed copy alongside it, treating the original as raw.
-        if preserve_input:
-            raw_path = Path(file_path)
-            raw_name = name
-            main_name = f"_c_{name}"
-            main_path = dir_path / main_name
-            if main_path.exists():
-                raise ValueError(f"Destination already exists: {main_path}")
-        else:
-            raw_name = f"_raw_{name}"
-            raw_path = dir_path / raw_name
-            if raw_path.exists():
-                raise ValueError(f"Destination already exists: {raw_path}")
-            shutil.move(str(file_path), str(raw_path))
-            main_name = f"_c_{name}"
-            main_path = dir_path / main_name
-        try:
-            result = _do_compress(
-                str(raw_path),
-                output_name=main_name,
-                **compress_kwargs,
-            )
-            savings = result.savings_pct
-        except Exception:
-            # On failure, restore original location when we moved it.
-            if not preserve_input:
-                shutil.move(str(raw_path), str(file_path))
-            raise
+        job = _CompressionJob(
+            file_path=row["path"],
+            name=row["name"],
+            preserve_input=preserve_input,
+            compress_kwargs=dict(compress_kwargs),
+        )
+        return job, row
+
+    def _record_compression(
+        self,
+        job: "_CompressionJob",
+        row: sqlite3.Row,
+        result,
+        *,
+        min_savings_pct: float,
+    ) -> CompressResult:
+        """Registry half of compress_and_register after compression: write rows, relations and log."""
+        conn = self._get_connection()
+        file_id, file_path = row["id"], row["path"]
+        raw_name, raw_path, main_name, main_path = job.paths()
+        preserve_input = job.preserve_input
+        savings = result.savings_pct
         if savings >= min_savings_pct and not result.skipped:
             now = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
             main_id = str(uuid.uuid4())
@@ -1444,7 +1677,29 @@ class PdfFileManager:
         auto_fix_template: bool = True,
         inherit_metadata: bool = True,
         on_file_start: Callable[[Path], None] | None = None,
+        compress_workers: int | None = None,
+        on_file_done: Callable[[Path, ScanResult | None], None] | None = None,
+        compress_page_workers: int | None = None,
     ) -> list[ScanResult]:
+        """Register new PDFs under the scan roots, compressing files that need it.
+
+        With ``compress_workers > 1`` compression is pipelined: the scan queues every file
+        that needs compressing, ``compress_pdf`` runs in a process pool, and this thread
+        applies each finished result to the registry as it arrives (the registry connection
+        stays single-writer). ``on_file_start`` fires when a file is queued and
+        ``on_file_done`` when its registry update lands (in either mode). Results keep scan
+        order. If any compression fails, the remaining jobs still finish and are recorded,
+        then the first error is raised.
+
+        ``compress_page_workers`` is passed to ``compress_pdf(workers=...)`` so each file's
+        pages also render in parallel. Both counts default to ``PDF_COMPRESS_WORKERS`` /
+        ``PDF_COMPRESS_PAGE_WORKERS`` (1 when unset).
+        """
+        if compress_workers is None:
+            compress_workers = _default_compress_workers("PDF_COMPRESS_WORKERS")
+        if compress_page_workers is None:
+            compress_page_workers = _default_compress_workers("PDF_COMPRESS_PAGE_WORKERS")
+
         def _build_dry_run_preview(file_type: str, pdf_path: Path, inferred: dict, inferred_student_id: str | None) -> PdfFile:
             metadata = inferred.get("metadata")
             inferred_doc_type = self._normalize_doc_type(inferred.get("doc_type") or "exam")
@@ -1466,6 +1721,80 @@ class PdfFileManager:
                 notes=None,
             )
 
+        def _apply_compress_result(
+            pdf_path: Path,
+            result: CompressResult,
+            *,
+            root_student_id: str | None,
+            inferred: dict,
+            inferred_student_id: str | None,
+            link_goodnotes: bool,
+        ) -> ScanResult | None:
+            if root_student_id:
+                conn.execute("UPDATE pdf_files SET student_id = ? WHERE id = ?", (root_student_id, result.main_file_id))
+                if result.raw_archive_id:
+                    conn.execute("UPDATE pdf_files SET student_id = ? WHERE id = ?", (root_student_id, result.raw_archive_id))
+                conn.commit()
+            if inferred:
+                kwargs = {k: v for k, v in inferred.items() if k != "metadata" and v is not None}
+                if inferred_student_id is not None:
+                    kwargs["student_id"] = inferred_student_id
+                if inferred.get("metadata"):
+                    kwargs["metadata"] = inferred["metadata"]
+                if kwargs:
+                    self.update_metadata(result.main_file_id, **kwargs)
+                    if result.raw_archive_id:
+                        self.update_metadata(result.raw_archive_id, **kwargs)
+            main_file = self.get_file(result.main_file_id)
+            raw_file = self.get_file(result.raw_archive_id) if result.raw_archive_id else None
+            if not main_file:
+                return None
+            template_link = None
+            if link_goodnotes:
+                template_link = self._auto_link_goodnotes_after_scan(
+                    Path(main_file.path),
+                    dry_run=False,
+                    auto_link_goodnotes=auto_link_goodnotes,
+                    auto_fix_template=auto_fix_template,
+                    inherit_metadata=inherit_metadata,
+                )
+            return ScanResult(
+                file=main_file,
+                raw_archive=raw_file,
+                compressed=result.compressed,
+                template_link=template_link,
+            )
+
+        pipelined = compress_workers > 1 and not dry_run
+        # (result slot, pdf_path, job, row, apply kwargs) for the pipelined mode.
+        pending: list[tuple[int, Path, _CompressionJob, sqlite3.Row, dict]] = []
+
+        def _compress_one(target, pdf_path: Path, *, preserve_input: bool, apply_kwargs: dict) -> None:
+            if pipelined:
+                job, row = self._prepare_compression_job(
+                    target, preserve_input=preserve_input, workers=compress_page_workers
+                )
+                results.append(None)
+                pending.append((len(results) - 1, pdf_path, job, row, apply_kwargs))
+                if on_file_start is not None:
+                    on_file_start(pdf_path)
+                return
+            if on_file_start is not None:
+                on_file_start(pdf_path)
+            if preserve_input:
+                result = self.compress_and_register(
+                    target, min_savings_pct=min_savings_pct, preserve_input=True, workers=compress_page_workers
+                )
+            else:
+                result = self.compress_and_register(
+                    target, min_savings_pct=min_savings_pct, workers=compress_page_workers
+                )
+            scan_result = _apply_compress_result(pdf_path, result, **apply_kwargs)
+            if scan_result is not None:
+                results.append(scan_result)
+            if on_file_done is not None:
+                on_file_done(pdf_path, scan_result)
+
         conn = self._get_connection()
         if roots is not None:
             configured_scan_roots = {r.path: r.student_id for r in self.list_scan_roots()}
@@ -1479,7 +1808,7 @@ class PdfFileManager:
                 raise ConfigError("No scan roots configured. Add one with: config add-root <path> [--student-id <id>]")
             root_entries = [ (r.path, r.student_id) for r in scan_roots_list ]
         registered_paths = { row[0] for row in conn.execute("SELECT path FROM pdf_files").fetchall() }
-        results: list[ScanResult] = []
+        results: list[ScanResult | None] = []
         book_folders_to_sync: set[Path] = set()
         for root_path, root_student_id in root_entries:
             root_p = Path(root_path)
@@ -1507,32 +1836,17 @@ class PdfFileManager:
                                 )
                             )
                             continue
-                        if on_file_start is not None:
-                            on_file_start(pdf_path)
-                        is_goodnotes = "GoodNotes" in pdf_path.parts
-                        if is_goodnotes:
-                            result = self.compress_and_register(existing.id, min_savings_pct=min_savings_pct, preserve_input=True)
-                        else:
-                            result = self.compress_and_register(existing.id, min_savings_pct=min_savings_pct)
-                        if root_student_id:
-                            conn.execute("UPDATE pdf_files SET student_id = ? WHERE id = ?", (root_student_id, result.main_file_id))
-                            if result.raw_archive_id:
-                                conn.execute("UPDATE pdf_files SET student_id = ? WHERE id = ?", (root_student_id, result.raw_archive_id))
-                            conn.commit()
-                        if inferred:
-                            kwargs = {k: v for k, v in inferred.items() if k != "metadata" and v is not None}
-                            if inferred_student_id is not None:
-                                kwargs["student_id"] = inferred_student_id
-                            if inferred.get("metadata"):
-                                kwargs["metadata"] = inferred["metadata"]
-                            if kwargs:
-                                self.update_metadata(result.main_file_id, **kwargs)
-                                if result.raw_archive_id:
-                                    self.update_metadata(result.raw_archive_id, **kwargs)
-                        main_file = self.get_file(result.main_file_id)
-                        raw_file = self.get_file(result.raw_archive_id) if result.raw_archive_id else None
-                        if main_file:
-                            results.append(ScanResult(file=main_file, raw_archive=raw_file, compressed=result.compressed))
+                        _compress_one(
+                            existing.id,
+                            pdf_path,
+                            preserve_input="GoodNotes" in pdf_path.parts,
+                            apply_kwargs={
+                                "root_student_id": root_student_id,
+                                "inferred": inferred,
+                                "inferred_student_id": inferred_student_id,
+                                "link_goodnotes": False,
+                            },
+                        )
                         continue
                     if not dry_run:
                         if existing and inferred:
@@ -1632,52 +1946,43 @@ class PdfFileManager:
                         compressed=False,
                     ))
                     continue
-                if on_file_start is not None:
-                    on_file_start(pdf_path)
                 # For GoodNotes trees, prefer preserve_input=True so originals
                 # are never renamed or moved; elsewhere keep existing behaviour.
                 is_goodnotes = "GoodNotes" in pdf_path.parts
-                if is_goodnotes:
-                    result = self.compress_and_register(pdf_path, min_savings_pct=min_savings_pct, preserve_input=True)
-                else:
-                    result = self.compress_and_register(pdf_path, min_savings_pct=min_savings_pct)
-                if root_student_id:
-                    conn.execute("UPDATE pdf_files SET student_id = ? WHERE id = ?", (root_student_id, result.main_file_id))
-                    if result.raw_archive_id:
-                        conn.execute("UPDATE pdf_files SET student_id = ? WHERE id = ?", (root_student_id, result.raw_archive_id))
-                    conn.commit()
-                if inferred:
-                    kwargs = {k: v for k, v in inferred.items() if k != "metadata" and v is not None}
-                    if inferred_student_id is not None:
-                        kwargs["student_id"] = inferred_student_id
-                    if inferred.get("metadata"):
-                        kwargs["metadata"] = inferred["metadata"]
-                    if kwargs:
-                        self.update_metadata(result.main_file_id, **kwargs)
-                        if result.raw_archive_id:
-                            self.update_metadata(result.raw_archive_id, **kwargs)
-                main_file = self.get_file(result.main_file_id)
-                raw_file = self.get_file(result.raw_archive_id) if result.raw_archive_id else None
-                if main_file:
-                    template_link = None
-                    if is_goodnotes:
-                        template_link = self._auto_link_goodnotes_after_scan(
-                            Path(main_file.path),
-                            dry_run=False,
-                            auto_link_goodnotes=auto_link_goodnotes,
-                            auto_fix_template=auto_fix_template,
-                            inherit_metadata=inherit_metadata,
-                        )
-                    results.append(ScanResult(
-                        file=main_file,
-                        raw_archive=raw_file,
-                        compressed=result.compressed,
-                        template_link=template_link,
-                    ))
+                _compress_one(
+                    pdf_path,
+                    pdf_path,
+                    preserve_input=is_goodnotes,
+                    apply_kwargs={
+                        "root_student_id": root_student_id,
+                        "inferred": inferred,
+                        "inferred_student_id": inferred_student_id,
+                        "link_goodnotes": is_goodnotes,
+                    },
+                )
+        if pending:
+            first_error: Exception | None = None
+            with ProcessPoolExecutor(max_workers=min(compress_workers, len(pending))) as pool:
+                futures = {pool.submit(_run_compression_job, item[2]): item for item in pending}
+                for future in as_completed(futures):
+                    slot, pdf_path, job, row, apply_kwargs = futures[future]
+                    try:
+                        compressed = future.result()
+                    except Exception as exc:
+                        logger.warning("compression failed for %s: %s", pdf_path, exc)
+                        if first_error is None:
+                            first_error = exc
+                        continue
+                    result = self._record_compression(job, row, compressed, min_savings_pct=min_savings_pct)
+                    results[slot] = _apply_compress_result(pdf_path, result, **apply_kwargs)
+                    if on_file_done is not None:
+                        on_file_done(pdf_path, results[slot])
+            if first_error is not None:
+                raise first_error
         if not dry_run:
             for book_folder in sorted(book_folders_to_sync):
                 self.ensure_book_group_from_path(book_folder)
-        return results
+        return [r for r in results if r is not None]
 
     # ---------------------------------------------------------------------------
     # Phase 3: update_metadata, rename_file, move_file, delete_file, open_file
@@ -2025,17 +2330,17 @@ class PdfFileManager:
         """Return raw/main counterpart (raw_source and main_version only). Each element is (PdfFile, relation_type)."""
         conn = self._get_connection()
         rows = conn.execute(
-            """SELECT source_id, target_id, relation_type FROM file_relations
-               WHERE (source_id = ? OR target_id = ?) AND relation_type IN ('raw_source', 'main_version')""",
-            (file_id, file_id),
+            """SELECT f.*, r.relation_type AS relation_type, r.rowid AS rid FROM file_relations r
+               JOIN pdf_files f ON f.id = r.target_id
+               WHERE r.source_id = ? AND r.relation_type IN ('raw_source', 'main_version')
+               UNION ALL
+               SELECT f.*, r.relation_type AS relation_type, r.rowid AS rid FROM file_relations r
+               JOIN pdf_files f ON f.id = r.source_id
+               WHERE r.target_id = ? AND r.source_id != ? AND r.relation_type IN ('raw_source', 'main_version')
+               ORDER BY rid""",
+            (file_id, file_id, file_id),
         ).fetchall()
-        result = []
-        for row in rows:
-            other_id = row["target_id"] if row["source_id"] == file_id else row["source_id"]
-            other = self.get_file(other_id)
-            if other:
-                result.append((other, row["relation_type"]))
-        return result
+        return [(self._row_to_pdf_file(row), row["relation_type"]) for row in rows]
 
     def _get_raw_main_pair(self, file_id: str) -> tuple[PdfFile | None, PdfFile | None]:
         current = self.get_file(file_id)
@@ -2207,14 +2512,54 @@ class PdfFileManager:
     def get_completions(self, template_id: str) -> list[PdfFile]:
         conn = self._get_connection()
         rows = conn.execute(
-            "SELECT target_id FROM file_relations WHERE source_id = ? AND relation_type = 'template_for'",
+            """SELECT f.* FROM file_relations r
+               JOIN pdf_files f ON f.id = r.target_id
+               WHERE r.source_id = ? AND r.relation_type = 'template_for'
+               ORDER BY r.target_id""",
             (template_id,),
         ).fetchall()
-        out = []
-        for row in rows:
-            f = self.get_file(row["target_id"])
-            if f:
-                out.append(f)
+        return [self._row_to_pdf_file(row) for row in rows]
+
+    def get_files_by_ids(self, file_ids: list[str]) -> dict[str, PdfFile]:
+        """Bulk :meth:`get_file`: id -> row for every id that exists."""
+        conn = self._get_connection()
+        out: dict[str, PdfFile] = {}
+        for chunk in _id_chunks(list(dict.fromkeys(file_ids))):
+            placeholders = ",".join("?" for _ in chunk)
+            rows = conn.execute(f"SELECT * FROM pdf_files WHERE id IN ({placeholders})", chunk).fetchall()
+            for row in rows:
+                out[row["id"]] = self._row_to_pdf_file(row)
+        return out
+
+    def get_templates_for_files(self, file_ids: list[str]) -> dict[str, PdfFile]:
+        """Bulk :meth:`get_template`: completion id -> linked template (``completed_from``)."""
+        conn = self._get_connection()
+        out: dict[str, PdfFile] = {}
+        for chunk in _id_chunks(list(dict.fromkeys(file_ids))):
+            placeholders = ",".join("?" for _ in chunk)
+            rows = conn.execute(
+                f"""SELECT r.source_id AS completion_id, f.* FROM file_relations r
+                    JOIN pdf_files f ON f.id = r.target_id
+                    WHERE r.relation_type = 'completed_from' AND r.source_id IN ({placeholders})""",
+                chunk,
+            ).fetchall()
+            for row in rows:
+                out[row["completion_id"]] = self._row_to_pdf_file(row)
+        return out
+
+    def _get_completions_for_templates(self, template_ids: list[str]) -> dict[str, list[PdfFile]]:
+        conn = self._get_connection()
+        out: dict[str, list[PdfFile]] = {}
+        for chunk in _id_chunks(list(dict.fromkeys(template_ids))):
+            placeholders = ",".join("?" for _ in chunk)
+            rows = conn.execute(
+                f"""SELECT r.source_id AS template_id, f.* FROM file_relations r
+                    JOIN pdf_files f ON f.id = r.target_id
+                    WHERE r.relation_type = 'template_for' AND r.source_id IN ({placeholders})""",
+                chunk,
+            ).fetchall()
+            for row in rows:
+                out.setdefault(row["template_id"], []).append(self._row_to_pdf_file(row))
         return out
 
     # -----------------------------------------------------------------------
@@ -2266,6 +2611,45 @@ class PdfFileManager:
                 return series, member
         return None
 
+    def get_completion_series_members_for_files(self, file_ids: list[str]) -> dict[str, tuple]:
+        """Bulk :meth:`get_completion_series_member` using a fixed number of set-based queries.
+
+        Returns ``file_id -> (CompletionSeries, CompletionSeriesMember)`` for files that belong
+        to a series; same membership and ordering rules as the single-file method.
+        """
+        from ai_study_buddy.pdf_file_manager.completion_series import build_completion_series
+
+        files = self.get_files_by_ids(file_ids)
+        candidates = [fid for fid, f in files.items() if f.student_id]
+        templates = {
+            fid: t for fid, t in self.get_templates_for_files(candidates).items() if t.is_template
+        }
+        completions_by_template = self._get_completions_for_templates(
+            sorted({t.id for t in templates.values()})
+        )
+        students = {s.id: s for s in self.list_students()}
+        series_by_key: dict[tuple[str, str], object] = {}
+        out: dict[str, tuple] = {}
+        for fid, template in templates.items():
+            student_id = files[fid].student_id
+            key = (student_id, template.id)
+            if key not in series_by_key:
+                student = students.get(student_id)
+                series_by_key[key] = build_completion_series(
+                    student_id=student.id if student else student_id,
+                    student_name=student.name if student else None,
+                    template_file_id=template.id,
+                    completions=completions_by_template.get(template.id, []),
+                )
+            series = series_by_key[key]
+            if series is None:
+                continue
+            for member in series.members:
+                if member.file_id == fid:
+                    out[fid] = (series, member)
+                    break
+        return out
+
     def next_attempt_sequence_for_completion(self, file_id: str) -> int | None:
         completion = self.get_file(file_id)
         if completion is None or not completion.student_id:
@@ -2963,18 +3347,69 @@ class PdfFileManager:
     def get_completion_dates_for_files(
         self, file_ids: list[str]
     ) -> dict[str, CompletionDateRecord]:
-        if not file_ids:
-            return {}
-        conn = self._get_connection()
-        placeholders = ",".join("?" for _ in file_ids)
-        rows = conn.execute(
-            f"SELECT * FROM file_completion_dates WHERE file_id IN ({placeholders})",
-            file_ids,
-        ).fetchall()
         return {
-            row["file_id"]: self._row_to_completion_date_record(row) for row in rows
+            file_id: self._row_to_completion_date_record(row)
+            for file_id, row in self._completion_date_rows_for_files(file_ids).items()
         }
 
+    def _completion_date_rows_for_files(self, file_ids: list[str]) -> dict[str, sqlite3.Row]:
+        conn = self._get_connection()
+        out: dict[str, sqlite3.Row] = {}
+        for chunk in _id_chunks(list(dict.fromkeys(file_ids))):
+            placeholders = ",".join("?" for _ in chunk)
+            rows = conn.execute(
+                f"SELECT * FROM file_completion_dates WHERE file_id IN ({placeholders})",
+                chunk,
+            ).fetchall()
+            for row in rows:
+                out[row["file_id"]] = row
+        return out
+
+    def _write_inferred_completion_dates(
+        self,
+        plans: list,
+        existing_rows: dict[str, sqlite3.Row],
+        written_by_source: dict[str, int],
+    ) -> int:
+        """Stage every planned inference write and commit once; returns rows written.
+
+        Plans with invalid values are logged and skipped; a database error rolls back
+        the whole batch.
+        """
+        from .completion_date.batch import page1_inference_log_state
+
+        conn = self._get_connection()
+        written = 0
+        try:
+            for plan in plans:
+                try:
+                    values = _normalize_completion_date_values(
+                        plan.completion_date, plan.source, plan.confidence, plan.inference_model
+                    )
+                except ValueError:
+                    logger.exception("completion-date inference failed for %s", plan.pdf.id)
+                    continue
+                self._stage_completion_date(
+                    plan.pdf.id,
+                    values,
+                    existing_rows.get(plan.pdf.id),
+                    source_detail=plan.source_detail,
+                )
+                if plan.source == PAGE1_SOURCE:
+                    self._log_operation(
+                        "infer_completion_date",
+                        file_id=plan.pdf.id,
+                        after_state=page1_inference_log_state(plan),
+                        commit=False,
+                    )
+                written += 1
+                written_by_source[plan.source] = written_by_source.get(plan.source, 0) + 1
+            conn.commit()
+        except sqlite3.Error:
+            conn.rollback()
+            raise
+        return written
+
     def set_completion_date(
         self,
         file_id: str,
@@ -2985,22 +3420,40 @@ class PdfFileManager:
         inference_model: str | None = None,
         source_detail: dict | None = None,
     ) -> CompletionDateRecord:
-        completion_date = normalize_completion_date(completion_date)
-        source = normalize_completion_date_source(source)
-        confidence = normalize_completion_date_confidence(confidence)
-        inference_model = normalize_inference_model(inference_model)
-        validate_inferred_completion_date_provenance(
-            source=source,
-            confidence=confidence,
-            inference_model=inference_model,
+        values = _normalize_completion_date_values(
+            completion_date, source, confidence, inference_model
         )
         self._validate_completion_date_target(file_id)
-        detail_json = json.dumps(source_detail) if source_detail is not None else None
         conn = self._get_connection()
         existing = conn.execute(
             "SELECT * FROM file_completion_dates WHERE file_id = ?",
             (file_id,),
         ).fetchone()
+        self._stage_completion_date(file_id, values, existing, source_detail=source_detail)
+        conn.commit()
+        row = conn.execute(
+            "SELECT * FROM file_completion_dates WHERE file_id = ?",
+            (file_id,),
+        ).fetchone()
+        assert row is not None
+        return self._row_to_completion_date_record(row)
+
+    def _stage_completion_date(
+        self,
+        file_id: str,
+        values: tuple[str, str, str | None, str | None],
+        existing: sqlite3.Row | None,
+        *,
+        source_detail: dict | None,
+    ) -> None:
+        """Insert/update one file_completion_dates row plus its operation_log entry, uncommitted.
+
+        ``values`` comes from ``_normalize_completion_date_values``; ``existing`` is the
+        current row (or None). The caller commits.
+        """
+        completion_date, source, confidence, inference_model = values
+        detail_json = json.dumps(source_detail) if source_detail is not None else None
+        conn = self._get_connection()
         now = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
         after_payload = {
             "file_id": file_id,
@@ -3031,11 +3484,11 @@ class PdfFileManager:
                     now,
                 ),
             )
-            conn.commit()
             self._log_operation(
                 "set_completion_date",
                 file_id=file_id,
                 after_state=json.dumps(after_payload),
+                commit=False,
             )
         else:
             before_payload = {
@@ -3070,20 +3523,13 @@ class PdfFileManager:
                     file_id,
                 ),
             )
-            conn.commit()
-            after_payload["updated_at"] = now
             self._log_operation(
                 "set_completion_date",
                 file_id=file_id,
                 before_state=json.dumps(before_payload),
                 after_state=json.dumps(after_payload),
+                commit=False,
             )
-        row = conn.execute(
-            "SELECT * FROM file_completion_dates WHERE file_id = ?",
-            (file_id,),
-        ).fetchone()
-        assert row is not None
-        return self._row_to_completion_date_record(row)
 
     def clear_completion_date(self, file_id: str) -> None:
         conn = self._get_connection()
@@ -3249,6 +3695,7 @@ class PdfFileManager:
         dry_run: bool = False,
         force: bool = False,
         force_manual: bool = False,
+        workers: int = DEFAULT_INFERENCE_WORKERS,
     ) -> InferCompletionDatesReport:
         """Batch completion-date inference over a selected cohort.
 
@@ -3257,9 +3704,12 @@ class PdfFileManager:
         - Otherwise, select main, non-template files via filters on ``student_id``,
           ``root`` (d_root / g_root / None), and ``doc_types``.
 
-        Delegates per-file work to ``infer_completion_date_for_file`` and accumulates
-        counts in an ``InferCompletionDatesReport``. When ``dry_run=True``, this still
-        walks the cohort but does **not** write any rows.
+        Runs the bulk engine (``completion_date.batch.infer_completion_dates_bulk``): one
+        load of existing rows, page-1 / GoodNotes lookups on ``workers`` threads, the same
+        priority chain as ``infer_completion_date_for_file`` resolved in memory, and all
+        upserts committed in one transaction. ``report.timings`` summarizes time per stage
+        and source. When ``dry_run=True``, this still walks the cohort but does **not**
+        write any rows.
         """
         report = InferCompletionDatesReport()
         active = methods if methods is not None else COMPLETION_DATE_SOURCES
@@ -3305,60 +3755,16 @@ class PdfFileManager:
         if not candidates or not active:
             return report
 
-        for pdf in candidates:
-            report = merge_infer_completion_dates_report(
-                report, processed=report.processed + 1
-            )
-            existing = self.get_completion_date(pdf.id)
-            if existing is not None:
-                if existing.source == "manual" and not force_manual:
-                    report = merge_infer_completion_dates_report(
-                        report, skipped_manual=report.skipped_manual + 1
-                    )
-                    continue
-                if existing.source != "manual" and not force:
-                    report = merge_infer_completion_dates_report(
-                        report, skipped_existing=report.skipped_existing + 1
-                    )
-                    continue
-
-            if dry_run:
-                if existing is None:
-                    report = merge_infer_completion_dates_report(
-                        report, still_undated=report.still_undated + 1
-                    )
-                continue
-
-            try:
-                result = self.infer_completion_date_for_file(
-                    pdf.id,
-                    force=force,
-                    force_manual=force_manual,
-                    methods=active,
-                    work_dir=work_dir,
-                )
-            except Exception:
-                logger.exception("completion-date inference failed for %s", pdf.id)
-                report = merge_infer_completion_dates_report(
-                    report, failed=report.failed + 1
-                )
-                continue
-
-            if result is None:
-                if self.get_completion_date(pdf.id) is None:
-                    report = merge_infer_completion_dates_report(
-                        report, still_undated=report.still_undated + 1
-                    )
-                else:
-                    report = merge_infer_completion_dates_report(
-                        report, written=report.written + 1
-                    )
-            else:
-                report = merge_infer_completion_dates_report(
-                    report, written=report.written + 1
-                )
-
-        return report
+        return infer_completion_dates_bulk(
+            self,
+            candidates,
+            active=active,
+            work_dir=work_dir,
+            dry_run=dry_run,
+            force=force,
+            force_manual=force_manual,
+            workers=workers,
+        )
 
     def import_book_answer_mappings_from_json(
         self,
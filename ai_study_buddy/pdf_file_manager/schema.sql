@@ -30,6 +30,19 @@ CREATE TABLE IF NOT EXISTS pdf_files (
     notes          TEXT
 );
 
+-- find_files filters; metadata expression indexes must match the json_extract() text used in queries
+CREATE INDEX IF NOT EXISTS idx_pdf_files_student_type
+    ON pdf_files(student_id, file_type, doc_type);
+
+CREATE INDEX IF NOT EXISTS idx_pdf_files_file_type_doc_type
+    ON pdf_files(file_type, doc_type);
+
+CREATE INDEX IF NOT EXISTS idx_pdf_files_grade_or_scope
+    ON pdf_files(json_extract(metadata, '$.grade_or_scope'));
+
+CREATE INDEX IF NOT EXISTS idx_pdf_files_unit
+    ON pdf_files(json_extract(metadata, '$.unit'));
+
 -- Raw ↔ main pairs; template ↔ completed pairs
 CREATE TABLE IF NOT EXISTS file_relations (
     id            TEXT PRIMARY KEY,
@@ -41,6 +54,10 @@ CREATE TABLE IF NOT EXISTS file_relations (
     UNIQUE(source_id, target_id, relation_type)
 );
 
+-- source_id lookups use the UNIQUE index above
+CREATE INDEX IF NOT EXISTS idx_file_relations_target
+    ON file_relations(target_id, relation_type);
+
 -- Named groups of files
 CREATE TABLE IF NOT EXISTS file_groups (
     id         TEXT PRIMARY KEY,
@@ -35,6 +35,8 @@ def load_missing_on_disk(db_path: Path | None = None) -> list[dict]:
         "-m",
         "ai_study_buddy.pdf_file_manager.scripts.validate_pdf_registry_integrity",
         "--json",
+        "--checks",
+        "missing_on_disk_files",
     ]
     if db_path is not None:
         args += ["--db", str(db_path)]
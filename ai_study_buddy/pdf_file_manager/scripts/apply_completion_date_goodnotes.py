@@ -62,6 +62,7 @@ def main() -> int:
     cohort = list_g_root_browser_cohort_files(mgr)
     report = ApplyGoodnotesReport(by_status={})
 
+    todo = []
     for pdf in cohort:
         report.processed += 1
         existing = mgr.get_completion_date(pdf.id)
@@ -72,8 +73,12 @@ def main() -> int:
             if undated_only or not args.force:
                 report.skipped_existing += 1
                 continue
+        todo.append(pdf)
 
-        match = mgr.get_goodnotes_document_timestamps_for_file(pdf.id)
+    # One metadata snapshot for the whole cohort instead of a DB round-trip per file.
+    matches = mgr.get_goodnotes_document_timestamps_for_files([pdf.id for pdf in todo])
+    for pdf in todo:
+        match = matches[pdf.id]
         assert report.by_status is not None
         report.by_status[match.status] = report.by_status.get(match.status, 0) + 1
 
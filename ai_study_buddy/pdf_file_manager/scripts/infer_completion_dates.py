@@ -14,6 +14,7 @@ import argparse
 from pathlib import Path
 from typing import Iterable
 
+from ai_study_buddy.pdf_file_manager.completion_date.batch import DEFAULT_INFERENCE_WORKERS
 from ai_study_buddy.pdf_file_manager.pdf_file_manager import PdfFileManager
 
 
@@ -84,6 +85,12 @@ def build_arg_parser() -> argparse.ArgumentParser:
         action="store_true",
         help="Allow overwriting non-manual completion_date rows.",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=DEFAULT_INFERENCE_WORKERS,
+        help=f"Threads for page-1 / GoodNotes lookups (default {DEFAULT_INFERENCE_WORKERS}; 1 = serial).",
+    )
     parser.add_argument(
         "--force-manual",
         action="store_true",
@@ -114,6 +121,7 @@ def main(args: list[str] | None = None) -> int:
         dry_run=ns.dry_run,
         force=ns.force,
         force_manual=ns.force_manual,
+        workers=ns.workers,
     )
 
     print("completion_date inference report")
@@ -126,6 +134,12 @@ def main(args: list[str] | None = None) -> int:
     print(f"skipped_no_date : {report.skipped_no_date}")
     print(f"failed          : {report.failed}")
     print(f"still_undated   : {report.still_undated}")
+    for source, count in sorted(report.written_by_source.items()):
+        print(f"  written[{source}]: {count}")
+    if report.timings:
+        print("\ntimings (s)")
+        for key, seconds in report.timings.items():
+            print(f"  {key:<18}: {seconds:.3f}")
 
     if ns.dry_run:
         print("\nNote: dry-run mode; no registry rows were written.")
@@ -1,7 +1,9 @@
 #!/usr/bin/env python3
 """Prepare Phase 2 page-1 batch: d_root cohort manifest + rendered PNGs (no vision).
 
-Renders page 1 for every file and page 2 when the PDF has ≥2 pages. After this script, run
+Renders page 1 for every file and page 2 when the PDF has ≥2 pages, through the
+content-addressed render cache (``<work_dir>/render_cache``): unchanged PDFs are not
+re-rendered on later runs. After this script, run
 the Cursor agent ``completion-date-page1-inspector`` (``model: inherit``) per manifest item:
 inspect ``page1_image_path`` first; if no date and ``page2_image_path`` is set, inspect page 2.
 Write JSON to ``<work_dir>/results/<file_id>.json``. Then run
@@ -57,6 +59,12 @@ def main() -> int:
     )
     parser.add_argument("--dry-run", action="store_true", help="Manifest only; do not render PNGs")
     parser.add_argument("--limit", type=int, default=None, help="Max files (testing)")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Render processes for cache misses (default: 4)",
+    )
     parser.add_argument("--json", action="store_true", help="Print manifest JSON to stdout")
     args = parser.parse_args()
 
@@ -66,6 +74,7 @@ def main() -> int:
         return 2
 
     from ai_study_buddy.pdf_file_manager.completion_date.page1 import (
+        DEFAULT_RENDER_WORKERS,
         default_page1_work_dir,
         manifest_path_for,
         prepare_page1_batch,
@@ -81,6 +90,7 @@ def main() -> int:
         include_activity_note=not args.exclude_activity_note,
         dry_run=args.dry_run,
         limit=args.limit,
+        render_workers=args.workers if args.workers is not None else DEFAULT_RENDER_WORKERS,
     )
 
     if args.json:
@@ -101,6 +111,8 @@ def main() -> int:
         print(f"Total: {manifest.counts.get('total', 0)}")
         print(f"  priority (non-book): {manifest.counts.get('priority', 0)}")
         print(f"  deprioritized (book): {manifest.counts.get('deprioritized', 0)}")
+        print(f"Render cache hits: {manifest.counts.get('cache_hits', 0)}")
+        print(f"Rendered this run: {manifest.counts.get('rendered', 0)}")
         if args.dry_run:
             print("(dry-run: PNGs not rendered)")
         else:
@@ -0,0 +1,102 @@
+"""Weekly import: register and compress new PDFs under the scan roots.
+
+Usage (from repo root or ai_study_buddy/):
+
+    python3 -m ai_study_buddy.pdf_file_manager.scripts.scan_for_new_files \\
+        --workers 4 --page-workers 2
+
+Without ``--root`` every configured scan root is scanned. ``--workers`` compresses that
+many files at once (pipelined; registry writes stay on this process) and ``--page-workers``
+renders each file's pages in parallel. Both default to ``PDF_COMPRESS_WORKERS`` /
+``PDF_COMPRESS_PAGE_WORKERS`` (1 when unset).
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+from pathlib import Path
+
+from ai_study_buddy.pdf_file_manager.pdf_file_manager import PdfFileManager, ScanResult
+
+
+def build_arg_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Register and compress new PDFs under the scan roots.")
+    parser.add_argument(
+        "--db",
+        dest="db_path",
+        help="Path to pdf_registry.db (defaults to PdfFileManager default).",
+    )
+    parser.add_argument(
+        "--root",
+        dest="roots",
+        action="append",
+        help="Scan this folder instead of the configured scan roots (may be repeated).",
+    )
+    parser.add_argument(
+        "--min-savings-pct",
+        type=float,
+        default=10,
+        help="Keep the compressed output only when it saves at least this much (default 10).",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Files compressed at once (default PDF_COMPRESS_WORKERS, else 1 = serial).",
+    )
+    parser.add_argument(
+        "--page-workers",
+        type=int,
+        default=None,
+        help="Page render/encode processes per file (default PDF_COMPRESS_PAGE_WORKERS, else 1).",
+    )
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="Report what would be registered without writing or compressing anything.",
+    )
+    return parser
+
+
+def main(args: list[str] | None = None) -> int:
+    parser = build_arg_parser()
+    ns = parser.parse_args(args=args)
+    if ns.workers is not None and ns.workers < 1:
+        parser.error("--workers must be >= 1")
+    if ns.page_workers is not None and ns.page_workers < 1:
+        parser.error("--page-workers must be >= 1")
+
+    mgr_kwargs = {}
+    if ns.db_path:
+        mgr_kwargs["db_path"] = Path(ns.db_path)
+    mgr = PdfFileManager(**mgr_kwargs)
+
+    started = time.perf_counter()
+
+    def on_file_done(path: Path, result: ScanResult | None) -> None:
+        status = "compressed" if result is not None and result.compressed else "registered"
+        print(f"[{time.perf_counter() - started:7.1f}s] {status}: {path}")
+
+    results = mgr.scan_for_new_files(
+        roots=ns.roots,
+        min_savings_pct=ns.min_savings_pct,
+        dry_run=ns.dry_run,
+        on_file_start=lambda path: print(f"queued: {path}"),
+        on_file_done=on_file_done,
+        compress_workers=ns.workers,
+        compress_page_workers=ns.page_workers,
+    )
+
+    print("scan report")
+    print("-----------")
+    print(f"files      : {len(results)}")
+    print(f"compressed : {sum(1 for r in results if r.compressed)}")
+    print(f"elapsed (s): {time.perf_counter() - started:.1f}")
+    if ns.dry_run:
+        print("\nNote: dry-run mode; no registry rows were written.")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -25,21 +25,35 @@ Health checks (for large registry operations):
 14. stored path-derived fields drifted from what the registered path now implies
 15. linked raw/main pairs live in different folders
 
+All checks read one snapshot taken up front: ``pdf_files``, ``file_relations``, book groups
+and students in a single read transaction, plus (only when a selected check needs it) one
+resolve + ``os.scandir`` pass over the registered files' folders. Checks then run
+concurrently against that snapshot; ``report["timings"]`` holds seconds per check.
+
 Usage:
   python3 -m ai_study_buddy.pdf_file_manager.scripts.validate_pdf_registry_integrity
   python3 -m ai_study_buddy.pdf_file_manager.scripts.validate_pdf_registry_integrity --json
   python3 -m ai_study_buddy.pdf_file_manager.scripts.validate_pdf_registry_integrity --db /path/to/pdf_registry.db
+  python3 -m ai_study_buddy.pdf_file_manager.scripts.validate_pdf_registry_integrity \\
+    --checks invalid_subject_values,dangling_file_relations   # quick, no filesystem pass
 """
 
 from __future__ import annotations
 
 import argparse
 import json
+import os
+import sqlite3
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from pathlib import Path
+from typing import Callable
 
-from ai_study_buddy.pdf_file_manager.pdf_file_manager import PdfFileManager
+from ai_study_buddy.pdf_file_manager.pdf_file_manager import PdfFile, PdfFileManager, Student
 
 SCRIPT_DIR = Path(__file__).resolve().parent
+DEFAULT_WORKERS = 8
 
 
 INVARIANT_METADATA_KEYS = (
@@ -61,14 +75,157 @@ def default_db_path() -> Path:
     return repo_root() / "ai_study_buddy" / "db" / "pdf_registry.db"
 
 
-def collect_invalid_chinese_variant_foundation(mgr: PdfFileManager) -> list[dict]:
-    """Rows where metadata.chinese_variant is the invalid legacy value ``foundation``."""
+@dataclass
+class RegistrySnapshot:
+    """Everything the checks read, captured once.
+
+    ``rows``/``files`` are ``pdf_files`` in ``added_at`` order (same as ``find_files``);
+    ``relations`` are ``file_relations`` in rowid order. The path fields are filled only
+    when a selected check needs them: ``resolved`` (id -> resolved path), ``scopes``
+    (``student``/``general``/None), ``inferred_student_ids`` and ``on_disk`` (ids whose
+    registered path exists).
+    """
+
+    db_path: str
+    rows: list[sqlite3.Row]
+    files: list[PdfFile]
+    relations: list[sqlite3.Row]
+    book_group_rows: list[sqlite3.Row]
+    students: list[Student]
+    resolved: dict[str, Path] = field(default_factory=dict)
+    scopes: dict[str, str | None] = field(default_factory=dict)
+    inferred_student_ids: dict[str, str | None] = field(default_factory=dict)
+    on_disk: set[str] = field(default_factory=set)
+
+    @property
+    def rows_by_path(self) -> list[sqlite3.Row]:
+        return sorted(self.rows, key=lambda row: row["path"])
+
+
+def _path_scope(resolved: Path) -> str | None:
+    if PdfFileManager._path_has_student_mirror_layout(resolved):
+        return "student"
+    if any(part in PdfFileManager._GRADE_SCOPE_SEGMENTS for part in resolved.parts):
+        return "general"
+    return None
+
+
+def _infer_book_folder(resolved: Path) -> str | None:
+    parts = resolved.parts
+    try:
+        book_idx = parts.index("Book")
+    except ValueError:
+        return None
+    if book_idx + 1 >= len(parts):
+        return None
+    return str(Path(*parts[: book_idx + 2]))
+
+
+def _existing_names(directory: str) -> set[str]:
+    """Names in ``directory`` that exist (symlinks followed, like ``Path.exists``)."""
+    try:
+        with os.scandir(directory) as entries:
+            return {entry.name for entry in entries if entry.is_file() or entry.is_dir()}
+    except OSError:
+        return set()
+
+
+def _capture_paths(snap: RegistrySnapshot, pool: ThreadPoolExecutor, *, disk: bool) -> None:
+    ids = [file.id for file in snap.files]
+    paths = [file.path for file in snap.files]
+    for file_id, resolved in zip(ids, pool.map(lambda p: Path(p).resolve(), paths, chunksize=256)):
+        snap.resolved[file_id] = resolved
+        snap.scopes[file_id] = _path_scope(resolved)
+        snap.inferred_student_ids[file_id] = PdfFileManager._student_id_for_path_parts(
+            resolved.parts, snap.students
+        )
+    if not disk:
+        return
+    by_dir: dict[str, list[tuple[str, str]]] = {}
+    for file_id, path in zip(ids, paths):
+        directory, name = os.path.split(path)
+        by_dir.setdefault(directory, []).append((file_id, name))
+    directories = list(by_dir)
+    for directory, names in zip(directories, pool.map(_existing_names, directories)):
+        for file_id, name in by_dir[directory]:
+            # Fall back to a stat for misses (e.g. case-insensitive volumes).
+            if name in names or os.path.exists(os.path.join(directory, name)):
+                snap.on_disk.add(file_id)
+
+
+def take_snapshot(
+    mgr: PdfFileManager,
+    *,
+    paths: bool = True,
+    disk: bool = True,
+    pool: ThreadPoolExecutor | None = None,
+) -> RegistrySnapshot:
+    """Read the registry in one transaction, then (optionally) the filesystem in one pass."""
     conn = mgr._get_connection()
-    rows = conn.execute(
-        "SELECT id, path, file_type, metadata FROM pdf_files WHERE metadata IS NOT NULL"
-    ).fetchall()
+    own_txn = not conn.in_transaction
+    if own_txn:
+        conn.execute("BEGIN")
+    try:
+        rows = conn.execute("SELECT * FROM pdf_files ORDER BY added_at").fetchall()
+        relations = conn.execute("SELECT rowid AS rid, * FROM file_relations ORDER BY rowid").fetchall()
+        book_group_rows = conn.execute(
+            """
+            SELECT fg.id AS group_id, fg.label AS group_label, fgm.file_id AS file_id
+            FROM file_groups fg
+            LEFT JOIN file_group_members fgm ON fgm.group_id = fg.id
+            WHERE fg.group_type = 'book'
+            """
+        ).fetchall()
+        students = mgr.list_students()
+    finally:
+        if own_txn:
+            conn.commit()
+    snap = RegistrySnapshot(
+        db_path=str(Path(mgr.db_path).resolve()),
+        rows=rows,
+        files=[mgr._row_to_pdf_file(row) for row in rows],
+        relations=relations,
+        book_group_rows=book_group_rows,
+        students=students,
+    )
+    if paths or disk:
+        if pool is None:
+            with ThreadPoolExecutor(max_workers=DEFAULT_WORKERS) as own_pool:
+                _capture_paths(snap, own_pool, disk=disk)
+        else:
+            _capture_paths(snap, pool, disk=disk)
+    return snap
+
+
+def _main_version_pairs(snap: RegistrySnapshot) -> list[tuple[sqlite3.Row, sqlite3.Row]]:
+    """(raw, main) rows for ``main_version`` edges, ordered by raw path, first edge per raw."""
+    rows_by_id = {row["id"]: row for row in snap.rows}
+    pairs: list[tuple[sqlite3.Row, sqlite3.Row]] = []
+    for rel in snap.relations:
+        if rel["relation_type"] != "main_version":
+            continue
+        raw = rows_by_id.get(rel["source_id"])
+        main = rows_by_id.get(rel["target_id"])
+        if raw is None or main is None or raw["file_type"] != "raw" or main["file_type"] != "main":
+            continue
+        pairs.append((raw, main))
+    pairs.sort(key=lambda pair: pair[0]["path"])
+    first: list[tuple[sqlite3.Row, sqlite3.Row]] = []
+    seen_raw_ids: set[str] = set()
+    for raw, main in pairs:
+        if raw["id"] in seen_raw_ids:
+            continue
+        seen_raw_ids.add(raw["id"])
+        first.append((raw, main))
+    return first
+
+
+def collect_invalid_chinese_variant_foundation(snap: RegistrySnapshot) -> list[dict]:
+    """Rows where metadata.chinese_variant is the invalid legacy value ``foundation``."""
     bad: list[dict] = []
-    for row in rows:
+    for row in snap.rows:
+        if row["metadata"] is None:
+            continue
         try:
             m = json.loads(row["metadata"]) if row["metadata"] else {}
         except json.JSONDecodeError:
@@ -84,20 +241,11 @@ def collect_invalid_chinese_variant_foundation(mgr: PdfFileManager) -> list[dict
     return bad
 
 
-def collect_invalid_subject_values(mgr: PdfFileManager) -> list[dict]:
-    conn = mgr._get_connection()
-    rows = conn.execute(
-        """
-        SELECT id, path, file_type, doc_type, subject
-        FROM pdf_files
-        WHERE subject IS NOT NULL
-        ORDER BY path
-        """
-    ).fetchall()
-    allowed = set(mgr._ALLOWED_SUBJECTS)
+def collect_invalid_subject_values(snap: RegistrySnapshot) -> list[dict]:
+    allowed = set(PdfFileManager._ALLOWED_SUBJECTS)
     bad: list[dict] = []
-    for row in rows:
-        if row["subject"] in allowed:
+    for row in snap.rows_by_path:
+        if row["subject"] is None or row["subject"] in allowed:
             continue
         bad.append(
             {
@@ -111,19 +259,12 @@ def collect_invalid_subject_values(mgr: PdfFileManager) -> list[dict]:
     return bad
 
 
-def collect_invalid_grade_or_scope_values(mgr: PdfFileManager) -> list[dict]:
-    conn = mgr._get_connection()
-    rows = conn.execute(
-        """
-        SELECT id, path, file_type, doc_type, metadata
-        FROM pdf_files
-        WHERE metadata IS NOT NULL
-        ORDER BY path
-        """
-    ).fetchall()
-    allowed = set(mgr._GRADE_SCOPE_SEGMENTS)
+def collect_invalid_grade_or_scope_values(snap: RegistrySnapshot) -> list[dict]:
+    allowed = set(PdfFileManager._GRADE_SCOPE_SEGMENTS)
     bad: list[dict] = []
-    for row in rows:
+    for row in snap.rows_by_path:
+        if row["metadata"] is None:
+            continue
         try:
             metadata = json.loads(row["metadata"]) if row["metadata"] else {}
         except json.JSONDecodeError:
@@ -147,11 +288,11 @@ def collect_invalid_grade_or_scope_values(mgr: PdfFileManager) -> list[dict]:
     return bad
 
 
-def collect_template_invalid_doc_type(mgr: PdfFileManager) -> list[dict]:
+def collect_template_invalid_doc_type(snap: RegistrySnapshot) -> list[dict]:
     allowed_template_doc_types = {"exam", "exercise", "book", "activity"}
     bad: list[dict] = []
-    for file in mgr.find_files(is_template=True):
-        if file.doc_type in allowed_template_doc_types:
+    for file in snap.files:
+        if not file.is_template or file.doc_type in allowed_template_doc_types:
             continue
         bad.append(
             {
@@ -165,10 +306,10 @@ def collect_template_invalid_doc_type(mgr: PdfFileManager) -> list[dict]:
     return bad
 
 
-def collect_missing_student_id(mgr: PdfFileManager) -> list[dict]:
+def collect_missing_student_id(snap: RegistrySnapshot) -> list[dict]:
     items = []
-    for f in mgr.find_files():
-        inferred_student_id = mgr._infer_student_id_from_path(f.path)
+    for f in snap.files:
+        inferred_student_id = snap.inferred_student_ids[f.id]
         if inferred_student_id is not None and not f.student_id:
             items.append(
                 {
@@ -181,31 +322,10 @@ def collect_missing_student_id(mgr: PdfFileManager) -> list[dict]:
     return items
 
 
-def _path_scope(mgr: PdfFileManager, file_path: str | Path) -> str | None:
-    path = Path(file_path).resolve()
-    if mgr._path_has_student_mirror_layout(path):
-        return "student"
-    if any(part in mgr._GRADE_SCOPE_SEGMENTS for part in path.parts):
-        return "general"
-    return None
-
-
-def _infer_book_folder(path: str | Path) -> str | None:
-    resolved = Path(path).resolve()
-    parts = resolved.parts
-    try:
-        book_idx = parts.index("Book")
-    except ValueError:
-        return None
-    if book_idx + 1 >= len(parts):
-        return None
-    return str(Path(*parts[: book_idx + 2]))
-
-
-def collect_missing_on_disk_files(mgr: PdfFileManager) -> list[dict]:
+def collect_missing_on_disk_files(snap: RegistrySnapshot) -> list[dict]:
     missing: list[dict] = []
-    for file in mgr.find_files():
-        if not Path(file.path).exists():
+    for file in snap.files:
+        if file.id not in snap.on_disk:
             missing.append(
                 {
                     "id": file.id,
@@ -217,10 +337,10 @@ def collect_missing_on_disk_files(mgr: PdfFileManager) -> list[dict]:
     return missing
 
 
-def collect_student_scope_missing_student_id(mgr: PdfFileManager) -> list[dict]:
+def collect_student_scope_missing_student_id(snap: RegistrySnapshot) -> list[dict]:
     items: list[dict] = []
-    for file in mgr.find_files():
-        if _path_scope(mgr, file.path) != "student":
+    for file in snap.files:
+        if snap.scopes[file.id] != "student":
             continue
         if file.student_id:
             continue
@@ -229,16 +349,16 @@ def collect_student_scope_missing_student_id(mgr: PdfFileManager) -> list[dict]:
                 "id": file.id,
                 "path": file.path,
                 "file_type": file.file_type,
-                "expected_student_id": mgr._infer_student_id_from_path(file.path),
+                "expected_student_id": snap.inferred_student_ids[file.id],
             }
         )
     return items
 
 
-def collect_general_scope_non_template(mgr: PdfFileManager) -> list[dict]:
+def collect_general_scope_non_template(snap: RegistrySnapshot) -> list[dict]:
     items: list[dict] = []
-    for file in mgr.find_files():
-        if _path_scope(mgr, file.path) != "general":
+    for file in snap.files:
+        if snap.scopes[file.id] != "general":
             continue
         if file.is_template:
             continue
@@ -253,10 +373,10 @@ def collect_general_scope_non_template(mgr: PdfFileManager) -> list[dict]:
     return items
 
 
-def collect_student_scope_template_true(mgr: PdfFileManager) -> list[dict]:
+def collect_student_scope_template_true(snap: RegistrySnapshot) -> list[dict]:
     items: list[dict] = []
-    for file in mgr.find_files():
-        if _path_scope(mgr, file.path) != "student":
+    for file in snap.files:
+        if snap.scopes[file.id] != "student":
             continue
         if not file.is_template:
             continue
@@ -271,19 +391,10 @@ def collect_student_scope_template_true(mgr: PdfFileManager) -> list[dict]:
     return items
 
 
-def collect_book_folder_group_unit_issues(mgr: PdfFileManager) -> list[dict]:
-    conn = mgr._get_connection()
-    group_rows = conn.execute(
-        """
-        SELECT fg.id AS group_id, fg.label AS group_label, fgm.file_id AS file_id
-        FROM file_groups fg
-        LEFT JOIN file_group_members fgm ON fgm.group_id = fg.id
-        WHERE fg.group_type = 'book'
-        """
-    ).fetchall()
+def collect_book_folder_group_unit_issues(snap: RegistrySnapshot) -> list[dict]:
     file_to_book_group_ids: dict[str, set[str]] = {}
     label_to_book_group_ids: dict[str, set[str]] = {}
-    for row in group_rows:
+    for row in snap.book_group_rows:
         group_id = row["group_id"]
         label = row["group_label"]
         label_to_book_group_ids.setdefault(label, set()).add(group_id)
@@ -292,11 +403,13 @@ def collect_book_folder_group_unit_issues(mgr: PdfFileManager) -> list[dict]:
             file_to_book_group_ids.setdefault(file_id, set()).add(group_id)
 
     files_by_book_folder: dict[str, list] = {}
-    for file in mgr.find_files(doc_type="book", file_type="main", is_template=True):
-        book_folder = _infer_book_folder(file.path)
+    for file in snap.files:
+        if file.doc_type != "book" or file.file_type != "main" or not file.is_template:
+            continue
+        book_folder = _infer_book_folder(snap.resolved[file.id])
         if book_folder is None:
             continue
-        if _path_scope(mgr, file.path) != "general":
+        if snap.scopes[file.id] != "general":
             continue
         files_by_book_folder.setdefault(book_folder, []).append(file)
 
@@ -355,49 +468,26 @@ def collect_book_folder_group_unit_issues(mgr: PdfFileManager) -> list[dict]:
     return issues
 
 
-def collect_main_raw_metadata_drift(mgr: PdfFileManager) -> list[dict]:
-    conn = mgr._get_connection()
-    rows = conn.execute(
-        """
-        SELECT raw.id AS raw_id, raw.path AS raw_path, raw.file_type AS raw_file_type,
-               raw.subject AS raw_subject, raw.doc_type AS raw_doc_type, raw.student_id AS raw_student_id,
-               raw.is_template AS raw_is_template, raw.metadata AS raw_metadata,
-               main.id AS main_id, main.path AS main_path, main.file_type AS main_file_type,
-               main.subject AS main_subject, main.doc_type AS main_doc_type, main.student_id AS main_student_id,
-               main.is_template AS main_is_template, main.metadata AS main_metadata
-        FROM file_relations fr
-        JOIN pdf_files raw ON raw.id = fr.source_id
-        JOIN pdf_files main ON main.id = fr.target_id
-        WHERE fr.relation_type = 'main_version'
-          AND raw.file_type = 'raw'
-          AND main.file_type = 'main'
-        ORDER BY raw.path
-        """
-    ).fetchall()
+def collect_main_raw_metadata_drift(snap: RegistrySnapshot) -> list[dict]:
     issues = []
-    seen_raw_ids: set[str] = set()
-    for row in rows:
-        raw_id = row["raw_id"]
-        if raw_id in seen_raw_ids:
-            continue
-        seen_raw_ids.add(raw_id)
-        raw_meta = json.loads(row["raw_metadata"]) if row["raw_metadata"] else {}
-        main_meta = json.loads(row["main_metadata"]) if row["main_metadata"] else {}
+    for raw, main in _main_version_pairs(snap):
+        raw_meta = json.loads(raw["metadata"]) if raw["metadata"] else {}
+        main_meta = json.loads(main["metadata"]) if main["metadata"] else {}
         field_diffs = []
         comparisons = {
-            "subject": (row["raw_subject"], row["main_subject"]),
-            "doc_type": (row["raw_doc_type"], row["main_doc_type"]),
-            "student_id": (row["raw_student_id"], row["main_student_id"]),
-            "is_template": (bool(row["raw_is_template"]), bool(row["main_is_template"])),
+            "subject": (raw["subject"], main["subject"]),
+            "doc_type": (raw["doc_type"], main["doc_type"]),
+            "student_id": (raw["student_id"], main["student_id"]),
+            "is_template": (bool(raw["is_template"]), bool(main["is_template"])),
             "metadata.grade_or_scope": (raw_meta.get("grade_or_scope"), main_meta.get("grade_or_scope")),
             "metadata.content_folder": (raw_meta.get("content_folder"), main_meta.get("content_folder")),
             "metadata.chinese_variant": (raw_meta.get("chinese_variant"), main_meta.get("chinese_variant")),
         }
-        for field, (raw_value, main_value) in comparisons.items():
+        for field_name, (raw_value, main_value) in comparisons.items():
             if raw_value != main_value:
                 field_diffs.append(
                     {
-                        "field": field,
+                        "field": field_name,
                         "raw_value": raw_value,
                         "main_value": main_value,
                     }
@@ -405,22 +495,22 @@ def collect_main_raw_metadata_drift(mgr: PdfFileManager) -> list[dict]:
         if field_diffs:
             issues.append(
                 {
-                    "raw_id": row["raw_id"],
-                    "raw_path": row["raw_path"],
-                    "main_id": row["main_id"],
-                    "main_path": row["main_path"],
+                    "raw_id": raw["id"],
+                    "raw_path": raw["path"],
+                    "main_id": main["id"],
+                    "main_path": main["path"],
                     "fields": field_diffs,
                 }
             )
     return issues
 
 
-def collect_path_inferred_metadata_drift(mgr: PdfFileManager) -> list[dict]:
+def collect_path_inferred_metadata_drift(snap: RegistrySnapshot) -> list[dict]:
     """Rows whose stored path-derived fields differ from the current registered path."""
     issues: list[dict] = []
-    for file in mgr.find_files():
+    for file in snap.files:
         try:
-            inferred = mgr._infer_from_path(Path(file.path))
+            inferred = PdfFileManager._infer_from_path(snap.resolved[file.id])
         except Exception as exc:
             issues.append(
                 {
@@ -436,20 +526,20 @@ def collect_path_inferred_metadata_drift(mgr: PdfFileManager) -> list[dict]:
             continue
 
         field_diffs: list[dict] = []
-        inferred_student_id = mgr._infer_student_id_from_path(file.path)
+        inferred_student_id = snap.inferred_student_ids[file.id]
         comparisons = {
             "subject": (file.subject, inferred.get("subject")),
             "doc_type": (file.doc_type, inferred.get("doc_type")),
             "student_id": (file.student_id, inferred_student_id),
             "is_template": (file.is_template, inferred.get("is_template")),
         }
-        for field, (stored_value, expected_value) in comparisons.items():
+        for field_name, (stored_value, expected_value) in comparisons.items():
             if expected_value is None:
                 continue
             if stored_value != expected_value:
                 field_diffs.append(
                     {
-                        "field": field,
+                        "field": field_name,
                         "stored_value": stored_value,
                         "expected_value": expected_value,
                     }
@@ -485,39 +575,20 @@ def collect_path_inferred_metadata_drift(mgr: PdfFileManager) -> list[dict]:
     return issues
 
 
-def collect_raw_main_folder_mismatches(mgr: PdfFileManager) -> list[dict]:
+def collect_raw_main_folder_mismatches(snap: RegistrySnapshot) -> list[dict]:
     """Linked raw/main pairs whose registered paths are not in the same folder."""
-    conn = mgr._get_connection()
-    rows = conn.execute(
-        """
-        SELECT raw.id AS raw_id, raw.path AS raw_path,
-               main.id AS main_id, main.path AS main_path
-        FROM file_relations fr
-        JOIN pdf_files raw ON raw.id = fr.source_id
-        JOIN pdf_files main ON main.id = fr.target_id
-        WHERE fr.relation_type = 'main_version'
-          AND raw.file_type = 'raw'
-          AND main.file_type = 'main'
-        ORDER BY raw.path
-        """
-    ).fetchall()
     issues: list[dict] = []
-    seen_raw_ids: set[str] = set()
-    for row in rows:
-        raw_id = row["raw_id"]
-        if raw_id in seen_raw_ids:
-            continue
-        seen_raw_ids.add(raw_id)
-        raw_parent = Path(row["raw_path"]).resolve().parent
-        main_parent = Path(row["main_path"]).resolve().parent
+    for raw, main in _main_version_pairs(snap):
+        raw_parent = snap.resolved[raw["id"]].parent
+        main_parent = snap.resolved[main["id"]].parent
         if raw_parent == main_parent:
             continue
         issues.append(
             {
-                "raw_id": row["raw_id"],
-                "raw_path": row["raw_path"],
-                "main_id": row["main_id"],
-                "main_path": row["main_path"],
+                "raw_id": raw["id"],
+                "raw_path": raw["path"],
+                "main_id": main["id"],
+                "main_path": main["path"],
                 "raw_folder": str(raw_parent),
                 "main_folder": str(main_parent),
             }
@@ -525,61 +596,43 @@ def collect_raw_main_folder_mismatches(mgr: PdfFileManager) -> list[dict]:
     return issues
 
 
-def collect_dangling_file_relations(mgr: PdfFileManager) -> list[dict]:
+def collect_dangling_file_relations(snap: RegistrySnapshot) -> list[dict]:
     """Rows in file_relations referencing a deleted pdf_files id (FK drift).
 
     Normal deletes through PdfFileManager run with foreign_keys enabled so CASCADE
     removes these edges; raw SQL or tools that omit PRAGMA foreign_keys=ON can leave orphans.
     """
-    conn = mgr._get_connection()
-    rows = conn.execute(
-        """
-        SELECT r.id AS relation_id, r.relation_type, r.source_id, r.target_id,
-               s.path AS source_path, t.path AS target_path
-        FROM file_relations r
-        LEFT JOIN pdf_files s ON s.id = r.source_id
-        LEFT JOIN pdf_files t ON t.id = r.target_id
-        WHERE s.id IS NULL OR t.id IS NULL
-        ORDER BY r.relation_type, r.source_id, r.target_id
-        """
-    ).fetchall()
+    paths_by_id = {row["id"]: row["path"] for row in snap.rows}
+    dangling = [
+        rel
+        for rel in snap.relations
+        if rel["source_id"] not in paths_by_id or rel["target_id"] not in paths_by_id
+    ]
+    dangling.sort(key=lambda rel: (rel["relation_type"], rel["source_id"] or "", rel["target_id"] or ""))
     items: list[dict] = []
-    for row in rows:
-        missing_source = row["source_path"] is None
-        missing_target = row["target_path"] is None
+    for rel in dangling:
+        source_path = paths_by_id.get(rel["source_id"])
+        target_path = paths_by_id.get(rel["target_id"])
         items.append(
             {
-                "relation_id": row["relation_id"],
-                "relation_type": row["relation_type"],
-                "source_id": row["source_id"],
-                "target_id": row["target_id"],
-                "source_path": row["source_path"],
-                "target_path": row["target_path"],
-                "missing_source": missing_source,
-                "missing_target": missing_target,
+                "relation_id": rel["id"],
+                "relation_type": rel["relation_type"],
+                "source_id": rel["source_id"],
+                "target_id": rel["target_id"],
+                "source_path": source_path,
+                "target_path": target_path,
+                "missing_source": source_path is None,
+                "missing_target": target_path is None,
             }
         )
     return items
 
 
-def collect_raw_main_relation_issues(mgr: PdfFileManager) -> list[dict]:
-    conn = mgr._get_connection()
-    rows = conn.execute(
-        """
-        SELECT id, path, file_type, has_raw
-        FROM pdf_files
-        ORDER BY path
-        """
-    ).fetchall()
+def collect_raw_main_relation_issues(snap: RegistrySnapshot) -> list[dict]:
+    rows = snap.rows_by_path
     files_by_id: dict[str, dict] = {row["id"]: dict(row) for row in rows}
 
-    rel_rows = conn.execute(
-        """
-        SELECT source_id, target_id, relation_type
-        FROM file_relations
-        WHERE relation_type IN ('raw_source', 'main_version')
-        """
-    ).fetchall()
+    rel_rows = [rel for rel in snap.relations if rel["relation_type"] in ("raw_source", "main_version")]
     raw_source_edges = {(row["source_id"], row["target_id"]) for row in rel_rows if row["relation_type"] == "raw_source"}
     main_version_edges = {(row["source_id"], row["target_id"]) for row in rel_rows if row["relation_type"] == "main_version"}
 
@@ -679,59 +732,74 @@ def collect_raw_main_relation_issues(mgr: PdfFileManager) -> list[dict]:
     return issues
 
 
-def build_report(mgr: PdfFileManager) -> dict:
-    missing_on_disk_files = collect_missing_on_disk_files(mgr)
-    book_folder_group_unit_issues = collect_book_folder_group_unit_issues(mgr)
-    student_scope_missing_student_id = collect_student_scope_missing_student_id(mgr)
-    general_scope_non_template = collect_general_scope_non_template(mgr)
-    student_scope_template_true = collect_student_scope_template_true(mgr)
-
-    missing_student_id = collect_missing_student_id(mgr)
-    main_raw_drift = collect_main_raw_metadata_drift(mgr)
-    invalid_chinese_variant_foundation = collect_invalid_chinese_variant_foundation(mgr)
-    invalid_subject_values = collect_invalid_subject_values(mgr)
-    invalid_grade_or_scope_values = collect_invalid_grade_or_scope_values(mgr)
-    raw_main_relation_issues = collect_raw_main_relation_issues(mgr)
-    template_invalid_doc_type = collect_template_invalid_doc_type(mgr)
-    dangling_file_relations = collect_dangling_file_relations(mgr)
-    path_inferred_metadata_drift = collect_path_inferred_metadata_drift(mgr)
-    raw_main_folder_mismatches = collect_raw_main_folder_mismatches(mgr)
+@dataclass(frozen=True)
+class _Check:
+    collect: Callable[[RegistrySnapshot], list[dict]]
+    needs_paths: bool = False  # resolved paths / scopes / inferred student ids
+    needs_disk: bool = False  # on-disk existence pass
+
+
+# Report order; names are the --checks tokens and the summary/checks keys.
+CHECKS: dict[str, _Check] = {
+    "missing_on_disk_files": _Check(collect_missing_on_disk_files, needs_disk=True),
+    "book_folder_group_unit_issues": _Check(collect_book_folder_group_unit_issues, needs_paths=True),
+    "student_scope_missing_student_id": _Check(collect_student_scope_missing_student_id, needs_paths=True),
+    "general_scope_non_template": _Check(collect_general_scope_non_template, needs_paths=True),
+    "student_scope_template_true": _Check(collect_student_scope_template_true, needs_paths=True),
+    "missing_student_id": _Check(collect_missing_student_id, needs_paths=True),
+    "main_raw_metadata_drift": _Check(collect_main_raw_metadata_drift),
+    "invalid_chinese_variant_foundation": _Check(collect_invalid_chinese_variant_foundation),
+    "invalid_subject_values": _Check(collect_invalid_subject_values),
+    "invalid_grade_or_scope_values": _Check(collect_invalid_grade_or_scope_values),
+    "raw_main_relation_issues": _Check(collect_raw_main_relation_issues),
+    "template_invalid_doc_type": _Check(collect_template_invalid_doc_type),
+    "dangling_file_relations": _Check(collect_dangling_file_relations),
+    "path_inferred_metadata_drift": _Check(collect_path_inferred_metadata_drift, needs_paths=True),
+    "raw_main_folder_mismatches": _Check(collect_raw_main_folder_mismatches, needs_paths=True),
+}
+
+
+def build_report(
+    mgr: PdfFileManager,
+    *,
+    checks: list[str] | None = None,
+    workers: int = DEFAULT_WORKERS,
+) -> dict:
+    """Run ``checks`` (default: all, in :data:`CHECKS` order) against one snapshot.
+
+    Raises ``ValueError`` for unknown check names. ``timings`` holds wall seconds for the
+    snapshot and for each check.
+    """
+    selected = list(CHECKS) if checks is None else list(dict.fromkeys(checks))
+    unknown = [name for name in selected if name not in CHECKS]
+    if unknown:
+        raise ValueError(f"Unknown check(s): {', '.join(unknown)} (known: {', '.join(CHECKS)})")
+    selected = [name for name in CHECKS if name in selected]
+
+    timings: dict[str, float] = {}
+
+    def run(name: str) -> list[dict]:
+        started = time.perf_counter()
+        result = CHECKS[name].collect(snap)
+        timings[name] = round(time.perf_counter() - started, 4)
+        return result
+
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+        started = time.perf_counter()
+        snap = take_snapshot(
+            mgr,
+            paths=any(CHECKS[name].needs_paths for name in selected),
+            disk=any(CHECKS[name].needs_disk for name in selected),
+            pool=pool,
+        )
+        timings["snapshot"] = round(time.perf_counter() - started, 4)
+        results = dict(zip(selected, pool.map(run, selected)))
+
     return {
-        "db_path": str(Path(mgr.db_path).resolve()),
-        "summary": {
-            "missing_on_disk_files": len(missing_on_disk_files),
-            "book_folder_group_unit_issues": len(book_folder_group_unit_issues),
-            "student_scope_missing_student_id": len(student_scope_missing_student_id),
-            "general_scope_non_template": len(general_scope_non_template),
-            "student_scope_template_true": len(student_scope_template_true),
-            "missing_student_id": len(missing_student_id),
-            "main_raw_metadata_drift": len(main_raw_drift),
-            "invalid_chinese_variant_foundation": len(invalid_chinese_variant_foundation),
-            "invalid_subject_values": len(invalid_subject_values),
-            "invalid_grade_or_scope_values": len(invalid_grade_or_scope_values),
-            "raw_main_relation_issues": len(raw_main_relation_issues),
-            "template_invalid_doc_type": len(template_invalid_doc_type),
-            "dangling_file_relations": len(dangling_file_relations),
-            "path_inferred_metadata_drift": len(path_inferred_metadata_drift),
-            "raw_main_folder_mismatches": len(raw_main_folder_mismatches),
-        },
-        "checks": {
-            "missing_on_disk_files": missing_on_disk_files,
-            "book_folder_group_unit_issues": book_folder_group_unit_issues,
-            "student_scope_missing_student_id": student_scope_missing_student_id,
-            "general_scope_non_template": general_scope_non_template,
-            "student_scope_template_true": student_scope_template_true,
-            "missing_student_id": missing_student_id,
-            "main_raw_metadata_drift": main_raw_drift,
-            "invalid_chinese_variant_foundation": invalid_chinese_variant_foundation,
-            "invalid_subject_values": invalid_subject_values,
-            "invalid_grade_or_scope_values": invalid_grade_or_scope_values,
-            "raw_main_relation_issues": raw_main_relation_issues,
-            "template_invalid_doc_type": template_invalid_doc_type,
-            "dangling_file_relations": dangling_file_relations,
-            "path_inferred_metadata_drift": path_inferred_metadata_drift,
-            "raw_main_folder_mismatches": raw_main_folder_mismatches,
-        },
+        "db_path": snap.db_path,
+        "summary": {name: len(results[name]) for name in selected},
+        "checks": results,
+        "timings": {"snapshot": timings["snapshot"], **{name: timings[name] for name in selected}},
     }
 
 
@@ -740,13 +808,22 @@ def _print_human_report(report: dict, *, limit: int) -> None:
     print("Summary:")
     for key, value in report["summary"].items():
         print(f"- {key}: {value}")
+    timings = report.get("timings") or {}
+    if timings:
+        print("Timings (s): " + ", ".join(f"{key}={value}" for key, value in timings.items()))
+
+    checks = report["checks"]
 
-    print("\nMissing on-disk files (registered path no longer exists):")
-    for item in report["checks"]["missing_on_disk_files"][:limit]:
+    def section(name: str, title: str) -> list[dict]:
+        if name not in checks:
+            return []
+        print(f"\n{title}")
+        return checks[name][:limit]
+
+    for item in section("missing_on_disk_files", "Missing on-disk files (registered path no longer exists):"):
         print(f"- {item['path']} [{item['file_type']}/{item['doc_type']}] id={item['id']}")
 
-    print("\nBook folder group + unit issues (general-scope book mains):")
-    for item in report["checks"]["book_folder_group_unit_issues"][:limit]:
+    for item in section("book_folder_group_unit_issues", "Book folder group + unit issues (general-scope book mains):"):
         print(f"- {item['book_folder']}")
         if item["folder_issues"]:
             print(f"  folder_issues={', '.join(item['folder_issues'])}")
@@ -757,46 +834,37 @@ def _print_human_report(report: dict, *, limit: int) -> None:
             print(f"  file={file_item['path']}")
             print(f"  issues={', '.join(file_item['issues'])}")
 
-    print("\nStudent-scope files missing student_id:")
-    for item in report["checks"]["student_scope_missing_student_id"][:limit]:
+    for item in section("student_scope_missing_student_id", "Student-scope files missing student_id:"):
         print(f"- {item['path']} [{item['file_type']}] expected={item['expected_student_id']}")
 
-    print("\nGeneral-scope files where is_template != true:")
-    for item in report["checks"]["general_scope_non_template"][:limit]:
+    for item in section("general_scope_non_template", "General-scope files where is_template != true:"):
         print(f"- {item['path']} [{item['file_type']}] is_template={item['is_template']}")
 
-    print("\nStudent-scope files where is_template != false:")
-    for item in report["checks"]["student_scope_template_true"][:limit]:
+    for item in section("student_scope_template_true", "Student-scope files where is_template != false:"):
         print(f"- {item['path']} [{item['file_type']}] is_template={item['is_template']}")
 
-    print("\nMissing student_id:")
-    for item in report["checks"]["missing_student_id"][:limit]:
+    for item in section("missing_student_id", "Missing student_id:"):
         print(f"- {item['path']} [{item['file_type']}] expected={item['expected_student_id']}")
 
-    print("\nMain/raw metadata drift:")
-    for item in report["checks"]["main_raw_metadata_drift"][:limit]:
+    for item in section("main_raw_metadata_drift", "Main/raw metadata drift:"):
         field_names = ", ".join(diff["field"] for diff in item["fields"])
         print(f"- raw={item['raw_path']}")
         print(f"  main={item['main_path']}")
         print(f"  fields={field_names}")
 
-    print("\nInvalid metadata.chinese_variant=foundation (use 'standard' for Standard 华文):")
-    for item in report["checks"]["invalid_chinese_variant_foundation"][:limit]:
+    for item in section("invalid_chinese_variant_foundation", "Invalid metadata.chinese_variant=foundation (use 'standard' for Standard 华文):"):
         print(f"- {item['path']} [{item['file_type']}] id={item['id']}")
 
-    print("\nInvalid subject enum values:")
-    for item in report["checks"]["invalid_subject_values"][:limit]:
+    for item in section("invalid_subject_values", "Invalid subject enum values:"):
         print(f"- {item['path']} [{item['file_type']}/{item['doc_type']}] subject={item['subject']!r}")
 
-    print("\nInvalid metadata.grade_or_scope values:")
-    for item in report["checks"]["invalid_grade_or_scope_values"][:limit]:
+    for item in section("invalid_grade_or_scope_values", "Invalid metadata.grade_or_scope values:"):
         print(
             f"- {item['path']} [{item['file_type']}/{item['doc_type']}] "
             f"grade_or_scope={item['grade_or_scope']!r}"
         )
 
-    print("\nRaw/main relation consistency issues:")
-    for item in report["checks"]["raw_main_relation_issues"][:limit]:
+    for item in section("raw_main_relation_issues", "Raw/main relation consistency issues:"):
         issue = item.get("issue")
         if issue == "main_has_raw_mismatch":
             print(
@@ -806,12 +874,10 @@ def _print_human_report(report: dict, *, limit: int) -> None:
         else:
             print(f"- {issue}: {item}")
 
-    print("\nTemplate files with invalid doc_type (allowed: exam, exercise, book, activity):")
-    for item in report["checks"]["template_invalid_doc_type"][:limit]:
+    for item in section("template_invalid_doc_type", "Template files with invalid doc_type (allowed: exam, exercise, book, activity):"):
         print(f"- {item['path']} [{item['file_type']}/{item['doc_type']}] id={item['id']}")
 
-    print("\nDangling file_relations (source or target id not in pdf_files):")
-    for item in report["checks"]["dangling_file_relations"][:limit]:
+    for item in section("dangling_file_relations", "Dangling file_relations (source or target id not in pdf_files):"):
         parts = []
         if item["missing_source"]:
             parts.append("missing_source")
@@ -826,16 +892,14 @@ def _print_human_report(report: dict, *, limit: int) -> None:
         print(f"  source_id={item['source_id']} -> {sp}")
         print(f"  target_id={item['target_id']} -> {tp}")
 
-    print("\nPath-inferred metadata drift:")
-    for item in report["checks"]["path_inferred_metadata_drift"][:limit]:
+    for item in section("path_inferred_metadata_drift", "Path-inferred metadata drift:"):
         if item.get("issue") == "path_inference_error":
             print(f"- {item['path']} [{item['file_type']}] inference_error={item['error_type']}: {item['error']}")
             continue
         field_names = ", ".join(diff["field"] for diff in item["fields"])
         print(f"- {item['path']} [{item['file_type']}] fields={field_names}")
 
-    print("\nRaw/main folder mismatches:")
-    for item in report["checks"]["raw_main_folder_mismatches"][:limit]:
+    for item in section("raw_main_folder_mismatches", "Raw/main folder mismatches:"):
         print(f"- raw={item['raw_path']}")
         print(f"  main={item['main_path']}")
 
@@ -845,10 +909,25 @@ def main() -> int:
     parser.add_argument("--db", default=str(default_db_path()), help="Path to pdf_registry.db")
     parser.add_argument("--json", action="store_true", help="Emit machine-readable JSON")
     parser.add_argument("--limit", type=int, default=20, help="Max examples per section for human-readable output")
+    parser.add_argument(
+        "--checks",
+        default="",
+        help=f"Comma-separated subset of checks to run (default: all). Known: {', '.join(CHECKS)}",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=DEFAULT_WORKERS,
+        help=f"Threads for the filesystem pass and the checks (default: {DEFAULT_WORKERS})",
+    )
     args = parser.parse_args()
 
+    selected = [name.strip() for name in args.checks.split(",") if name.strip()] or None
     mgr = PdfFileManager(db_path=args.db)
-    report = build_report(mgr)
+    try:
+        report = build_report(mgr, checks=selected, workers=args.workers)
+    except ValueError as exc:
+        parser.error(str(exc))
     if args.json:
         print(json.dumps(report, ensure_ascii=False, indent=2))
     else:
@@ -15,6 +15,11 @@ EXPECTED_TABLES = [
     "file_relations",
     "operation_log",
     "pdf_files",
+    "pdf_files_fts",
+    "pdf_files_fts_config",
+    "pdf_files_fts_data",
+    "pdf_files_fts_docsize",
+    "pdf_files_fts_idx",
     "scan_roots",
     "students",
 ]
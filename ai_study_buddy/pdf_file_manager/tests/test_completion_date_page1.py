@@ -132,6 +132,14 @@ def test_cohort_orders_book_last_and_skips_g_root():
         Path(db_path).unlink(missing_ok=True)
 
 
+def _fake_render_pages(pdf_path, out_dir, page_indices, *, dpi_scale=2.0, calls=None):
+    if calls is not None:
+        calls.append(Path(pdf_path).name)
+    Path(out_dir).mkdir(parents=True, exist_ok=True)
+    (Path(out_dir) / "page-01.png").write_bytes(b"\x89PNG\r\n\x1a\n")
+    return 1
+
+
 def test_prepare_batch_manifest_and_render(monkeypatch):
     with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as f:
         db_path = f.name
@@ -144,21 +152,12 @@ def test_prepare_batch_manifest_and_render(monkeypatch):
 
             fake_png = work_dir / "images" / file_id / "page-01.png"
 
-            def _fake_render(pdf_path, out_path, *, page_index=0, dpi_scale=2.0):
-                Path(out_path).parent.mkdir(parents=True, exist_ok=True)
-                Path(out_path).write_bytes(b"\x89PNG\r\n\x1a\n")
-                return Path(out_path)
-
-            monkeypatch.setattr(
-                "ai_study_buddy.pdf_file_manager.completion_date.page1.render_page_png",
-                _fake_render,
-            )
             monkeypatch.setattr(
-                "ai_study_buddy.pdf_file_manager.completion_date.page1.pdf_page_count",
-                lambda _path: 1,
+                "ai_study_buddy.pdf_file_manager.completion_date.render_cache.render_pdf_pages_png",
+                _fake_render_pages,
             )
 
-            manifest = prepare_page1_batch(mgr, work_dir, limit=1)
+            manifest = prepare_page1_batch(mgr, work_dir, limit=1, render_workers=1)
             assert manifest.counts["total"] == 1
             assert manifest.items[0].slice == "priority"
             assert fake_png.is_file()
@@ -169,6 +168,31 @@ def test_prepare_batch_manifest_and_render(monkeypatch):
         Path(db_path).unlink(missing_ok=True)
 
 
+def test_prepare_batch_rerun_hits_render_cache(monkeypatch, tmp_path):
+    mgr = PdfFileManager(db_path=tmp_path / "registry.db")
+    work_dir = tmp_path / "work"
+    one_id = _register_d_root_completion(mgr, tmp_path, "_c_one.pdf")
+    two_id = _register_d_root_completion(mgr, tmp_path, "_c_two.pdf")
+    calls: list[str] = []
+    monkeypatch.setattr(
+        "ai_study_buddy.pdf_file_manager.completion_date.render_cache.render_pdf_pages_png",
+        lambda *a, **kw: _fake_render_pages(*a, calls=calls, **kw),
+    )
+
+    first = prepare_page1_batch(mgr, work_dir, render_workers=1)
+    # Identical bytes: one render serves both files.
+    assert len(calls) == 1
+    assert first.counts["rendered"] == 1
+
+    second = prepare_page1_batch(mgr, work_dir, render_workers=1)
+    assert len(calls) == 1
+    assert second.counts["cache_hits"] == 2
+    assert second.counts["rendered"] == 0
+    by_id = {item.file_id: item for item in second.items}
+    for file_id in (one_id, two_id):
+        assert Path(by_id[file_id].page1_image_path).is_file()
+
+
 def test_merge_page_inspection_prefers_page1_then_page2():
     fid = "3966d6d8-1e61-420b-ac5f-97f9ab740c2f"
     page1_null = {
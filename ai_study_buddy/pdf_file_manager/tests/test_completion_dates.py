@@ -232,3 +232,70 @@ def test_infer_completion_dates_dry_run_and_force_flags():
             assert report4.processed == 1
     finally:
         Path(db_path).unlink(missing_ok=True)
+
+
+def test_infer_completion_dates_bulk_walks_priority_chain_in_one_transaction():
+    """Bulk engine: page-1 cache, filename term and drive mtime resolved per file, one commit."""
+    from ai_study_buddy.pdf_file_manager.completion_date.page1 import save_page1_inspection_result
+
+    with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as f:
+        db_path = f.name
+    try:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            root = Path(tmpdir)
+            mgr = PdfFileManager(db_path=db_path)
+            mgr.add_student("winston", "Winston")
+            p5 = root / "DaydreamEdu" / "completion" / "Science" / "winston@x.com" / "P5"
+            ids = {}
+            for key, folder, name, doc_type in [
+                ("term", "Exam", "_c_P5 EYE 2025 Practice Paper 1.pdf", "exam"),
+                ("page1", "Exam", "_c_plain.pdf", "exam"),
+                ("none", "Exam", "_c_other.pdf", "exam"),
+                ("book", "Book", "_c_workbook.pdf", "book"),
+            ]:
+                (p5 / folder).mkdir(parents=True, exist_ok=True)
+                ids[key] = mgr.register_file(
+                    _make_pdf(p5 / folder / name),
+                    file_type="main",
+                    doc_type=doc_type,
+                    student_id="winston",
+                    is_template=False,
+                ).id
+            work_dir = root / "page1"
+            save_page1_inspection_result(
+                work_dir,
+                {
+                    "file_id": ids["page1"],
+                    "completion_date": "2025-05-06",
+                    "confidence": "medium",
+                    "inference_model": "composer-2.5-fast",
+                    "source_detail": {"timezone": "Asia/Singapore"},
+                },
+            )
+
+            report = mgr.infer_completion_dates(root="d_root", work_dir=work_dir, workers=4)
+
+            assert (report.processed, report.written, report.still_undated, report.failed) == (4, 3, 1, 0)
+            assert report.written_by_source == {
+                "handwritten_page1": 1,
+                "filename_term": 1,
+                "drive_modified": 1,
+            }
+            assert {"load", "lookup", "resolve", "write"} <= set(report.timings)
+            assert mgr.get_completion_date(ids["term"]).completion_date == "2025-11-07"
+            assert mgr.get_completion_date(ids["page1"]).source == "handwritten_page1"
+            assert mgr.get_completion_date(ids["book"]).source == "drive_modified"
+            assert mgr.get_completion_date(ids["none"]) is None
+            ops = [
+                row[0]
+                for row in mgr._get_connection().execute(
+                    "SELECT operation FROM operation_log WHERE file_id = ?", (ids["page1"],)
+                )
+            ]
+            assert ops.count("set_completion_date") == 1
+            assert ops.count("infer_completion_date") == 1
+
+            rerun = mgr.infer_completion_dates(root="d_root", work_dir=work_dir)
+            assert (rerun.skipped_existing, rerun.written) == (3, 0)
+    finally:
+        Path(db_path).unlink(missing_ok=True)
@@ -212,3 +212,30 @@ def test_build_completion_series_filters_non_main():
     assert series is not None
     assert len(series.members) == 1
     assert series.members[0].file_id == "m1"
+
+
+def test_bulk_series_members_and_templates_match_per_file_lookups():
+    with tempfile.TemporaryDirectory() as tmp:
+        tmpdir = Path(tmp)
+        mgr = PdfFileManager(db_path=str(tmpdir / "registry.db"))
+        mgr.add_student("winston", STUDENT_DISPLAY_NAME, STUDENT_FOLDER_EMAIL)
+        mgr.add_student("other", "Other Student", "other@example.com")
+        tpl_id = _register_template(mgr, tmpdir, name="_c_unit.pdf")
+        w1 = _register_completion(mgr, tmpdir, name="_c_w1.pdf")
+        w2 = _register_completion(mgr, tmpdir, name="_c_w2.pdf")
+        o1 = _register_completion(mgr, tmpdir, name="_c_o1.pdf", student_id="other")
+        unlinked = _register_completion(mgr, tmpdir, name="_c_unlinked.pdf")
+        for cid in (w1, w2, o1):
+            mgr.link_to_template(cid, tpl_id)
+
+        ids = [w1, w2, o1, unlinked, "missing-id"]
+        templates = mgr.get_templates_for_files(ids)
+        assert {fid: t.id for fid, t in templates.items()} == {w1: tpl_id, w2: tpl_id, o1: tpl_id}
+
+        bulk = mgr.get_completion_series_members_for_files(ids)
+        assert set(bulk) == {w1, w2, o1}
+        for fid in (w1, w2, o1):
+            assert bulk[fid] == mgr.get_completion_series_member(fid)
+        assert bulk[w2][0].attempt_count == 2
+        assert bulk[o1][0].attempt_count == 1
+        assert set(mgr.get_files_by_ids(ids)) == {w1, w2, o1, unlinked}
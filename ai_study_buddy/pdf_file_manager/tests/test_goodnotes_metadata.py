@@ -350,3 +350,45 @@ def test_goodnotes_timestamps_missing_registry_file_raises(tmp_path):
 
     with pytest.raises(NotFoundError):
         mgr.get_goodnotes_document_timestamps_for_file("missing")
+
+
+def test_bulk_goodnotes_matches_share_one_index_load_per_db_version(tmp_path, monkeypatch, goodnotes_env):
+    from ai_study_buddy.pdf_file_manager import goodnotes_metadata
+
+    loads = []
+    real_load = goodnotes_metadata.GoodnotesMetadataIndex.load.__func__
+
+    def counting_load(cls, projection, fts, *, version=None):
+        loads.append(version)
+        return real_load(cls, projection, fts, version=version)
+
+    monkeypatch.setattr(goodnotes_metadata.GoodnotesMetadataIndex, "load", classmethod(counting_load))
+    monkeypatch.setattr(goodnotes_metadata, "_INDEX", None)
+
+    mgr = PdfFileManager(db_path=tmp_path / "registry.db")
+    matched_path = goodnotes_env / "P6" / "c_p6.science.wa1.4.pdf"
+    missing_path = goodnotes_env / "c_missing.pdf"
+    daydream_path = tmp_path / "DaydreamEdu" / "_c_other.pdf"
+    for path in (matched_path, missing_path, daydream_path):
+        _touch(path)
+    ids = [mgr.register_file(path, file_type="main").id for path in (matched_path, missing_path, daydream_path)]
+
+    bulk = mgr.get_goodnotes_document_timestamps_for_files(ids + ["unregistered"])
+    assert set(bulk) == set(ids)
+    assert [bulk[file_id].status for file_id in ids] == [
+        "matched_leading_underscore_restored",
+        "not_found",
+        "not_goodnotes_root",
+    ]
+    for file_id in ids:
+        assert mgr.get_goodnotes_document_timestamps_for_file(file_id) == bulk[file_id]
+    assert len(loads) == 1
+
+    projection = Path(goodnotes_metadata._projection_db_path())
+    conn = sqlite3.connect(projection)
+    conn.execute("INSERT INTO documents (id, name) VALUES ('DOC2', '_c_missing')")
+    conn.commit()
+    conn.close()
+
+    assert mgr.get_goodnotes_document_timestamps_for_file(ids[1]).goodnotes_document_id == "DOC2"
+    assert len(loads) == 2
@@ -4,6 +4,8 @@ import sys
 import tempfile
 from pathlib import Path
 
+import pytest
+
 from ai_study_buddy.pdf_file_manager.pdf_file_manager import PdfFileManager
 from ai_study_buddy.pdf_file_manager.scripts.validate_pdf_registry_integrity import build_report
 
@@ -278,3 +280,36 @@ def test_integrity_validator_reports_raw_main_folder_mismatch():
         assert issue["main_id"] == main.id
         assert issue["raw_folder"].endswith("/Exercise")
         assert issue["main_folder"].endswith("/Note")
+
+
+def test_integrity_validator_checks_selector_skips_filesystem_pass(monkeypatch):
+    from ai_study_buddy.pdf_file_manager.scripts import validate_pdf_registry_integrity as validator
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        tmpdir = Path(tmpdir)
+        mgr = PdfFileManager(db_path=str(tmpdir / "registry.db"))
+        pdf = tmpdir / "DaydreamEdu" / "Singapore Primary Math" / "P4" / "Exam" / "bad_grade.pdf"
+        pdf.parent.mkdir(parents=True, exist_ok=True)
+        pdf.write_bytes(b"%PDF-1.0\n")
+        registered = mgr.register_file(pdf, file_type="main", doc_type="exam", subject="math", is_template=True)
+        conn = mgr._get_connection()
+        conn.execute(
+            "UPDATE pdf_files SET metadata = ? WHERE id = ?",
+            (json.dumps({"grade_or_scope": "P9"}), registered.id),
+        )
+        conn.commit()
+
+        def no_fs(*_args, **_kwargs):
+            raise AssertionError("filesystem pass for a registry-only selection")
+
+        monkeypatch.setattr(validator, "_capture_paths", no_fs)
+        report = build_report(mgr, checks=["dangling_file_relations", "invalid_grade_or_scope_values"])
+
+        # Report order follows CHECKS, not the selector order.
+        assert list(report["checks"]) == ["invalid_grade_or_scope_values", "dangling_file_relations"]
+        assert report["summary"] == {"invalid_grade_or_scope_values": 1, "dangling_file_relations": 0}
+        assert report["checks"]["invalid_grade_or_scope_values"][0]["grade_or_scope"] == "P9"
+        assert set(report["timings"]) == {"snapshot", "invalid_grade_or_scope_values", "dangling_file_relations"}
+
+        with pytest.raises(ValueError):
+            build_report(mgr, checks=["no_such_check"])
@@ -184,3 +184,51 @@ def test_find_files_is_template_and_has_raw():
             assert len(with_raw) >= 1 and all(f.has_raw for f in with_raw)
         finally:
             Path(db_path).unlink(missing_ok=True)
+
+
+def _write_pdf(path: Path) -> Path:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(b"%PDF-1.0\n")
+    return path
+
+
+def test_find_files_fts_index_matches_like_semantics_and_stays_in_sync():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        tmpdir = Path(tmpdir)
+        mgr = PdfFileManager(db_path=str(tmpdir / "registry.db"))
+        math = mgr.register_file(
+            _write_pdf(tmpdir / "P5" / "P5 Math Exam.pdf"), metadata={"grade_or_scope": "P5"}
+        )
+        mgr.register_file(_write_pdf(tmpdir / "ab_c.pdf"))
+        mgr.register_file(_write_pdf(tmpdir / "abXc.pdf"))
+        assert mgr._fts_enabled
+
+        def names(**kwargs):
+            return [f.name for f in mgr.find_files(**kwargs)]
+
+        for query in ("math", "MATH", "b_c", "ab", "%", "h E"):
+            with_index = names(query=query)
+            mgr._fts_enabled = False
+            assert names(query=query) == with_index, query
+            mgr._fts_enabled = True
+        assert names(query="b_c") == ["ab_c.pdf", "abXc.pdf"]  # LIKE wildcards kept
+
+        mgr.rename_file(math.id, "P5 Science Exam.pdf")
+        mgr.delete_file(mgr.get_file_by_path(tmpdir / "abXc.pdf").id)
+        assert names(query="math") == []
+        assert names(query="science") == ["P5 Science Exam.pdf"]
+        assert names(query="abxc") == []
+        assert names(grade_or_scope="P5") == ["P5 Science Exam.pdf"]
+        assert names(grade_or_scope="P6") == []
+
+        conn = mgr._get_connection()
+        conn.execute("INSERT INTO pdf_files_fts (pdf_files_fts, rank) VALUES ('integrity-check', 1)")
+        plan = " ".join(
+            row[3]
+            for row in conn.execute(
+                "EXPLAIN QUERY PLAN SELECT * FROM pdf_files WHERE student_id = ? AND file_type = ? "
+                "AND json_extract(metadata, '$.grade_or_scope') = ?",
+                ("s", "main", "P5"),
+            )
+        )
+        assert "USING INDEX idx_pdf_files_" in plan
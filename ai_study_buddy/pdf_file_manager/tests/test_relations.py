@@ -335,3 +335,29 @@ def test_link_template_by_paths_already_linked_raises():
             assert "already linked" in str(exc.value).lower()
         finally:
             Path(db_path).unlink(missing_ok=True)
+
+
+def test_related_files_and_completions_are_single_joined_lookups():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        tmpdir = Path(tmpdir)
+        mgr = PdfFileManager(db_path=str(tmpdir / "registry.db"))
+        paths = {}
+        for name in ("main", "raw", "template", "done_a", "done_b"):
+            paths[name] = tmpdir / f"{name}.pdf"
+            paths[name].write_bytes(b"%PDF-1.0\n")
+        main = mgr.register_file(paths["main"], file_type="main")
+        raw = mgr.register_file(paths["raw"], file_type="raw")
+        template = mgr.register_file(paths["template"], file_type="main", is_template=True)
+        done = [mgr.register_file(paths[n], file_type="main") for n in ("done_b", "done_a")]
+        mgr.link_files(main.id, raw.id, "raw_source")
+        for completed in done:
+            mgr.link_to_template(completed.id, template.id)
+
+        related = mgr.get_related_files(main.id)
+        assert [(f.id, rel) for f, rel in related] == [(raw.id, "raw_source"), (raw.id, "main_version")]
+        assert [(f.id, rel) for f, rel in mgr.get_related_files(raw.id)] == [
+            (main.id, "raw_source"),
+            (main.id, "main_version"),
+        ]
+        assert [f.id for f in mgr.get_completions(template.id)] == sorted(c.id for c in done)
+        assert mgr.get_related_files(template.id) == []
@@ -483,3 +483,86 @@ def test_scan_dry_run_raises_for_in_scope_unknown_content_folder():
         mgr.add_scan_root(bad_root)
         with pytest.raises(InvalidDocTypeError):
             mgr.scan_for_new_files(dry_run=True)
+
+
+def _write_scan_like_pdf(path: Path, *, pages: int = 1) -> None:
+    import pymupdf
+
+    doc = pymupdf.open()
+    for idx in range(pages):
+        page = doc.new_page(width=595, height=842)
+        pix = pymupdf.Pixmap(pymupdf.csRGB, pymupdf.IRect(0, 0, 300, 420), False)
+        pix.set_rect(pix.irect, (230 - idx * 10, 220, 210))
+        page.insert_image(page.rect, pixmap=pix)
+    doc.save(str(path))
+    doc.close()
+
+
+def test_scan_compress_workers_pipelines_compression_and_keeps_scan_order():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        tmpdir = Path(tmpdir)
+        root = tmpdir / "DaydreamEdu" / "Singapore Primary Math" / STUDENT_FOLDER_EMAIL / "P6" / "Exam"
+        root.mkdir(parents=True)
+        names = ["a paper.pdf", "b paper.pdf", "c paper.pdf"]
+        for name in names:
+            _write_scan_like_pdf(root / name)
+        mgr = PdfFileManager(db_path=str(tmpdir / "registry.db"))
+        mgr.add_student("winston", STUDENT_DISPLAY_NAME, STUDENT_FOLDER_EMAIL)
+        mgr.add_scan_root(root, student_id="winston")
+
+        started: list[str] = []
+        done: list[str] = []
+        results = mgr.scan_for_new_files(
+            roots=[root],
+            min_savings_pct=-1000,
+            compress_workers=2,
+            compress_page_workers=2,
+            on_file_start=lambda p: started.append(p.name),
+            on_file_done=lambda p, r: done.append(p.name),
+        )
+
+        assert sorted(started) == sorted(names)
+        assert sorted(done) == sorted(names)
+        assert [Path(r.file.path).name for r in results] == [f"_c_{n}" for n in started]
+        for result in results:
+            assert result.compressed is True
+            assert result.file.file_type == "main"
+            assert result.file.student_id == "winston"
+            assert result.raw_archive is not None
+            assert Path(result.raw_archive.path).name.startswith("_raw_")
+            assert Path(result.file.path).exists()
+        assert not any((root / name).exists() for name in names)
+
+
+def test_scan_cli_takes_worker_counts_from_env_and_flags(monkeypatch, capsys):
+    from ai_study_buddy.pdf_file_manager.scripts import scan_for_new_files as scan_cli
+
+    prepared: list[dict] = []
+    original_prepare = PdfFileManager._prepare_compression_job
+
+    def _recording_prepare(self, target, preserve_input=False, **compress_kwargs):
+        prepared.append(compress_kwargs)
+        return original_prepare(self, target, preserve_input=preserve_input, **compress_kwargs)
+
+    monkeypatch.setattr(PdfFileManager, "_prepare_compression_job", _recording_prepare)
+    monkeypatch.setenv("PDF_COMPRESS_WORKERS", "2")
+    monkeypatch.setenv("PDF_COMPRESS_PAGE_WORKERS", "3")
+    with tempfile.TemporaryDirectory() as tmpdir:
+        tmpdir = Path(tmpdir)
+        root = tmpdir / "scans"
+        root.mkdir()
+        for name in ("a paper.pdf", "b paper.pdf"):
+            _write_scan_like_pdf(root / name)
+        db_path = tmpdir / "registry.db"
+        args = ["--db", str(db_path), "--root", str(root), "--min-savings-pct", "-1000"]
+
+        assert scan_cli.main(args) == 0
+        assert prepared == [{"workers": 3}, {"workers": 3}]  # pipelined (env workers=2)
+        out = capsys.readouterr().out
+        assert "compressed : 2" in out
+
+        _write_scan_like_pdf(root / "c paper.pdf")
+        prepared.clear()
+        assert scan_cli.main(args + ["--workers", "1", "--page-workers", "2"]) == 0
+        assert prepared == [{"workers": 2}]  # serial compress_and_register path
+        assert len(PdfFileManager(db_path=str(db_path)).find_files(file_type="main")) == 3
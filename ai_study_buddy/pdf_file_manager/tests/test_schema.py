@@ -189,3 +189,45 @@ def test_manager_connection_enables_foreign_keys():
         assert fk_on == 1
     finally:
         Path(tmp).unlink(missing_ok=True)
+
+
+def test_existing_registry_gains_search_indexes_and_backfilled_fts():
+    """Opening a pre-FTS registry creates indexes, triggers and a populated pdf_files_fts."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        db_path = Path(tmpdir) / "registry.db"
+        pdf = Path(tmpdir) / "Legacy Fractions Worksheet.pdf"
+        pdf.write_bytes(b"%PDF-1.0\n")
+        mgr = PdfFileManager(db_path=str(db_path))
+        mgr.register_file(pdf)
+        mgr._get_connection().close()
+
+        conn = sqlite3.connect(db_path)
+        conn.executescript(
+            """
+            DROP TRIGGER pdf_files_fts_ai;
+            DROP TRIGGER pdf_files_fts_ad;
+            DROP TRIGGER pdf_files_fts_au;
+            DROP TABLE pdf_files_fts;
+            DROP INDEX idx_pdf_files_student_type;
+            DROP INDEX idx_file_relations_target;
+            """
+        )
+        conn.close()
+
+        reopened = PdfFileManager(db_path=str(db_path))
+        assert [f.name for f in reopened.find_files(query="fractions")] == [pdf.name]
+        names = {
+            row[0]
+            for row in reopened._get_connection().execute("SELECT name FROM sqlite_master").fetchall()
+        }
+        assert {
+            "pdf_files_fts",
+            "pdf_files_fts_ai",
+            "pdf_files_fts_ad",
+            "pdf_files_fts_au",
+            "idx_pdf_files_student_type",
+            "idx_pdf_files_grade_or_scope",
+            "idx_file_relations_target",
+        } <= names
+        fts_rows = reopened._get_connection().execute("SELECT COUNT(*) FROM pdf_files_fts").fetchone()[0]
+        assert fts_rows == 1
@@ -16,10 +16,12 @@ Usage (CLI — single file, output required):
     python compress_pdf.py abc.pdf --output out.pdf --target-dpi 300 --jpeg-quality 75
     python compress_pdf.py abc.pdf --output out.pdf --verbose
     python compress_pdf.py abc.pdf --output out.pdf --dry-run
+    python compress_pdf.py book.pdf --output out.pdf --workers 8     # page-parallel
 
 Usage (CLI — batch mode):
     python compress_pdf.py --batch /path/to/pdfs/
     python compress_pdf.py --batch /path/to/pdfs/ --batch-prefix _c_  # custom prefix (default: _c_)
+    python compress_pdf.py --batch /path/to/pdfs/ --workers 8         # page-parallel per file
 
 Usage (library):
     from compress_pdf import compress_pdf
@@ -32,6 +34,7 @@ Dependencies: pymupdf, Pillow, numpy
 from __future__ import annotations
 
 import argparse
+from concurrent.futures import ProcessPoolExecutor
 import os
 import sys
 import tempfile
@@ -191,6 +194,40 @@ def _compress_page(
     return compressed, stat
 
 
+def _compress_page_range(
+    input_path: str,
+    start: int,
+    stop: int,
+    target_dpi: int,
+    jpeg_quality: int,
+) -> list[tuple[bytes, PageStat]]:
+    """Worker entry point: compress pages [start, stop) with this process's own document handle."""
+    doc = pymupdf.open(input_path)
+    try:
+        return [_compress_page(doc[i], doc, target_dpi, jpeg_quality) for i in range(start, stop)]
+    finally:
+        doc.close()
+
+
+def _compress_pages_parallel(
+    input_path: Path,
+    page_count: int,
+    target_dpi: int,
+    jpeg_quality: int,
+    workers: int,
+) -> list[tuple[bytes, PageStat]]:
+    """Fan page ranges out to a process pool; results come back in page order."""
+    # Several small ranges per worker keep the pool busy when page cost is uneven.
+    chunk = max(1, -(-page_count // (workers * 4)))
+    ranges = [(start, min(start + chunk, page_count)) for start in range(0, page_count, chunk)]
+    with ProcessPoolExecutor(max_workers=min(workers, len(ranges))) as pool:
+        futures = [
+            pool.submit(_compress_page_range, str(input_path), start, stop, target_dpi, jpeg_quality)
+            for start, stop in ranges
+        ]
+        return [page for future in futures for page in future.result()]
+
+
 def compress_pdf(
     input_path: str | os.PathLike,
     output_path: Optional[str | os.PathLike] = None,
@@ -198,6 +235,7 @@ def compress_pdf(
     target_dpi: int = DEFAULT_TARGET_DPI,
     jpeg_quality: int = DEFAULT_JPEG_QUALITY,
     force: bool = False,
+    workers: int = 1,
 ) -> CompressResult:
     """
     Compress a scanned PDF and write the result to a caller-specified output path.
@@ -213,6 +251,8 @@ def compress_pdf(
         target_dpi:   Pages above this DPI are downsampled.
         jpeg_quality: JPEG quality for re-encoding color/grayscale pages (1–95).
         force:        If True, overwrite an existing output file.
+        workers:      Render/encode pages in this many worker processes (each opens its
+                      own document). Output is assembled in page order; 1 = in-process.
 
     Returns:
         CompressResult with sizes, savings, and per-page stats.
@@ -289,9 +329,15 @@ def compress_pdf(
     out_doc = pymupdf.open()
     page_stats: list[PageStat] = []
 
-    for i in range(doc.page_count):
+    if workers > 1 and doc.page_count > 1:
+        compressed_pages = _compress_pages_parallel(
+            input_path, doc.page_count, target_dpi, jpeg_quality, workers
+        )
+    else:
+        compressed_pages = (_compress_page(doc[i], doc, target_dpi, jpeg_quality) for i in range(doc.page_count))
+
+    for i, (compressed_bytes, stat) in enumerate(compressed_pages):
         page = doc[i]
-        compressed_bytes, stat = _compress_page(page, doc, target_dpi, jpeg_quality)
         page_stats.append(stat)
 
         # page.get_pixmap() renders in display orientation, so rebuild pages in
@@ -373,6 +419,8 @@ def _build_parser() -> argparse.ArgumentParser:
                         help=f"JPEG quality for color/grayscale pages (default: {DEFAULT_JPEG_QUALITY}).")
     parser.add_argument("--force", action="store_true",
                         help="Overwrite existing output file.")
+    parser.add_argument("--workers", "-j", type=int, default=1, metavar="N",
+                        help="Render/encode pages in N worker processes (default: 1).")
     parser.add_argument("--dry-run", action="store_true",
                         help="Print projected savings without writing output.")
     parser.add_argument("--verbose", "-v", action="store_true",
@@ -412,6 +460,7 @@ def _main() -> None:
                         target_dpi=args.target_dpi,
                         jpeg_quality=args.jpeg_quality,
                         force=True,
+                        workers=args.workers,
                     )
                     _print_result(result, verbose=args.verbose)
                     total_orig += result.original_size
@@ -426,6 +475,7 @@ def _main() -> None:
                     target_dpi=args.target_dpi,
                     jpeg_quality=args.jpeg_quality,
                     force=args.force,
+                    workers=args.workers,
                 )
                 _print_result(result, verbose=args.verbose)
                 total_orig += result.original_size
@@ -450,6 +500,7 @@ def _main() -> None:
                     target_dpi=args.target_dpi,
                     jpeg_quality=args.jpeg_quality,
                     force=True,
+                    workers=args.workers,
                 )
                 print("(dry-run) Projected result:")
                 _print_result(result, verbose=args.verbose)
@@ -464,6 +515,7 @@ def _main() -> None:
                 target_dpi=args.target_dpi,
                 jpeg_quality=args.jpeg_quality,
                 force=args.force,
+                workers=args.workers,
             )
             _print_result(result, verbose=args.verbose)
 
@@ -77,3 +77,26 @@ def test_compress_pdf_preserves_rotated_page_geometry():
         finally:
             src.close()
             out.close()
+
+
+def test_compress_pdf_workers_matches_serial_output():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        tmpdir = Path(tmpdir)
+        input_path = _make_rotated_scan_pdf(tmpdir / "input.pdf")
+        serial_path = tmpdir / "serial.pdf"
+        parallel_path = tmpdir / "parallel.pdf"
+
+        serial = compress_pdf(input_path, output_path=serial_path, force=True)
+        parallel = compress_pdf(input_path, output_path=parallel_path, force=True, workers=2)
+
+        assert parallel.pages == serial.pages == 2
+        assert parallel.page_stats == serial.page_stats
+        a = pymupdf.open(str(serial_path))
+        b = pymupdf.open(str(parallel_path))
+        try:
+            assert [(p.rect.width, p.rect.height) for p in b] == [(p.rect.width, p.rect.height) for p in a]
+            for page_a, page_b in zip(a, b):
+                assert np.abs(_render_signature(page_a) - _render_signature(page_b)).mean() < 1
+        finally:
+            a.close()
+            b.close()
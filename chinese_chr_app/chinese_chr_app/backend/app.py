@@ -1,21 +1,21 @@
-from flask import Flask, jsonify, send_file, request
+from flask import Flask, Response, jsonify, request
 from flask_cors import CORS
+import atexit
 import json
 import logging
 import re
 import os
 import time
-import urllib.request
-import urllib.parse
-import ssl
-import certifi
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Optional, Dict, Any, List, Tuple
 from collections import defaultdict
 
+from event_write_behind import WriteBehindQueue
+from stroke_store import StrokeStore, fetch_stroke_json, normalize_stroke_json
+from image_store import GCSImageSource, ImageStore, LocalImageSource
 from english_translations import flatten_hwxnet_english_translations
-from pinyin_search import parse_pinyin_query, compute_searchable_pinyin_for_entry
+from pinyin_search import parse_pinyin_query, PinyinSearchIndex
 from pinyin_recall import (
     build_session_queue,
     build_reading_units_for_character,
@@ -23,6 +23,7 @@ from pinyin_recall import (
     get_correct_pinyin,
     _all_pinyin_list,
     _first_basic_meaning_zh_for_unit,
+    invalidate_session_unit_pool,
 )
 import uuid
 
@@ -53,12 +54,18 @@ else:
     DATA_DIR = BASE_DIR / "data"
 BACKUP_DIR = DATA_DIR / "backups"
 HANZI_WRITER_CACHE_DIR = DATA_DIR / "temp" / "hanzi_writer"
+# Packed stroke store built by scripts/characters/build_hanzi_writer_stroke_store.py (shipped in the image)
+HANZI_WRITER_STROKE_STORE = Path(os.getenv('HW_STROKES_STORE', str(DATA_DIR / "hanzi_writer_strokes.sqlite")))
+HW_STROKES_MAX_AGE = 86400
 
 # PNG directory - use GCS in production, local path for development
 GCS_BUCKET_NAME = os.getenv('GCS_BUCKET_NAME', '')
 # Default to data/png/ relative to BASE_DIR (chinese_chr_app/data/png/)
 # Can be overridden via PNG_BASE_DIR environment variable
 PNG_BASE_DIR = Path(os.getenv('PNG_BASE_DIR', str(DATA_DIR / "png")))
+# Card images are immutable: cache bytes per worker (IMAGE_CACHE_MAX_BYTES) and let clients keep them
+IMAGE_CACHE_MAX_BYTES = int(os.getenv('IMAGE_CACHE_MAX_BYTES', str(64 * 1024 * 1024)))
+IMAGE_MAX_AGE = 31536000
 
 # Logs directory (local: chinese_chr_app/chinese_chr_app/backend/logs/; override with LOGS_DIR)
 LOGS_DIR = Path(os.getenv('LOGS_DIR', str(_backend_dir / "logs")))
@@ -68,6 +75,14 @@ PINYIN_RECALL_LOG_FILE = LOGS_DIR / "pinyin_recall.log"
 # Enable detailed pinyin recall timing logs/headers when set (e.g. PINYIN_RECALL_PROFILE=true)
 PINYIN_RECALL_PROFILE = os.environ.get('PINYIN_RECALL_PROFILE', '').strip().lower() in ('1', 'true', 'yes')
 
+# Pinyin recall item_presented/item_answered rows are written behind the request: flushed in bulk
+# every PINYIN_RECALL_EVENT_FLUSH_SIZE rows or PINYIN_RECALL_EVENT_FLUSH_SECONDS, with at most
+# PINYIN_RECALL_EVENT_MAX_BACKLOG rows buffered. PINYIN_RECALL_EVENT_ASYNC=0 writes inline.
+PINYIN_RECALL_EVENT_ASYNC = os.environ.get('PINYIN_RECALL_EVENT_ASYNC', '1').strip().lower() not in ('0', 'false', 'no')
+PINYIN_RECALL_EVENT_FLUSH_SIZE = int(os.environ.get('PINYIN_RECALL_EVENT_FLUSH_SIZE', '100'))
+PINYIN_RECALL_EVENT_FLUSH_SECONDS = float(os.environ.get('PINYIN_RECALL_EVENT_FLUSH_SECONDS', '1.0'))
+PINYIN_RECALL_EVENT_MAX_BACKLOG = int(os.environ.get('PINYIN_RECALL_EVENT_MAX_BACKLOG', '5000'))
+
 # CORS configuration - allow multiple origins
 # Explicit origins from env (e.g. http://localhost:3000, https://chinese-chr.daydreamedu.org)
 CORS_ORIGINS_RAW = os.getenv('CORS_ORIGINS', 'http://localhost:3000').split(',')
@@ -162,6 +177,7 @@ stroke_counts_lookup = {}  # Map count(int) -> list of character entries
 # Load dictionary (hwxnet) data into memory
 hwxnet_data = None      # Raw dict loaded from JSON
 hwxnet_lookup = {}      # Map character -> hwxnet entry
+pinyin_search_index = None  # PinyinSearchIndex over hwxnet_lookup (built on first search)
 
 # Setup logging
 LOGS_DIR.mkdir(exist_ok=True)
@@ -206,6 +222,9 @@ def reload_characters():
     global characters_data, character_lookup
     characters_data = None
     character_lookup = {}
+    invalidate_session_unit_pool()
+    import database as db
+    db.clear_enabled_recall_unit_ids_cache()
     load_characters()
 
 def load_hwxnet():
@@ -221,9 +240,13 @@ def load_hwxnet():
 
 def reload_hwxnet():
     """Force reload hwxnet dictionary from DB (e.g. after updating hwxnet_characters 拼音)."""
-    global hwxnet_data, hwxnet_lookup
+    global hwxnet_data, hwxnet_lookup, pinyin_search_index
     hwxnet_data = None
     hwxnet_lookup = {}
+    pinyin_search_index = None
+    invalidate_session_unit_pool()
+    import database as db
+    db.clear_enabled_recall_unit_ids_cache()
     load_hwxnet()
 
 def load_characters():
@@ -586,48 +609,15 @@ def search_character():
         }), 500
 
 
-def _pinyin_search_in_memory(search_keys: List[str]) -> List[Dict[str, Any]]:
-    """Look up characters by search keys using in-memory hwxnet_lookup (no DB)."""
+def get_pinyin_search_index() -> PinyinSearchIndex:
+    """Inverted pinyin index over the loaded hwxnet_lookup; rebuilt after reload_hwxnet()."""
+    global pinyin_search_index
     _, hwx_lookup = load_hwxnet()
-    if not hwx_lookup:
-        return []
-    # Build index: search_key -> list of (character, entry)
-    key_to_entries: Dict[str, List[Tuple[str, Dict]]] = defaultdict(list)
-    for ch, entry in hwx_lookup.items():
-        if not isinstance(entry, dict):
-            continue
-        pinyin_list = entry.get('拼音') or []
-        if isinstance(pinyin_list, str):
-            pinyin_list = [pinyin_list]
-        for key in compute_searchable_pinyin_for_entry(pinyin_list):
-            key_to_entries[key].append((ch, entry))
-    # Collect all characters that match any key
-    seen = set()
-    candidates = []
-    for key in search_keys:
-        for ch, entry in key_to_entries.get(key, []):
-            if ch in seen:
-                continue
-            seen.add(ch)
-            strokes = entry.get('总笔画')
-            zibiao = entry.get('zibiao_index')
-            candidates.append({
-                'character': ch,
-                'radical': (entry.get('部首') or '').strip() or '',
-                'pinyin': entry.get('拼音') or [],
-                'strokes': strokes,
-                'zibiao_index': zibiao,
-                'index': entry.get('index'),
-            })
-    # Sort by 总笔画 ASC, then zibiao_index ASC
-    def _sort_key(x):
-        s = x.get('strokes')
-        z = x.get('zibiao_index')
-        strokes_val = s if isinstance(s, (int, float)) else (int(s) if s is not None and str(s).strip().isdigit() else 999)
-        zibiao_val = z if isinstance(z, (int, float)) else (999999 if z is None else z)
-        return (strokes_val, zibiao_val)
-    candidates.sort(key=_sort_key)
-    return candidates
+    index = pinyin_search_index
+    if index is None or index.lookup is not hwx_lookup:
+        index = PinyinSearchIndex(hwx_lookup)
+        pinyin_search_index = index
+    return index
 
 
 @app.route('/api/pinyin-search', methods=['GET'])
@@ -638,8 +628,7 @@ def pinyin_search():
     if not is_valid or search_keys is None:
         return jsonify({'error': err_msg or '拼音输入格式错误'}), 400
     try:
-        from database import get_characters_by_pinyin_search_keys
-        characters = get_characters_by_pinyin_search_keys(search_keys)
+        characters = get_pinyin_search_index().search(search_keys)
         if not characters:
             return jsonify({
                 'found': False,
@@ -659,62 +648,78 @@ def pinyin_search():
         return jsonify({'error': f'服务器错误: {str(e)}', 'detail': str(e)}), 500
 
 
+def _make_image_store() -> ImageStore:
+    source = LocalImageSource(PNG_BASE_DIR)
+    if GCS_BUCKET_NAME:
+        try:
+            source = GCSImageSource(GCS_BUCKET_NAME)
+        except ImportError:
+            print("Warning: google-cloud-storage not installed, falling back to local filesystem", flush=True)
+    return ImageStore(source, max_bytes=IMAGE_CACHE_MAX_BYTES)
+
+
+image_store = _make_image_store()
+
+
 @app.route('/api/images/<index>/<page>', methods=['GET'])
 def get_image(index, page):
-    """Serve character card images from GCS or local filesystem"""
+    """Serve character card images from GCS or local filesystem (LRU-cached, ETag/immutable)"""
     if page not in ['page1', 'page2']:
         return jsonify({'error': 'Invalid page. Use page1 or page2'}), 400
 
-    blob_path = f"png/{index}/{page}.png"
+    key = f"{index}/{page}.png"
+    try:
+        record = image_store.get(key)
+    except Exception as e:
+        print(f"Error loading image {image_store.source.describe(key)}: {e}", flush=True)
+        import traceback
+        traceback.print_exc()
+        return jsonify({'error': 'Image storage unavailable', 'detail': str(e)}), 503
+    if record is None:
+        # GCS is configured but blob missing - don't fall back to local (container has no PNGs)
+        print(f"Image not found: {image_store.source.describe(key)}", flush=True)
+        return jsonify({'error': 'Image not found', 'path': image_store.source.describe(key)}), 404
+
+    data, etag = record
+    resp = Response(data, mimetype='image/png')
+    resp.set_etag(etag)
+    resp.cache_control.public = True
+    resp.cache_control.max_age = IMAGE_MAX_AGE
+    resp.cache_control.immutable = True
+    return resp.make_conditional(request)
 
-    # Try GCS first if bucket is configured (production)
-    if GCS_BUCKET_NAME:
-        try:
-            from google.cloud import storage
-            storage_client = storage.Client()
-            bucket = storage_client.bucket(GCS_BUCKET_NAME)
-            blob = bucket.blob(blob_path)
-            if blob.exists():
-                image_bytes = blob.download_as_bytes()
-                from io import BytesIO
-                return send_file(BytesIO(image_bytes), mimetype='image/png')
-            # GCS is configured but blob missing - don't fall back to local (container has no PNGs)
-            print(f"GCS blob not found: gs://{GCS_BUCKET_NAME}/{blob_path}", flush=True)
-            return jsonify({'error': 'Image not found in GCS', 'path': blob_path}), 404
-        except ImportError:
-            print("Warning: google-cloud-storage not installed, falling back to local filesystem", flush=True)
-        except Exception as e:
-            print(f"Error loading from GCS: {e}", flush=True)
-            import traceback
-            traceback.print_exc()
-            return jsonify({'error': 'Image storage unavailable', 'detail': str(e)}), 503
 
-    # Local filesystem (development)
-    image_path = PNG_BASE_DIR / index / f"{page}.png"
-    if not image_path.exists():
-        return jsonify({'error': 'Image not found', 'path': str(image_path)}), 404
-    return send_file(str(image_path), mimetype='image/png')
+stroke_store = StrokeStore(HANZI_WRITER_STROKE_STORE, lru_size=int(os.getenv('HW_STROKES_LRU_SIZE', '512')))
+
+
+def _stroke_response(record: Tuple[bytes, str]):
+    data, etag = record
+    resp = Response(data, mimetype='application/json')
+    resp.set_etag(etag)
+    resp.cache_control.public = True
+    resp.cache_control.max_age = HW_STROKES_MAX_AGE
+    return resp.make_conditional(request)
 
 
 @app.route('/api/strokes', methods=['GET'])
 def get_hanzi_writer_strokes():
     """
-    Proxy HanziWriter stroke JSON (makemeahanzi) through our backend.
-    This avoids client-side CDN/adblock/CORS issues and caches locally.
+    Serve HanziWriter stroke JSON (makemeahanzi) as raw bytes with ETag/Cache-Control.
+    Order: in-memory LRU / packed stroke store, then local file cache, then the
+    jsDelivr/unpkg CDN proxy (avoids client-side CDN/adblock/CORS issues).
     """
     ch = request.args.get('char', '').strip()
     if not ch or len(ch) != 1:
         return jsonify({'error': 'Please provide exactly one character via ?char='}), 400
 
-    HANZI_WRITER_CACHE_DIR.mkdir(parents=True, exist_ok=True)
-    cache_file = HANZI_WRITER_CACHE_DIR / f"{ord(ch):x}.json"
+    record = stroke_store.get(ch)
+    if record is not None:
+        return _stroke_response(record)
 
-    # Serve cached if available
+    cache_file = HANZI_WRITER_CACHE_DIR / f"{ord(ch):x}.json"
     if cache_file.exists():
         try:
-            with open(cache_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-            return jsonify(data)
+            return _stroke_response(stroke_store.put(ch, normalize_stroke_json(cache_file.read_bytes())))
         except Exception:
             # If cache is corrupted, fall through to refetch
             try:
@@ -722,39 +727,18 @@ def get_hanzi_writer_strokes():
             except Exception:
                 pass
 
-    encoded = urllib.parse.quote(ch)
-    urls = [
-        f"https://cdn.jsdelivr.net/npm/hanzi-writer-data@2.0.1/{encoded}.json",
-        f"https://unpkg.com/hanzi-writer-data@2.0.1/{encoded}.json",
-    ]
-
-    # Use certifi CA bundle to avoid local truststore issues
-    # (common on some macOS/Python setups).
     verify_ssl = os.getenv('HW_STROKES_VERIFY_SSL', '').strip().lower() not in ('0', 'false', 'no', 'off')
-    ssl_context = ssl.create_default_context(cafile=certifi.where()) if verify_ssl else ssl._create_unverified_context()
-
-    last_err = None
-    for url in urls:
-        try:
-            req = urllib.request.Request(url, headers={'User-Agent': 'Mozilla/5.0'})
-            with urllib.request.urlopen(req, timeout=20, context=ssl_context) as resp:
-                if getattr(resp, 'status', 200) != 200:
-                    raise Exception(f"HTTP {getattr(resp, 'status', 'unknown')}")
-                raw = resp.read().decode('utf-8')
-                data = json.loads(raw)
-            # Cache best-effort (Cloud Run FS is ephemeral; permission errors shouldn't break the response)
-            try:
-                with open(cache_file, 'w', encoding='utf-8', newline='\n') as f:
-                    json.dump(data, f, ensure_ascii=False)
-                    f.write('\n')
-            except Exception as cache_err:
-                print(f"Warning: failed to write stroke cache {cache_file}: {cache_err}")
-            return jsonify(data)
-        except Exception as e:
-            last_err = e
-            continue
-
-    return jsonify({'error': f'Failed to load stroke data for {ch}: {last_err}'}), 502
+    try:
+        data = fetch_stroke_json(ch, verify_ssl=verify_ssl)
+    except Exception as e:
+        return jsonify({'error': f'Failed to load stroke data for {ch}: {e}'}), 502
+    # Cache best-effort (Cloud Run FS is ephemeral; permission errors shouldn't break the response)
+    try:
+        HANZI_WRITER_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        cache_file.write_bytes(data + b'\n')
+    except Exception as cache_err:
+        print(f"Warning: failed to write stroke cache {cache_file}: {cache_err}")
+    return _stroke_response(stroke_store.put(ch, data))
 
 def generate_radicals_data(characters_data: List[Dict], hwxnet_lookup: Optional[Dict[str, Any]] = None) -> List[Dict]:
     """
@@ -1141,28 +1125,15 @@ def get_profile_progress():
         return jsonify({"error": "Unauthorized"}), 401
     try:
         import database as db
-        viewed_count = db.get_character_views_count_for_user(user.user_id)
-        viewed_recent = db.get_character_views_recent_for_user(user.user_id, limit=50)
-        daily_stats = db.get_pinyin_recall_daily_stats(user.user_id, days=30)
-        practice_summary = db.get_pinyin_recall_practice_summary(user.user_id)
-        enabled_unit_ids = sorted(db._get_enabled_recall_unit_ids())
-        category_counts = db.get_pinyin_recall_category_counts(
-            user.user_id,
-            enabled_unit_ids=enabled_unit_ids,
-        )
-        category_trend = db.get_pinyin_recall_category_daily_trend(
-            user.user_id,
-            days=None,
-            live_counts=category_counts,
-            enabled_unit_ids=enabled_unit_ids,
-        )
+        progress = db.get_profile_progress_data(user.user_id, recent_limit=50, daily_stats_days=30)
+        category_counts = progress["category_counts"]
         learned_count = category_counts["learned"]
         learning_count = category_counts["learning"]
         not_tested_count = category_counts["not_tested"]
         total_units = category_counts.get("total_units", db.PROFILE_HWXNET_TOTAL)
         return jsonify({
-            "viewed_characters_count": viewed_count,
-            "viewed_characters_recent": viewed_recent,
+            "viewed_characters_count": progress["viewed_characters_count"],
+            "viewed_characters_recent": progress["viewed_characters_recent"],
             "proficiency": {
                 "learned_count": learned_count,
                 "learning_count": learning_count,
@@ -1176,9 +1147,9 @@ def get_profile_progress():
                 "learned_memorized": category_counts.get("learned_memorized", 0),
                 "learned_normal": category_counts.get("learned_normal", 0),
             },
-            "daily_stats": daily_stats,
-            "practice_summary": practice_summary,
-            "category_trend": category_trend,
+            "daily_stats": progress["daily_stats"],
+            "practice_summary": progress["practice_summary"],
+            "category_trend": progress["category_trend"],
         })
     except Exception as e:
         print(f"[profile/progress] Error: {e}", flush=True)
@@ -1252,6 +1223,36 @@ def _get_pinyin_recall_global_overrides() -> Dict[str, Dict[str, Any]]:
     return overrides if isinstance(overrides, dict) else {}
 
 
+def _flush_pinyin_recall_events(event: str, payloads: List[Dict[str, Any]]) -> None:
+    import database as db
+    if event == "item_presented":
+        db.bulk_insert_pinyin_recall_item_presented(payloads)
+    elif event == "item_answered":
+        db.bulk_insert_pinyin_recall_item_answered(payloads)
+
+
+def _spill_pinyin_recall_events(event: str, payloads: List[Dict[str, Any]], reason: str) -> None:
+    """Rows that could not be written to Postgres go to pinyin_recall.log (one JSON line each) for replay."""
+    for payload in payloads:
+        pinyin_recall_logger.info(json.dumps(
+            {"event": "pinyin_recall_event_spill", "type": event, "reason": reason, "payload": payload},
+            ensure_ascii=False,
+            default=str,
+        ))
+    print(f"[pinyin-recall] Failed to insert {len(payloads)} {event} event(s), spilled to {PINYIN_RECALL_LOG_FILE.name}: {reason}", flush=True)
+
+
+_pinyin_recall_event_queue = WriteBehindQueue(
+    _flush_pinyin_recall_events,
+    _spill_pinyin_recall_events,
+    max_batch=PINYIN_RECALL_EVENT_FLUSH_SIZE,
+    flush_interval=PINYIN_RECALL_EVENT_FLUSH_SECONDS,
+    max_backlog=PINYIN_RECALL_EVENT_MAX_BACKLOG,
+    background=PINYIN_RECALL_EVENT_ASYNC,
+)
+atexit.register(_pinyin_recall_event_queue.close)
+
+
 def _log_pinyin_recall_event(
     event: str,
     *,
@@ -1262,12 +1263,12 @@ def _log_pinyin_recall_event(
     batch_mode: Optional[str] = None,
     payload: Optional[Dict[str, Any]] = None,
 ) -> None:
-    """Write pinyin recall event to Supabase/Postgres."""
+    """Queue pinyin recall event rows for a background bulk write to Supabase/Postgres."""
     try:
-        import database as db
         if event == "item_presented" and items is not None and user_id and session_id:
+            rows = []
             for item in items:
-                p = {
+                rows.append({
                     "user_id": user_id,
                     "session_id": session_id,
                     "batch_id": batch_id,
@@ -1283,12 +1284,12 @@ def _log_pinyin_recall_event(
                     "prompt_type": item.get("prompt_type"),
                     "correct_choice": item.get("correct_pinyin"),
                     "choices": item.get("choices"),
-                }
-                db.insert_pinyin_recall_item_presented(p)
+                })
+            _pinyin_recall_event_queue.put("item_presented", rows)
         elif event == "item_answered" and payload is not None:
-            db.insert_pinyin_recall_item_answered(payload)
+            _pinyin_recall_event_queue.put("item_answered", [payload])
     except Exception as e:
-        print(f"[pinyin-recall] Failed to insert event: {e}", flush=True)
+        print(f"[pinyin-recall] Failed to queue event: {e}", flush=True)
 
 
 @app.route('/api/games/pinyin-recall/session', methods=['GET'])
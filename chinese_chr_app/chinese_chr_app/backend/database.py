@@ -2,11 +2,16 @@
 Database layer for feng_characters and hwxnet_characters (Supabase/Postgres).
 
 Returns dict shapes compatible with the rest of the app (same as JSON-based responses).
-Uses Psycopg 3 (psycopg[binary]>=3.1) for Python 3.13+ compatibility.
+Uses Psycopg 3 (psycopg[binary]>=3.1) for Python 3.13+ compatibility. When psycopg_pool is
+installed, connections come from a process-wide ConnectionPool (see _get_connection).
 """
 
+import atexit
+import copy
 import json
 import os
+import threading
+import time
 from datetime import date, datetime, timedelta, timezone
 from functools import lru_cache
 from typing import Any, Dict, List, Optional, Tuple
@@ -25,19 +30,160 @@ except ImportError:
     psycopg = None
     dict_row = None
 
+try:
+    from psycopg_pool import ConnectionPool
+except ImportError:
+    ConnectionPool = None
+
 
 _FENG_HAS_WORDS_BY_PINYIN: Optional[bool] = None
 _HWXNET_HAS_COMMON_PHRASES_BY_PINYIN: Optional[bool] = None
 _HWXNET_HAS_ENGLISH_TRANSLATIONS_BY_PINYIN: Optional[bool] = None
 
 
-def _get_connection():
-    if psycopg is None:
-        raise RuntimeError("psycopg is required for database support. Install with: pip3 install 'psycopg[binary]>=3.1'")
+_POOL = None
+_POOL_LOCK = threading.Lock()
+
+# Supabase's transaction pooler (Supavisor, port 6543) cannot keep server-side prepared
+# statements across transactions, so statement caching defaults to off for it.
+_TRANSACTION_POOLER_PORT = 6543
+
+
+def _database_url() -> str:
     url = os.environ.get("DATABASE_URL") or os.environ.get("SUPABASE_DB_URL")
     if not url:
         raise RuntimeError("DATABASE_URL or SUPABASE_DB_URL must be set when using database")
-    return psycopg.connect(url, row_factory=dict_row)
+    return url
+
+
+def _env_number(name: str, default: float) -> float:
+    raw = (os.environ.get(name) or "").strip()
+    if not raw:
+        return default
+    try:
+        return float(raw)
+    except ValueError as e:
+        raise RuntimeError(f"{name} must be a number, got {raw!r}") from e
+
+
+def _prepare_threshold(url: str) -> Optional[int]:
+    """
+    DB_PREPARE_THRESHOLD: executions before psycopg prepares a query server-side
+    ("none" disables). Defaults to psycopg's 5, or disabled on the transaction pooler.
+    """
+    raw = (os.environ.get("DB_PREPARE_THRESHOLD") or "").strip().lower()
+    if raw in ("none", "off", "-1"):
+        return None
+    if raw:
+        try:
+            return int(raw)
+        except ValueError as e:
+            raise RuntimeError(f"DB_PREPARE_THRESHOLD must be an integer or 'none', got {raw!r}") from e
+    try:
+        port = psycopg.conninfo.conninfo_to_dict(url).get("port")
+    except psycopg.Error:
+        port = None
+    if str(port or "") == str(_TRANSACTION_POOLER_PORT):
+        return None
+    return 5
+
+
+def _connection_pool_enabled() -> bool:
+    """DB_POOL_ENABLED=0 falls back to one connection per call (e.g. one-off scripts)."""
+    return ConnectionPool is not None and (os.environ.get("DB_POOL_ENABLED") or "").strip() != "0"
+
+
+def _get_pool():
+    global _POOL
+    if _POOL is not None:
+        return _POOL
+    with _POOL_LOCK:
+        if _POOL is None:
+            url = _database_url()
+            min_size = int(_env_number("DB_POOL_MIN_SIZE", 1))
+            max_size = max(min_size, int(_env_number("DB_POOL_MAX_SIZE", 8)))
+            pool_kwargs: Dict[str, Any] = {}
+            check = getattr(ConnectionPool, "check_connection", None)
+            if check is not None:
+                pool_kwargs["check"] = check
+            pool = ConnectionPool(
+                url,
+                min_size=min_size,
+                max_size=max_size,
+                timeout=_env_number("DB_POOL_TIMEOUT", 30.0),
+                max_idle=_env_number("DB_POOL_MAX_IDLE", 300.0),
+                max_lifetime=_env_number("DB_POOL_MAX_LIFETIME", 1800.0),
+                kwargs={"row_factory": dict_row, "prepare_threshold": _prepare_threshold(url)},
+                name="chinese_chr",
+                open=False,
+                **pool_kwargs,
+            )
+            pool.open()
+            _POOL = pool
+    return _POOL
+
+
+def close_connection_pool() -> None:
+    """Close the process-wide pool; the next _get_connection() re-reads the DB_* environment."""
+    global _POOL
+    with _POOL_LOCK:
+        pool, _POOL = _POOL, None
+    if pool is not None:
+        pool.close()
+
+
+atexit.register(close_connection_pool)
+
+
+class _PooledConnection:
+    """
+    A pool checkout that quacks like a psycopg connection. ``close()`` rolls back any
+    uncommitted work (what closing a direct connection did) and returns it to the pool.
+    """
+
+    __slots__ = ("_pool", "_conn")
+
+    def __init__(self, pool, conn) -> None:
+        self._pool = pool
+        self._conn = conn
+
+    def __getattr__(self, name: str) -> Any:
+        conn = self._conn
+        if conn is None:
+            raise psycopg.OperationalError("the connection is closed")
+        return getattr(conn, name)
+
+    @property
+    def closed(self) -> bool:
+        return self._conn is None or self._conn.closed
+
+    def close(self) -> None:
+        conn, self._conn = self._conn, None
+        if conn is None:
+            return
+        try:
+            if not conn.closed and conn.info.transaction_status != psycopg.pq.TransactionStatus.IDLE:
+                conn.rollback()
+        except psycopg.Error:
+            pass  # putconn discards connections left in a broken state
+        self._pool.putconn(conn)
+
+
+def _get_connection():
+    """
+    Connection for one DB helper call; callers always ``close()`` it in ``finally``.
+
+    Pooled when psycopg_pool is available (sized by DB_POOL_MIN_SIZE / DB_POOL_MAX_SIZE,
+    checked before checkout, recycled after DB_POOL_MAX_IDLE / DB_POOL_MAX_LIFETIME seconds).
+    Point DATABASE_URL at a local Postgres and call close_connection_pool() to retarget.
+    """
+    if psycopg is None:
+        raise RuntimeError("psycopg is required for database support. Install with: pip3 install 'psycopg[binary]>=3.1'")
+    if not _connection_pool_enabled():
+        url = _database_url()
+        return psycopg.connect(url, row_factory=dict_row, prepare_threshold=_prepare_threshold(url))
+    pool = _get_pool()
+    return _PooledConnection(pool, pool.getconn())
 
 
 def normalize_words_by_pinyin(
@@ -507,6 +653,7 @@ def log_character_view(user_id: str, character: str, display_name: Optional[str]
         raise e
     finally:
         conn.close()
+    invalidate_profile_progress_cache(user_id)
 
 
 # --- Profile / progress (Issue #2, user_profiles) ---
@@ -602,9 +749,154 @@ def _get_enabled_recall_unit_ids_cached(disabled_fingerprint: tuple[str, ...]) -
     )
 
 
+# Enabled reading-unit catalogue persisted in Postgres so profile queries can join it instead of
+# shipping thousands of unit_ids as ``unit_id = ANY(%s)``. pinyin_recall_enabled_units_meta holds a
+# single version row bumped whenever the catalogue changes; each process caches (version, unit_ids)
+# and revalidates with a one-row read. Created by scripts/pinyin_recall/create_pinyin_recall_enabled_units_table.py.
+_HAS_ENABLED_UNITS_TABLE: Optional[bool] = None
+_ENABLED_UNIT_CATALOGUE: Optional[Tuple[int, frozenset[str]]] = None
+_ENABLED_UNIT_CATALOGUE_SYNCED = False
+_ENABLED_UNIT_CATALOGUE_PREDICATE = "unit_id IN (SELECT unit_id FROM pinyin_recall_enabled_units)"
+
+
 def clear_enabled_recall_unit_ids_cache() -> None:
-    """Clear cached enabled-unit pool (tests or after global disable changes)."""
+    """
+    Clear cached enabled-unit pool (tests, or after HWXNet/Feng data or global disables change).
+    The next lookup re-derives the pool and re-syncs pinyin_recall_enabled_units with it.
+    """
+    global _ENABLED_UNIT_CATALOGUE, _ENABLED_UNIT_CATALOGUE_SYNCED
     _get_enabled_recall_unit_ids_cached.cache_clear()
+    _ENABLED_UNIT_CATALOGUE = None
+    _ENABLED_UNIT_CATALOGUE_SYNCED = False
+
+
+def _get_has_enabled_units_table(conn) -> bool:
+    global _HAS_ENABLED_UNITS_TABLE
+    if _HAS_ENABLED_UNITS_TABLE:
+        return True
+    with conn.cursor() as cur:
+        cur.execute(
+            """
+            SELECT
+                to_regclass('pinyin_recall_enabled_units') IS NOT NULL
+                AND to_regclass('pinyin_recall_enabled_units_meta') IS NOT NULL AS has_table
+            """
+        )
+        row = cur.fetchone() or {}
+    # Only a positive result is cached, so creating the tables takes effect without a restart.
+    _HAS_ENABLED_UNITS_TABLE = bool(row.get("has_table")) or None
+    return bool(_HAS_ENABLED_UNITS_TABLE)
+
+
+def _bump_enabled_unit_catalogue_version(cur) -> int:
+    cur.execute(
+        """
+        INSERT INTO pinyin_recall_enabled_units_meta (id, version, refreshed_at)
+        VALUES (1, 1, now())
+        ON CONFLICT (id) DO UPDATE SET
+            version = pinyin_recall_enabled_units_meta.version + 1,
+            refreshed_at = now()
+        RETURNING version
+        """,
+        prepare=False,
+    )
+    return int(cur.fetchone()["version"])
+
+
+def _sync_enabled_unit_catalogue(conn, unit_ids: frozenset[str]) -> int:
+    """
+    Make pinyin_recall_enabled_units hold exactly ``unit_ids`` (caller commits). The version is
+    bumped only when rows change, so workers deriving the same pool leave it untouched.
+    """
+    with conn.cursor() as cur:
+        cur.execute(
+            "SELECT pg_advisory_xact_lock(hashtextextended('pinyin_recall_enabled_units', 0))",
+            prepare=False,
+        )
+        cur.execute("SELECT unit_id FROM pinyin_recall_enabled_units")
+        current = {(r.get("unit_id") or "").strip() for r in cur.fetchall()}
+        stale = sorted(current - unit_ids)
+        missing = sorted(unit_ids - current)
+        if stale:
+            cur.execute("DELETE FROM pinyin_recall_enabled_units WHERE unit_id = ANY(%s)", (stale,), prepare=False)
+        if missing:
+            cur.executemany(
+                "INSERT INTO pinyin_recall_enabled_units (unit_id) VALUES (%s) ON CONFLICT (unit_id) DO NOTHING",
+                [(unit_id,) for unit_id in missing],
+            )
+        if not stale and not missing:
+            cur.execute("SELECT version FROM pinyin_recall_enabled_units_meta WHERE id = 1")
+            row = cur.fetchone()
+            if row is not None:
+                return int(row["version"])
+        return _bump_enabled_unit_catalogue_version(cur)
+
+
+def _get_enabled_unit_catalogue() -> Optional[Tuple[int, frozenset[str]]]:
+    """
+    Return (version, enabled unit IDs) from pinyin_recall_enabled_units, or None when the
+    catalogue tables do not exist (callers fall back to the in-process pool).
+
+    The first call per process (and after clear_enabled_recall_unit_ids_cache()) syncs the
+    table with the pool derived from HWXNet/Feng; later calls only read the version row and
+    reload the IDs when another worker changed the catalogue.
+    """
+    global _ENABLED_UNIT_CATALOGUE, _ENABLED_UNIT_CATALOGUE_SYNCED
+    derived = None
+    if not _ENABLED_UNIT_CATALOGUE_SYNCED:
+        derived = _get_enabled_recall_unit_ids_cached(_disabled_recall_unit_ids_fingerprint())
+    conn = _get_connection()
+    try:
+        if not _get_has_enabled_units_table(conn):
+            return None
+        if derived is not None:
+            version = _sync_enabled_unit_catalogue(conn, derived)
+            conn.commit()
+            _ENABLED_UNIT_CATALOGUE = (version, derived)
+            _ENABLED_UNIT_CATALOGUE_SYNCED = True
+            return _ENABLED_UNIT_CATALOGUE
+        with conn.cursor() as cur:
+            cur.execute("SELECT version FROM pinyin_recall_enabled_units_meta WHERE id = 1")
+            row = cur.fetchone()
+            version = int(row["version"]) if row else 0
+            cached = _ENABLED_UNIT_CATALOGUE
+            if cached is not None and cached[0] == version:
+                return cached
+            cur.execute("SELECT unit_id FROM pinyin_recall_enabled_units")
+            unit_ids = frozenset((r.get("unit_id") or "").strip() for r in cur.fetchall())
+        _ENABLED_UNIT_CATALOGUE = (version, unit_ids)
+        return _ENABLED_UNIT_CATALOGUE
+    except Exception as e:
+        conn.rollback()
+        print(f"[pinyin-recall] Enabled-unit catalogue unavailable, using in-process pool: {e}", flush=True)
+        return None
+    finally:
+        conn.close()
+
+
+def refresh_pinyin_recall_enabled_units() -> int:
+    """Re-derive the enabled pool and sync pinyin_recall_enabled_units with it. Returns the catalogue version."""
+    clear_enabled_recall_unit_ids_cache()
+    catalogue = _get_enabled_unit_catalogue()
+    if catalogue is None:
+        raise RuntimeError("pinyin_recall_enabled_units is not available")
+    return catalogue[0]
+
+
+def _enabled_unit_scope(enabled_unit_ids: Optional[List[str]] = None) -> Tuple[str, tuple, int]:
+    """
+    Return (SQL predicate on unit_id, its params, enabled unit total) for profile/recall queries.
+
+    Explicit ``enabled_unit_ids`` are passed as an array; otherwise the predicate joins the
+    persisted catalogue, falling back to the in-process pool when the table is missing.
+    """
+    if enabled_unit_ids is None:
+        catalogue = _get_enabled_unit_catalogue()
+        if catalogue is not None:
+            return _ENABLED_UNIT_CATALOGUE_PREDICATE, (), len(catalogue[1])
+        enabled_unit_ids = list(_get_enabled_recall_unit_ids_cached(_disabled_recall_unit_ids_fingerprint()))
+    unit_ids = sorted(enabled_unit_ids)
+    return "unit_id = ANY(%s)", (unit_ids,), len(unit_ids)
 
 
 def _get_enabled_recall_unit_ids() -> set[str]:
@@ -612,9 +904,13 @@ def _get_enabled_recall_unit_ids() -> set[str]:
     Return the current enabled pinyin-recall unit IDs derived from live character tables.
 
     Phase 4 progress/reporting uses reading-unit denominator semantics rather than raw
-    character count. Cached by globally-disabled unit fingerprint; call
-    clear_enabled_recall_unit_ids_cache() after mutating disabled units in-process.
+    character count. Served from the pinyin_recall_enabled_units catalogue (revalidated by
+    version) when it exists; otherwise cached by globally-disabled unit fingerprint. Call
+    clear_enabled_recall_unit_ids_cache() after reloading HWXNet/Feng data in-process.
     """
+    catalogue = _get_enabled_unit_catalogue()
+    if catalogue is not None:
+        return set(catalogue[1])
     return set(_get_enabled_recall_unit_ids_cached(_disabled_recall_unit_ids_fingerprint()))
 
 
@@ -764,13 +1060,52 @@ def disable_pinyin_recall_unit_globally(
                 ),
                 prepare=False,
             )
+            if _get_has_daily_band_counts_table(conn):
+                # Daily band rollups of users who answered this unit now over-count it;
+                # drop their "built" marker so the next trend read replays without it.
+                cur.execute(
+                    """
+                    DELETE FROM pinyin_recall_daily_band_counts_users
+                    WHERE user_id IN (
+                        SELECT DISTINCT user_id
+                        FROM pinyin_recall_item_answered
+                        WHERE unit_id = %s
+                    )
+                    """,
+                    ((unit_id or "").strip(),),
+                    prepare=False,
+                )
+            if _get_has_enabled_units_table(conn):
+                cur.execute(
+                    "DELETE FROM pinyin_recall_enabled_units WHERE unit_id = %s",
+                    ((unit_id or "").strip(),),
+                    prepare=False,
+                )
+                if cur.rowcount:
+                    _bump_enabled_unit_catalogue_version(cur)
         conn.commit()
     except Exception:
         conn.rollback()
         raise
     finally:
         conn.close()
-    clear_enabled_recall_unit_ids_cache()
+    # The catalogue version bump tells every worker to reload; only the derived pool is stale here.
+    _get_enabled_recall_unit_ids_cached.cache_clear()
+    invalidate_profile_progress_cache()
+
+
+_CHARACTER_VIEWS_COUNT_SQL = "SELECT COUNT(DISTINCT character) AS cnt FROM character_views WHERE user_id = %s"
+
+_CHARACTER_VIEWS_RECENT_SQL = """
+    SELECT character FROM (
+        SELECT character, MAX(viewed_at) AS max_at
+        FROM character_views
+        WHERE user_id = %s
+        GROUP BY character
+    ) sub
+    ORDER BY max_at DESC
+    LIMIT %s
+"""
 
 
 def get_character_views_count_for_user(user_id: str) -> int:
@@ -778,10 +1113,7 @@ def get_character_views_count_for_user(user_id: str) -> int:
     conn = _get_connection()
     try:
         with conn.cursor() as cur:
-            cur.execute(
-                "SELECT COUNT(DISTINCT character) AS cnt FROM character_views WHERE user_id = %s",
-                (user_id.strip(),),
-            )
+            cur.execute(_CHARACTER_VIEWS_COUNT_SQL, (user_id.strip(),))
             row = cur.fetchone()
         return int(row.get("cnt") or 0)
     finally:
@@ -793,83 +1125,83 @@ def get_character_views_recent_for_user(user_id: str, limit: int = 50) -> List[s
     conn = _get_connection()
     try:
         with conn.cursor() as cur:
-            cur.execute(
-                """
-                SELECT character FROM (
-                    SELECT character, MAX(viewed_at) AS max_at
-                    FROM character_views
-                    WHERE user_id = %s
-                    GROUP BY character
-                ) sub
-                ORDER BY max_at DESC
-                LIMIT %s
-                """,
-                (user_id.strip(), limit),
-            )
+            cur.execute(_CHARACTER_VIEWS_RECENT_SQL, (user_id.strip(), limit))
             rows = cur.fetchall()
-        return [(r.get("character") or "").strip() for r in rows if (r.get("character") or "").strip()]
+        return _recent_characters_from_rows(rows)
     finally:
         conn.close()
 
 
+def _recent_characters_from_rows(rows: List[Dict[str, Any]]) -> List[str]:
+    return [(r.get("character") or "").strip() for r in rows if (r.get("character") or "").strip()]
+
+
 def get_pinyin_recall_daily_stats(user_id: str, days: int = 30) -> List[Dict[str, Any]]:
     """Return daily stats: date, answered, correct, by_category. Ordered by date DESC (most recent first)."""
     conn = _get_connection()
     try:
         with conn.cursor() as cur:
-            cur.execute(
-                """
-                SELECT
-                    DATE(created_at AT TIME ZONE 'UTC') AS day,
-                    COUNT(*) AS answered,
-                    SUM(CASE WHEN correct THEN 1 ELSE 0 END)::int AS correct,
-                    COUNT(*) FILTER (WHERE category = %s) AS new_answered,
-                    COALESCE(SUM(CASE WHEN correct AND category = %s THEN 1 ELSE 0 END), 0)::int AS new_correct,
-                    COUNT(*) FILTER (WHERE category = %s) AS confirm_answered,
-                    COALESCE(SUM(CASE WHEN correct AND category = %s THEN 1 ELSE 0 END), 0)::int AS confirm_correct,
-                    COUNT(*) FILTER (WHERE category = %s) AS revise_answered,
-                    COALESCE(SUM(CASE WHEN correct AND category = %s THEN 1 ELSE 0 END), 0)::int AS revise_correct
-                FROM pinyin_recall_item_answered
-                WHERE user_id = %s
-                  AND created_at >= (NOW() AT TIME ZONE 'UTC') - (%s || ' days')::interval
-                GROUP BY DATE(created_at AT TIME ZONE 'UTC')
-                ORDER BY day DESC
-                LIMIT %s
-                """,
-                (
-                    PINYIN_RECALL_CATEGORY_NEW, PINYIN_RECALL_CATEGORY_NEW,
-                    PINYIN_RECALL_CATEGORY_CONFIRM, PINYIN_RECALL_CATEGORY_CONFIRM,
-                    PINYIN_RECALL_CATEGORY_REVISE, PINYIN_RECALL_CATEGORY_REVISE,
-                    user_id.strip(), str(days), days,
-                ),
-            )
+            cur.execute(_DAILY_STATS_SQL, _daily_stats_params(user_id, days))
             rows = cur.fetchall()
-        return [
-            {
-                "date": str(r.get("day") or ""),
-                "answered": int(r.get("answered") or 0),
-                "correct": int(r.get("correct") or 0),
-                "by_category": {
-                    PINYIN_RECALL_CATEGORY_NEW: {
-                        "answered": int(r.get("new_answered") or 0),
-                        "correct": int(r.get("new_correct") or 0),
-                    },
-                    PINYIN_RECALL_CATEGORY_CONFIRM: {
-                        "answered": int(r.get("confirm_answered") or 0),
-                        "correct": int(r.get("confirm_correct") or 0),
-                    },
-                    PINYIN_RECALL_CATEGORY_REVISE: {
-                        "answered": int(r.get("revise_answered") or 0),
-                        "correct": int(r.get("revise_correct") or 0),
-                    },
-                },
-            }
-            for r in rows
-        ]
+        return _daily_stats_from_rows(rows)
     finally:
         conn.close()
 
 
+_DAILY_STATS_SQL = """
+    SELECT
+        DATE(created_at AT TIME ZONE 'UTC') AS day,
+        COUNT(*) AS answered,
+        SUM(CASE WHEN correct THEN 1 ELSE 0 END)::int AS correct,
+        COUNT(*) FILTER (WHERE category = %s) AS new_answered,
+        COALESCE(SUM(CASE WHEN correct AND category = %s THEN 1 ELSE 0 END), 0)::int AS new_correct,
+        COUNT(*) FILTER (WHERE category = %s) AS confirm_answered,
+        COALESCE(SUM(CASE WHEN correct AND category = %s THEN 1 ELSE 0 END), 0)::int AS confirm_correct,
+        COUNT(*) FILTER (WHERE category = %s) AS revise_answered,
+        COALESCE(SUM(CASE WHEN correct AND category = %s THEN 1 ELSE 0 END), 0)::int AS revise_correct
+    FROM pinyin_recall_item_answered
+    WHERE user_id = %s
+      AND created_at >= (NOW() AT TIME ZONE 'UTC') - (%s || ' days')::interval
+    GROUP BY DATE(created_at AT TIME ZONE 'UTC')
+    ORDER BY day DESC
+    LIMIT %s
+"""
+
+
+def _daily_stats_params(user_id: str, days: int) -> tuple:
+    return (
+        PINYIN_RECALL_CATEGORY_NEW, PINYIN_RECALL_CATEGORY_NEW,
+        PINYIN_RECALL_CATEGORY_CONFIRM, PINYIN_RECALL_CATEGORY_CONFIRM,
+        PINYIN_RECALL_CATEGORY_REVISE, PINYIN_RECALL_CATEGORY_REVISE,
+        user_id.strip(), str(days), days,
+    )
+
+
+def _daily_stats_from_rows(rows: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    return [
+        {
+            "date": str(r.get("day") or ""),
+            "answered": int(r.get("answered") or 0),
+            "correct": int(r.get("correct") or 0),
+            "by_category": {
+                PINYIN_RECALL_CATEGORY_NEW: {
+                    "answered": int(r.get("new_answered") or 0),
+                    "correct": int(r.get("new_correct") or 0),
+                },
+                PINYIN_RECALL_CATEGORY_CONFIRM: {
+                    "answered": int(r.get("confirm_answered") or 0),
+                    "correct": int(r.get("confirm_correct") or 0),
+                },
+                PINYIN_RECALL_CATEGORY_REVISE: {
+                    "answered": int(r.get("revise_answered") or 0),
+                    "correct": int(r.get("revise_correct") or 0),
+                },
+            },
+        }
+        for r in rows
+    ]
+
+
 def _build_pinyin_recall_practice_summary(
     daily_rows: List[Dict[str, Any]],
     today_utc: Optional[date] = None,
@@ -933,36 +1265,40 @@ def get_pinyin_recall_practice_summary(user_id: str) -> List[Dict[str, Any]]:
     conn = _get_connection()
     try:
         with conn.cursor() as cur:
-            cur.execute(
-                """
-                SELECT
-                    DATE(created_at AT TIME ZONE 'UTC') AS date,
-                    COUNT(*) AS answered,
-                    SUM(CASE WHEN correct THEN 1 ELSE 0 END)::int AS correct,
-                    COUNT(*) FILTER (WHERE category = %s) AS 新字_answered,
-                    COALESCE(SUM(CASE WHEN correct AND category = %s THEN 1 ELSE 0 END), 0)::int AS 新字_correct,
-                    COUNT(*) FILTER (WHERE category = %s) AS 巩固_answered,
-                    COALESCE(SUM(CASE WHEN correct AND category = %s THEN 1 ELSE 0 END), 0)::int AS 巩固_correct,
-                    COUNT(*) FILTER (WHERE category = %s) AS 重测_answered,
-                    COALESCE(SUM(CASE WHEN correct AND category = %s THEN 1 ELSE 0 END), 0)::int AS 重测_correct
-                FROM pinyin_recall_item_answered
-                WHERE user_id = %s
-                GROUP BY DATE(created_at AT TIME ZONE 'UTC')
-                ORDER BY date DESC
-                """,
-                (
-                    PINYIN_RECALL_CATEGORY_NEW, PINYIN_RECALL_CATEGORY_NEW,
-                    PINYIN_RECALL_CATEGORY_CONFIRM, PINYIN_RECALL_CATEGORY_CONFIRM,
-                    PINYIN_RECALL_CATEGORY_REVISE, PINYIN_RECALL_CATEGORY_REVISE,
-                    user_id.strip(),
-                ),
-            )
+            cur.execute(_PRACTICE_SUMMARY_SQL, _practice_summary_params(user_id))
             rows = cur.fetchall()
         return _build_pinyin_recall_practice_summary(rows)
     finally:
         conn.close()
 
 
+_PRACTICE_SUMMARY_SQL = """
+    SELECT
+        DATE(created_at AT TIME ZONE 'UTC') AS date,
+        COUNT(*) AS answered,
+        SUM(CASE WHEN correct THEN 1 ELSE 0 END)::int AS correct,
+        COUNT(*) FILTER (WHERE category = %s) AS 新字_answered,
+        COALESCE(SUM(CASE WHEN correct AND category = %s THEN 1 ELSE 0 END), 0)::int AS 新字_correct,
+        COUNT(*) FILTER (WHERE category = %s) AS 巩固_answered,
+        COALESCE(SUM(CASE WHEN correct AND category = %s THEN 1 ELSE 0 END), 0)::int AS 巩固_correct,
+        COUNT(*) FILTER (WHERE category = %s) AS 重测_answered,
+        COALESCE(SUM(CASE WHEN correct AND category = %s THEN 1 ELSE 0 END), 0)::int AS 重测_correct
+    FROM pinyin_recall_item_answered
+    WHERE user_id = %s
+    GROUP BY DATE(created_at AT TIME ZONE 'UTC')
+    ORDER BY date DESC
+"""
+
+
+def _practice_summary_params(user_id: str) -> tuple:
+    return (
+        PINYIN_RECALL_CATEGORY_NEW, PINYIN_RECALL_CATEGORY_NEW,
+        PINYIN_RECALL_CATEGORY_CONFIRM, PINYIN_RECALL_CATEGORY_CONFIRM,
+        PINYIN_RECALL_CATEGORY_REVISE, PINYIN_RECALL_CATEGORY_REVISE,
+        user_id.strip(),
+    )
+
+
 def _profile_sub_band_for_score(score: int) -> str:
     """Map a unit-bank score to one of the five profile sub-bands (chart/table)."""
     if score < PROFILE_PROFICIENCY_MIN_SCORE:
@@ -1016,6 +1352,343 @@ def _sync_category_trend_with_live_counts(
     return output
 
 
+_PROFILE_TREND_BAND_COLUMNS: Dict[str, str] = {
+    "难字": "hard",
+    "普通在学字": "learning_normal",
+    "普通已学字": "learned_normal",
+    "掌握字": "mastered",
+    "精通字": "memorized",
+}
+
+# Rollup of end-of-day band counts per user. A user's rows are authoritative only while the
+# user has a pinyin_recall_daily_band_counts_users row; otherwise the trend replays history
+# and (re)builds the rollup. Created by scripts/pinyin_recall/create_pinyin_recall_daily_band_counts_table.py.
+_HAS_DAILY_BAND_COUNTS_TABLE: Optional[bool] = None
+# A missing-table result is trusted this long, so answers skip the probe yet tables created
+# while the backend runs are picked up without a restart.
+_DAILY_BAND_COUNTS_TABLE_RECHECK_SECONDS = 60
+_DAILY_BAND_COUNTS_TABLE_RECHECK_AT = 0.0
+
+
+def clear_daily_band_counts_table_cache() -> None:
+    """Forget the cached rollup-table probe (tests, or after creating the tables in-process)."""
+    global _HAS_DAILY_BAND_COUNTS_TABLE, _DAILY_BAND_COUNTS_TABLE_RECHECK_AT
+    _HAS_DAILY_BAND_COUNTS_TABLE = None
+    _DAILY_BAND_COUNTS_TABLE_RECHECK_AT = 0.0
+
+
+def _get_has_daily_band_counts_table(conn) -> bool:
+    global _HAS_DAILY_BAND_COUNTS_TABLE, _DAILY_BAND_COUNTS_TABLE_RECHECK_AT
+    if _HAS_DAILY_BAND_COUNTS_TABLE:
+        return True
+    if _HAS_DAILY_BAND_COUNTS_TABLE is False and time.monotonic() < _DAILY_BAND_COUNTS_TABLE_RECHECK_AT:
+        return False
+    with conn.cursor() as cur:
+        cur.execute(
+            """
+            SELECT
+                to_regclass('pinyin_recall_daily_band_counts') IS NOT NULL
+                AND to_regclass('pinyin_recall_daily_band_counts_users') IS NOT NULL AS has_table
+            """
+        )
+        row = cur.fetchone() or {}
+    _HAS_DAILY_BAND_COUNTS_TABLE = bool(row.get("has_table"))
+    if not _HAS_DAILY_BAND_COUNTS_TABLE:
+        _DAILY_BAND_COUNTS_TABLE_RECHECK_AT = time.monotonic() + _DAILY_BAND_COUNTS_TABLE_RECHECK_SECONDS
+    return _HAS_DAILY_BAND_COUNTS_TABLE
+
+
+def _replay_category_daily_snapshots(
+    conn,
+    user_id: str,
+    unit_scope: Tuple[str, tuple, int],
+) -> Dict[date, Dict[str, int]]:
+    """
+    End-of-day band counts for each UTC day with at least one answer, replayed from
+    pinyin_recall_item_answered.score_after (enabled unit_id rows only).
+    """
+    unit_predicate, unit_params, _ = unit_scope
+    with conn.cursor() as cur:
+        # One row per unit per UTC day (last answer that day) — same end-of-day semantics,
+        # far fewer rows than replaying every answer event.
+        cur.execute(
+            f"""
+            SELECT entity_id, score_after, ev_day
+            FROM (
+                SELECT DISTINCT ON (unit_id, (created_at AT TIME ZONE 'UTC')::date)
+                    unit_id AS entity_id,
+                    score_after,
+                    (created_at AT TIME ZONE 'UTC')::date AS ev_day,
+                    created_at
+                FROM pinyin_recall_item_answered
+                WHERE user_id = %s
+                  AND unit_id IS NOT NULL
+                  AND {unit_predicate}
+                ORDER BY unit_id, (created_at AT TIME ZONE 'UTC')::date, created_at DESC
+            ) last_per_unit_day
+            ORDER BY ev_day ASC, created_at ASC
+            """,
+            (user_id.strip(), *unit_params),
+        )
+        rows = cur.fetchall()
+
+    # Track current band per recall unit and global band counts.
+    band_counts: Dict[str, int] = {k: 0 for k in _PROFILE_TREND_BAND_COLUMNS}
+    per_entity_band: Dict[str, str] = {}
+
+    # Snapshots for days that had at least one event.
+    daily_snapshots: Dict[date, Dict[str, int]] = {}
+    current_day: Optional[date] = None
+
+    for r in rows:
+        entity_id = (r.get("entity_id") or "").strip()
+        score_after = r.get("score_after")
+        ev_day = r.get("ev_day")
+        if not entity_id or score_after is None or ev_day is None:
+            continue
+
+        if not isinstance(ev_day, date):
+            ev_day = ev_day.date() if hasattr(ev_day, "date") else ev_day
+        if current_day is None:
+            current_day = ev_day
+        elif ev_day != current_day:
+            # Snapshot counts at end of previous day before moving on.
+            daily_snapshots[current_day] = dict(band_counts)
+            current_day = ev_day
+
+        prev_band = per_entity_band.get(entity_id)
+        new_band = _profile_sub_band_for_score(int(score_after))
+
+        if prev_band == new_band:
+            continue
+
+        if prev_band is not None:
+            band_counts[prev_band] = max(0, band_counts.get(prev_band, 0) - 1)
+        band_counts[new_band] = band_counts.get(new_band, 0) + 1
+        per_entity_band[entity_id] = new_band
+
+    # Snapshot the final day.
+    if current_day is not None and current_day not in daily_snapshots:
+        daily_snapshots[current_day] = dict(band_counts)
+    return daily_snapshots
+
+
+def _load_daily_band_count_snapshots(conn, user_id: str, days: Optional[int]) -> Optional[Dict[date, Dict[str, int]]]:
+    """
+    Rollup snapshots needed for the last ``days`` days (plus the carry-forward anchor day),
+    or None when the user's rollup has not been built.
+    """
+    with conn.cursor() as cur:
+        cur.execute(_DAILY_BAND_COUNTS_COVERED_SQL, (user_id,))
+        if cur.fetchone() is None:
+            return None
+        cur.execute(_DAILY_BAND_COUNTS_RANGE_SQL, {"user_id": user_id, "days": days})
+        rows = cur.fetchall()
+    return _daily_band_count_snapshots_from_rows(rows)
+
+
+_DAILY_BAND_COUNTS_COVERED_SQL = "SELECT 1 AS covered FROM pinyin_recall_daily_band_counts_users WHERE user_id = %s"
+
+_DAILY_BAND_COUNTS_RANGE_SQL = """
+    SELECT day, hard, learning_normal, learned_normal, mastered, memorized
+    FROM pinyin_recall_daily_band_counts
+    WHERE user_id = %(user_id)s
+      AND (
+          %(days)s::int IS NULL
+          OR day >= COALESCE(
+              (
+                  SELECT max(anchor.day)
+                  FROM pinyin_recall_daily_band_counts anchor
+                  WHERE anchor.user_id = %(user_id)s
+                    AND anchor.day <= (
+                        SELECT max(last_day.day)
+                        FROM pinyin_recall_daily_band_counts last_day
+                        WHERE last_day.user_id = %(user_id)s
+                    ) - %(days)s::int + 1
+              ),
+              '-infinity'::date
+          )
+      )
+    ORDER BY day ASC
+"""
+
+
+def _daily_band_count_snapshots_from_rows(rows: List[Dict[str, Any]]) -> Dict[date, Dict[str, int]]:
+    return {
+        r["day"]: {band: int(r.get(column) or 0) for band, column in _PROFILE_TREND_BAND_COLUMNS.items()}
+        for r in rows
+    }
+
+
+def _lock_daily_band_counts(cur, user_id: str) -> None:
+    """
+    Serialize a user's rollup rebuild with answers folded in concurrently (held until commit):
+    an answer either commits before the rebuild replays history or sees the built marker.
+    """
+    cur.execute(
+        "SELECT pg_advisory_xact_lock(hashtextextended(%s, 0))",
+        (f"pinyin_recall_daily_band_counts:{user_id}",),
+        prepare=False,
+    )
+
+
+def _rebuild_daily_band_count_snapshots(
+    conn,
+    user_id: str,
+    unit_scope: Tuple[str, tuple, int],
+) -> Dict[date, Dict[str, int]]:
+    """Replay one user's history and replace their rollup rows, marking it built (caller commits)."""
+    with conn.cursor() as cur:
+        _lock_daily_band_counts(cur, user_id)
+    snapshots = _replay_category_daily_snapshots(conn, user_id, unit_scope) if unit_scope[2] else {}
+    columns = list(_PROFILE_TREND_BAND_COLUMNS.values())
+    with conn.cursor() as cur:
+        cur.execute("DELETE FROM pinyin_recall_daily_band_counts WHERE user_id = %s", (user_id,))
+        cur.executemany(
+            f"""
+            INSERT INTO pinyin_recall_daily_band_counts (user_id, day, {", ".join(columns)})
+            VALUES (%s, %s, {", ".join(["%s"] * len(columns))})
+            """,
+            [
+                (user_id, day, *(counts.get(band, 0) for band in _PROFILE_TREND_BAND_COLUMNS))
+                for day, counts in sorted(snapshots.items())
+            ],
+        )
+        cur.execute(
+            """
+            INSERT INTO pinyin_recall_daily_band_counts_users (user_id, built_at)
+            VALUES (%s, now())
+            ON CONFLICT (user_id) DO UPDATE SET built_at = EXCLUDED.built_at
+            """,
+            (user_id,),
+        )
+    return snapshots
+
+
+def rebuild_pinyin_recall_daily_band_counts(
+    user_id: str,
+    *,
+    enabled_unit_ids: Optional[List[str]] = None,
+) -> int:
+    """Replay one user's answer history into pinyin_recall_daily_band_counts. Returns the day-row count."""
+    user_id = user_id.strip()
+    unit_scope = _enabled_unit_scope(enabled_unit_ids)
+    conn = _get_connection()
+    try:
+        snapshots = _rebuild_daily_band_count_snapshots(conn, user_id, unit_scope)
+        conn.commit()
+        return len(snapshots)
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        conn.close()
+
+
+def _apply_daily_band_count_transition(
+    conn,
+    user_id: str,
+    unit_id: str,
+    prev_score: Optional[int],
+    score_after: int,
+) -> None:
+    """
+    Fold one answer into today's rollup row (inside the answer transaction). Today's row
+    starts as a copy of the latest earlier day; skipped for users whose rollup is not built
+    and for globally disabled units, matching the replayed trend.
+    """
+    if not _get_has_daily_band_counts_table(conn):
+        return
+    columns = list(_PROFILE_TREND_BAND_COLUMNS.values())
+    params = {"user_id": user_id, "unit_id": unit_id}
+    applies = """
+        EXISTS (SELECT 1 FROM pinyin_recall_daily_band_counts_users WHERE user_id = %(user_id)s)
+        AND NOT EXISTS (SELECT 1 FROM pinyin_recall_disabled_units WHERE unit_id = %(unit_id)s)
+    """
+    with conn.cursor() as cur:
+        _lock_daily_band_counts(cur, user_id)
+        cur.execute(
+            f"""
+            INSERT INTO pinyin_recall_daily_band_counts (user_id, day, {", ".join(columns)})
+            SELECT %(user_id)s, (now() AT TIME ZONE 'UTC')::date, {", ".join(f"COALESCE(prev.{c}, 0)" for c in columns)}
+            FROM (SELECT 1) AS one
+            LEFT JOIN LATERAL (
+                SELECT {", ".join(columns)}
+                FROM pinyin_recall_daily_band_counts
+                WHERE user_id = %(user_id)s AND day < (now() AT TIME ZONE 'UTC')::date
+                ORDER BY day DESC
+                LIMIT 1
+            ) AS prev ON true
+            WHERE {applies}
+            ON CONFLICT (user_id, day) DO NOTHING
+            """,
+            params,
+            prepare=False,
+        )
+        prev_band = _profile_sub_band_for_score(prev_score) if prev_score is not None else None
+        new_band = _profile_sub_band_for_score(score_after)
+        if prev_band == new_band:
+            return
+        new_column = _PROFILE_TREND_BAND_COLUMNS[new_band]
+        assignments = [f"{new_column} = {new_column} + 1"]
+        if prev_band is not None:
+            prev_column = _PROFILE_TREND_BAND_COLUMNS[prev_band]
+            assignments.append(f"{prev_column} = GREATEST({prev_column} - 1, 0)")
+        cur.execute(
+            f"""
+            UPDATE pinyin_recall_daily_band_counts
+            SET {", ".join(assignments)}, updated_at = now()
+            WHERE user_id = %(user_id)s
+              AND day = (now() AT TIME ZONE 'UTC')::date
+              AND {applies}
+            """,
+            params,
+            prepare=False,
+        )
+
+
+def _category_trend_from_snapshots(
+    daily_snapshots: Dict[date, Dict[str, int]],
+    days: Optional[int],
+) -> List[Dict[str, Any]]:
+    """Gap-fill end-of-day snapshots and keep the last ``days`` days relative to the last snapshot."""
+    if not daily_snapshots:
+        return []
+
+    all_days_sorted = sorted(daily_snapshots.keys())
+    start = all_days_sorted[0]
+    end = all_days_sorted[-1]
+
+    # Fill gaps for days without events by carrying forward the last known counts.
+    filled: Dict[date, Dict[str, int]] = {}
+    last_counts: Dict[str, int] = {k: 0 for k in _PROFILE_TREND_BAND_COLUMNS}
+    d = start
+    while d <= end:
+        if d in daily_snapshots:
+            last_counts = daily_snapshots[d]
+        filled[d] = dict(last_counts)
+        d += timedelta(days=1)
+
+    # Restrict to the last `days` days relative to `end` (skip when days is None).
+    cutoff = None if days is None else end - timedelta(days=days - 1)
+    output: List[Dict[str, Any]] = []
+    for day_key in sorted(filled.keys()):
+        if cutoff is not None and day_key < cutoff:
+            continue
+        counts = filled[day_key]
+        output.append(
+            {
+                "date": day_key.isoformat(),
+                "hard": counts.get("难字", 0),
+                "learning_normal": counts.get("普通在学字", 0),
+                "learned_normal": counts.get("普通已学字", 0),
+                "mastered": counts.get("掌握字", 0),
+                "memorized": counts.get("精通字", 0),
+            }
+        )
+    return output
+
+
 def get_pinyin_recall_category_daily_trend(
     user_id: str,
     days: Optional[int] = 60,
@@ -1032,8 +1705,11 @@ def get_pinyin_recall_category_daily_trend(
     - mastered (掌握字)
     - memorized (精通字)
 
-    Counts reflect band membership at end-of-day. Derived at runtime from
-    pinyin_recall_item_answered.score_after.
+    Counts reflect band membership at end-of-day, read from the
+    pinyin_recall_daily_band_counts rollup (maintained by
+    upsert_pinyin_recall_answer_and_log). Users without a built rollup are
+    replayed from pinyin_recall_item_answered.score_after once and the rollup is
+    written for them.
 
     Important: this trend is intended to match the Profile table counts, which
     are based on *enabled* recall reading-units (unit_id). Therefore we:
@@ -1047,124 +1723,199 @@ def get_pinyin_recall_category_daily_trend(
     if days is not None and days <= 0:
         return []
 
-    unit_ids = sorted(enabled_unit_ids) if enabled_unit_ids is not None else sorted(_get_enabled_recall_unit_ids())
-    if not unit_ids:
-        return []
-
+    user_id = user_id.strip()
     conn = _get_connection()
     try:
-        with conn.cursor() as cur:
-            # One row per unit per UTC day (last answer that day) — same end-of-day semantics,
-            # far fewer rows than replaying every answer event.
-            cur.execute(
-                """
-                SELECT entity_id, score_after, ev_day
-                FROM (
-                    SELECT DISTINCT ON (unit_id, (created_at AT TIME ZONE 'UTC')::date)
-                        unit_id AS entity_id,
-                        score_after,
-                        (created_at AT TIME ZONE 'UTC')::date AS ev_day,
-                        created_at
-                    FROM pinyin_recall_item_answered
-                    WHERE user_id = %s
-                      AND unit_id IS NOT NULL
-                      AND unit_id = ANY(%s)
-                    ORDER BY unit_id, (created_at AT TIME ZONE 'UTC')::date, created_at DESC
-                ) last_per_unit_day
-                ORDER BY ev_day ASC, created_at ASC
-                """,
-                (user_id.strip(), unit_ids),
-            )
-            rows = cur.fetchall()
-
-        # No activity for this user.
-        if not rows:
-            if live_counts is not None:
-                return [_category_trend_point_from_counts(live_counts, _profile_trend_today_utc_date())]
-            return []
-
-        # Track current band per recall unit and global band counts.
-        band_keys = ["难字", "普通在学字", "普通已学字", "掌握字", "精通字"]
-        band_counts: Dict[str, int] = {k: 0 for k in band_keys}
-        per_entity_band: Dict[str, str] = {}
-
-        # Snapshots for days that had at least one event.
-        daily_snapshots: Dict[date, Dict[str, int]] = {}
-        current_day: Optional[date] = None
+        has_rollup = _get_has_daily_band_counts_table(conn)
+        daily_snapshots = _load_daily_band_count_snapshots(conn, user_id, days) if has_rollup else None
+        return _finish_category_daily_trend(
+            conn,
+            user_id,
+            days,
+            daily_snapshots,
+            has_rollup=has_rollup,
+            live_counts=live_counts,
+            enabled_unit_ids=enabled_unit_ids,
+        )
+    finally:
+        conn.close()
 
-        for r in rows:
-            entity_id = (r.get("entity_id") or "").strip()
-            score_after = r.get("score_after")
-            ev_day = r.get("ev_day")
-            if not entity_id or score_after is None or ev_day is None:
-                continue
 
-            if not isinstance(ev_day, date):
-                ev_day = ev_day.date() if hasattr(ev_day, "date") else ev_day
-            if current_day is None:
-                current_day = ev_day
-            elif ev_day != current_day:
-                # Snapshot counts at end of previous day before moving on.
-                daily_snapshots[current_day] = dict(band_counts)
-                current_day = ev_day
+def _finish_category_daily_trend(
+    conn,
+    user_id: str,
+    days: Optional[int],
+    daily_snapshots: Optional[Dict[date, Dict[str, int]]],
+    *,
+    has_rollup: bool,
+    live_counts: Optional[Dict[str, int]],
+    enabled_unit_ids: Optional[List[str]] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Turn rollup snapshots into the trend series; ``daily_snapshots=None`` (no built rollup)
+    replays history instead, building the rollup when its tables exist.
+    """
+    if daily_snapshots is None:
+        unit_scope = _enabled_unit_scope(enabled_unit_ids)
+        if not unit_scope[2]:
+            return []
+        if has_rollup:
+            try:
+                daily_snapshots = _rebuild_daily_band_count_snapshots(conn, user_id, unit_scope)
+                conn.commit()
+            except Exception as e:
+                conn.rollback()
+                print(f"[profile] Failed to build daily band rollup for {user_id}: {e}", flush=True)
+                daily_snapshots = None
+        if daily_snapshots is None:
+            daily_snapshots = _replay_category_daily_snapshots(conn, user_id, unit_scope)
+
+    # No activity for this user.
+    if not daily_snapshots:
+        if live_counts is not None:
+            return [_category_trend_point_from_counts(live_counts, _profile_trend_today_utc_date())]
+        return []
 
-            prev_band = per_entity_band.get(entity_id)
-            new_band = _profile_sub_band_for_score(int(score_after))
+    output = _category_trend_from_snapshots(daily_snapshots, days)
+    output = _sync_category_trend_with_live_counts(user_id, output, live_counts=live_counts)
+    if days is not None and days > 0 and len(output) > days:
+        output = output[-days:]
+    return output
 
-            if prev_band == new_band:
-                continue
 
-            if prev_band is not None:
-                band_counts[prev_band] = max(0, band_counts.get(prev_band, 0) - 1)
-            band_counts[new_band] = band_counts.get(new_band, 0) + 1
-            per_entity_band[entity_id] = new_band
+# Per-user cache of get_profile_progress_data(). Answers, character views and global disables
+# written through this module invalidate it; writes from other workers show up within
+# PROFILE_PROGRESS_CACHE_SECONDS (0 disables the cache). Writes prune expired entries and
+# evict the oldest beyond _PROFILE_PROGRESS_CACHE_MAX_ENTRIES.
+_PROFILE_PROGRESS_CACHE: Dict[Tuple[str, int, int], Tuple[float, Dict[str, Any]]] = {}
+_PROFILE_PROGRESS_CACHE_MAX_ENTRIES = 1024
+_PROFILE_PROGRESS_CACHE_LOCK = threading.Lock()
+_PROFILE_PROGRESS_CACHE_GENERATION = 0
+
+
+def invalidate_profile_progress_cache(user_id: Optional[str] = None) -> None:
+    """Drop cached profile progress for one user, or for everyone when ``user_id`` is None."""
+    global _PROFILE_PROGRESS_CACHE_GENERATION
+    with _PROFILE_PROGRESS_CACHE_LOCK:
+        # Bumping the generation keeps a read that raced this write from caching its result.
+        _PROFILE_PROGRESS_CACHE_GENERATION += 1
+        if user_id is None:
+            _PROFILE_PROGRESS_CACHE.clear()
+            return
+        user_id = user_id.strip()
+        for key in [k for k in _PROFILE_PROGRESS_CACHE if k[0] == user_id]:
+            del _PROFILE_PROGRESS_CACHE[key]
+
+
+def _store_profile_progress(cache_key: Tuple[str, int, int], expires_at: float, result: Dict[str, Any]) -> None:
+    """Cache one result (caller holds the lock); insertion order doubles as eviction order."""
+    now = time.monotonic()
+    for key in [k for k, (entry_expires_at, _) in _PROFILE_PROGRESS_CACHE.items() if entry_expires_at <= now]:
+        del _PROFILE_PROGRESS_CACHE[key]
+    _PROFILE_PROGRESS_CACHE.pop(cache_key, None)
+    while len(_PROFILE_PROGRESS_CACHE) >= _PROFILE_PROGRESS_CACHE_MAX_ENTRIES:
+        del _PROFILE_PROGRESS_CACHE[next(iter(_PROFILE_PROGRESS_CACHE))]
+    _PROFILE_PROGRESS_CACHE[cache_key] = (expires_at, result)
+
+
+def _fetch_pipelined(conn, statements: List[Tuple[str, str, Any]]) -> Dict[str, List[Dict[str, Any]]]:
+    """Run (name, sql, params) statements in one psycopg pipeline; returns name -> rows."""
+    cursors = []
+    try:
+        with conn.pipeline():
+            for name, sql, params in statements:
+                cur = conn.cursor()
+                cursors.append((name, cur))
+                cur.execute(sql, params)
+        return {name: cur.fetchall() for name, cur in cursors}
+    finally:
+        for _, cur in cursors:
+            cur.close()
 
-        # Snapshot the final day.
-        if current_day is not None and current_day not in daily_snapshots:
-            daily_snapshots[current_day] = dict(band_counts)
 
-        if not daily_snapshots:
-            return []
+def get_profile_progress_data(
+    user_id: str,
+    *,
+    recent_limit: int = 50,
+    daily_stats_days: int = 30,
+) -> Dict[str, Any]:
+    """
+    Return everything GET /api/profile/progress needs in one pipelined round-trip:
+    viewed_characters_count, viewed_characters_recent, daily_stats, practice_summary,
+    category_counts and category_trend (full history, as with days=None).
 
-        all_days_sorted = sorted(daily_snapshots.keys())
-        start = all_days_sorted[0]
-        end = all_days_sorted[-1]
-
-        # Fill gaps for days without events by carrying forward the last known counts.
-        filled: Dict[date, Dict[str, int]] = {}
-        last_counts: Dict[str, int] = {k: 0 for k in band_keys}
-        d = start
-        while d <= end:
-            if d in daily_snapshots:
-                last_counts = daily_snapshots[d]
-            filled[d] = dict(last_counts)
-            d += timedelta(days=1)
-
-        # Restrict to the last `days` days relative to `end` (skip when days is None).
-        cutoff = None if days is None else end - timedelta(days=days - 1)
-        output: List[Dict[str, Any]] = []
-        for day_key in sorted(filled.keys()):
-            if cutoff is not None and day_key < cutoff:
-                continue
-            counts = filled[day_key]
-            output.append(
-                {
-                    "date": day_key.isoformat(),
-                    "hard": counts.get("难字", 0),
-                    "learning_normal": counts.get("普通在学字", 0),
-                    "learned_normal": counts.get("普通已学字", 0),
-                    "mastered": counts.get("掌握字", 0),
-                    "memorized": counts.get("精通字", 0),
-                }
-            )
+    Same results as calling the individual helpers; users without a built trend rollup
+    pay the one-off replay afterwards on the same connection.
+    """
+    user_id = user_id.strip()
+    cache_key = (user_id, recent_limit, daily_stats_days)
+    ttl = _env_number("PROFILE_PROGRESS_CACHE_SECONDS", 30)
+    with _PROFILE_PROGRESS_CACHE_LOCK:
+        generation = _PROFILE_PROGRESS_CACHE_GENERATION
+        hit = _PROFILE_PROGRESS_CACHE.get(cache_key) if ttl > 0 else None
+    if hit is not None and hit[0] > time.monotonic():
+        return copy.deepcopy(hit[1])
+
+    if _ENABLED_UNIT_CATALOGUE_SYNCED and _HAS_ENABLED_UNITS_TABLE:
+        # Catalogue already synced by this worker: count it inside the pipeline instead of
+        # spending a separate version round-trip.
+        unit_predicate, unit_params, total_units = _ENABLED_UNIT_CATALOGUE_PREDICATE, (), None
+    else:
+        unit_predicate, unit_params, total_units = _enabled_unit_scope()
 
-        output = _sync_category_trend_with_live_counts(user_id, output, live_counts=live_counts)
-        if days is not None and days > 0 and len(output) > days:
-            output = output[-days:]
-        return output
+    conn = _get_connection()
+    try:
+        has_rollup = _get_has_daily_band_counts_table(conn)
+        statements: List[Tuple[str, str, Any]] = [
+            ("views_count", _CHARACTER_VIEWS_COUNT_SQL, (user_id,)),
+            ("views_recent", _CHARACTER_VIEWS_RECENT_SQL, (user_id, recent_limit)),
+            ("daily_stats", _DAILY_STATS_SQL, _daily_stats_params(user_id, daily_stats_days)),
+            ("practice", _PRACTICE_SUMMARY_SQL, _practice_summary_params(user_id)),
+        ]
+        if total_units != 0:
+            statements.append(("counts", _category_counts_sql(unit_predicate), _category_counts_params(user_id, unit_params)))
+        if total_units is None:
+            statements.append(("total_units", "SELECT COUNT(*) AS total_units FROM pinyin_recall_enabled_units", ()))
+        if has_rollup:
+            statements.append(("trend_covered", _DAILY_BAND_COUNTS_COVERED_SQL, (user_id,)))
+            statements.append(("trend_rows", _DAILY_BAND_COUNTS_RANGE_SQL, {"user_id": user_id, "days": None}))
+        rows = _fetch_pipelined(conn, statements)
+
+        if total_units is None:
+            total_units = int((rows["total_units"] or [{}])[0].get("total_units") or 0)
+        category_counts = _category_counts_from_row(
+            (rows.get("counts") or [None])[0] if total_units else None,
+            total_units,
+        )
+        daily_snapshots = None
+        if has_rollup and rows["trend_covered"]:
+            daily_snapshots = _daily_band_count_snapshots_from_rows(rows["trend_rows"])
+        category_trend = _finish_category_daily_trend(
+            conn,
+            user_id,
+            None,
+            daily_snapshots,
+            has_rollup=has_rollup,
+            live_counts=category_counts,
+        )
+        views_count_row = (rows["views_count"] or [{}])[0]
+        result = {
+            "viewed_characters_count": int(views_count_row.get("cnt") or 0),
+            "viewed_characters_recent": _recent_characters_from_rows(rows["views_recent"]),
+            "daily_stats": _daily_stats_from_rows(rows["daily_stats"]),
+            "practice_summary": _build_pinyin_recall_practice_summary(rows["practice"]),
+            "category_counts": category_counts,
+            "category_trend": category_trend,
+        }
     finally:
         conn.close()
 
+    if ttl > 0:
+        with _PROFILE_PROGRESS_CACHE_LOCK:
+            if generation == _PROFILE_PROGRESS_CACHE_GENERATION:
+                _store_profile_progress(cache_key, time.monotonic() + ttl, copy.deepcopy(result))
+    return result
+
 
 def get_proficient_character_count(user_id: str, min_score: int = PROFILE_PROFICIENCY_MIN_SCORE) -> int:
     """Return count of characters with score >= min_score in pinyin_recall_character_bank."""
@@ -1203,72 +1954,70 @@ def get_pinyin_recall_category_counts(
          learned_normal (10 <= score < 20), learned_mastered (20 <= score < 40),
          learned_memorized (score >= 40, 精通项).
     """
-    unit_ids = sorted(enabled_unit_ids) if enabled_unit_ids is not None else sorted(_get_enabled_recall_unit_ids())
-    if not unit_ids:
-        return {
-            "total_units": 0,
-            "learned": 0,
-            "learning": 0,
-            "not_tested": 0,
-            "learning_hard": 0,
-            "learning_normal": 0,
-            "learned_mastered": 0,
-            "learned_memorized": 0,
-            "learned_normal": 0,
-        }
+    unit_predicate, unit_params, total_units = _enabled_unit_scope(enabled_unit_ids)
+    if not total_units:
+        return _category_counts_from_row({}, 0)
     conn = _get_connection()
     try:
         with conn.cursor() as cur:
-            cur.execute(
-                """
-                SELECT
-                    COUNT(*) FILTER (WHERE score >= %s) AS learned,
-                    COUNT(*) FILTER (WHERE score < %s) AS learning,
-                    COUNT(*) FILTER (WHERE score < %s AND score <= %s) AS learning_hard,
-                    COUNT(*) FILTER (WHERE score < %s AND score > %s) AS learning_normal,
-                    COUNT(*) FILTER (WHERE score >= %s AND score < %s) AS learned_mastered,
-                    COUNT(*) FILTER (WHERE score >= %s) AS learned_memorized,
-                    COUNT(*) FILTER (WHERE score >= %s AND score < %s) AS learned_normal
-                FROM pinyin_recall_unit_bank
-                WHERE user_id = %s
-                  AND unit_id = ANY(%s)
-                """,
-                (
-                    PROFILE_PROFICIENCY_MIN_SCORE,
-                    PROFILE_PROFICIENCY_MIN_SCORE,
-                    PROFILE_PROFICIENCY_MIN_SCORE,
-                    PROFILE_LEARNING_HARD_MAX_SCORE,
-                    PROFILE_PROFICIENCY_MIN_SCORE,
-                    PROFILE_LEARNING_HARD_MAX_SCORE,
-                    PROFILE_LEARNED_MASTERED_MIN_SCORE,
-                    PROFILE_LEARNED_MEMORIZED_MIN_SCORE,
-                    PROFILE_LEARNED_MEMORIZED_MIN_SCORE,
-                    PROFILE_PROFICIENCY_MIN_SCORE,
-                    PROFILE_LEARNED_MASTERED_MIN_SCORE,
-                    user_id.strip(),
-                    unit_ids,
-                ),
-            )
+            cur.execute(_category_counts_sql(unit_predicate), _category_counts_params(user_id, unit_params))
             row = cur.fetchone()
-        learned = int(row.get("learned") or 0)
-        learning = int(row.get("learning") or 0)
-        total_units = len(unit_ids)
-        not_tested = max(0, total_units - learned - learning)
-        return {
-            "total_units": total_units,
-            "learned": learned,
-            "learning": learning,
-            "not_tested": not_tested,
-            "learning_hard": int(row.get("learning_hard") or 0),
-            "learning_normal": int(row.get("learning_normal") or 0),
-            "learned_mastered": int(row.get("learned_mastered") or 0),
-            "learned_memorized": int(row.get("learned_memorized") or 0),
-            "learned_normal": int(row.get("learned_normal") or 0),
-        }
+        return _category_counts_from_row(row, total_units)
     finally:
         conn.close()
 
 
+def _category_counts_sql(unit_predicate: str) -> str:
+    return f"""
+        SELECT
+            COUNT(*) FILTER (WHERE score >= %s) AS learned,
+            COUNT(*) FILTER (WHERE score < %s) AS learning,
+            COUNT(*) FILTER (WHERE score < %s AND score <= %s) AS learning_hard,
+            COUNT(*) FILTER (WHERE score < %s AND score > %s) AS learning_normal,
+            COUNT(*) FILTER (WHERE score >= %s AND score < %s) AS learned_mastered,
+            COUNT(*) FILTER (WHERE score >= %s) AS learned_memorized,
+            COUNT(*) FILTER (WHERE score >= %s AND score < %s) AS learned_normal
+        FROM pinyin_recall_unit_bank
+        WHERE user_id = %s
+          AND {unit_predicate}
+    """
+
+
+def _category_counts_params(user_id: str, unit_params: tuple) -> tuple:
+    return (
+        PROFILE_PROFICIENCY_MIN_SCORE,
+        PROFILE_PROFICIENCY_MIN_SCORE,
+        PROFILE_PROFICIENCY_MIN_SCORE,
+        PROFILE_LEARNING_HARD_MAX_SCORE,
+        PROFILE_PROFICIENCY_MIN_SCORE,
+        PROFILE_LEARNING_HARD_MAX_SCORE,
+        PROFILE_LEARNED_MASTERED_MIN_SCORE,
+        PROFILE_LEARNED_MEMORIZED_MIN_SCORE,
+        PROFILE_LEARNED_MEMORIZED_MIN_SCORE,
+        PROFILE_PROFICIENCY_MIN_SCORE,
+        PROFILE_LEARNED_MASTERED_MIN_SCORE,
+        user_id.strip(),
+        *unit_params,
+    )
+
+
+def _category_counts_from_row(row: Optional[Dict[str, Any]], total_units: int) -> Dict[str, int]:
+    row = row or {}
+    learned = int(row.get("learned") or 0)
+    learning = int(row.get("learning") or 0)
+    return {
+        "total_units": total_units,
+        "learned": learned,
+        "learning": learning,
+        "not_tested": max(0, total_units - learned - learning),
+        "learning_hard": int(row.get("learning_hard") or 0),
+        "learning_normal": int(row.get("learning_normal") or 0),
+        "learned_mastered": int(row.get("learned_mastered") or 0),
+        "learned_memorized": int(row.get("learned_memorized") or 0),
+        "learned_normal": int(row.get("learned_normal") or 0),
+    }
+
+
 # Profile sub-categories for character list (same thresholds as get_pinyin_recall_category_counts)
 PROFILE_CATEGORY_LEARNING_HARD = "learning_hard"
 PROFILE_CATEGORY_LEARNING_NORMAL = "learning_normal"
@@ -1284,26 +2033,26 @@ def get_pinyin_recall_characters_by_category(
     Return reading units in the given profile sub-category, ordered by last_answered_at DESC (latest first).
     category: learning_hard | learning_normal | learned_normal | learned_mastered | learned_memorized.
     """
-    enabled_unit_ids = sorted(_get_enabled_recall_unit_ids())
-    if not enabled_unit_ids:
+    unit_predicate, unit_params, total_units = _enabled_unit_scope()
+    if not total_units:
         return []
     conn = _get_connection()
     try:
         if category == PROFILE_CATEGORY_LEARNING_HARD:
-            where = "user_id = %s AND unit_id = ANY(%s) AND score < %s AND score <= %s"
-            params = (user_id.strip(), enabled_unit_ids, PROFILE_PROFICIENCY_MIN_SCORE, PROFILE_LEARNING_HARD_MAX_SCORE)
+            where = f"user_id = %s AND {unit_predicate} AND score < %s AND score <= %s"
+            params = (user_id.strip(), *unit_params, PROFILE_PROFICIENCY_MIN_SCORE, PROFILE_LEARNING_HARD_MAX_SCORE)
         elif category == PROFILE_CATEGORY_LEARNING_NORMAL:
-            where = "user_id = %s AND unit_id = ANY(%s) AND score < %s AND score > %s"
-            params = (user_id.strip(), enabled_unit_ids, PROFILE_PROFICIENCY_MIN_SCORE, PROFILE_LEARNING_HARD_MAX_SCORE)
+            where = f"user_id = %s AND {unit_predicate} AND score < %s AND score > %s"
+            params = (user_id.strip(), *unit_params, PROFILE_PROFICIENCY_MIN_SCORE, PROFILE_LEARNING_HARD_MAX_SCORE)
         elif category == PROFILE_CATEGORY_LEARNED_MASTERED:
-            where = "user_id = %s AND unit_id = ANY(%s) AND score >= %s AND score < %s"
-            params = (user_id.strip(), enabled_unit_ids, PROFILE_LEARNED_MASTERED_MIN_SCORE, PROFILE_LEARNED_MEMORIZED_MIN_SCORE)
+            where = f"user_id = %s AND {unit_predicate} AND score >= %s AND score < %s"
+            params = (user_id.strip(), *unit_params, PROFILE_LEARNED_MASTERED_MIN_SCORE, PROFILE_LEARNED_MEMORIZED_MIN_SCORE)
         elif category == PROFILE_CATEGORY_LEARNED_MEMORIZED:
-            where = "user_id = %s AND unit_id = ANY(%s) AND score >= %s"
-            params = (user_id.strip(), enabled_unit_ids, PROFILE_LEARNED_MEMORIZED_MIN_SCORE)
+            where = f"user_id = %s AND {unit_predicate} AND score >= %s"
+            params = (user_id.strip(), *unit_params, PROFILE_LEARNED_MEMORIZED_MIN_SCORE)
         elif category == PROFILE_CATEGORY_LEARNED_NORMAL:
-            where = "user_id = %s AND unit_id = ANY(%s) AND score >= %s AND score < %s"
-            params = (user_id.strip(), enabled_unit_ids, PROFILE_PROFICIENCY_MIN_SCORE, PROFILE_LEARNED_MASTERED_MIN_SCORE)
+            where = f"user_id = %s AND {unit_predicate} AND score >= %s AND score < %s"
+            params = (user_id.strip(), *unit_params, PROFILE_PROFICIENCY_MIN_SCORE, PROFILE_LEARNED_MASTERED_MIN_SCORE)
         else:
             return []
         with conn.cursor() as cur:
@@ -1411,20 +2160,20 @@ def get_pinyin_recall_learning_state(user_id: str) -> Dict[str, Dict[str, Any]]:
     Returns dict: unit_id -> { character, reading_key, reading_display, stage, next_due_utc, score, total_correct, total_wrong, total_i_dont_know }.
     Used by build_session_queue. Table must exist (run create_pinyin_recall_unit_bank_table.py once).
     """
-    enabled_unit_ids = sorted(_get_enabled_recall_unit_ids())
-    if not enabled_unit_ids:
+    unit_predicate, unit_params, total_units = _enabled_unit_scope()
+    if not total_units:
         return {}
     conn = _get_connection()
     try:
         with conn.cursor() as cur:
             cur.execute(
-                """
+                f"""
                 SELECT unit_id, character, reading_key, reading_display, score, stage, next_due_utc, total_correct, total_wrong, total_i_dont_know
                 FROM pinyin_recall_unit_bank
                 WHERE user_id = %s
-                  AND unit_id = ANY(%s)
+                  AND {unit_predicate}
                 """,
-                (user_id.strip(), enabled_unit_ids),
+                (user_id.strip(), *unit_params),
             )
             rows = cur.fetchall()
         result: Dict[str, Dict[str, Any]] = {}
@@ -1796,7 +2545,15 @@ def upsert_pinyin_recall_answer_and_log(
                 ),
                 prepare=False,
             )
+        _apply_daily_band_count_transition(
+            conn,
+            user_id,
+            unit_id,
+            score_before if row else None,
+            score_after,
+        )
         conn.commit()
+        invalidate_profile_progress_cache(user_id)
         log_payload["score_before"] = score_before
         log_payload["score_after"] = score_after
         log_payload["category"] = category
@@ -1849,36 +2606,38 @@ def insert_pinyin_recall_item_answered(payload: Dict[str, Any]) -> None:
 
 
 def bulk_insert_pinyin_recall_item_presented(payloads: List[Dict[str, Any]]) -> int:
-    """Insert multiple item_presented rows in one connection. Returns count inserted."""
+    """Insert multiple item_presented rows with one pipelined executemany. Returns count inserted."""
     if not payloads:
         return 0
-    conn = _get_connection()
     sql = """
         INSERT INTO pinyin_recall_item_presented (user_id, session_id, unit_id, character, reading_key, reading_display, prompt_type, correct_choice, choices, batch_id, batch_mode, batch_character_category, from_user_priority, priority_label, priority_source)
         VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
     """
+    rows = []
+    for p in payloads:
+        choices = p.get("choices")
+        choices_json = json.dumps(choices) if choices is not None else "[]"
+        rows.append((
+            (p.get("user_id") or "").strip(),
+            (p.get("session_id") or "").strip(),
+            (p.get("unit_id") or "").strip() or None,
+            (p.get("character") or "").strip(),
+            (p.get("reading_key") or "").strip() or None,
+            (p.get("reading_display") or "").strip() or None,
+            (p.get("prompt_type") or "").strip(),
+            (p.get("correct_choice") or "").strip(),
+            choices_json,
+            p.get("batch_id"),
+            p.get("batch_mode"),
+            p.get("batch_character_category"),
+            bool(p.get("from_user_priority")) if p.get("from_user_priority") is not None else None,
+            (p.get("priority_label") or "").strip() or None,
+            (p.get("priority_source") or "").strip() or None,
+        ))
+    conn = _get_connection()
     try:
         with conn.cursor() as cur:
-            for p in payloads:
-                choices = p.get("choices")
-                choices_json = json.dumps(choices) if choices is not None else "[]"
-                cur.execute(sql, (
-                    (p.get("user_id") or "").strip(),
-                    (p.get("session_id") or "").strip(),
-                    (p.get("unit_id") or "").strip() or None,
-                    (p.get("character") or "").strip(),
-                    (p.get("reading_key") or "").strip() or None,
-                    (p.get("reading_display") or "").strip() or None,
-                    (p.get("prompt_type") or "").strip(),
-                    (p.get("correct_choice") or "").strip(),
-                    choices_json,
-                    p.get("batch_id"),
-                    p.get("batch_mode"),
-                    p.get("batch_character_category"),
-                    bool(p.get("from_user_priority")) if p.get("from_user_priority") is not None else None,
-                    (p.get("priority_label") or "").strip() or None,
-                    (p.get("priority_source") or "").strip() or None,
-                ), prepare=False)
+            cur.executemany(sql, rows)
         conn.commit()
         return len(payloads)
     except Exception as e:
@@ -1889,32 +2648,34 @@ def bulk_insert_pinyin_recall_item_presented(payloads: List[Dict[str, Any]]) ->
 
 
 def bulk_insert_pinyin_recall_item_answered(payloads: List[Dict[str, Any]]) -> int:
-    """Insert multiple item_answered rows in one connection. Returns count inserted."""
+    """Insert multiple item_answered rows with one pipelined executemany. Returns count inserted."""
     if not payloads:
         return 0
-    conn = _get_connection()
     sql = """
         INSERT INTO pinyin_recall_item_answered (user_id, session_id, unit_id, character, reading_key, reading_display, selected_choice, correct, latency_ms, i_dont_know, score_before, score_after, category)
         VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
     """
+    rows = []
+    for p in payloads:
+        rows.append((
+            (p.get("user_id") or "").strip(),
+            (p.get("session_id") or "").strip(),
+            (p.get("unit_id") or "").strip() or None,
+            (p.get("character") or "").strip(),
+            (p.get("reading_key") or "").strip() or None,
+            (p.get("reading_display") or "").strip() or None,
+            (p.get("selected_choice") or "").strip() if p.get("selected_choice") is not None else None,
+            bool(p.get("correct") is True),
+            p.get("latency_ms"),
+            bool(p.get("i_dont_know") is True),
+            p.get("score_before"),
+            p.get("score_after"),
+            p.get("category"),
+        ))
+    conn = _get_connection()
     try:
         with conn.cursor() as cur:
-            for p in payloads:
-                cur.execute(sql, (
-                    (p.get("user_id") or "").strip(),
-                    (p.get("session_id") or "").strip(),
-                    (p.get("unit_id") or "").strip() or None,
-                    (p.get("character") or "").strip(),
-                    (p.get("reading_key") or "").strip() or None,
-                    (p.get("reading_display") or "").strip() or None,
-                    (p.get("selected_choice") or "").strip() if p.get("selected_choice") is not None else None,
-                    bool(p.get("correct") is True),
-                    p.get("latency_ms"),
-                    bool(p.get("i_dont_know") is True),
-                    p.get("score_before"),
-                    p.get("score_after"),
-                    p.get("category"),
-                ), prepare=False)
+            cur.executemany(sql, rows)
         conn.commit()
         return len(payloads)
     except Exception as e:
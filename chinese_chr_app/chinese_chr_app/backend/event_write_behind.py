@@ -0,0 +1,135 @@
+"""
+In-process write-behind buffer for append-only event rows (pinyin recall item_presented / item_answered).
+
+Request handlers call ``put()`` and return immediately; a daemon thread hands buffered rows to a
+bulk ``flush(event, payloads)`` callable once ``max_batch`` rows are waiting or ``flush_interval``
+seconds have passed. The backlog is bounded: rows that do not fit, and rows whose flush raises, go
+to ``spill(event, payloads, reason)`` instead of being retried. ``close()`` drains what is left.
+"""
+
+import threading
+from typing import Any, Callable, Dict, List, Optional
+
+FlushFn = Callable[[str, List[Dict[str, Any]]], Any]
+SpillFn = Callable[[str, List[Dict[str, Any]], str], None]
+
+
+class WriteBehindQueue:
+    def __init__(
+        self,
+        flush: FlushFn,
+        spill: SpillFn,
+        *,
+        max_batch: int = 100,
+        flush_interval: float = 1.0,
+        max_backlog: int = 5000,
+        background: bool = True,
+    ) -> None:
+        self._flush = flush
+        self._spill = spill
+        self.max_batch = max(1, int(max_batch))
+        self.flush_interval = max(0.01, float(flush_interval))
+        self.max_backlog = max(self.max_batch, int(max_backlog))
+        self.background = background
+        self._pending: Dict[str, List[Dict[str, Any]]] = {}
+        self._size = 0
+        self._inflight = 0
+        self._closed = False
+        self._cond = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def backlog(self) -> int:
+        with self._cond:
+            return self._size
+
+    def put(self, event: str, payloads: List[Dict[str, Any]]) -> None:
+        """Buffer rows for ``event``; never blocks on the database and never raises."""
+        if not payloads:
+            return
+        if not self.background:
+            self._write({event: list(payloads)})
+            return
+        overflow: List[Dict[str, Any]] = []
+        reason = "backlog_full"
+        with self._cond:
+            if self._closed:
+                overflow, reason = list(payloads), "queue_closed"
+            else:
+                room = self.max_backlog - self._size
+                accepted = list(payloads[:room]) if room > 0 else []
+                overflow = list(payloads[len(accepted):])
+                if accepted:
+                    self._pending.setdefault(event, []).extend(accepted)
+                    self._size += len(accepted)
+                    self._ensure_worker()
+                    if self._size >= self.max_batch:
+                        self._cond.notify_all()
+        if overflow:
+            self._safe_spill(event, overflow, reason)
+
+    def flush(self) -> None:
+        """Write everything buffered so far from the calling thread and wait for in-flight writes."""
+        with self._cond:
+            batch = self._take()
+            self._inflight += 1
+        try:
+            self._write(batch)
+        finally:
+            with self._cond:
+                self._inflight -= 1
+                self._cond.notify_all()
+                while self._inflight:
+                    self._cond.wait()
+
+    def close(self, timeout: float = 10.0) -> None:
+        """Stop accepting rows, let the worker drain, then flush any remainder inline."""
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+            thread = self._thread
+        if thread is not None:
+            thread.join(timeout)
+        self.flush()
+
+    def _ensure_worker(self) -> None:
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(target=self._run, name="event-write-behind", daemon=True)
+            self._thread.start()
+
+    def _take(self) -> Dict[str, List[Dict[str, Any]]]:
+        batch, self._pending, self._size = self._pending, {}, 0
+        return batch
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                if not self._closed and self._size < self.max_batch:
+                    self._cond.wait(self.flush_interval)
+                if not self._size:
+                    if self._closed:
+                        return
+                    continue
+                batch = self._take()
+                self._inflight += 1
+            try:
+                self._write(batch)
+            finally:
+                with self._cond:
+                    self._inflight -= 1
+                    self._cond.notify_all()
+
+    def _write(self, batch: Dict[str, List[Dict[str, Any]]]) -> None:
+        for event, payloads in batch.items():
+            for start in range(0, len(payloads), self.max_batch):
+                chunk = payloads[start:start + self.max_batch]
+                try:
+                    self._flush(event, chunk)
+                except Exception as e:
+                    self._safe_spill(event, chunk, f"{type(e).__name__}: {e}")
+
+    def _safe_spill(self, event: str, payloads: List[Dict[str, Any]], reason: str) -> None:
+        try:
+            self._spill(event, payloads, reason)
+        except Exception as e:
+            print(f"[event-write-behind] Dropped {len(payloads)} {event} row(s) ({reason}); spill failed: {e}", flush=True)
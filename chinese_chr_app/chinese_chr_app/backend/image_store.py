@@ -0,0 +1,115 @@
+"""
+Character-card PNGs for GET /api/images/<index>/<page>.
+
+Card pages never change once uploaded, so every image is fetched at most once per worker:
+``ImageStore`` keeps (bytes, ETag) in an LRU bounded by total bytes in front of a source.
+``GCSImageSource`` reads ``gs://<bucket>/png/<index>/<page>.png`` through one shared
+``storage.Client`` with a single download per miss (NotFound -> None, no ``exists()`` probe);
+``LocalImageSource`` reads ``<PNG_BASE_DIR>/<index>/<page>.png`` for development and tests.
+"""
+
+import hashlib
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Optional, Tuple
+
+ImageRecord = Tuple[bytes, str]  # (PNG bytes, ETag value without quotes)
+
+_GCS_CLIENT = None
+_GCS_CLIENT_LOCK = threading.Lock()
+
+
+def image_etag(data: bytes) -> str:
+    """Strong ETag for one image's bytes."""
+    return hashlib.sha256(data).hexdigest()[:32]
+
+
+def _get_gcs_client():
+    """Process-wide storage.Client (created on first use; raises ImportError without google-cloud-storage)."""
+    global _GCS_CLIENT
+    if _GCS_CLIENT is None:
+        with _GCS_CLIENT_LOCK:
+            if _GCS_CLIENT is None:
+                from google.cloud import storage
+                _GCS_CLIENT = storage.Client()
+    return _GCS_CLIENT
+
+
+class LocalImageSource:
+    """Card PNGs under a local directory (development, offline tests)."""
+
+    def __init__(self, base_dir: Path):
+        self.base_dir = Path(base_dir)
+
+    def describe(self, key: str) -> str:
+        return str(self.base_dir / key)
+
+    def fetch(self, key: str) -> Optional[bytes]:
+        path = self.base_dir / key
+        if not path.is_file():
+            return None
+        return path.read_bytes()
+
+
+class GCSImageSource:
+    """Card PNGs in a GCS bucket under ``png/`` (production)."""
+
+    def __init__(self, bucket_name: str, prefix: str = "png/"):
+        from google.api_core.exceptions import NotFound
+
+        self.bucket_name = bucket_name
+        self.prefix = prefix
+        self._not_found = NotFound
+        self._bucket = None
+
+    def describe(self, key: str) -> str:
+        return f"gs://{self.bucket_name}/{self.prefix}{key}"
+
+    def fetch(self, key: str) -> Optional[bytes]:
+        if self._bucket is None:
+            self._bucket = _get_gcs_client().bucket(self.bucket_name)
+        try:
+            return self._bucket.blob(f"{self.prefix}{key}").download_as_bytes()
+        except self._not_found:
+            return None
+
+
+class ImageStore:
+    """Size-bounded LRU of (bytes, etag) in front of a Local/GCS image source."""
+
+    def __init__(self, source, *, max_bytes: int = 64 * 1024 * 1024):
+        self.source = source
+        self.max_bytes = max(0, int(max_bytes))
+        self._lru: "OrderedDict[str, ImageRecord]" = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[ImageRecord]:
+        """Return (bytes, etag) for ``key`` (``<index>/<page>.png``), or None when the source has no such image."""
+        with self._lock:
+            hit = self._lru.get(key)
+            if hit is not None:
+                self._lru.move_to_end(key)
+                return hit
+        # Fetch outside the lock so one slow download doesn't serialize other requests.
+        data = self.source.fetch(key)
+        if data is None:
+            return None
+        record = (data, image_etag(data))
+        with self._lock:
+            self._remember(key, record)
+        return record
+
+    def _remember(self, key: str, record: ImageRecord) -> None:
+        size = len(record[0])
+        if size > self.max_bytes:
+            return
+        old = self._lru.pop(key, None)
+        if old is not None:
+            self._size -= len(old[0])
+        self._lru[key] = record
+        self._size += size
+        while self._size > self.max_bytes:
+            _, evicted = self._lru.popitem(last=False)
+            self._size -= len(evicted[0])
@@ -5,6 +5,7 @@ Uses HWXNet (拼音 = first as correct; other pronunciations excluded from distr
 and Feng/HWXNet for stem words. In-memory learning state keyed by user_id.
 """
 
+import bisect
 import hashlib
 import random
 import time
@@ -186,9 +187,7 @@ def _select_priority_new_items(
     prioritized_characters: Optional[List[Dict[str, Any]]],
     new_items: List[Dict[str, Any]],
     user_state: Dict[str, Dict[str, Any]],
-    hwxnet_lookup: Dict[str, Any],
-    character_lookup: Dict[str, Any],
-    recall_overrides: Optional[Dict[str, Dict[str, Any]]],
+    unit_pool: "SessionUnitPool",
     zibiao_min: int,
     zibiao_max_effective: int,
 ) -> Tuple[List[Dict[str, Any]], Set[str]]:
@@ -217,39 +216,15 @@ def _select_priority_new_items(
     def _build_override_candidates(character: str) -> List[Dict[str, Any]]:
         if character in override_candidates_by_character:
             return override_candidates_by_character[character]
-        entry = (hwxnet_lookup or {}).get(character)
-        if not isinstance(entry, dict):
+        zi_int = unit_pool.zibiao_by_character.get(character)
+        if zi_int is None or zibiao_min <= zi_int <= zibiao_max_effective:
             override_candidates_by_character[character] = []
             return []
-        zi = entry.get("zibiao_index")
-        try:
-            zi_int = int(zi)
-        except (TypeError, ValueError):
-            override_candidates_by_character[character] = []
-            return []
-        if zibiao_min <= zi_int <= zibiao_max_effective:
-            override_candidates_by_character[character] = []
-            return []
-        feng_entry = (character_lookup or {}).get(character) if character_lookup else None
-        units = build_reading_units_for_character(
-            character,
-            entry,
-            feng_entry,
-            recall_overrides=recall_overrides,
-        )
-        candidates: List[Dict[str, Any]] = []
-        for unit in units:
-            if not unit.get("recall_enabled"):
-                continue
-            unit_id = unit.get("unit_id")
-            if not unit_id or user_state.get(unit_id):
-                continue
-            candidates.append({
-                "unit": unit,
-                "character": character,
-                "entry": entry,
-                "zibiao_index": zi_int,
-            })
+        candidates = [
+            candidate
+            for candidate in unit_pool.by_character.get(character, [])
+            if not user_state.get(candidate["unit"]["unit_id"])
+        ]
         candidates.sort(key=lambda candidate: candidate.get("unit", {}).get("reading_rank", 0))
         override_candidates_by_character[character] = candidates
         return candidates
@@ -309,6 +284,7 @@ DEEP_CONSOLIDATION_NEW = 0
 _PINYIN_INDEX_CACHE: Tuple[
     Dict[Tuple[str, int], List[str]], List[str]
 ] | None = None
+_SESSION_UNIT_POOL_CACHE: Optional[Dict[str, Any]] = None
 
 
 DEPRIORITIZED_STEM_WORDS: Set[str] = {
@@ -808,6 +784,172 @@ def get_or_build_pinyin_index(
     return _PINYIN_INDEX_CACHE
 
 
+class SessionUnitPool:
+    """
+    Enabled reading-unit candidates for every HWXNet character with a zibiao_index,
+    ordered by (zibiao_index, character, reading_rank) so a session window is a bisect slice.
+
+    Candidates are shared by every session built from the pool: treat them as read-only.
+    """
+
+    def __init__(
+        self,
+        by_character: Dict[str, List[Dict[str, Any]]],
+        zibiao_by_character: Dict[str, int],
+    ) -> None:
+        self.by_character = by_character
+        self.zibiao_by_character = zibiao_by_character
+        self.max_zibiao_in_corpus = max([0, *zibiao_by_character.values()])
+        ordered_characters = sorted(zibiao_by_character, key=lambda ch: (zibiao_by_character[ch], ch))
+        self.candidates: List[Dict[str, Any]] = [
+            candidate for ch in ordered_characters for candidate in by_character.get(ch, [])
+        ]
+        self._zibiao_keys = [candidate["zibiao_index"] for candidate in self.candidates]
+
+    def window(self, zibiao_min: int, zibiao_max: int) -> List[Dict[str, Any]]:
+        """Fresh list of candidates with zibiao_min <= zibiao_index <= zibiao_max, in pool order."""
+        lo = bisect.bisect_left(self._zibiao_keys, zibiao_min)
+        hi = bisect.bisect_right(self._zibiao_keys, zibiao_max)
+        return self.candidates[lo:hi]
+
+
+def _session_candidates_for_character(
+    character: str,
+    entry: Dict[str, Any],
+    zibiao_index: int,
+    character_lookup: Optional[Dict[str, Any]],
+    recall_overrides: Optional[Dict[str, Dict[str, Any]]],
+) -> List[Dict[str, Any]]:
+    feng_entry = (character_lookup or {}).get(character) if character_lookup else None
+    units = build_reading_units_for_character(
+        character,
+        entry,
+        feng_entry,
+        recall_overrides=recall_overrides,
+    )
+    return [
+        {
+            "unit": unit,
+            "character": character,
+            "entry": entry,
+            "zibiao_index": zibiao_index,
+        }
+        for unit in units
+        if unit.get("recall_enabled")
+    ]
+
+
+def build_session_unit_pool(
+    hwxnet_lookup: Dict[str, Any],
+    character_lookup: Optional[Dict[str, Any]] = None,
+    recall_overrides: Optional[Dict[str, Dict[str, Any]]] = None,
+    *,
+    base: Optional[SessionUnitPool] = None,
+) -> SessionUnitPool:
+    """
+    Build the session candidate pool. With ``base`` (a pool built from the same lookups
+    without overrides), only characters named in ``recall_overrides`` are rebuilt.
+    """
+    if base is not None:
+        by_character = dict(base.by_character)
+        overridden = {str(unit_id).split("|", 1)[0] for unit_id in (recall_overrides or {})}
+        for ch in overridden:
+            zi_int = base.zibiao_by_character.get(ch)
+            if zi_int is None:
+                continue
+            by_character[ch] = _session_candidates_for_character(
+                ch, hwxnet_lookup[ch], zi_int, character_lookup, recall_overrides
+            )
+        return SessionUnitPool(by_character, base.zibiao_by_character)
+
+    by_character: Dict[str, List[Dict[str, Any]]] = {}
+    zibiao_by_character: Dict[str, int] = {}
+    for ch, entry in (hwxnet_lookup or {}).items():
+        if not isinstance(entry, dict):
+            continue
+        zi = entry.get("zibiao_index")
+        if zi is None:
+            continue
+        try:
+            zi_int = int(zi)
+        except (TypeError, ValueError):
+            continue
+        zibiao_by_character[ch] = zi_int
+        by_character[ch] = _session_candidates_for_character(
+            ch, entry, zi_int, character_lookup, recall_overrides
+        )
+    return SessionUnitPool(by_character, zibiao_by_character)
+
+
+def _recall_overrides_key(recall_overrides: Optional[Dict[str, Dict[str, Any]]]) -> frozenset:
+    """The override fields build_reading_units_for_character reads, as a hashable cache key."""
+    key = set()
+    for unit_id, override in (recall_overrides or {}).items():
+        override = override if isinstance(override, dict) else {}
+        key.add((
+            unit_id,
+            bool(override.get("recall_enabled", True)),
+            str(override.get("enable_reason") or ""),
+            "is_primary" in override,
+            bool(override.get("is_primary")),
+        ))
+    return frozenset(key)
+
+
+def _same_lookup(cached: Optional[Dict[str, Any]], current: Optional[Dict[str, Any]]) -> bool:
+    return cached is current or (not cached and not current)
+
+
+def get_or_build_session_unit_pool(
+    hwxnet_lookup: Dict[str, Any],
+    character_lookup: Optional[Dict[str, Any]] = None,
+    recall_overrides: Optional[Dict[str, Dict[str, Any]]] = None,
+) -> SessionUnitPool:
+    """
+    Cached wrapper around build_session_unit_pool. The override-free pool is rebuilt only
+    when a different (or resized) lookup is passed; an override change re-derives just the
+    affected characters. Call invalidate_session_unit_pool() after editing a lookup in place.
+    """
+    global _SESSION_UNIT_POOL_CACHE
+    cache = _SESSION_UNIT_POOL_CACHE
+    lookup_key = (
+        len(hwxnet_lookup or {}),
+        len(character_lookup or {}),
+    )
+    if (
+        cache is None
+        or not _same_lookup(cache["hwxnet_lookup"], hwxnet_lookup)
+        or not _same_lookup(cache["character_lookup"], character_lookup)
+        or cache["lookup_key"] != lookup_key
+    ):
+        base = build_session_unit_pool(hwxnet_lookup, character_lookup)
+        cache = {
+            "hwxnet_lookup": hwxnet_lookup,
+            "character_lookup": character_lookup,
+            "lookup_key": lookup_key,
+            "base": base,
+            "overrides_key": frozenset(),
+            "pool": base,
+        }
+    overrides_key = _recall_overrides_key(recall_overrides)
+    if overrides_key != cache["overrides_key"]:
+        pool = cache["base"]
+        if overrides_key:
+            pool = build_session_unit_pool(
+                hwxnet_lookup, character_lookup, recall_overrides, base=cache["base"]
+            )
+        cache = {**cache, "overrides_key": overrides_key, "pool": pool}
+    _SESSION_UNIT_POOL_CACHE = cache
+    return cache["pool"]
+
+
+def invalidate_session_unit_pool() -> None:
+    """Drop the cached session pool and pinyin index (call after reloading HWXNet/Feng data)."""
+    global _SESSION_UNIT_POOL_CACHE, _PINYIN_INDEX_CACHE
+    _SESSION_UNIT_POOL_CACHE = None
+    _PINYIN_INDEX_CACHE = None
+
+
 def build_distractors(
     correct_pinyin: str,
     other_pronunciations: List[str],
@@ -903,15 +1045,8 @@ def build_session_queue(
         1 for s in user_state.values()
         if isinstance(s, dict) and (s.get("score") or 0) >= PROFICIENCY_MIN_SCORE
     )
-    max_zibiao_in_corpus = 0
-    for entry in (hwxnet_lookup or {}).values():
-        if isinstance(entry, dict):
-            zi = entry.get("zibiao_index")
-            if zi is not None:
-                try:
-                    max_zibiao_in_corpus = max(max_zibiao_in_corpus, int(zi))
-                except (TypeError, ValueError):
-                    pass
+    unit_pool = get_or_build_session_unit_pool(hwxnet_lookup, character_lookup, recall_overrides)
+    max_zibiao_in_corpus = unit_pool.max_zibiao_in_corpus
     tier = mastered_count // ZIBIAO_EXPAND_MASTERED_STEP
     zibiao_max_effective = min(
         max_zibiao_in_corpus or 7000,
@@ -923,38 +1058,9 @@ def build_session_queue(
     rng = random.Random(hashlib.sha256(seed_str.encode()).hexdigest())
 
     # Candidate pool: reading units derived from HWXNet/Feng rows with source
-    # character zibiao_index in [zibiao_min, zibiao_max_effective].
-    candidates: List[Dict[str, Any]] = []
-    for ch, entry in (hwxnet_lookup or {}).items():
-        if not isinstance(entry, dict):
-            continue
-        zi = entry.get("zibiao_index")
-        if zi is None:
-            continue
-        try:
-            zi_int = int(zi)
-        except (TypeError, ValueError):
-            continue
-        if not (zibiao_min <= zi_int <= zibiao_max_effective):
-            continue
-        feng_entry = (character_lookup or {}).get(ch) if character_lookup else None
-        units = build_reading_units_for_character(
-            ch,
-            entry,
-            feng_entry,
-            recall_overrides=recall_overrides,
-        )
-        for unit in units:
-            if not unit.get("recall_enabled"):
-                continue
-            candidates.append({
-                "unit": unit,
-                "character": ch,
-                "entry": entry,
-                "zibiao_index": zi_int,
-            })
-
-    candidates.sort(key=lambda x: (x.get("zibiao_index"), x.get("character"), x["unit"].get("reading_rank", 0)))
+    # character zibiao_index in [zibiao_min, zibiao_max_effective], sliced from the
+    # shared pool (already in (zibiao_index, character, reading_rank) order).
+    candidates = unit_pool.window(zibiao_min, zibiao_max_effective)
     rng.shuffle(candidates)
 
     pinyin_by_base_tone, all_pinyin = get_or_build_pinyin_index(hwxnet_lookup)
@@ -1028,9 +1134,7 @@ def build_session_queue(
         normalized_prioritized_characters,
         new_items,
         user_state,
-        hwxnet_lookup,
-        character_lookup,
-        recall_overrides,
+        unit_pool,
         zibiao_min,
         zibiao_max_effective,
     )
@@ -6,8 +6,10 @@ Used by GET /api/pinyin-search. Accepts:
 - Numeric tone (e.g. ke3, ma0) -> one key
 - No tone (e.g. ke, lv) -> keys for any tone: base, base1, base2, base3, base4, base0, base5
 Invalid: empty, both tone mark and trailing digit, or malformed.
+
+PinyinSearchIndex answers those keys from the in-memory HWXNet lookup.
 """
-from typing import List, Optional, Tuple
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 # Accented vowel -> (base_letter, tone). Tone 1-4, 0 = neutral. ü/ǖ/ǘ/ǚ/ǜ -> v
 _ACCENT_TO_BASE_AND_TONE = {
@@ -141,3 +143,73 @@ def compute_searchable_pinyin_for_entry(pinyin_list: list) -> List[str]:
             for key in pinyin_to_searchable_forms(s):
                 seen.add(key)
     return sorted(seen)
+
+
+def _search_sort_value(value: Any) -> float:
+    """Numeric 总笔画 / zibiao_index for ordering; missing or non-numeric values sort last."""
+    if isinstance(value, (int, float)):
+        return value
+    if isinstance(value, str) and value.strip().isdigit():
+        return int(value.strip())
+    return float("inf")
+
+
+class PinyinSearchIndex:
+    """
+    Inverted index over an HWXNet lookup: search key -> characters pre-sorted by
+    (总笔画, zibiao_index). Keys are computed from each entry's current 拼音 at build time
+    (never from a stored searchable_pinyin column), so rebuild it whenever the lookup reloads.
+    """
+
+    def __init__(self, hwxnet_lookup: Dict[str, Any]):
+        self.lookup = hwxnet_lookup  # the mapping this index was built from (identity check for callers)
+        ranked: List[Tuple[float, float, int, str]] = []
+        self._rows: Dict[str, Dict[str, Any]] = {}
+        keys_by_character: Dict[str, List[str]] = {}
+        for position, (ch, entry) in enumerate((hwxnet_lookup or {}).items()):
+            if not ch or not isinstance(entry, dict):
+                continue
+            pinyin_list = entry.get("拼音") or []
+            if isinstance(pinyin_list, str):
+                pinyin_list = [pinyin_list]
+            keys = compute_searchable_pinyin_for_entry(pinyin_list)
+            if not keys:
+                continue
+            self._rows[ch] = {
+                "character": ch,
+                "radical": (entry.get("部首") or "").strip() or "",
+                "pinyin": list(pinyin_list),
+                "strokes": entry.get("总笔画"),
+                "zibiao_index": entry.get("zibiao_index"),
+                "index": entry.get("index"),
+            }
+            keys_by_character[ch] = keys
+            ranked.append((
+                _search_sort_value(entry.get("总笔画")),
+                _search_sort_value(entry.get("zibiao_index")),
+                position,
+                ch,
+            ))
+        ranked.sort()
+        self._rank: Dict[str, int] = {}
+        postings: Dict[str, List[str]] = {}
+        for rank, (_, _, _, ch) in enumerate(ranked):
+            self._rank[ch] = rank
+            for key in keys_by_character[ch]:
+                postings.setdefault(key, []).append(ch)
+        self._postings: Dict[str, Tuple[str, ...]] = {key: tuple(chars) for key, chars in postings.items()}
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def characters_for_keys(self, search_keys: Iterable[str]) -> List[str]:
+        """Characters matching any key, one per character, in (总笔画, zibiao_index) order."""
+        postings = [self._postings[key] for key in search_keys if key in self._postings]
+        if len(postings) == 1:
+            return list(postings[0])
+        matched = {ch for chars in postings for ch in chars}
+        return sorted(matched, key=self._rank.__getitem__)
+
+    def search(self, search_keys: Iterable[str]) -> List[Dict[str, Any]]:
+        """Result rows (character, radical, pinyin, strokes, zibiao_index, index) for the keys."""
+        return [dict(self._rows[ch]) for ch in self.characters_for_keys(search_keys)]
@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Build the packed HanziWriter stroke store (data/hanzi_writer_strokes.sqlite) served by GET /api/strokes.
+
+Fetches stroke JSON for every HWXNet character from the jsDelivr/unpkg CDN (reusing files
+already in data/temp/hanzi_writer), stores the compact bytes plus a strong ETag per
+character, and writes one read-only SQLite file. Rebuild when the character set changes;
+the Docker image copies the file if it exists, otherwise the endpoint falls back to the CDN.
+
+Run from backend/:
+  python3 scripts/characters/build_hanzi_writer_stroke_store.py
+  python3 scripts/characters/build_hanzi_writer_stroke_store.py --from-db --workers 16
+  python3 scripts/characters/build_hanzi_writer_stroke_store.py --output /tmp/strokes.sqlite
+"""
+
+import argparse
+import json
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+try:
+    from dotenv import load_dotenv
+    env_file = Path(__file__).resolve().parent.parent.parent / ".env.local"
+    if env_file.exists():
+        load_dotenv(env_file)
+except ImportError:
+    pass
+
+SCRIPT_DIR = Path(__file__).resolve().parent
+BACKEND_DIR = SCRIPT_DIR.parent.parent
+OUTER_APP_DIR = BACKEND_DIR.parent.parent
+DATA_DIR = OUTER_APP_DIR / "data"
+HWXNET_JSON = DATA_DIR / "extracted_characters_hwxnet.json"
+CHARACTERS_JSON = DATA_DIR / "characters.json"
+
+sys.path.insert(0, str(BACKEND_DIR))
+from stroke_store import fetch_stroke_json, normalize_stroke_json, write_stroke_store  # noqa: E402
+
+
+def _load_characters(from_db: bool):
+    if from_db:
+        if not (os.environ.get("DATABASE_URL") or os.environ.get("SUPABASE_DB_URL")):
+            print("DATABASE_URL or SUPABASE_DB_URL is not set.")
+            sys.exit(1)
+        import database as db  # type: ignore
+        chars = list(db.get_hwxnet_lookup().keys())
+    elif HWXNET_JSON.exists():
+        with open(HWXNET_JSON, "r", encoding="utf-8") as f:
+            chars = list(json.load(f).keys())
+    else:
+        print(f"extracted_characters_hwxnet.json not found at {HWXNET_JSON}; using characters.json")
+        with open(CHARACTERS_JSON, "r", encoding="utf-8") as f:
+            chars = [(e.get("Character") or "").strip() for e in json.load(f)]
+    return sorted({c for c in chars if len(c) == 1}, key=ord)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--from-db", action="store_true", help="Read the character set from hwxnet_characters")
+    parser.add_argument("--output", default=str(DATA_DIR / "hanzi_writer_strokes.sqlite"), help="Store path")
+    parser.add_argument("--cache-dir", default=str(DATA_DIR / "temp" / "hanzi_writer"), help="Per-character JSON cache")
+    parser.add_argument("--workers", type=int, default=8, help="Concurrent CDN fetches")
+    parser.add_argument("--insecure", action="store_true", help="Skip TLS verification (like HW_STROKES_VERIFY_SSL=0)")
+    args = parser.parse_args()
+
+    chars = _load_characters(args.from_db)
+    cache_dir = Path(args.cache_dir)
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    print(f"Building stroke store for {len(chars)} character(s)...")
+
+    def load(ch):
+        cache_file = cache_dir / f"{ord(ch):x}.json"
+        if cache_file.exists():
+            try:
+                return ch, normalize_stroke_json(cache_file.read_bytes()), None
+            except Exception:
+                pass
+        try:
+            data = fetch_stroke_json(ch, verify_ssl=not args.insecure)
+        except Exception as e:
+            return ch, None, e
+        cache_file.write_bytes(data + b"\n")
+        return ch, data, None
+
+    records = []
+    missing = []
+    with ThreadPoolExecutor(max_workers=max(1, args.workers)) as pool:
+        for i, (ch, data, err) in enumerate(pool.map(load, chars), start=1):
+            if data is None:
+                missing.append((ch, err))
+            else:
+                records.append((ch, data))
+            if i % 500 == 0:
+                print(f"  {i}/{len(chars)}")
+
+    count = write_stroke_store(Path(args.output), records, source="hanzi-writer-data")
+    size_kb = Path(args.output).stat().st_size / 1024
+    print(f"Done. Wrote {count} character(s) to {args.output} ({size_kb:.0f} KiB).")
+    if missing:
+        print(f"No stroke data for {len(missing)} character(s) (served via CDN fallback if ever available):")
+        for ch, err in missing[:20]:
+            print(f"  {ch} (U+{ord(ch):04X}): {err}")
+
+
+if __name__ == "__main__":
+    main()
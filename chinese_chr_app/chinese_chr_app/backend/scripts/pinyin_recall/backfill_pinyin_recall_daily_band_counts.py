@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Backfill pinyin_recall_daily_band_counts by replaying pinyin_recall_item_answered.
+
+Rebuilds every user with unit-aware answers (or one user with --user-id) using the same
+end-of-day replay as the profile trend, replacing existing rollup rows. Safe to re-run;
+use it after bulk edits to answer history or the disabled-unit list.
+
+Requires DATABASE_URL (or SUPABASE_DB_URL) and the tables from
+create_pinyin_recall_daily_band_counts_table.py. Run from backend/:
+  python3 scripts/pinyin_recall/backfill_pinyin_recall_daily_band_counts.py
+  python3 scripts/pinyin_recall/backfill_pinyin_recall_daily_band_counts.py --dry-run
+  python3 scripts/pinyin_recall/backfill_pinyin_recall_daily_band_counts.py --user-id "uuid"
+  python3 scripts/pinyin_recall/backfill_pinyin_recall_daily_band_counts.py --missing-only
+"""
+
+import argparse
+import os
+import sys
+from pathlib import Path
+
+try:
+    from dotenv import load_dotenv
+    env_file = Path(__file__).resolve().parent.parent.parent / ".env.local"
+    if env_file.exists():
+        load_dotenv(env_file)
+except ImportError:
+    pass
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--user-id", help="Only rebuild this user")
+    parser.add_argument("--missing-only", action="store_true", help="Skip users whose rollup is already built")
+    parser.add_argument("--dry-run", action="store_true", help="List users that would be rebuilt")
+    args = parser.parse_args()
+
+    if not (os.environ.get("DATABASE_URL") or os.environ.get("SUPABASE_DB_URL")):
+        print("DATABASE_URL or SUPABASE_DB_URL is not set.")
+        sys.exit(1)
+
+    backend_dir = Path(__file__).resolve().parents[2]
+    sys.path.insert(0, str(backend_dir))
+    import database as db  # type: ignore
+
+    conn = db._get_connection()  # noqa: SLF001 - maintenance script
+    try:
+        with conn.cursor() as cur:
+            if args.user_id:
+                user_ids = [args.user_id.strip()]
+            else:
+                cur.execute(
+                    """
+                    SELECT DISTINCT user_id
+                    FROM pinyin_recall_item_answered
+                    WHERE unit_id IS NOT NULL
+                    ORDER BY user_id
+                    """
+                )
+                user_ids = [r["user_id"] for r in cur.fetchall()]
+            if args.missing_only:
+                cur.execute("SELECT user_id FROM pinyin_recall_daily_band_counts_users")
+                built = {r["user_id"] for r in cur.fetchall()}
+                user_ids = [u for u in user_ids if u not in built]
+    finally:
+        conn.close()
+
+    if args.dry_run:
+        print(f"Dry run: would rebuild daily band counts for {len(user_ids)} user(s).")
+        for user_id in user_ids:
+            print(f"  {user_id}")
+        return
+
+    enabled_unit_ids = sorted(db._get_enabled_recall_unit_ids())  # noqa: SLF001
+    total_days = 0
+    for i, user_id in enumerate(user_ids, start=1):
+        days = db.rebuild_pinyin_recall_daily_band_counts(user_id, enabled_unit_ids=enabled_unit_ids)
+        total_days += days
+        print(f"[{i}/{len(user_ids)}] {user_id}: {days} day row(s)")
+    print(f"Done. Rebuilt {len(user_ids)} user(s), {total_days} day row(s).")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+Create the pinyin_recall_daily_band_counts rollup tables in Supabase.
+
+pinyin_recall_daily_band_counts holds one end-of-day snapshot of a user's five profile
+bands (难字 / 普通在学字 / 普通已学字 / 掌握字 / 精通字) per UTC day with answer activity.
+upsert_pinyin_recall_answer_and_log keeps today's row current; the profile trend chart
+reads it with one indexed range scan. pinyin_recall_daily_band_counts_users marks users
+whose rollup has been built (backfill script or first trend read).
+
+Requires DATABASE_URL (or SUPABASE_DB_URL). Run from backend/:
+  python3 scripts/pinyin_recall/create_pinyin_recall_daily_band_counts_table.py
+Then backfill:
+  python3 scripts/pinyin_recall/backfill_pinyin_recall_daily_band_counts.py
+A running backend re-probes for the tables within a minute, so no restart is needed.
+"""
+
+import os
+import sys
+from pathlib import Path
+
+try:
+    from dotenv import load_dotenv
+    env_file = Path(__file__).resolve().parent.parent.parent / ".env.local"
+    if env_file.exists():
+        load_dotenv(env_file)
+except ImportError:
+    pass
+
+
+CREATE_DAILY_BAND_COUNTS_SQL = """
+CREATE TABLE IF NOT EXISTS pinyin_recall_daily_band_counts (
+    user_id text NOT NULL,
+    day date NOT NULL,
+    hard integer NOT NULL DEFAULT 0,
+    learning_normal integer NOT NULL DEFAULT 0,
+    learned_normal integer NOT NULL DEFAULT 0,
+    mastered integer NOT NULL DEFAULT 0,
+    memorized integer NOT NULL DEFAULT 0,
+    updated_at timestamptz NOT NULL DEFAULT now(),
+    PRIMARY KEY (user_id, day)
+);
+
+CREATE TABLE IF NOT EXISTS pinyin_recall_daily_band_counts_users (
+    user_id text PRIMARY KEY,
+    built_at timestamptz NOT NULL DEFAULT now()
+);
+"""
+
+
+def main():
+    try:
+        import psycopg
+    except ImportError:
+        print("psycopg is required. Install with: pip3 install 'psycopg[binary]>=3.1'")
+        sys.exit(1)
+
+    url = os.environ.get("DATABASE_URL") or os.environ.get("SUPABASE_DB_URL")
+    if not url:
+        print("DATABASE_URL or SUPABASE_DB_URL is not set.")
+        sys.exit(1)
+
+    conn = psycopg.connect(url)
+    try:
+        with conn.cursor() as cur:
+            cur.execute(CREATE_DAILY_BAND_COUNTS_SQL)
+        conn.commit()
+        print("pinyin_recall_daily_band_counts tables created (or already exist).")
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        conn.close()
+
+
+if __name__ == "__main__":
+    main()
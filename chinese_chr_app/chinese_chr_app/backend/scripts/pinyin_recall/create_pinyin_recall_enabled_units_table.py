@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Create the pinyin_recall_enabled_units catalogue tables in Supabase and populate them.
+
+pinyin_recall_enabled_units holds one row per enabled reading unit (HWXNet/Feng pool minus
+pinyin_recall_disabled_units), so profile and learning-state queries join it instead of
+sending the whole unit_id list as an array parameter. pinyin_recall_enabled_units_meta is a
+single version row bumped on every change; backend workers revalidate their cached copy
+against it. The backend re-syncs the catalogue on startup and after HWXNet reloads, and
+disable_pinyin_recall_unit_globally removes units in the same transaction.
+
+Requires DATABASE_URL (or SUPABASE_DB_URL). Run from backend/:
+  python3 scripts/pinyin_recall/create_pinyin_recall_enabled_units_table.py
+  python3 scripts/pinyin_recall/create_pinyin_recall_enabled_units_table.py --skip-populate
+"""
+
+import argparse
+import os
+import sys
+from pathlib import Path
+
+try:
+    from dotenv import load_dotenv
+    env_file = Path(__file__).resolve().parent.parent.parent / ".env.local"
+    if env_file.exists():
+        load_dotenv(env_file)
+except ImportError:
+    pass
+
+
+CREATE_ENABLED_UNITS_SQL = """
+CREATE TABLE IF NOT EXISTS pinyin_recall_enabled_units (
+    unit_id text PRIMARY KEY
+);
+
+CREATE TABLE IF NOT EXISTS pinyin_recall_enabled_units_meta (
+    id smallint PRIMARY KEY CHECK (id = 1),
+    version bigint NOT NULL,
+    refreshed_at timestamptz NOT NULL DEFAULT now()
+);
+"""
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--skip-populate", action="store_true", help="Only create the tables")
+    args = parser.parse_args()
+
+    try:
+        import psycopg
+    except ImportError:
+        print("psycopg is required. Install with: pip3 install 'psycopg[binary]>=3.1'")
+        sys.exit(1)
+
+    url = os.environ.get("DATABASE_URL") or os.environ.get("SUPABASE_DB_URL")
+    if not url:
+        print("DATABASE_URL or SUPABASE_DB_URL is not set.")
+        sys.exit(1)
+
+    conn = psycopg.connect(url)
+    try:
+        with conn.cursor() as cur:
+            cur.execute(CREATE_ENABLED_UNITS_SQL)
+        conn.commit()
+        print("pinyin_recall_enabled_units tables created (or already exist).")
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        conn.close()
+
+    if args.skip_populate:
+        return
+
+    backend_dir = Path(__file__).resolve().parents[2]
+    sys.path.insert(0, str(backend_dir))
+    import database as db  # type: ignore
+
+    version = db.refresh_pinyin_recall_enabled_units()
+    total = db.get_pinyin_recall_enabled_unit_total()
+    print(f"Catalogue synced: {total} enabled unit(s), version {version}.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,168 @@
+"""
+Packed HanziWriter stroke data for GET /api/strokes.
+
+The store is one read-only SQLite file (``data/hanzi_writer_strokes.sqlite``) built offline by
+``scripts/characters/build_hanzi_writer_stroke_store.py`` for the HWXNet character set and
+shipped with the image. Each row keeps the compact JSON bytes exactly as served plus a strong
+ETag, so requests never parse or re-serialize stroke JSON. A small in-memory LRU sits in front
+of the file (and also holds characters fetched from the CDN at runtime).
+"""
+
+import hashlib
+import json
+import sqlite3
+import ssl
+import threading
+import urllib.parse
+import urllib.request
+from collections import OrderedDict
+from pathlib import Path
+from typing import Iterable, Optional, Tuple
+
+import certifi
+
+STROKE_STORE_FORMAT_VERSION = "1"
+HANZI_WRITER_DATA_VERSION = "2.0.1"
+
+CREATE_STROKE_STORE_SQL = """
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS strokes (
+    codepoint INTEGER PRIMARY KEY,
+    etag TEXT NOT NULL,
+    data BLOB NOT NULL
+);
+"""
+
+StrokeRecord = Tuple[bytes, str]  # (raw JSON bytes, ETag value without quotes)
+
+
+def stroke_etag(data: bytes) -> str:
+    """Strong ETag for one character's stroke JSON bytes."""
+    return hashlib.sha256(data).hexdigest()[:32]
+
+
+def normalize_stroke_json(raw: bytes) -> bytes:
+    """Validate CDN stroke JSON once and return its compact UTF-8 encoding (raises ValueError)."""
+    data = json.loads(raw.decode("utf-8"))
+    if not isinstance(data, dict) or "strokes" not in data:
+        raise ValueError("not HanziWriter stroke data")
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def fetch_stroke_json(ch: str, *, verify_ssl: bool = True, timeout: float = 20) -> bytes:
+    """Fetch one character's stroke JSON from jsDelivr, falling back to unpkg; returns normalized bytes."""
+    encoded = urllib.parse.quote(ch)
+    urls = [
+        f"https://cdn.jsdelivr.net/npm/hanzi-writer-data@{HANZI_WRITER_DATA_VERSION}/{encoded}.json",
+        f"https://unpkg.com/hanzi-writer-data@{HANZI_WRITER_DATA_VERSION}/{encoded}.json",
+    ]
+    # Use certifi CA bundle to avoid local truststore issues
+    # (common on some macOS/Python setups).
+    ssl_context = ssl.create_default_context(cafile=certifi.where()) if verify_ssl else ssl._create_unverified_context()
+    last_err: Optional[Exception] = None
+    for url in urls:
+        try:
+            req = urllib.request.Request(url, headers={"User-Agent": "Mozilla/5.0"})
+            with urllib.request.urlopen(req, timeout=timeout, context=ssl_context) as resp:
+                if getattr(resp, "status", 200) != 200:
+                    raise Exception(f"HTTP {getattr(resp, 'status', 'unknown')}")
+                return normalize_stroke_json(resp.read())
+        except Exception as e:
+            last_err = e
+    raise RuntimeError(str(last_err))
+
+
+def write_stroke_store(path: Path, records: Iterable[Tuple[str, bytes]], *, source: str = "") -> int:
+    """Write (character, raw JSON bytes) pairs to a fresh store at ``path``; returns the row count."""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(path.name + ".tmp")
+    if tmp_path.exists():
+        tmp_path.unlink()
+    conn = sqlite3.connect(tmp_path)
+    try:
+        conn.executescript(CREATE_STROKE_STORE_SQL)
+        count = 0
+        with conn:
+            for ch, data in records:
+                conn.execute(
+                    "INSERT OR REPLACE INTO strokes (codepoint, etag, data) VALUES (?, ?, ?)",
+                    (ord(ch), stroke_etag(data), sqlite3.Binary(data)),
+                )
+                count += 1
+            conn.executemany(
+                "INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)",
+                [("format_version", STROKE_STORE_FORMAT_VERSION), ("source", source)],
+            )
+        conn.execute("VACUUM")
+    finally:
+        conn.close()
+    tmp_path.replace(path)
+    return count
+
+
+class StrokeStore:
+    """Read side: packed SQLite file (optional) behind a bounded LRU of (bytes, etag)."""
+
+    def __init__(self, path: Optional[Path], *, lru_size: int = 512):
+        self.path = Path(path) if path else None
+        self.lru_size = max(0, int(lru_size))
+        self._lru: "OrderedDict[str, StrokeRecord]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._opened = False
+
+    def _connection(self) -> Optional[sqlite3.Connection]:
+        if not self._opened:
+            self._opened = True
+            if self.path is not None and self.path.is_file():
+                try:
+                    conn = sqlite3.connect(
+                        f"{self.path.resolve().as_uri()}?mode=ro&immutable=1",
+                        uri=True,
+                        check_same_thread=False,
+                    )
+                    row = conn.execute("SELECT value FROM meta WHERE key = 'format_version'").fetchone()
+                    if row and row[0] == STROKE_STORE_FORMAT_VERSION:
+                        self._conn = conn
+                    else:
+                        conn.close()
+                        print(f"Warning: ignoring stroke store {self.path} (unknown format)", flush=True)
+                except sqlite3.Error as e:
+                    print(f"Warning: failed to open stroke store {self.path}: {e}", flush=True)
+        return self._conn
+
+    def get(self, ch: str) -> Optional[StrokeRecord]:
+        """Return (bytes, etag) for ``ch`` from the LRU or packed file, or None when absent."""
+        with self._lock:
+            hit = self._lru.get(ch)
+            if hit is not None:
+                self._lru.move_to_end(ch)
+                return hit
+            conn = self._connection()
+            row = None
+            if conn is not None:
+                row = conn.execute("SELECT data, etag FROM strokes WHERE codepoint = ?", (ord(ch),)).fetchone()
+            if row is None:
+                return None
+            record = (bytes(row[0]), row[1])
+            self._remember(ch, record)
+            return record
+
+    def put(self, ch: str, data: bytes) -> StrokeRecord:
+        """Keep runtime-fetched bytes (e.g. characters missing from the packed file) in the LRU."""
+        record = (data, stroke_etag(data))
+        with self._lock:
+            self._remember(ch, record)
+        return record
+
+    def _remember(self, ch: str, record: StrokeRecord) -> None:
+        if not self.lru_size:
+            return
+        self._lru[ch] = record
+        self._lru.move_to_end(ch)
+        while len(self._lru) > self.lru_size:
+            self._lru.popitem(last=False)
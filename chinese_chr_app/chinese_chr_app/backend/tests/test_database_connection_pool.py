@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""Tests for the pooled connection accessor in database.py."""
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import database
+from psycopg import pq
+
+
+class _FakeInfo:
+    def __init__(self):
+        self.transaction_status = pq.TransactionStatus.IDLE
+
+
+class _FakePoolConnection:
+    def __init__(self):
+        self.closed = False
+        self.info = _FakeInfo()
+        self.rollbacks = 0
+
+    def execute(self, query):
+        self.info.transaction_status = pq.TransactionStatus.INTRANS
+        return query
+
+    def rollback(self):
+        self.rollbacks += 1
+        self.info.transaction_status = pq.TransactionStatus.IDLE
+
+
+class _FakePool:
+    instances = []
+
+    def __init__(self, conninfo, **kwargs):
+        self.conninfo = conninfo
+        self.kwargs = kwargs
+        self.idle = [_FakePoolConnection()]
+        self.checked_out = 0
+        self.opened = False
+        _FakePool.instances.append(self)
+
+    def open(self):
+        self.opened = True
+
+    def close(self):
+        self.opened = False
+
+    def getconn(self):
+        self.checked_out += 1
+        return self.idle.pop() if self.idle else _FakePoolConnection()
+
+    def putconn(self, conn):
+        self.checked_out -= 1
+        self.idle.append(conn)
+
+
+@pytest.fixture()
+def fake_pool(monkeypatch):
+    _FakePool.instances = []
+    database.close_connection_pool()
+    monkeypatch.setattr(database, "ConnectionPool", _FakePool)
+    monkeypatch.setenv("DATABASE_URL", "postgresql://u:p@db.example.com:5432/postgres")
+    monkeypatch.delenv("DB_POOL_ENABLED", raising=False)
+    monkeypatch.delenv("DB_PREPARE_THRESHOLD", raising=False)
+    yield
+    database.close_connection_pool()
+
+
+def test_get_connection_reuses_one_pool_and_returns_connections_on_close(fake_pool, monkeypatch):
+    monkeypatch.setenv("DB_POOL_MIN_SIZE", "2")
+    monkeypatch.setenv("DB_POOL_MAX_SIZE", "4")
+
+    first = database._get_connection()
+    first.execute("SELECT 1")
+    raw = first._conn
+    first.close()
+    first.close()
+    second = database._get_connection()
+
+    assert len(_FakePool.instances) == 1
+    pool = _FakePool.instances[0]
+    assert pool.opened and pool.kwargs["min_size"] == 2 and pool.kwargs["max_size"] == 4
+    assert pool.kwargs["kwargs"]["prepare_threshold"] == 5
+    assert second._conn is raw
+    assert raw.rollbacks == 1
+    assert first.closed and not second.closed
+    second.close()
+    assert pool.checked_out == 0
+
+
+def test_transaction_pooler_url_disables_statement_caching_unless_configured(fake_pool, monkeypatch):
+    monkeypatch.setenv("DATABASE_URL", "postgresql://u:p@aws-0.pooler.supabase.com:6543/postgres")
+    assert database._prepare_threshold(os.environ["DATABASE_URL"]) is None
+    monkeypatch.setenv("DB_PREPARE_THRESHOLD", "2")
+    assert database._prepare_threshold(os.environ["DATABASE_URL"]) == 2
+
+
+def test_local_postgres_stand_in_round_trips_through_the_pool(monkeypatch):
+    """Runs when CHINESE_CHR_TEST_DATABASE_URL points at a disposable local Postgres."""
+    url = os.environ.get("CHINESE_CHR_TEST_DATABASE_URL")
+    if not url or database.ConnectionPool is None:
+        pytest.skip("set CHINESE_CHR_TEST_DATABASE_URL and install psycopg_pool to run")
+    database.close_connection_pool()
+    monkeypatch.setenv("DATABASE_URL", url)
+    monkeypatch.setenv("DB_POOL_MAX_SIZE", "2")
+    try:
+        backend_pids = set()
+        for _ in range(3):
+            conn = database._get_connection()
+            try:
+                with conn.cursor() as cur:
+                    cur.execute("SELECT pg_backend_pid() AS pid")
+                    backend_pids.add(cur.fetchone()["pid"])
+            finally:
+                conn.close()
+        assert len(backend_pids) == 1
+    finally:
+        database.close_connection_pool()
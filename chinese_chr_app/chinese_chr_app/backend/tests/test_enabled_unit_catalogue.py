@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""Enabled reading-unit catalogue (pinyin_recall_enabled_units) sync and version revalidation."""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import database
+
+
+class _CatalogueCursor:
+    def __init__(self, conn):
+        self._conn = conn
+        self._rows = []
+        self.rowcount = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+    def execute(self, query, params=None, prepare=None):
+        self._conn.queries.append((query, params))
+        self._rows, self.rowcount = self._conn.respond(query, params)
+
+    def executemany(self, query, rows):
+        self._conn.units.update(row[0] for row in rows)
+
+    def fetchone(self):
+        return self._rows[0] if self._rows else None
+
+    def fetchall(self):
+        return list(self._rows)
+
+
+class _CatalogueConnection:
+    """Shared in-memory state standing in for the catalogue tables."""
+
+    def __init__(self, units, version):
+        self.units = set(units)
+        self.version = version
+        self.queries = []
+
+    def respond(self, query, params):
+        if "FROM pinyin_recall_unit_bank" in query:
+            return [{"learned": 1, "learning": 0}], 1
+        if "to_regclass" in query:
+            return [{"has_table": True}], 1
+        if "INSERT INTO pinyin_recall_enabled_units_meta" in query:
+            self.version += 1
+            return [{"version": self.version}], 1
+        if "SELECT version FROM pinyin_recall_enabled_units_meta" in query:
+            return [{"version": self.version}], 1
+        if "SELECT unit_id FROM pinyin_recall_enabled_units" in query:
+            return [{"unit_id": u} for u in sorted(self.units)], len(self.units)
+        if "DELETE FROM pinyin_recall_enabled_units" in query:
+            self.units -= set(params[0])
+            return [], len(params[0])
+        return [], 0
+
+    def cursor(self):
+        return _CatalogueCursor(self)
+
+    def commit(self):
+        pass
+
+    def rollback(self):
+        pass
+
+    def close(self):
+        pass
+
+
+@pytest.fixture()
+def catalogue(monkeypatch):
+    conn = _CatalogueConnection({"甲|jia3", "旧|jiu4"}, version=4)
+    monkeypatch.setattr(database, "_get_connection", lambda: conn)
+    monkeypatch.setattr(database, "_HAS_ENABLED_UNITS_TABLE", None)
+    monkeypatch.setattr(database, "_disabled_recall_unit_ids_fingerprint", lambda: ())
+    monkeypatch.setattr(
+        database,
+        "_get_enabled_recall_unit_ids_cached",
+        _DerivedPool(frozenset({"甲|jia3", "乙|yi3"})),
+    )
+    database.clear_enabled_recall_unit_ids_cache()
+    yield conn
+    database.clear_enabled_recall_unit_ids_cache()
+
+
+class _DerivedPool:
+    def __init__(self, unit_ids):
+        self.unit_ids = unit_ids
+        self.calls = 0
+
+    def __call__(self, fingerprint):
+        self.calls += 1
+        return self.unit_ids
+
+    def cache_clear(self):
+        pass
+
+
+def test_first_lookup_syncs_table_then_revalidates_by_version_only(catalogue):
+    assert database._get_enabled_recall_unit_ids() == {"甲|jia3", "乙|yi3"}
+    assert catalogue.units == {"甲|jia3", "乙|yi3"}
+    assert catalogue.version == 5
+
+    catalogue.queries.clear()
+    assert database._get_enabled_recall_unit_ids() == {"甲|jia3", "乙|yi3"}
+    assert [q for q, _ in catalogue.queries] == ["SELECT version FROM pinyin_recall_enabled_units_meta WHERE id = 1"]
+    assert database._get_enabled_recall_unit_ids_cached.calls == 1
+
+    # Another worker disabled a unit: the version moved, so the IDs are re-read from the table.
+    catalogue.units.discard("乙|yi3")
+    catalogue.version += 1
+    assert database._get_enabled_recall_unit_ids() == {"甲|jia3"}
+
+
+def test_profile_counts_join_catalogue_instead_of_shipping_unit_ids(catalogue):
+    counts = database.get_pinyin_recall_category_counts("u1")
+
+    query, params = catalogue.queries[-1]
+    assert "unit_id IN (SELECT unit_id FROM pinyin_recall_enabled_units)" in query
+    assert "ANY(" not in query
+    assert not any(isinstance(p, list) for p in params)
+    assert counts["total_units"] == 2
+    assert counts["not_tested"] == 1
@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""Tests for the write-behind buffer used by pinyin recall event logging."""
+import sys
+import threading
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from event_write_behind import WriteBehindQueue
+
+
+def _rows(n, start=0):
+    return [{"n": i} for i in range(start, start + n)]
+
+
+def test_put_returns_immediately_and_worker_flushes_full_batches_in_bulk():
+    flushed = []
+    ready = threading.Event()
+
+    def flush(event, payloads):
+        flushed.append((event, [p["n"] for p in payloads]))
+        ready.set()
+
+    queue = WriteBehindQueue(flush, lambda *a: None, max_batch=3, flush_interval=60)
+    queue.put("item_presented", _rows(3))
+    assert ready.wait(5)
+    assert flushed == [("item_presented", [0, 1, 2])]
+    queue.close()
+
+
+def test_backlog_overflow_and_flush_failures_are_spilled_not_retried():
+    spilled = []
+    attempts = []
+
+    def flush(event, payloads):
+        attempts.append(len(payloads))
+        raise RuntimeError("db down")
+
+    queue = WriteBehindQueue(
+        flush,
+        lambda event, payloads, reason: spilled.append((event, len(payloads), reason)),
+        max_batch=2,
+        flush_interval=60,
+        max_backlog=4,
+    )
+    # No worker thread: rows stay buffered until close() drains them inline.
+    queue._ensure_worker = lambda: None
+    queue.put("item_presented", _rows(3))
+    queue.put("item_answered", _rows(3))
+    assert spilled == [("item_answered", 2, "backlog_full")]
+    assert queue.backlog == 4
+
+    queue.close()
+    assert attempts == [2, 1, 1]
+    assert [(e, n) for e, n, _reason in spilled[1:]] == [("item_presented", 2), ("item_presented", 1), ("item_answered", 1)]
+    assert all(reason == "RuntimeError: db down" for _e, _n, reason in spilled[1:])
+
+    queue.put("item_presented", _rows(1))
+    assert spilled[-1] == ("item_presented", 1, "queue_closed")
+
+
+def test_close_drains_rows_waiting_for_the_flush_interval():
+    flushed = []
+    queue = WriteBehindQueue(lambda event, payloads: flushed.extend(payloads), lambda *a: None, max_batch=100, flush_interval=60)
+    queue.put("item_presented", _rows(5))
+    queue.close(timeout=5)
+    assert [p["n"] for p in flushed] == [0, 1, 2, 3, 4]
+    assert queue.backlog == 0
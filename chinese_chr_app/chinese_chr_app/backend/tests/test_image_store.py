@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""Card image serving: GCS single download, byte-bounded LRU, ETag/immutable + 304."""
+
+import importlib
+import sys
+import types
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import image_store
+from image_store import GCSImageSource, ImageStore, LocalImageSource, image_etag
+
+CARD = b"\x89PNG card"
+
+
+class _CountingSource:
+    def __init__(self, images):
+        self.images = images
+        self.fetches = []
+
+    def describe(self, key):
+        return key
+
+    def fetch(self, key):
+        self.fetches.append(key)
+        return self.images.get(key)
+
+
+def test_store_fetches_each_image_once_and_evicts_by_bytes():
+    source = _CountingSource({"a.png": b"a" * 40, "b.png": b"b" * 40, "c.png": b"c" * 40})
+    store = ImageStore(source, max_bytes=100)
+
+    assert store.get("a.png") == (b"a" * 40, image_etag(b"a" * 40))
+    store.get("a.png")
+    store.get("b.png")
+    store.get("a.png")
+    store.get("c.png")  # 120 bytes > 100: evicts least recently used b.png
+    store.get("a.png")
+    store.get("b.png")
+    assert store.get("missing.png") is None
+
+    assert source.fetches == ["a.png", "b.png", "c.png", "b.png", "missing.png"]
+
+
+def test_gcs_source_downloads_once_without_exists_probe(monkeypatch):
+    from google.api_core.exceptions import NotFound
+
+    calls = []
+
+    class _Blob:
+        def __init__(self, name):
+            self.name = name
+
+        def exists(self):
+            pytest.fail("exists() round-trip")
+
+        def download_as_bytes(self):
+            calls.append(self.name)
+            if self.name == "png/0001/page1.png":
+                return b"png-bytes"
+            raise NotFound("missing")
+
+    class _Client:
+        def bucket(self, name):
+            return types.SimpleNamespace(blob=_Blob)
+
+    monkeypatch.setattr(image_store, "_GCS_CLIENT", _Client())
+    source = GCSImageSource("cards")
+
+    assert source.fetch("0001/page1.png") == b"png-bytes"
+    assert source.fetch("0002/page1.png") is None
+    assert calls == ["png/0001/page1.png", "png/0002/page1.png"]
+
+
+@pytest.fixture
+def images_client(monkeypatch, tmp_path):
+    (tmp_path / "0001").mkdir()
+    (tmp_path / "0001" / "page1.png").write_bytes(CARD)
+    monkeypatch.setenv("IMPORT_SMOKE_TEST", "1")
+    monkeypatch.setenv("GCS_BUCKET_NAME", "")
+    monkeypatch.setenv("PNG_BASE_DIR", str(tmp_path))
+    fake_db_module = types.SimpleNamespace(
+        _get_connection=lambda: None,
+        get_hwxnet_lookup=lambda: {},
+        clear_enabled_recall_unit_ids_cache=lambda: None,
+    )
+    monkeypatch.setitem(sys.modules, "database", fake_db_module)
+    monkeypatch.delitem(sys.modules, "app", raising=False)
+    app_module = importlib.import_module("app")
+    assert isinstance(app_module.image_store.source, LocalImageSource)
+    with app_module.app.test_client() as client:
+        yield client
+
+
+def test_image_endpoint_sets_immutable_etag_and_answers_304(images_client):
+    r = images_client.get("/api/images/0001/page1")
+    assert r.status_code == 200
+    assert r.data == CARD
+    assert r.mimetype == "image/png"
+    assert r.headers["ETag"] == f'"{image_etag(CARD)}"'
+    assert "immutable" in r.headers["Cache-Control"]
+
+    again = images_client.get("/api/images/0001/page1", headers={"If-None-Match": r.headers["ETag"]})
+    assert again.status_code == 304
+
+    assert images_client.get("/api/images/0002/page1").status_code == 404
+    assert images_client.get("/api/images/0001/page3").status_code == 400
@@ -24,7 +24,7 @@ def test_log_pinyin_recall_event_persists_priority_metadata(monkeypatch):
 
     fake_db_module = types.SimpleNamespace(
         _get_connection=lambda: _FakeConn(),
-        insert_pinyin_recall_item_presented=lambda payload: captured.append(payload),
+        bulk_insert_pinyin_recall_item_presented=lambda payloads: captured.extend(payloads),
     )
 
     monkeypatch.setitem(sys.modules, "database", fake_db_module)
@@ -54,6 +54,7 @@ def test_log_pinyin_recall_event_persists_priority_metadata(monkeypatch):
         batch_id="batch-1",
         batch_mode="expansion",
     )
+    app._pinyin_recall_event_queue.flush()
 
     assert len(captured) == 1
     payload = captured[0]
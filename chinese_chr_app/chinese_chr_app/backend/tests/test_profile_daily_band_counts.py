@@ -0,0 +1,202 @@
+#!/usr/bin/env python3
+"""Profile 掌握度 trend served from the pinyin_recall_daily_band_counts rollup."""
+
+import sys
+from datetime import date
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import database
+
+
+class _ScriptedCursor:
+    def __init__(self, conn):
+        self._conn = conn
+        self._rows = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+    def execute(self, query, params=None, prepare=None):
+        self._conn.queries.append(query)
+        self._rows = self._conn.respond(query, params)
+
+    def executemany(self, query, rows):
+        self._conn.written.extend(rows)
+
+    def fetchone(self):
+        return self._rows[0] if self._rows else None
+
+    def fetchall(self):
+        return list(self._rows)
+
+
+class _ScriptedConnection:
+    def __init__(self, *, covered, rollup_rows=(), answered_rows=(), has_table=True):
+        self.covered = covered
+        self.has_table = has_table
+        self.rollup_rows = list(rollup_rows)
+        self.answered_rows = list(answered_rows)
+        self.queries = []
+        self.written = []
+        self.commits = 0
+
+    def respond(self, query, params):
+        if "to_regclass" in query:
+            return [{"has_table": self.has_table}]
+        if "FROM pinyin_recall_daily_band_counts_users WHERE user_id" in query:
+            return [{"covered": 1}] if self.covered else []
+        if "FROM pinyin_recall_daily_band_counts\n" in query and query.lstrip().startswith("SELECT day"):
+            return self.rollup_rows
+        if "DISTINCT ON" in query:
+            return self.answered_rows
+        return []
+
+    def cursor(self):
+        return _ScriptedCursor(self)
+
+    def commit(self):
+        self.commits += 1
+
+    def rollback(self):
+        pass
+
+    def close(self):
+        pass
+
+
+def _rollup_row(day, hard=0, learning_normal=0, learned_normal=0, mastered=0, memorized=0):
+    return {
+        "day": day,
+        "hard": hard,
+        "learning_normal": learning_normal,
+        "learned_normal": learned_normal,
+        "mastered": mastered,
+        "memorized": memorized,
+    }
+
+
+@pytest.fixture(autouse=True)
+def _today(monkeypatch):
+    monkeypatch.setattr(database, "_HAS_DAILY_BAND_COUNTS_TABLE", None)
+    monkeypatch.setattr(database, "_DAILY_BAND_COUNTS_TABLE_RECHECK_AT", 0.0)
+    monkeypatch.setattr(database, "_profile_trend_today_utc_date", lambda: date(2026, 6, 4))
+
+
+def test_trend_reads_built_rollup_without_replaying_answer_history(monkeypatch):
+    conn = _ScriptedConnection(
+        covered=True,
+        rollup_rows=[
+            _rollup_row(date(2026, 6, 1), learning_normal=3),
+            _rollup_row(date(2026, 6, 3), learning_normal=1, learned_normal=2),
+        ],
+    )
+    monkeypatch.setattr(database, "_get_connection", lambda: conn)
+
+    trend = database.get_pinyin_recall_category_daily_trend(
+        "u1",
+        days=None,
+        live_counts={"learning_normal": 1, "learned_normal": 1, "learned_mastered": 1},
+        enabled_unit_ids=["甲|jia3"],
+    )
+
+    assert [(p["date"], p["learning_normal"], p["learned_normal"], p["mastered"]) for p in trend] == [
+        ("2026-06-01", 3, 0, 0),
+        ("2026-06-02", 3, 0, 0),
+        ("2026-06-03", 1, 2, 0),
+        ("2026-06-04", 1, 1, 1),
+    ]
+    assert not any("DISTINCT ON" in q for q in conn.queries)
+    assert conn.written == []
+
+
+def test_trend_replays_and_builds_rollup_for_user_without_one(monkeypatch):
+    conn = _ScriptedConnection(
+        covered=False,
+        answered_rows=[
+            {"entity_id": "甲|jia3", "score_after": 10, "ev_day": date(2026, 6, 1)},
+            {"entity_id": "乙|yi3", "score_after": -10, "ev_day": date(2026, 6, 1)},
+            {"entity_id": "甲|jia3", "score_after": 20, "ev_day": date(2026, 6, 3)},
+        ],
+    )
+    monkeypatch.setattr(database, "_get_connection", lambda: conn)
+
+    trend = database.get_pinyin_recall_category_daily_trend(
+        "u1",
+        days=2,
+        live_counts={"learning_normal": 1, "learned_mastered": 1},
+        enabled_unit_ids=["甲|jia3", "乙|yi3"],
+    )
+
+    assert conn.written == [
+        ("u1", date(2026, 6, 1), 0, 1, 1, 0, 0),
+        ("u1", date(2026, 6, 3), 0, 1, 0, 1, 0),
+    ]
+    assert any("pg_advisory_xact_lock" in q for q in conn.queries)
+    assert any("INSERT INTO pinyin_recall_daily_band_counts_users" in q for q in conn.queries)
+    assert conn.commits == 1
+    assert [(p["date"], p["learning_normal"], p["mastered"]) for p in trend] == [
+        ("2026-06-03", 1, 1),
+        ("2026-06-04", 1, 1),
+    ]
+
+
+def _band_updates(conn):
+    return [q for q in conn.queries if q.lstrip().startswith("UPDATE pinyin_recall_daily_band_counts")]
+
+
+def _seeds_today(conn):
+    return any("INSERT INTO pinyin_recall_daily_band_counts (" in q for q in conn.queries)
+
+
+def test_answer_moving_bands_shifts_one_unit_between_todays_columns():
+    conn = _ScriptedConnection(covered=True)
+
+    database._apply_daily_band_count_transition(conn, "u1", "甲|jia3", 15, 25)
+
+    assert _seeds_today(conn)
+    [update] = _band_updates(conn)
+    assert "mastered = mastered + 1" in update
+    assert "learned_normal = GREATEST(learned_normal - 1, 0)" in update
+
+
+def test_answer_within_same_band_leaves_todays_counts_alone():
+    conn = _ScriptedConnection(covered=True)
+
+    database._apply_daily_band_count_transition(conn, "u1", "甲|jia3", 21, 25)
+
+    assert _seeds_today(conn)
+    assert _band_updates(conn) == []
+
+
+def test_first_answer_only_increments_the_new_band():
+    conn = _ScriptedConnection(covered=True)
+
+    database._apply_daily_band_count_transition(conn, "u1", "甲|jia3", None, 0)
+
+    [update] = _band_updates(conn)
+    assert "learning_normal = learning_normal + 1" in update
+    assert "GREATEST" not in update
+
+
+def test_missing_rollup_tables_are_cached_until_recheck():
+    conn = _ScriptedConnection(covered=True, has_table=False)
+
+    database._apply_daily_band_count_transition(conn, "u1", "甲|jia3", None, 0)
+    database._apply_daily_band_count_transition(conn, "u1", "甲|jia3", 0, 25)
+
+    assert sum("to_regclass" in q for q in conn.queries) == 1
+    assert _band_updates(conn) == []
+
+    conn.has_table = True
+    database.clear_daily_band_counts_table_cache()
+    database._apply_daily_band_count_transition(conn, "u1", "甲|jia3", 0, 25)
+
+    assert sum("to_regclass" in q for q in conn.queries) == 2
+    assert len(_band_updates(conn)) == 1
@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""get_profile_progress_data: one pipelined round-trip plus the per-user TTL cache."""
+
+import sys
+from contextlib import contextmanager
+from datetime import date
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import database
+
+
+class _PipelineCursor:
+    def __init__(self, conn):
+        self._conn = conn
+        self._rows = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+    def execute(self, query, params=None, prepare=None):
+        self._conn.statements.append((self._conn.in_pipeline, query))
+        self._rows = self._conn.respond(query)
+
+    def fetchone(self):
+        return self._rows[0] if self._rows else None
+
+    def fetchall(self):
+        return list(self._rows)
+
+    def close(self):
+        pass
+
+
+class _PipelineConnection:
+    def __init__(self):
+        self.statements = []
+        self.in_pipeline = False
+        self.pipelines = 0
+
+    def respond(self, query):
+        if "to_regclass" in query:
+            return [{"has_table": True}]
+        if "COUNT(DISTINCT character)" in query:
+            return [{"cnt": 3}]
+        if "FROM character_views" in query:
+            return [{"character": "行"}, {"character": "和"}]
+        if "LIMIT %s" in query and "pinyin_recall_item_answered" in query:
+            return [{"day": date(2026, 6, 4), "answered": 4, "correct": 3, "new_answered": 4, "new_correct": 3}]
+        if "AS date" in query:
+            return [{"date": date(2026, 6, 4), "answered": 4, "correct": 3}]
+        if "FROM pinyin_recall_unit_bank" in query:
+            return [{"learned": 1, "learning": 2, "learned_normal": 1, "learning_normal": 2}]
+        if "pinyin_recall_daily_band_counts_users" in query:
+            return [{"covered": 1}]
+        if "FROM pinyin_recall_daily_band_counts" in query:
+            return [{"day": date(2026, 6, 3), "hard": 0, "learning_normal": 1, "learned_normal": 0, "mastered": 0, "memorized": 0}]
+        return []
+
+    @contextmanager
+    def pipeline(self):
+        self.pipelines += 1
+        self.in_pipeline = True
+        try:
+            yield
+        finally:
+            self.in_pipeline = False
+
+    def cursor(self):
+        return _PipelineCursor(self)
+
+    def commit(self):
+        pass
+
+    def rollback(self):
+        pass
+
+    def close(self):
+        pass
+
+
+@pytest.fixture()
+def profile_db(monkeypatch):
+    connections = []
+
+    def _connect():
+        connections.append(_PipelineConnection())
+        return connections[-1]
+
+    monkeypatch.setattr(database, "_get_connection", _connect)
+    monkeypatch.setattr(database, "_HAS_DAILY_BAND_COUNTS_TABLE", True)
+    monkeypatch.setattr(database, "_enabled_unit_scope", lambda enabled_unit_ids=None: ("unit_id = ANY(%s)", (["a", "b", "c", "d"],), 4))
+    monkeypatch.setattr(database, "_profile_trend_today_utc_date", lambda: date(2026, 6, 4))
+    monkeypatch.setenv("PROFILE_PROGRESS_CACHE_SECONDS", "60")
+    database.invalidate_profile_progress_cache()
+    yield connections
+    database.invalidate_profile_progress_cache()
+
+
+def test_profile_progress_is_one_pipeline_on_one_connection(profile_db):
+    progress = database.get_profile_progress_data("u1")
+
+    assert len(profile_db) == 1
+    conn = profile_db[0]
+    assert conn.pipelines == 1
+    assert all(in_pipeline for in_pipeline, _ in conn.statements)
+    assert progress["viewed_characters_count"] == 3
+    assert progress["viewed_characters_recent"] == ["行", "和"]
+    assert progress["daily_stats"][0]["answered"] == 4
+    assert progress["practice_summary"][-1]["answered"] == 4
+    assert progress["category_counts"]["not_tested"] == 1
+    assert [p["date"] for p in progress["category_trend"]] == ["2026-06-03", "2026-06-04"]
+    assert progress["category_trend"][-1]["learning_normal"] == 2
+
+
+def test_profile_progress_cache_serves_repeat_reads_until_invalidated(profile_db):
+    first = database.get_profile_progress_data("u1")
+    first["viewed_characters_recent"].append("x")
+    assert database.get_profile_progress_data("u1")["viewed_characters_recent"] == ["行", "和"]
+    assert len(profile_db) == 1
+
+    database.invalidate_profile_progress_cache("u1")
+    database.get_profile_progress_data("u1")
+    assert len(profile_db) == 2
+
+
+def test_profile_progress_cache_prunes_expired_entries_on_write(profile_db):
+    database._PROFILE_PROGRESS_CACHE[("gone", 50, 30)] = (0.0, {})
+
+    database.get_profile_progress_data("u1")
+
+    assert list(database._PROFILE_PROGRESS_CACHE) == [("u1", 50, 30)]
+
+
+def test_profile_progress_cache_evicts_oldest_beyond_max_entries(profile_db, monkeypatch):
+    monkeypatch.setattr(database, "_PROFILE_PROGRESS_CACHE_MAX_ENTRIES", 2)
+
+    for user_id in ("u1", "u2", "u3"):
+        database.get_profile_progress_data(user_id)
+
+    assert [key[0] for key in database._PROFILE_PROGRESS_CACHE] == ["u2", "u3"]
+    database.get_profile_progress_data("u1")
+    assert len(profile_db) == 4
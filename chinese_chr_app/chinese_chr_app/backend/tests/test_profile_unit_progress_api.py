@@ -121,36 +121,37 @@ def test_profile_progress_returns_unit_level_denominator(monkeypatch):
     _set_auth(monkeypatch)
 
     fake_db = SimpleNamespace(
-        get_character_views_count_for_user=lambda user_id: 12,
-        get_character_views_recent_for_user=lambda user_id, limit=50: ["行", "和"],
-        get_pinyin_recall_daily_stats=lambda user_id, days=30: [],
-        get_pinyin_recall_practice_summary=lambda user_id: [
-            {
-                "key": "last_7_days",
-                "label": "最近7天",
-                "active_days": 2,
-                "answered": 9,
-                "correct": 7,
-                "accuracy_pct": 78,
-                "by_category": {
-                    "新字": {"answered": 3, "correct": 2},
-                    "巩固": {"answered": 2, "correct": 2},
-                    "重测": {"answered": 4, "correct": 3},
-                },
-            }
-        ],
-        _get_enabled_recall_unit_ids=lambda: {"u1", "u2"},
-        get_pinyin_recall_category_daily_trend=lambda user_id, days=None, **kwargs: [],
-        get_pinyin_recall_category_counts=lambda user_id, **kwargs: {
-            "total_units": 904,
-            "learned": 200,
-            "learning": 50,
-            "not_tested": 654,
-            "learning_hard": 10,
-            "learning_normal": 40,
-            "learned_mastered": 65,
-            "learned_memorized": 15,
-            "learned_normal": 120,
+        get_profile_progress_data=lambda user_id, **kwargs: {
+            "viewed_characters_count": 12,
+            "viewed_characters_recent": ["行", "和"],
+            "daily_stats": [],
+            "practice_summary": [
+                {
+                    "key": "last_7_days",
+                    "label": "最近7天",
+                    "active_days": 2,
+                    "answered": 9,
+                    "correct": 7,
+                    "accuracy_pct": 78,
+                    "by_category": {
+                        "新字": {"answered": 3, "correct": 2},
+                        "巩固": {"answered": 2, "correct": 2},
+                        "重测": {"answered": 4, "correct": 3},
+                    },
+                }
+            ],
+            "category_counts": {
+                "total_units": 904,
+                "learned": 200,
+                "learning": 50,
+                "not_tested": 654,
+                "learning_hard": 10,
+                "learning_normal": 40,
+                "learned_mastered": 65,
+                "learned_memorized": 15,
+                "learned_normal": 120,
+            },
+            "category_trend": [],
         },
         PROFILE_HWXNET_TOTAL=3664,
     )
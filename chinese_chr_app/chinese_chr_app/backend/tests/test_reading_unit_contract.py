@@ -229,3 +229,31 @@ def test_build_session_queue_excludes_globally_disabled_units_from_future_batche
     )
 
     assert [item["unit_id"] for item in items] == ["行|xing2"]
+
+
+def test_session_unit_pool_is_cached_sliced_by_zibiao_and_rederived_on_override_change():
+    hwxnet_lookup = {
+        "乙": {"拼音": ["yǐ"], "zibiao_index": 3},
+        "甲": {"拼音": ["jiǎ"], "zibiao_index": 1},
+        "乐": {"拼音": ["lè", "yuè"], "zibiao_index": 2},
+        "无": {"拼音": ["wú"]},
+    }
+    pinyin_recall.invalidate_session_unit_pool()
+
+    pool = pinyin_recall.get_or_build_session_unit_pool(hwxnet_lookup, {})
+    assert pinyin_recall.get_or_build_session_unit_pool(hwxnet_lookup, {}) is pool
+    assert pool.max_zibiao_in_corpus == 3
+    assert [c["unit"]["unit_id"] for c in pool.candidates] == ["甲|jia3", "乐|le4", "乐|yue4", "乙|yi3"]
+    assert [c["unit"]["unit_id"] for c in pool.window(2, 2)] == ["乐|le4", "乐|yue4"]
+
+    overrides = {"乐|yue4": {"recall_enabled": False, "enable_reason": "disabled_reported_by_user"}}
+    disabled = pinyin_recall.get_or_build_session_unit_pool(hwxnet_lookup, {}, overrides)
+    assert disabled is not pool
+    assert [c["unit"]["unit_id"] for c in disabled.window(1, 3)] == ["甲|jia3", "乐|le4", "乙|yi3"]
+    assert disabled.by_character["甲"] is pool.by_character["甲"]
+    assert pinyin_recall.get_or_build_session_unit_pool(hwxnet_lookup, {}, dict(overrides)) is disabled
+
+    hwxnet_lookup["丙"] = {"拼音": ["bǐng"], "zibiao_index": 4}
+    grown = pinyin_recall.get_or_build_session_unit_pool(hwxnet_lookup, {}, overrides)
+    assert grown.max_zibiao_in_corpus == 4
+    pinyin_recall.invalidate_session_unit_pool()
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""Packed HanziWriter stroke store and GET /api/strokes (raw bytes, ETag, 304)."""
+
+import importlib
+import sys
+import types
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from stroke_store import StrokeStore, normalize_stroke_json, stroke_etag, write_stroke_store
+
+WO = normalize_stroke_json(b'{"strokes": ["M 1 2"], "medians": [[[1, 2]]]}')
+NI = normalize_stroke_json(b'{"strokes": ["M 3 4"], "medians": [[[3, 4]]]}')
+
+
+def test_store_returns_stored_bytes_and_etag(tmp_path):
+    path = tmp_path / "strokes.sqlite"
+    assert write_stroke_store(path, [("我", WO), ("你", NI)]) == 2
+
+    store = StrokeStore(path)
+    assert store.get("我") == (WO, stroke_etag(WO))
+    assert store.get("他") is None
+    assert WO == b'{"strokes":["M 1 2"],"medians":[[[1,2]]]}'
+
+
+def test_lru_keeps_most_recent_runtime_fetches(tmp_path):
+    store = StrokeStore(tmp_path / "missing.sqlite", lru_size=2)
+    store.put("我", WO)
+    store.put("你", NI)
+    store.get("我")
+    store.put("他", NI)
+
+    assert store.get("我") is not None
+    assert store.get("你") is None
+    assert store.get("他") is not None
+
+
+def test_normalize_rejects_non_stroke_json():
+    with pytest.raises(ValueError):
+        normalize_stroke_json(b'{"error": "not found"}')
+
+
+@pytest.fixture
+def strokes_client(monkeypatch, tmp_path):
+    path = tmp_path / "strokes.sqlite"
+    write_stroke_store(path, [("我", WO)])
+    monkeypatch.setenv("IMPORT_SMOKE_TEST", "1")
+    monkeypatch.setenv("HW_STROKES_STORE", str(path))
+    fake_db_module = types.SimpleNamespace(
+        _get_connection=lambda: None,
+        get_hwxnet_lookup=lambda: {},
+        clear_enabled_recall_unit_ids_cache=lambda: None,
+    )
+    monkeypatch.setitem(sys.modules, "database", fake_db_module)
+    monkeypatch.delitem(sys.modules, "app", raising=False)
+    app_module = importlib.import_module("app")
+    monkeypatch.setattr(app_module, "fetch_stroke_json", lambda ch, **kw: pytest.fail("CDN fetch"))
+    with app_module.app.test_client() as client:
+        yield client
+
+
+def test_strokes_endpoint_serves_packed_bytes_with_etag(strokes_client):
+    r = strokes_client.get("/api/strokes?char=我")
+    assert r.status_code == 200
+    assert r.data == WO
+    assert r.mimetype == "application/json"
+    assert r.headers["ETag"] == f'"{stroke_etag(WO)}"'
+    assert "max-age=86400" in r.headers["Cache-Control"]
+
+    again = strokes_client.get("/api/strokes?char=我", headers={"If-None-Match": r.headers["ETag"]})
+    assert again.status_code == 304
+    assert again.data == b""
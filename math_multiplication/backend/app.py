@@ -22,7 +22,15 @@ except ImportError:
 from jwt import InvalidTokenError
 
 from auth import extract_bearer_token, verify_bearer_token
-from database import init_db, get_all_games, get_or_create_profile, save_game, save_game_with_user, update_profile
+from database import (
+    init_db,
+    get_all_games,
+    get_leaderboard,
+    get_or_create_profile,
+    save_game,
+    save_game_with_user,
+    update_profile,
+)
 from models import db
 
 app = Flask(__name__)
@@ -210,9 +218,31 @@ def create_game():
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
+@app.route('/api/leaderboard', methods=['GET'])
+def leaderboard():
+    """Fastest games, paginated (?total_questions=&rounds=&user_id=&limit=&cursor=)"""
+    try:
+        args = request.args
+        total_questions = args.get('total_questions', type=int)
+        rounds = args.get('rounds', type=int)
+        limit = args.get('limit', default=20, type=int)
+        user_id = (args.get('user_id') or '').strip() or None
+        page = get_leaderboard(
+            total_questions=total_questions,
+            rounds=rounds,
+            user_id=user_id,
+            limit=limit,
+            cursor=args.get('cursor') or None,
+        )
+        return jsonify(page), 200
+    except ValueError:
+        return jsonify({'error': 'Invalid cursor'}), 400
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
 @app.route('/api/games', methods=['GET'])
 def get_games():
-    """Get all games (for leaderboard)"""
+    """Get all games (unbounded; the leaderboard page uses /api/leaderboard)"""
     try:
         games = get_all_games()
         return jsonify({'games': games}), 200
@@ -1,9 +1,19 @@
 """Database connection and initialization"""
 import os
+import threading
+import time
 from flask import Flask, current_app
-from sqlalchemy import text
+from sqlalchemy import text, tuple_
 from models import db, Game, UserProfile
 
+# Top-N leaderboard pages (first page, no user filter) cached per (total_questions, rounds).
+# Refreshed by save_game/save_game_with_user; the TTL bounds staleness across Cloud Run instances.
+LEADERBOARD_TOP_N = 20
+LEADERBOARD_MAX_LIMIT = 100
+LEADERBOARD_CACHE_SECONDS = float(os.getenv('LEADERBOARD_CACHE_SECONDS', '30'))
+_TOP_GAMES_CACHE: dict = {}
+_TOP_GAMES_CACHE_LOCK = threading.Lock()
+
 def init_db(app: Flask):
     """Initialize database connection"""
     # Get database URL from environment
@@ -46,7 +56,22 @@ def _ensure_schema():
     These statements are safe to run multiple times.
     """
     # Add user_id column to games if missing (for authenticated identity linking).
-    db.session.execute(text("ALTER TABLE games ADD COLUMN IF NOT EXISTS user_id varchar(36);"))
+    # Postgres only: other engines (SQLite in tests) get the column from create_all().
+    if db.engine.dialect.name == "postgresql":
+        db.session.execute(text("ALTER TABLE games ADD COLUMN IF NOT EXISTS user_id varchar(36);"))
+    # Leaderboard keyset scans: fastest games overall, per question count, and per player.
+    games_table = Game.__table__.fullname
+    db.session.execute(text(
+        f"CREATE INDEX IF NOT EXISTS ix_games_time_elapsed ON {games_table} (time_elapsed, id);"
+    ))
+    db.session.execute(text(
+        f"CREATE INDEX IF NOT EXISTS ix_games_total_questions_time_elapsed "
+        f"ON {games_table} (total_questions, time_elapsed, id);"
+    ))
+    db.session.execute(text(
+        f"CREATE INDEX IF NOT EXISTS ix_games_user_id_time_elapsed "
+        f"ON {games_table} (user_id, time_elapsed, id);"
+    ))
     db.session.commit()
 
 
@@ -60,6 +85,80 @@ def get_all_games():
         return []
 
 
+def _cursor_for(game: dict) -> str:
+    return f"{game['time_elapsed']}:{game['id']}"
+
+
+def _decode_cursor(cursor: str) -> tuple[int, int]:
+    """Parse a `time_elapsed:id` keyset cursor (raises ValueError)."""
+    time_elapsed, game_id = cursor.split(":", 1)
+    return int(time_elapsed), int(game_id)
+
+
+def _query_leaderboard(total_questions, rounds, user_id, limit, after):
+    """Up to `limit` game dicts ordered by (time_elapsed, id), plus whether more rows follow."""
+    query = Game.query
+    if total_questions is not None:
+        query = query.filter(Game.total_questions == total_questions)
+    if rounds is not None:
+        query = query.filter(Game.rounds == rounds)
+    if user_id is not None:
+        query = query.filter(Game.user_id == user_id)
+    if after is not None:
+        query = query.filter(tuple_(Game.time_elapsed, Game.id) > tuple_(*after))
+    games = query.order_by(Game.time_elapsed.asc(), Game.id.asc()).limit(limit + 1).all()
+    return [game.to_dict() for game in games[:limit]], len(games) > limit
+
+
+def _get_top_games(total_questions, rounds):
+    key = (total_questions, rounds)
+    with _TOP_GAMES_CACHE_LOCK:
+        cached = _TOP_GAMES_CACHE.get(key)
+    if cached is not None and time.monotonic() - cached[0] < LEADERBOARD_CACHE_SECONDS:
+        return cached[1]
+    top = _query_leaderboard(total_questions, rounds, None, LEADERBOARD_TOP_N, None)
+    with _TOP_GAMES_CACHE_LOCK:
+        _TOP_GAMES_CACHE[key] = (time.monotonic(), top)
+    return top
+
+
+def get_leaderboard(
+    total_questions: int | None = None,
+    rounds: int | None = None,
+    user_id: str | None = None,
+    limit: int = LEADERBOARD_TOP_N,
+    cursor: str | None = None,
+):
+    """
+    Fastest games first, one page at a time.
+
+    Keyset pagination on (time_elapsed, id): pass the returned `next_cursor` back as `cursor`
+    for the next page. The first top-N page without a user filter is served from a small cache.
+    Returns {"games": [...], "next_cursor": str | None}; raises ValueError for a bad cursor.
+    """
+    limit = max(1, min(int(limit), LEADERBOARD_MAX_LIMIT))
+    after = _decode_cursor(cursor) if cursor else None
+    if user_id is None and after is None and limit <= LEADERBOARD_TOP_N:
+        top, top_has_more = _get_top_games(total_questions, rounds)
+        games = top[:limit]
+        has_more = len(top) > limit or top_has_more
+    else:
+        games, has_more = _query_leaderboard(total_questions, rounds, user_id, limit, after)
+    return {"games": games, "next_cursor": _cursor_for(games[-1]) if has_more else None}
+
+
+def _refresh_top_games(game: Game) -> None:
+    """Drop cached top-N pages the new game could enter (re-read on the next request)."""
+    with _TOP_GAMES_CACHE_LOCK:
+        for key in list(_TOP_GAMES_CACHE):
+            total_questions, rounds = key
+            if total_questions not in (None, game.total_questions) or rounds not in (None, game.rounds):
+                continue
+            top = _TOP_GAMES_CACHE[key][1][0]
+            if len(top) < LEADERBOARD_TOP_N or game.time_elapsed <= top[-1]["time_elapsed"]:
+                del _TOP_GAMES_CACHE[key]
+
+
 def save_game(name: str, time_elapsed: int, rounds: int, total_questions: int):
     """Save a game to database (must be called within app context)"""
     try:
@@ -72,6 +171,7 @@ def save_game(name: str, time_elapsed: int, rounds: int, total_questions: int):
         )
         db.session.add(game)
         db.session.commit()
+        _refresh_top_games(game)
         return game.to_dict()
     except Exception as e:
         db.session.rollback()
@@ -112,6 +212,7 @@ def save_game_with_user(user_id: str | None, name: str, time_elapsed: int, round
         )
         db.session.add(game)
         db.session.commit()
+        _refresh_top_games(game)
         return game.to_dict()
     except Exception as e:
         db.session.rollback()
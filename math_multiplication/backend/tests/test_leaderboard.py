@@ -0,0 +1,103 @@
+"""GET /api/leaderboard and get_leaderboard() against a throwaway SQLite database.
+
+Run from math_multiplication/backend: python3 -m pytest tests
+"""
+import importlib
+import sys
+from pathlib import Path
+
+import pytest
+from sqlalchemy import inspect
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+
+@pytest.fixture(scope="module")
+def backend(tmp_path_factory):
+    db_path = tmp_path_factory.mktemp("leaderboard") / "games.db"
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv("DATABASE_URL", f"sqlite:///{db_path}")
+        mp.delenv("ENVIRONMENT", raising=False)
+        app_module = importlib.import_module("app")
+    yield app_module
+
+
+@pytest.fixture()
+def client(backend):
+    import database
+    from models import db, Game
+
+    with backend.app.app_context():
+        Game.query.delete()
+        db.session.commit()
+    database._TOP_GAMES_CACHE.clear()
+    yield backend.app.test_client()
+    database._TOP_GAMES_CACHE.clear()
+
+
+def _save(backend, time_elapsed, total_questions=10, user_id=None):
+    import database
+
+    with backend.app.app_context():
+        return database.save_game_with_user(user_id, "p", time_elapsed, 1, total_questions)
+
+
+def test_ensure_schema_creates_leaderboard_indexes(backend):
+    from models import db
+
+    with backend.app.app_context():
+        names = {ix["name"] for ix in inspect(db.engine).get_indexes("games")}
+    assert {
+        "ix_games_time_elapsed",
+        "ix_games_total_questions_time_elapsed",
+        "ix_games_user_id_time_elapsed",
+    } <= names
+
+
+def test_leaderboard_orders_fastest_first_and_breaks_ties_by_id(backend, client):
+    slow = _save(backend, 300)
+    tie_a = _save(backend, 100)
+    mid = _save(backend, 200)
+    tie_b = _save(backend, 100)
+    _save(backend, 50, total_questions=20)
+
+    first = client.get("/api/leaderboard?total_questions=10&limit=3").get_json()
+    assert [g["id"] for g in first["games"]] == [tie_a["id"], tie_b["id"], mid["id"]]
+    assert first["next_cursor"] == f"200:{mid['id']}"
+
+    rest = client.get(f"/api/leaderboard?total_questions=10&limit=3&cursor={first['next_cursor']}").get_json()
+    assert [g["id"] for g in rest["games"]] == [slow["id"]]
+    assert rest["next_cursor"] is None
+
+
+def test_leaderboard_filters_by_user(backend, client):
+    mine = _save(backend, 400, user_id="u1")
+    _save(backend, 100, user_id="u2")
+
+    page = client.get("/api/leaderboard?user_id=u1").get_json()
+    assert [g["id"] for g in page["games"]] == [mine["id"]]
+
+
+def test_leaderboard_rejects_bad_cursor(client):
+    response = client.get("/api/leaderboard?cursor=not-a-cursor")
+    assert response.status_code == 400
+
+
+def test_new_game_refreshes_cached_top_games(backend, client, monkeypatch):
+    import database
+
+    monkeypatch.setattr(database, "LEADERBOARD_TOP_N", 2)
+    _save(backend, 300)
+    _save(backend, 200)
+    client.get("/api/leaderboard?limit=2")
+    assert (None, None) in database._TOP_GAMES_CACHE
+
+    # Too slow for a full top 2: the cached page stays.
+    _save(backend, 500)
+    assert (None, None) in database._TOP_GAMES_CACHE
+
+    fastest = _save(backend, 100)
+    assert (None, None) not in database._TOP_GAMES_CACHE
+    page = client.get("/api/leaderboard?limit=2").get_json()
+    assert [g["time_elapsed"] for g in page["games"]] == [100, 200]
+    assert page["games"][0]["id"] == fastest["id"]
@@ -1,4 +1,4 @@
-import { useState, useEffect, useMemo } from 'react'
+import { useState, useEffect } from 'react'
 import '../App.css'
 import { useAuth } from '../AuthContext'
 
@@ -7,22 +7,34 @@ const API_URL = import.meta.env.VITE_API_URL || ''
 function Leaderboard() {
   const { user, profile, isAuthConfigured } = useAuth()
   const [games, setGames] = useState([])
+  const [personalGames, setPersonalGames] = useState([])
   const [loading, setLoading] = useState(true)
   const [error, setError] = useState(null)
+  const userId = user?.id
 
   useEffect(() => {
     fetchGames()
-  }, [])
+  }, [userId])
 
+  const fetchLeaderboard = async (params) => {
+    const response = await fetch(`${API_URL}/api/leaderboard?${new URLSearchParams(params)}`)
+    if (!response.ok) {
+      throw new Error('Failed to fetch games')
+    }
+    const data = await response.json()
+    return data.games || []
+  }
+
+  // Top 20 overall, plus the signed-in player's top 20 (both already sorted fastest first).
   const fetchGames = async () => {
     try {
       setLoading(true)
-      const response = await fetch(`${API_URL}/api/games`)
-      if (!response.ok) {
-        throw new Error('Failed to fetch games')
-      }
-      const data = await response.json()
-      setGames(data.games || [])
+      const [globalTop, personalTop] = await Promise.all([
+        fetchLeaderboard({ limit: '20' }),
+        userId ? fetchLeaderboard({ limit: '20', user_id: userId }) : Promise.resolve([]),
+      ])
+      setGames(globalTop)
+      setPersonalGames(personalTop)
       setError(null)
     } catch (err) {
       setError(err.message)
@@ -54,19 +66,6 @@ function Leaderboard() {
     return date.toLocaleString('en-SG', { timeZone: 'Asia/Singapore' })
   }
 
-  // Sort games by time (ascending - fastest first)
-  const sortedGames = useMemo(
-    () => [...games].sort((a, b) => a.time_elapsed - b.time_elapsed),
-    [games]
-  )
-
-  // Personal games for the logged-in user, also sorted by time.
-  const personalGames = useMemo(() => {
-    if (!user) return []
-    const userId = user.id
-    return sortedGames.filter((game) => game.user_id === userId)
-  }, [sortedGames, user])
-
   return (
     <div className="leaderboard-page">
       <div className="leaderboard-card">
@@ -78,7 +77,7 @@ function Leaderboard() {
             {/* If no auth configured or user not logged in, show the original single global leaderboard */}
             {(!isAuthConfigured || !user) && (
               <>
-                {sortedGames.length === 0 ? (
+                {games.length === 0 ? (
                   <div>No games recorded yet. Be the first to play!</div>
                 ) : (
                   <table style={{ width: '100%', borderCollapse: 'collapse', marginTop: '20px' }}>
@@ -93,7 +92,7 @@ function Leaderboard() {
                       </tr>
                     </thead>
                     <tbody>
-                      {sortedGames.map((game, index) => (
+                      {games.map((game, index) => (
                         <tr key={index} style={{ borderBottom: '1px solid #eee' }}>
                           <td style={{ padding: '12px' }}>{index + 1}</td>
                           <td style={{ padding: '12px', fontWeight: '500' }}>{game.name}</td>
@@ -116,7 +115,7 @@ function Leaderboard() {
               <div className="leaderboard-grid">
                 <div className="leaderboard-column">
                   <h3 className="leaderboard-subtitle">Global leaderboard</h3>
-                  {sortedGames.length === 0 ? (
+                  {games.length === 0 ? (
                     <div>No games recorded yet. Be the first to play!</div>
                   ) : (
                     <table className="leaderboard-table">
@@ -131,7 +130,7 @@ function Leaderboard() {
                         </tr>
                       </thead>
                       <tbody>
-                        {sortedGames.map((game, index) => (
+                        {games.map((game, index) => (
                           <tr key={game.id ?? index}>
                             <td>{index + 1}</td>
                             <td className="leaderboard-name-cell">{game.name}</td>